@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Время импорта и память модулей со справочниками (блюда, ингредиенты,
+переводы, напитки, веса штук, часовые пояса).
+
+Каждый замер — отдельный интерпретатор: «cold» без кэша байткода
+(PYTHONPYCACHEPREFIX во временный каталог, как первый запуск контейнера),
+«warm» с готовыми .pyc. Память — прирост RSS после импорта и объем,
+выделенный при импорте (tracemalloc, отдельным запуском — он замедляет импорт).
+
+    python benchmarks/catalog_load.py
+    python benchmarks/catalog_load.py --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = (
+    "services.dish_db",
+    "services.translator",
+    "utils.drink_parser",
+    "utils.unit_converter",
+    "utils.timezone_auto",
+)
+
+# Зависимости, которые бот и так импортирует, загружаются до замера — считаем только справочники
+PRELOAD = "import numpy, orjson, json, re, logging, functools, typing, bisect, collections"
+
+PROBE = f"""
+import json, resource, sys, time, tracemalloc
+{PRELOAD}
+def rss_kb():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * resource.getpagesize() // 1024
+trace = sys.argv[1] == "alloc"
+before = rss_kb()
+if trace:
+    tracemalloc.start()
+started = time.perf_counter()
+for name in sys.argv[2:]:
+    __import__(name)
+elapsed = time.perf_counter() - started
+allocated = tracemalloc.get_traced_memory()[0] if trace else 0
+print(json.dumps({{"ms": elapsed * 1000, "rss_kb": rss_kb() - before, "alloc_kb": allocated // 1024}}))
+"""
+
+
+def measure(modules: list, cold: bool, mode: str = "time") -> dict:
+    env = dict(os.environ)
+    env.setdefault("BOT_TOKEN", "123456:TEST")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # warm-замеру нужны записанные .pyc
+    with tempfile.TemporaryDirectory() as cache_dir:
+        if cold:
+            env["PYTHONPYCACHEPREFIX"] = cache_dir
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE, mode, *modules],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    # Прогрев .pyc для warm-замера
+    measure(list(MODULES), cold=False)
+
+    print(f"{'module':<24} {'cold ms':>9} {'warm ms':>9} {'RSS KB':>8} {'alloc KB':>9}")
+    for modules in [[module] for module in MODULES] + [list(MODULES)]:
+        cold = [measure(modules, cold=True) for _ in range(args.runs)]
+        warm = [measure(modules, cold=False) for _ in range(args.runs)]
+        alloc = measure(modules, cold=False, mode="alloc")
+        label = modules[0] if len(modules) == 1 else "all"
+        print(f"{label:<24} {statistics.median(r['ms'] for r in cold):9.1f} "
+              f"{statistics.median(r['ms'] for r in warm):9.1f} "
+              f"{statistics.median(r['rss_kb'] for r in warm):8.0f} "
+              f"{alloc['alloc_kb']:9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Определение блюда по ингредиентам: прежний перебор calculate_dish_similarity
+по всем блюдам против DishSimilarityMatrix.
+
+Наборы ингредиентов собираются случайно из ингредиентов и ключевых слов
+каталога (плюс «шум» от AI). Проверяется, что баллы по всем блюдам и
+выбранное блюдо совпадают с прежней реализацией.
+
+    python benchmarks/dish_match.py
+    python benchmarks/dish_match.py --requests 2000 --size 6
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.dish_db import (  # noqa: E402
+    COMPOSITE_DISHES, INGREDIENT_DATABASE, calculate_dish_similarity, find_best_match, find_top_matches,
+    _dish_matrix,
+)
+
+NOISE = ["соус", "зелень", "масло", "специи", "гарнир", "Chicken", "tomato", "сыр пармезан"]
+
+
+def legacy_find_best_match(ingredients, threshold=0.3):
+    """Прежняя реализация find_best_match"""
+    best_match = None
+    best_score = 0
+    for dish_key, dish_data in COMPOSITE_DISHES.items():
+        score = calculate_dish_similarity(ingredients, dish_data)
+        if score > best_score and score >= threshold:
+            best_score = score
+            best_match = dish_data.copy()
+            best_match["match_score"] = score
+            best_match["dish_key"] = dish_key
+    return best_match
+
+
+def legacy_top_matches(ingredients, limit=5, threshold=0.3):
+    """Полная сортировка всех блюд по баллу (при равенстве — порядок каталога)"""
+    scored = [(calculate_dish_similarity(ingredients, dish), index, dish_key)
+              for index, (dish_key, dish) in enumerate(COMPOSITE_DISHES.items())]
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return [(dish_key, score) for score, _, dish_key in scored[:limit] if score > 0 and score >= threshold]
+
+
+def build_requests(count: int, size: int, seed: int) -> list:
+    rng = random.Random(seed)
+    pool = list(INGREDIENT_DATABASE) + NOISE
+    for dish in COMPOSITE_DISHES.values():
+        pool.extend(ing["name"] for ing in dish["ingredients"])
+        pool.extend(dish["keywords"])
+    return [[rng.choice(pool) for _ in range(rng.randint(1, size))] for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--size", type=int, default=6, help="максимум ингредиентов в запросе")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    requests = build_requests(args.requests, args.size, args.seed)
+    for ingredients in requests[:100]:
+        expected = [calculate_dish_similarity(ingredients, dish) for dish in COMPOSITE_DISHES.values()]
+        if list(_dish_matrix.scores(ingredients)) != expected:
+            sys.exit(f"score mismatch for {ingredients!r}")
+
+    started = time.perf_counter()
+    legacy = [legacy_find_best_match(ingredients) for ingredients in requests]
+    legacy_time = (time.perf_counter() - started) / len(requests)
+
+    started = time.perf_counter()
+    matched = [find_best_match(ingredients) for ingredients in requests]
+    matrix_time = (time.perf_counter() - started) / len(requests)
+
+    for ingredients, old, new in zip(requests, legacy, matched):
+        if (old and old["dish_key"], old and old["match_score"]) != (new and new["dish_key"], new and new["match_score"]):
+            sys.exit(f"best match mismatch for {ingredients!r}")
+
+    started = time.perf_counter()
+    top = [find_top_matches(ingredients, 5) for ingredients in requests]
+    top_time = (time.perf_counter() - started) / len(requests)
+
+    for ingredients, matches, best in zip(requests, top, matched):
+        expected = legacy_top_matches(ingredients)
+        if [(m["dish_key"], m["match_score"]) for m in matches] != expected:
+            sys.exit(f"top-5 mismatch for {ingredients!r}")
+        if (matches[0]["dish_key"] if matches else None) != (best and best["dish_key"]):
+            sys.exit(f"top-5 does not start with the best match for {ingredients!r}")
+
+    print(f"{len(COMPOSITE_DISHES)} dishes, {len(_dish_matrix.vocabulary)} features, "
+          f"{len(requests)} requests, results identical")
+    print(f"  linear: {legacy_time * 1e3:8.3f} ms/request")
+    print(f"  matrix: {matrix_time * 1e3:8.3f} ms/request ({legacy_time / matrix_time:.1f}x)")
+    print(f"  top-5:  {top_time * 1e3:8.3f} ms/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Поиск блюд по названию: прежний линейный перебор против индекса DishSearchIndex.
+
+Запросы берутся из самого каталога (названия, ключевые слова, их префиксы и
+подстроки, отдельные слова) плюс несколько промахов. Для каждого запроса
+проверяется, что набор найденных блюд совпадает с прежней реализацией.
+
+    python benchmarks/dish_search.py
+    python benchmarks/dish_search.py --repeat 20 --seed 7
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.dish_db import COMPOSITE_DISHES, search_dishes_by_name  # noqa: E402
+from services.dish_search import tokenize  # noqa: E402
+
+
+def legacy_search(query: str) -> list:
+    """Прежняя реализация search_dishes_by_name"""
+    query_lower = query.lower()
+    results = []
+    for dish_data in COMPOSITE_DISHES.values():
+        if query_lower in dish_data["name"].lower():
+            results.append(dish_data)
+            continue
+        for keyword in dish_data["keywords"]:
+            if query_lower in keyword.lower():
+                results.append(dish_data)
+                break
+    return results
+
+
+def build_queries(seed: int) -> list:
+    rng = random.Random(seed)
+    queries = set()
+    for dish in COMPOSITE_DISHES.values():
+        for text in [dish["name"]] + dish["keywords"]:
+            queries.add(text)
+            queries.add(text.upper())
+            queries.update(text[:n] for n in (1, 2, 3, 5))
+            queries.update(tokenize(text))
+            if len(text) > 4:
+                start = rng.randrange(len(text) - 3)
+                queries.add(text[start:start + rng.randint(2, 4)])
+    queries.update(["", "пицца маргарита с ананасом", "xyz", "ё", "суп-пюре", "  "])
+    return sorted(queries)
+
+
+def timed(search, queries: list, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            search(query)
+    return (time.perf_counter() - started) / (repeat * len(queries))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    queries = build_queries(args.seed)
+    mismatches = [
+        query for query in queries
+        if {id(d) for d in search_dishes_by_name(query)} != {id(d) for d in legacy_search(query)}
+    ]
+    if mismatches:
+        sys.exit(f"result mismatch for {len(mismatches)} queries, e.g. {mismatches[:5]!r}")
+
+    legacy = timed(legacy_search, queries, args.repeat)
+    indexed = timed(search_dishes_by_name, queries, args.repeat)
+    print(f"{len(COMPOSITE_DISHES)} dishes, {len(queries)} queries, results identical")
+    print(f"  linear: {legacy * 1e6:8.1f} µs/query")
+    print(f"   index: {indexed * 1e6:8.1f} µs/query ({legacy / indexed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Задержка ответа на запись: проверка достижений в обработчике против
+публикации события в шину (services/event_bus.py, локальная очередь).
+
+Проверка достижений моделируется задержками запросов к БД: загрузка
+пользователя и по запросу на каждое достижение (как в
+GamificationSystem.check_achievements). Печатает p50/p99 времени, которое
+обработчик тратит до ответа, и время, за которое шина обрабатывает события
+в фоне.
+
+    python benchmarks/event_bus.py
+    python benchmarks/event_bus.py --query-ms 3 --events 2000 --workers 8
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.event_bus import FOOD_LOGGED, EventBus  # noqa: E402
+
+ACHIEVEMENTS = 9
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def make_check(query_ms: float):
+    async def check_achievements(event):
+        for _ in range(1 + ACHIEVEMENTS):
+            await asyncio.sleep(query_ms / 1000)
+    return check_achievements
+
+
+async def run(args) -> None:
+    check = make_check(args.query_ms)
+
+    inline = []
+    for user_id in range(args.inline_events):
+        started = time.perf_counter()
+        await check({"type": FOOD_LOGGED, "user_id": user_id})
+        inline.append(time.perf_counter() - started)
+
+    bus = EventBus(workers=args.workers, queue_size=args.events)
+    bus.subscribe(FOOD_LOGGED, check)
+    await bus.start()
+    published = []
+    started_all = time.perf_counter()
+    for user_id in range(args.events):
+        started = time.perf_counter()
+        await bus.publish(FOOD_LOGGED, user_id, calories=500)
+        published.append(time.perf_counter() - started)
+    await bus.stop(timeout=600)
+    drained = time.perf_counter() - started_all
+
+    for label, values in (("inline check", inline), ("publish", published)):
+        print(f"  {label:<13} p50={statistics.median(values) * 1000:8.3f} ms "
+              f"p99={percentile(values, 99) * 1000:8.3f} ms")
+    snapshot = bus.snapshot()
+    print(f"  background: {snapshot['handled']} events in {drained:.2f}s with {args.workers} workers, "
+          f"lag p50={snapshot['lag_p50_ms']} ms p99={snapshot['lag_p99_ms']} ms, dropped={snapshot['dropped']}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--query-ms", type=float, default=1.0, help="задержка одного запроса к БД")
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--inline-events", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Локальный разбор описаний еды: доля текстов без LLM и задержка разбора.
+
+Корпус генерируется с фиксированным seed из шаблонов сообщений (блюда и
+продукты справочника, количества, союзы) с примесью текстов, которые
+должны уходить в LLM (незнакомые продукты, свободные описания). Печатает
+долю локальных ответов и p50/p99 времени локального разбора отдельно для
+попаданий и промахов (для промаха это добавка к запросу в LLM).
+
+    python benchmarks/food_text_parser.py
+    python benchmarks/food_text_parser.py --inputs 20000 --show 30
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.food_text_parser import parse_food_text_local  # noqa: E402
+
+DISHES = ["борщ", "пельмени", "гречка", "овсянка", "плов", "салат цезарь", "котлета", "омлет", "рис", "пицца"]
+PIECES = ["яйцо", "яблоко", "хлеб", "сосиска", "котлета", "булочка", "печенье"]
+INGREDIENTS = ["курица", "гречка", "творог", "молоко", "говядина", "картофель", "сметана", "сыр"]
+WITH = ["курицей", "сметаной", "сыром", "молоком", "говядиной"]
+GLASS = ["молока", "кефира", "сметаны"]
+OTHER = [
+    "что-то сладкое", "бабушкин пирог с капустой", "смузи из манго", "банан", "чай с сахаром",
+    "шаурма в лаваше", "суп как в столовой", "немного орешков",
+]
+TEMPLATES = [
+    "{dish}", "съел {dish}", "{dish} и {dish}", "{k} {piece}", "{piece}", "{ingredient} {g} г",
+    "{ingredient} {g}г и {dish}", "{dish} с {with_}", "{k} {piece} и {dish}", "стакан {glass}",
+    "{ingredient} {g}", "на обед {dish}, {k} {piece}", "{other}", "{other} и {dish}",
+]
+FORMS = {"яйцо": "яйца", "яблоко": "яблока", "котлета": "котлеты", "сосиска": "сосиски", "булочка": "булочки"}
+
+
+def fill(template: str, rng: random.Random) -> str:
+    k = rng.randint(1, 4)
+    piece = rng.choice(PIECES)
+    return template.format(
+        dish=rng.choice(DISHES), piece=FORMS.get(piece, piece) if k > 1 else piece, k=k,
+        ingredient=rng.choice(INGREDIENTS), g=rng.randrange(50, 400, 10), other=rng.choice(OTHER),
+        with_=rng.choice(WITH), glass=rng.choice(GLASS),
+    )
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--inputs", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--show", type=int, default=0, help="напечатать разбор первых N текстов")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [fill(rng.choice(TEMPLATES), rng) for _ in range(args.inputs)]
+    for text in corpus[:200]:  # прогрев индексов лемм и кэшей
+        parse_food_text_local(text)
+
+    hits, misses = [], []
+    for text in corpus:
+        started = time.perf_counter()
+        result = parse_food_text_local(text)
+        elapsed = time.perf_counter() - started
+        (hits if result is not None else misses).append(elapsed)
+
+    for text in corpus[:args.show]:
+        result = parse_food_text_local(text)
+        parsed = [(item["name"], item["weight_grams"]) for item in result["ingredients"]] if result else "-> LLM"
+        print(f"  {text!r:<40} {parsed}")
+
+    print(f"{len(corpus)} texts, local hit rate {len(hits) / len(corpus):.1%}")
+    for name, values in (("local hit", hits), ("local miss", misses)):
+        if values:
+            print(f"  {name:<11} n={len(values):<6} p50={statistics.median(values) * 1e6:7.1f}us "
+                  f"p99={percentile(values, 99) * 1e6:7.1f}us")
+
+
+if __name__ == "__main__":
+    main()
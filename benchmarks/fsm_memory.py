@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Сравнение памяти Redis на одного активного пользователя FSM:
+старая схема (JSON по умолчанию, без TTL, анализ фото внутри данных FSM)
+против новой (orjson, TTL, анализ фото в отдельном истекающем ключе).
+
+Запускать против отдельной тестовой БД Redis — ключи бенчмарка удаляются.
+
+    python benchmarks/fsm_memory.py --redis redis://localhost:6379/15 --users 2000
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+import redis.asyncio as redis
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.redis import RedisStorage, DefaultKeyBuilder
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.fsm_storage import create_redis_storage  # noqa: E402
+from utils.fsm_cleanup import PhotoDataManager  # noqa: E402
+
+BOT_ID = 4242
+
+
+def sample_food_items() -> list:
+    return [
+        {"name": f"Продукт {i}", "calories": 120 + i, "protein": 5.5, "fat": 3.2, "carbs": 18.0,
+         "weight": 100, "source": "ai"}
+        for i in range(5)
+    ]
+
+
+def sample_history() -> list:
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant",
+         "content": "Сколько калорий в гречке с курицей и овощами на ужин? " * 3}
+        for i in range(20)
+    ]
+
+
+def sample_photo_analysis() -> dict:
+    return {
+        "dish_name": "Салат Цезарь с курицей",
+        "ingredients": [
+            {"name": f"ингредиент {i}", "weight": 40, "calories": 95.0, "protein": 4.1,
+             "fat": 6.3, "carbs": 3.8, "confidence": 0.87}
+            for i in range(12)
+        ],
+        "raw_response": "Описание блюда на фотографии: " + "листья салата, курица, сухарики, соус. " * 40,
+    }
+
+
+async def populate(storage: RedisStorage, users: int, legacy: bool):
+    for user_id in range(1, users + 1):
+        key = StorageKey(bot_id=BOT_ID, chat_id=user_id, user_id=user_id)
+        state = FSMContext(storage=storage, key=key)
+        await state.set_state("FoodClarificationStates:waiting_for_weight")
+        await state.update_data(
+            food_items=sample_food_items(),
+            conversation_history=sample_history(),
+            original_text="2 яйца и хлеб",
+        )
+        if legacy:
+            # Старое поведение: анализ целиком в данных FSM
+            data = await state.get_data()
+            data.setdefault("photo_analysis", {})["a1"] = sample_photo_analysis()
+            await state.update_data(data)
+        else:
+            await PhotoDataManager.store_photo_analysis(state, "a1", sample_photo_analysis())
+
+
+async def measure(client, pattern: str) -> tuple:
+    total_bytes = 0
+    keys = 0
+    async for key in client.scan_iter(match=pattern, count=1000):
+        total_bytes += await client.memory_usage(key) or 0
+        keys += 1
+    return total_bytes, keys
+
+
+async def run_case(client, users: int, legacy: bool) -> tuple:
+    await client.flushdb()
+    if legacy:
+        storage = RedisStorage(client, key_builder=DefaultKeyBuilder(with_bot_id=True))
+    else:
+        storage = create_redis_storage(client)
+    await populate(storage, users, legacy)
+    total_bytes, keys = await measure(client, f"fsm:{BOT_ID}:*")
+    without_ttl = 0
+    async for key in client.scan_iter(match=f"fsm:{BOT_ID}:*", count=1000):
+        if await client.ttl(key) == -1:
+            without_ttl += 1
+    return total_bytes, keys, without_ttl
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--redis", default="redis://localhost:6379/15")
+    parser.add_argument("--users", type=int, default=1000)
+    args = parser.parse_args()
+
+    client = redis.from_url(args.redis)
+    try:
+        for label, legacy in (("before", True), ("after", False)):
+            total_bytes, keys, without_ttl = await run_case(client, args.users, legacy)
+            print(f"{label:>6}: {total_bytes / args.users:8.0f} bytes/user, "
+                  f"{keys / args.users:.1f} keys/user, {without_ttl} keys without TTL")
+        await client.flushdb()
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
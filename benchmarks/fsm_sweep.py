@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Обход ключей FSM: KEYS + запросы по ключу против FSMKeySweeper (SCAN + pipeline).
+
+По умолчанию работает на встроенной in-memory заглушке, совместимой с нужным
+подмножеством redis.asyncio (SCAN, TTL, EXPIRE, pipeline), и может
+имитировать сетевую задержку на каждый round trip. С --redis запускается
+против настоящего сервера (используйте отдельную БД — она очищается).
+
+    python benchmarks/fsm_sweep.py --keys 1000000 --rtt-ms 0.2
+    python benchmarks/fsm_sweep.py --keys 200000 --redis redis://localhost:6379/15
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.fsm_cleanup import FSMKeySweeper  # noqa: E402
+
+TTL = 3600
+
+
+class InMemoryRedis:
+    """Минимальная Redis-совместимая заглушка: ключи, TTL, SCAN и pipeline"""
+
+    def __init__(self, rtt: float = 0.0):
+        self.rtt = rtt
+        self.round_trips = 0
+        self._keys = []
+        self._index = {}
+        self._values = {}
+        self._ttl = {}
+
+    async def _round_trip(self):
+        self.round_trips += 1
+        if self.rtt:
+            await asyncio.sleep(self.rtt)
+        else:
+            await asyncio.sleep(0)
+
+    def _set(self, key, value, ex=None):
+        if key not in self._values:
+            self._index[key] = len(self._keys)
+            self._keys.append(key)
+        self._values[key] = value
+        if ex:
+            self._ttl[key] = ex
+        else:
+            self._ttl.pop(key, None)
+
+    def _ttl_of(self, key):
+        if key not in self._values:
+            return -2
+        return self._ttl.get(key, -1)
+
+    def _expire(self, key, seconds):
+        if key not in self._values:
+            return False
+        self._ttl[key] = seconds
+        return True
+
+    def _delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            if key in self._values:
+                del self._values[key]
+                self._ttl.pop(key, None)
+                self._keys[self._index.pop(key)] = None
+                deleted += 1
+        return deleted
+
+    async def set(self, key, value, ex=None):
+        await self._round_trip()
+        self._set(key, value, ex)
+        return True
+
+    async def get(self, key):
+        await self._round_trip()
+        return self._values.get(key)
+
+    async def delete(self, *keys):
+        await self._round_trip()
+        return self._delete(*keys)
+
+    async def ttl(self, key):
+        await self._round_trip()
+        return self._ttl_of(key)
+
+    async def expire(self, key, seconds):
+        await self._round_trip()
+        return self._expire(key, seconds)
+
+    async def keys(self, pattern="*"):
+        await self._round_trip()
+        prefix = pattern.rstrip("*")
+        return [key for key in self._keys if key is not None and key.startswith(prefix)]
+
+    async def scan(self, cursor=0, match="*", count=10):
+        await self._round_trip()
+        prefix = match.rstrip("*")
+        end = min(len(self._keys), cursor + count)
+        batch = [key for key in self._keys[cursor:end] if key is not None and key.startswith(prefix)]
+        return (0 if end >= len(self._keys) else end), batch
+
+    def pipeline(self, transaction=False):
+        return _InMemoryPipeline(self)
+
+
+class _InMemoryPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def ttl(self, key):
+        self.commands.append((self.redis._ttl_of, (key,)))
+
+    def expire(self, key, seconds):
+        self.commands.append((self.redis._expire, (key, seconds)))
+
+    async def execute(self):
+        await self.redis._round_trip()
+        return [command(*args) for command, args in self.commands]
+
+
+async def populate(client, total: int, with_ttl_ratio: float):
+    """Ключи вида fsm:bot:chat:user:state|data, часть без TTL"""
+    if isinstance(client, InMemoryRedis):
+        for i in range(total):
+            part = "data" if i % 2 else "state"
+            client._set(f"fsm:1:{i // 2}:{i // 2}:{part}", b"{}", ex=TTL if i % 100 < with_ttl_ratio * 100 else None)
+        return
+    await client.flushdb()
+    pipe = client.pipeline(transaction=False)
+    for i in range(total):
+        part = "data" if i % 2 else "state"
+        ex = TTL if i % 100 < with_ttl_ratio * 100 else None
+        pipe.set(f"fsm:1:{i // 2}:{i // 2}:{part}", b"{}", ex=ex)
+        if len(pipe) >= 10000:
+            await pipe.execute()
+            pipe = client.pipeline(transaction=False)
+    await pipe.execute()
+
+
+async def legacy_cleanup(client) -> int:
+    """Прежний алгоритм: KEYS, затем TTL/EXPIRE для каждого ключа отдельно"""
+    updated = 0
+    for key in await client.keys("fsm:*"):
+        if await client.ttl(key) == -1:
+            await client.expire(key, TTL)
+            updated += 1
+    return updated
+
+
+async def run(client, args) -> None:
+    await populate(client, args.keys, args.with_ttl)
+    start_trips = getattr(client, "round_trips", 0)
+    started = time.perf_counter()
+    if args.legacy:
+        updated = await legacy_cleanup(client)
+        label = "KEYS + per-key"
+    else:
+        sweeper = FSMKeySweeper(client, batch_size=args.batch, max_keys_per_second=args.rate)
+        progress = await sweeper.sweep(ttl_seconds=TTL)
+        updated = progress["ttl_set"]
+        label = "SCAN + pipeline"
+    duration = time.perf_counter() - started
+    trips = getattr(client, "round_trips", 0) - start_trips
+    trips_info = f", {trips} round trips" if isinstance(client, InMemoryRedis) else ""
+    print(f"{label:>16}: {args.keys} keys in {duration:.2f}s "
+          f"({args.keys / duration:,.0f} keys/s), TTL set for {updated}{trips_info}")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    parser.add_argument("--with-ttl", type=float, default=0.5, help="доля ключей, у которых уже есть TTL")
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--rate", type=int, default=0, help="лимит ключей в секунду (0 — без лимита)")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="имитация задержки сети для заглушки")
+    parser.add_argument("--redis", help="URL настоящего Redis вместо заглушки")
+    parser.add_argument("--legacy", action="store_true", help="запустить прежний алгоритм")
+    args = parser.parse_args()
+
+    if args.redis:
+        import redis.asyncio as redis
+        client = redis.from_url(args.redis)
+        try:
+            await run(client, args)
+        finally:
+            await client.flushdb()
+            await client.close()
+    else:
+        await run(InMemoryRedis(rtt=args.rtt_ms / 1000), args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Отчет о времени импорта модулей бота (python -X importtime).
+
+Запускает отдельный интерпретатор, импортирует указанные модули с
+фиктивными обязательными переменными окружения и печатает самые
+тяжелые модули по суммарному (cumulative) времени.
+
+    python benchmarks/import_profile.py                 # import bot
+    python benchmarks/import_profile.py bot handlers.universal services.dish_db --top 40
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def collect(modules: list) -> list:
+    """Возвращает [(cumulative_us, self_us, module)] из вывода -X importtime"""
+    env = dict(os.environ)
+    env.setdefault("BOT_TOKEN", "123456:TEST")
+    env.setdefault("REDIS_URL", "redis://localhost:6379/0")
+    code = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    if result.returncode != 0:
+        print(result.stderr[-2000:], file=sys.stderr)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("modules", nargs="*", default=["bot"])
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args()
+
+    rows = collect(args.modules)
+    if not rows:
+        sys.exit("no importtime output")
+
+    top_level = [row for row in rows if not row[2].startswith("  ")]
+    total = sum(row[0] for row in top_level)
+    print(f"total import time: {total / 1000:.0f} ms ({len(rows)} modules)")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:10.1f}ms {self_us / 1000:8.1f}ms  {name.strip()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Пропускная способность парсеров пользовательского ввода (вода, напитки,
+количества продуктов, числа) на корпусе реалистичных сообщений.
+
+Корпус генерируется с фиксированным seed: разные числа и формы слов, поэтому
+большинство строк уникальны, как в живом трафике. Для каждого парсера
+печатается число вызовов в секунду; для лексера — отдельно без кэша.
+
+    python benchmarks/input_parsing.py
+    python benchmarks/input_parsing.py --inputs 20000 --dump corpus.txt
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.drink_parser import extract_volume, guess_drink_from_text  # noqa: E402
+from utils.number_parser import parse_russian_number  # noqa: E402
+from utils.safe_parser import extract_multiple_numbers  # noqa: E402
+from utils.unit_converter import convert_to_grams  # noqa: E402
+from utils.water_parser import parse_water_amount  # noqa: E402
+
+WATER = [
+    "{n} мл", "{n}мл воды", "выпил {n} мл", "{k} стакана воды", "{k} стакан", "стакан воды",
+    "{d} л", "{d}л воды", "полтора литра", "пол-литра", "поллитра воды", "кружка воды",
+    "{w} стакана", "бутылка воды", "большая бутылка", "{n}", "{w} литра воды",
+]
+DRINKS = [
+    "капучино {n} мл", "стакан апельсинового сока", "банка колы", "{k} бутылки пива",
+    "чашка чая с сахаром", "кофе {n}мл", "латте", "{d} л кефира", "рюмка водки",
+    "{w} чашки кофе", "смузи {n} мл", "зеленый чай", "горячий шоколад", "компот",
+]
+UNITS = ["г", "гр", "шт", "штуки", "кг", "столовая ложка", "чайных ложек", "граммов", "стакана", "ломтика", "мл"]
+NUMBERS = [
+    "{w}", "двадцать пять тысяч", "вес {d}", "рост {n} см", "{n} {n} {n}", "мне {k} лет",
+    "сто двадцать три", "полтора часа", "{d}, {d} и {n}", "пульс {n}, давление {n}/{n}",
+]
+WORDS = ["один", "два", "три", "пять", "десять", "двадцать", "сто", "двести"]
+FOODS = ["яблоко", "банан", "хлеб", "сыр", "курица", "рис", "масло", "сахар", "яйцо"]
+
+
+def fill(template: str, rng: random.Random) -> str:
+    return template.format(
+        n=rng.randint(50, 900), k=rng.randint(1, 5), d=f"{rng.randint(0, 3)},{rng.randint(1, 9)}",
+        w=rng.choice(WORDS),
+    )
+
+
+def build_corpus(size: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    return {
+        "water": [fill(rng.choice(WATER), rng) for _ in range(size)],
+        "drinks": [fill(rng.choice(DRINKS), rng) for _ in range(size)],
+        "quantities": [(rng.choice(FOODS), rng.randint(1, 300), rng.choice(UNITS)) for _ in range(size)],
+        "numbers": [fill(rng.choice(NUMBERS), rng) for _ in range(size)],
+    }
+
+
+def rate(func, inputs: list) -> float:
+    started = time.perf_counter()
+    for item in inputs:
+        func(item)
+    return len(inputs) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--inputs", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--dump", help="записать корпус и результаты парсеров в файл")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.inputs, args.seed)
+
+    cases = [
+        ("parse_water_amount", parse_water_amount, corpus["water"]),
+        ("extract_volume", extract_volume, corpus["drinks"]),
+        ("guess_drink_from_text", guess_drink_from_text, corpus["drinks"]),
+        ("convert_to_grams", lambda item: convert_to_grams(*item), corpus["quantities"]),
+        ("parse_russian_number", parse_russian_number, corpus["numbers"]),
+        ("extract_multiple_numbers", extract_multiple_numbers, corpus["numbers"]),
+    ]
+    for _, func, inputs in cases:  # прогрев ленивых индексов и кэшей regex
+        rate(func, inputs[:200])
+
+    print(f"{args.inputs} inputs per parser")
+    for name, func, inputs in cases:
+        print(f"  {name:<26} {rate(func, inputs) / 1000:8.1f}k/s")
+
+    try:
+        from utils.quantity_lexer import tokenize
+    except ImportError:
+        tokenize = None
+    if tokenize is not None:
+        texts = corpus["water"] + corpus["drinks"] + corpus["numbers"]
+        print(f"  {'tokenize (no cache)':<26} {rate(tokenize.__wrapped__, texts) / 1000:8.1f}k/s")
+
+    if args.dump:
+        with open(args.dump, "w", encoding="utf-8") as f:
+            for name, func, inputs in cases:
+                for item in inputs[:2000]:
+                    f.write(f"{name}\t{item!r}\t{func(item)!r}\n")
+
+
+if __name__ == "__main__":
+    main()
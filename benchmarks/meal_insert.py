@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Запись приема пищи из 1/5/20 продуктов: прежний путь через ORM (загрузка
+User, session.add на каждый продукт, commit и отдельный запрос сумм за день)
+против insert_food_entries (один INSERT ... RETURNING с суммами).
+
+Пишет в таблицу food_entries тестового пользователя и удаляет его записи
+в конце.
+
+    DATABASE_URL=postgresql://... python benchmarks/meal_insert.py --runs 200
+    python benchmarks/meal_insert.py            # SQLite файл nutribudy.db
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import delete, func, select  # noqa: E402
+
+from database.db import close_db, engine, get_session, init_db  # noqa: E402
+from database.meal_writes import food_row, insert_food_entries, utc_day_bounds, utc_now  # noqa: E402
+from database.models import FoodEntry, User  # noqa: E402
+
+BENCH_TELEGRAM_ID = 990000000001
+NUTRITION = {"calories": 120.0, "protein": 8.0, "fat": 4.0, "carbs": 14.0}
+
+
+async def orm_meal(items: int) -> None:
+    """Прежний FoodSaveService: пользователь, объект на продукт, commit, суммы отдельно"""
+    async with get_session() as session:
+        user = (await session.execute(select(User).where(User.telegram_id == BENCH_TELEGRAM_ID))).scalar_one()
+        for index in range(items):
+            session.add(FoodEntry(
+                user_id=user.telegram_id, food_name=f"продукт {index}", meal_type="lunch",
+                quantity=100, unit="г", created_at=utc_now(), **NUTRITION,
+            ))
+        await session.commit()
+        start, end = utc_day_bounds(None)
+        await session.execute(select(
+            func.sum(FoodEntry.calories), func.sum(FoodEntry.protein),
+            func.sum(FoodEntry.fat), func.sum(FoodEntry.carbs),
+        ).where(FoodEntry.user_id == BENCH_TELEGRAM_ID, FoodEntry.created_at >= start, FoodEntry.created_at < end))
+
+
+async def bulk_meal(items: int) -> None:
+    rows = [food_row(BENCH_TELEGRAM_ID, f"продукт {index}", NUTRITION, "lunch", quantity=100)
+            for index in range(items)]
+    await insert_food_entries(BENCH_TELEGRAM_ID, rows)
+
+
+async def clear_entries() -> None:
+    async with engine.begin() as conn:
+        await conn.execute(delete(FoodEntry).where(FoodEntry.user_id == BENCH_TELEGRAM_ID))
+
+
+async def measure(write, items: int, runs: int) -> list:
+    # Оба пути начинают с пустого дня: запрос сумм читает одинаковое число строк
+    await clear_entries()
+    await write(items)  # прогрев соединения и подготовленных запросов
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await write(items)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--items", type=int, nargs="+", default=[1, 5, 20])
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    await init_db()
+    async with get_session() as session:
+        exists = await session.execute(select(User.id).where(User.telegram_id == BENCH_TELEGRAM_ID))
+        if exists.scalar_one_or_none() is None:
+            session.add(User(telegram_id=BENCH_TELEGRAM_ID, first_name="bench"))
+            await session.commit()
+
+    try:
+        for items in args.items:
+            for label, write in (("orm", orm_meal), ("bulk", bulk_meal)):
+                timings = await measure(write, items, args.runs)
+                print(f"{items:>3} items {label:>5}: median {statistics.median(timings) * 1000:7.2f} ms, "
+                      f"p99 {percentile(timings, 99) * 1000:7.2f} ms over {args.runs} runs")
+    finally:
+        await clear_entries()
+        async with engine.begin() as conn:
+            await conn.execute(delete(User).where(User.telegram_id == BENCH_TELEGRAM_ID))
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
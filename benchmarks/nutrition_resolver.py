@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+КБЖУ списка ингредиентов: прежний перебор INGREDIENT_DATABASE для каждого
+ингредиента против NutritionResolver (индекс + кэш).
+
+Печатает время на запрос и долю ингредиентов, найденных каждым способом
+(exact / lemma / substring / partial / type).
+
+    python benchmarks/nutrition_resolver.py --requests 2000
+"""
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.dish_db import COMPOSITE_DISHES, INGREDIENT_DATABASE  # noqa: E402
+from services.nutrition_resolver import get_nutrition_resolver, type_fallback  # noqa: E402
+
+INFLECTED = ["помидоров", "курицей", "огурцами", "сыром", "гречкой", "грибами", "отварной картофель",
+             "grilled chicken", "fresh tomato", "соус терияки", "трюфель"]
+TYPES = ["protein", "carb", "vegetable", "fat", "spice", "dairy", ""]
+
+
+def legacy_totals(ingredients: list) -> dict:
+    """Прежний расчет из handlers/universal.py"""
+    totals = {"calories": 0, "protein": 0, "fat": 0, "carbs": 0}
+    for ingredient in ingredients:
+        name = ingredient.get("name", "").lower()
+        weight = ingredient.get("weight_grams", 0)
+        nutrition = None
+        for key, value in INGREDIENT_DATABASE.items():
+            if key.lower() in name or name in key.lower():
+                nutrition = value
+                break
+        if not nutrition:
+            nutrition = type_fallback(ingredient.get("type", ""))
+        for nutrient in totals:
+            totals[nutrient] += (nutrition[nutrient] * weight) / 100
+    return totals
+
+
+def build_requests(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    names = INFLECTED + [ing["name"] for dish in COMPOSITE_DISHES.values() for ing in dish["ingredients"]]
+    return [
+        [{"name": rng.choice(names), "weight_grams": rng.randint(5, 250), "type": rng.choice(TYPES)}
+         for _ in range(rng.randint(2, 8))]
+        for _ in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    resolver = get_nutrition_resolver()
+    resolver.warm_up()
+    requests = build_requests(args.requests, args.seed)
+
+    started = time.perf_counter()
+    for ingredients in requests:
+        legacy_totals(ingredients)
+    legacy_time = (time.perf_counter() - started) / len(requests)
+
+    started = time.perf_counter()
+    for ingredients in requests:
+        resolver.totals(ingredients)
+    resolver_time = (time.perf_counter() - started) / len(requests)
+
+    methods = Counter(item["method"] for ingredients in requests for item in resolver.resolve_many(ingredients))
+    total = sum(methods.values())
+    print(f"{len(resolver.catalog)} keys, {len(requests)} requests, {total} ingredients")
+    print(f"    linear: {legacy_time * 1e6:8.1f} µs/request")
+    print(f"  resolver: {resolver_time * 1e6:8.1f} µs/request ({legacy_time / resolver_time:.1f}x)")
+    print("  methods: " + ", ".join(f"{method} {count / total:.0%}" for method, count in methods.most_common()))
+    print(f"  memo: {resolver.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Локальный каталог OpenFoodFacts: время импорта, пиковая память и задержка поиска.
+
+Без --dump генерирует синтетический дамп JSONL (словарь с распределением Ципфа,
+бренды), импортирует его во временный файл и измеряет перцентили поиска по
+названиям, «бренд + слово» и недописанным словам. С --dump использует
+настоящий дамп OpenFoodFacts.
+
+    python benchmarks/off_catalog.py --products 500000
+    python benchmarks/off_catalog.py --dump openfoodfacts-products.jsonl.gz --country russia
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.off_catalog import OFFCatalog, import_dump, iter_dump_rows  # noqa: E402
+
+SYLLABLES = ["ма", "ко", "ло", "ры", "сы", "те", "на", "ви", "до", "ка", "ше", "гу", "ба", "ни", "ро", "ле"]
+COMMON = ["молоко", "кефир", "йогурт", "сыр", "хлеб", "шоколад", "печенье", "сок"]
+
+
+def write_synthetic_dump(path: str, products: int, seed: int) -> None:
+    rng = random.Random(seed)
+    vocab = COMMON + sorted({"".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(8000)})
+    weights = [1 / (i + 1) for i in range(len(vocab))]
+    brands = ["".join(rng.choice(SYLLABLES) for _ in range(3)).title() for _ in range(3000)]
+    with gzip.open(path, "wt", encoding="utf-8") as dump:
+        for i in range(products):
+            record = {
+                "code": str(4600000000000 + i),
+                "product_name": " ".join(rng.choices(vocab, weights, k=rng.randint(2, 5))),
+                "brands": rng.choice(brands),
+                "nutriments": {"energy-kcal_100g": rng.uniform(10, 500), "proteins_100g": rng.uniform(0, 30),
+                               "fat_100g": rng.uniform(0, 30), "carbohydrates_100g": rng.uniform(0, 60)},
+            }
+            dump.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def sample_queries(dump_path: str, country: str, every: int) -> list:
+    queries = []
+    for i, row in enumerate(iter_dump_rows(dump_path, country)):
+        if i % every:
+            continue
+        words = row[1].split()
+        queries.append(" ".join(words[:2]))
+        if row[2]:
+            queries.append(f"{row[2].split(',')[0]} {words[0]}")
+        queries.append(words[0][:3])
+    return queries + COMMON + ["xyzzy"]
+
+
+def percentile(values: list, q: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dump", help="дамп OpenFoodFacts (по умолчанию — синтетический)")
+    parser.add_argument("--country")
+    parser.add_argument("--products", type=int, default=300_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dump_path = args.dump
+        if not dump_path:
+            dump_path = os.path.join(tmp, "dump.jsonl.gz")
+            write_synthetic_dump(dump_path, args.products, args.seed)
+        out_path = os.path.join(tmp, "off_catalog.sqlite")
+
+        started = time.perf_counter()
+        total = import_dump(dump_path, out_path, args.country)
+        import_time = time.perf_counter() - started
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"import: {total} products in {import_time:.1f}s, peak RSS {peak_mb:.0f} MB, "
+              f"file {os.path.getsize(out_path) / 1e6:.0f} MB")
+
+        catalog = OFFCatalog(out_path)
+        queries = sample_queries(dump_path, args.country, max(1, total // 2000))
+        for query in queries:  # прогрев кэша лемм и страниц файла
+            catalog.search(query)
+        timings = []
+        for query in queries:
+            started = time.perf_counter()
+            catalog.search(query)
+            timings.append(time.perf_counter() - started)
+        timings.sort()
+        print(f"search: {len(queries)} queries, p50 {percentile(timings, 0.5) * 1e3:.3f} ms, "
+              f"p90 {percentile(timings, 0.9) * 1e3:.3f} ms, p99 {percentile(timings, 0.99) * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
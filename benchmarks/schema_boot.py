@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Время старта схемы БД: run_migrations() + init_db() с полной проверкой
+(SCHEMA_FORCE_MIGRATE=1, прежнее поведение) и с быстрым путем по отпечатку.
+
+    DATABASE_URL=postgresql://... python benchmarks/schema_boot.py --runs 5
+    python benchmarks/schema_boot.py            # SQLite файл nutribudy.db
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database.db import init_db, close_db  # noqa: E402
+from database.migrations import run_migrations  # noqa: E402
+
+
+async def boot_once() -> float:
+    started = time.perf_counter()
+    await run_migrations()
+    await init_db()
+    return time.perf_counter() - started
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {}
+    for label, force in (("full migrations", "1"), ("fingerprint fast-path", "")):
+        os.environ["SCHEMA_FORCE_MIGRATE"] = force
+        await boot_once()  # прогрев соединений и запись отпечатка
+        timings = [await boot_once() for _ in range(args.runs)]
+        results[label] = timings
+        print(f"{label:>22}: median {statistics.median(timings) * 1000:7.1f} ms, "
+              f"min {min(timings) * 1000:7.1f} ms over {args.runs} runs")
+
+    await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
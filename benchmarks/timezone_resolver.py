@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Определение часового пояса по городу и локальная дата пользователя.
+
+Корпус городов: названия справочника в разном написании (регистр, «г.»,
+падежи, латиница, начало названия) и незнакомые строки. Печатает число
+вызовов в секунду для get_timezone_by_city (первый проход — без кэша
+результатов), get_user_local_date и границ локальных суток для пакета
+пользователей.
+
+    python benchmarks/timezone_resolver.py
+    python benchmarks/timezone_resolver.py --users 100000
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.timezone_auto import CITY_TIMEZONE_MAP, get_timezone_by_city  # noqa: E402
+from utils.timezone_utils import get_user_local_date  # noqa: E402
+
+ZONES = ["Europe/Moscow", "Asia/Yekaterinburg", "Asia/Novosibirsk", "Europe/Kyiv", "Europe/Minsk",
+         "Asia/Almaty", "Europe/London", "America/New_York", "UTC", "Asia/Vladivostok"]
+
+
+def city_variants(rng: random.Random, size: int) -> list:
+    cities = list(CITY_TIMEZONE_MAP)
+    forms = [
+        lambda c: c, lambda c: c.title(), lambda c: f"г. {c.title()}", lambda c: f"{c.title()}, Россия",
+        lambda c: c[:max(4, len(c) - 3)], lambda c: f"{c} {rng.randint(1, 99)}", lambda c: "зз" + c[::-1],
+    ]
+    return [rng.choice(forms)(rng.choice(cities)) for _ in range(size)]
+
+
+def rate(func, inputs: list) -> float:
+    started = time.perf_counter()
+    for item in inputs:
+        func(item)
+    return len(inputs) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cities", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    rng = random.Random(args.seed)
+    cities = city_variants(rng, args.cities)
+    zones = [rng.choice(ZONES) for _ in range(args.users)]
+
+    print(f"{len(set(cities))} distinct city strings, {args.users} users")
+    print(f"  {'get_timezone_by_city':<26} {rate(get_timezone_by_city, cities) / 1000:8.1f}k/s")
+    print(f"  {'  (repeat)':<26} {rate(get_timezone_by_city, cities) / 1000:8.1f}k/s")
+    print(f"  {'get_user_local_date':<26} {rate(get_user_local_date, zones) / 1000:8.1f}k/s")
+
+    try:
+        from utils.timezone_utils import local_day_bounds
+    except ImportError:
+        local_day_bounds = None
+    if local_day_bounds is not None:
+        started = time.perf_counter()
+        local_day_bounds(zones)
+        print(f"  {'local_day_bounds':<26} {args.users / (time.perf_counter() - started) / 1000:8.1f}k users/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Пересчет норм воды для 100k синтетических пользователей: прежний путь
+(все пользователи ORM-объектами в одной сессии, погода по городам
+последовательно, commit на город) против update_all_users_water_goal
+(страницы по ключу, погода параллельно, UPDATE пачкой на страницу).
+
+Запрос погоды моделируется задержкой --weather-ms. Пользователи создаются
+с telegram_id от BENCH_BASE_ID и удаляются в конце; база должна быть
+пустой, иначе в пересчет попадут и ее пользователи. По умолчанию —
+отдельный файл SQLite.
+
+    python benchmarks/water_goal.py
+    python benchmarks/water_goal.py --users 100000 --cities 500 --weather-ms 200
+    DATABASE_URL=postgresql://... python benchmarks/water_goal.py
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///water_goal_bench.db")
+
+from sqlalchemy import delete, insert, select  # noqa: E402
+
+import services.weather_updater as weather_updater  # noqa: E402
+from database.db import close_db, engine, get_session, init_db  # noqa: E402
+from database.models import User  # noqa: E402
+from services.calculator import calculate_water_intake  # noqa: E402
+from utils.activity_normalizer import normalize_activity_level  # noqa: E402
+
+BENCH_BASE_ID = 970000000000
+ACTIVITY_LEVELS = ("низкая", "умеренная", "высокая", None)
+
+
+def make_weather(weather_ms: float):
+    calls = {"count": 0}
+
+    async def get_temperature(city: str) -> float:
+        calls["count"] += 1
+        await asyncio.sleep(weather_ms / 1000)
+        return 15.0 + hash(city) % 20
+
+    return get_temperature, calls
+
+
+async def legacy_update(get_temperature) -> int:
+    """Прежний update_all_users_water_goal"""
+    updated = 0
+    async with get_session() as session:
+        result = await session.execute(select(User).where(User.city.isnot(None)))
+        users = result.scalars().all()
+        city_users = {}
+        for user in users:
+            city_users.setdefault(user.city, []).append(user)
+        for city, city_user_list in city_users.items():
+            await get_temperature(city)
+            for user in city_user_list:
+                user.daily_water_goal = calculate_water_intake(
+                    weight=user.weight, activity_level=normalize_activity_level(user.activity_level)
+                )
+                updated += 1
+            await session.commit()
+    return updated
+
+
+async def seed(users: int, cities: int) -> None:
+    rng = random.Random(42)
+    rows = [
+        {
+            "telegram_id": BENCH_BASE_ID + index,
+            "first_name": f"bench{index}",
+            "city": f"Город {rng.randrange(cities)}",
+            "weight": rng.uniform(50, 110),
+            "activity_level": rng.choice(ACTIVITY_LEVELS),
+            "timezone": "UTC",
+        }
+        for index in range(users)
+    ]
+    async with engine.begin() as conn:
+        for start in range(0, len(rows), 5000):
+            await conn.execute(insert(User), rows[start:start + 5000])
+
+
+async def cleanup() -> None:
+    async with engine.begin() as conn:
+        await conn.execute(delete(User).where(User.telegram_id >= BENCH_BASE_ID))
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--cities", type=int, default=300)
+    parser.add_argument("--weather-ms", type=float, default=150.0, help="задержка запроса погоды")
+    parser.add_argument("--skip-legacy", action="store_true", help="только новый путь")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    await init_db()
+    await cleanup()
+    started = time.perf_counter()
+    await seed(args.users, args.cities)
+    print(f"  seeded {args.users} users in {args.cities} cities in {time.perf_counter() - started:.1f}s")
+
+    try:
+        if not args.skip_legacy:
+            get_temperature, calls = make_weather(args.weather_ms)
+            started = time.perf_counter()
+            updated = await legacy_update(get_temperature)
+            print(f"  legacy:    {time.perf_counter() - started:7.2f}s, {updated} users, "
+                  f"{calls['count']} weather calls")
+
+        get_temperature, calls = make_weather(args.weather_ms)
+        weather_updater.get_measured_temperature = get_temperature
+        started = time.perf_counter()
+        updated = await weather_updater.update_all_users_water_goal()
+        print(f"  streaming: {time.perf_counter() - started:7.2f}s, {updated} users changed, "
+              f"{calls['count']} weather calls")
+
+        started = time.perf_counter()
+        updated = await weather_updater.update_all_users_water_goal()
+        print(f"  repeat:    {time.perf_counter() - started:7.2f}s, {updated} users changed (same weather)")
+    finally:
+        await cleanup()
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Нагрузочный генератор для webhook NutriBuddy Bot.
+
+Шлет синтетические апдейты (текстовые сообщения от множества чатов) на
+/webhook и считает пропускную способность приема. Если передан --redis,
+дополнительно ждет, пока воркеры кластера разберут очереди, и печатает
+сквозную пропускную способность обработки.
+
+Пример:
+    BOT_WORKERS=4 WEBHOOK_URL=http://localhost:8080 python bot.py
+    python benchmarks/webhook_loadgen.py --url http://localhost:8080/webhook \\
+        --updates 20000 --chats 500 --concurrency 64 --redis redis://localhost:6379/0
+"""
+import argparse
+import asyncio
+import itertools
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SAMPLE_TEXTS = [
+    "2 яйца и хлеб",
+    "выпил 300 мл воды",
+    "овсянка 200г с бананом",
+    "пробежка 30 минут",
+    "вес 72.5",
+    "борщ тарелка",
+    "кофе с молоком",
+]
+
+
+def make_update(update_id: int, chat_id: int) -> dict:
+    """Синтетический апдейт с текстовым сообщением"""
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private", "first_name": "Load"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": "Load"},
+            "text": random.choice(SAMPLE_TEXTS),
+        },
+    }
+
+
+async def send_all(url: str, total: int, chats: int, concurrency: int) -> list:
+    """Отправляет апдейты и возвращает задержки ответов webhook (сек)"""
+    counter = itertools.count(1)
+    latencies = []
+    errors = 0
+
+    async def worker(session: aiohttp.ClientSession):
+        nonlocal errors
+        while True:
+            update_id = next(counter)
+            if update_id > total:
+                return
+            payload = make_update(update_id, 100000 + update_id % chats)
+            started = time.perf_counter()
+            try:
+                async with session.post(url, json=payload) as resp:
+                    await resp.read()
+                    if resp.status != 200:
+                        errors += 1
+            except aiohttp.ClientError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+
+    if errors:
+        print(f"errors: {errors}")
+    return latencies
+
+
+async def wait_drained(redis_url: str, workers: int, timeout: float) -> float:
+    """
+    Ждет, пока опустеют очереди и списки обработки всех шардов (апдейт уходит из
+    списка обработки, когда обработчик завершился); возвращает момент опустошения
+    """
+    import redis.asyncio as redis
+    from utils.cluster import processing_key, queue_key
+
+    client = redis.from_url(redis_url)
+    deadline = time.perf_counter() + timeout
+    try:
+        while time.perf_counter() < deadline:
+            pipe = client.pipeline(transaction=False)
+            for shard in range(workers):
+                pipe.llen(queue_key(shard))
+                pipe.llen(processing_key(shard))
+            if sum(await pipe.execute()) == 0:
+                return time.perf_counter()
+            await asyncio.sleep(0.05)
+    finally:
+        await client.close()
+    raise TimeoutError("queues were not drained in time")
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+    return ordered[index]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8080/webhook")
+    parser.add_argument("--updates", type=int, default=10000)
+    parser.add_argument("--chats", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--redis", help="REDIS_URL кластера, чтобы измерить обработку")
+    parser.add_argument("--workers", type=int, default=4, help="BOT_WORKERS кластера")
+    parser.add_argument("--timeout", type=float, default=600.0)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    latencies = await send_all(args.url, args.updates, args.chats, args.concurrency)
+    accepted_at = time.perf_counter()
+
+    accept_time = accepted_at - started
+    print(f"sent {len(latencies)} updates in {accept_time:.2f}s "
+          f"-> {len(latencies) / accept_time:.0f} updates/s accepted")
+    print(f"webhook latency: p50={statistics.median(latencies) * 1000:.1f}ms "
+          f"p99={percentile(latencies, 99) * 1000:.1f}ms")
+
+    if args.redis:
+        drained_at = await wait_drained(args.redis, args.workers, args.timeout)
+        total_time = drained_at - started
+        print(f"processed {len(latencies)} updates in {total_time:.2f}s "
+              f"-> {len(latencies) / total_time:.0f} updates/s end-to-end "
+              f"({args.workers} workers)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
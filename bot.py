@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 from aiogram import Bot, Dispatcher
 from aiogram.fsm.strategy import FSMStrategy
 from aiogram.enums import ParseMode
+from utils.startup_profiler import startup_timer, warm_up_modules
 from utils.rate_limiter import user_rate_limiter, global_rate_limiter
 
 # Начинаем настраивать логирование
@@ -23,17 +24,21 @@ logger = logging.getLogger(__name__)
 # Глобальные переменные
 dp = None
 bot = None
+# Фоновый прогрев тяжелых модулей (отменяется при остановке)
+warmup_task = None
 
 # Импортируем Redis (обязательная зависимость)
-from aiogram.fsm.storage.redis import RedisStorage, DefaultKeyBuilder
+from aiogram.fsm.storage.redis import RedisStorage
 import redis.asyncio as redis
 from aiogram.client.default import DefaultBotProperties
 from aiogram.types import Update, BotCommand
 from aiohttp import web
 from database.db import init_db, close_db, engine
+from utils.fsm_storage import create_redis_storage
 from sqlalchemy import text
 
 load_dotenv('.env')
+startup_timer.mark("module imports")
 
 # Validate required environment variables
 required_vars = {
@@ -76,7 +81,7 @@ CLOUDFLARE_API_TOKEN = os.getenv('CLOUDFLARE_API_TOKEN')
 
 # Initialize Redis storage
 redis_client = redis.from_url(REDIS_URL)
-storage = RedisStorage(redis_client, key_builder=DefaultKeyBuilder(with_bot_id=True))
+storage = create_redis_storage(redis_client)
 
 # FSM Strategy
 fsm_strategy = FSMStrategy.CHAT
@@ -96,6 +101,7 @@ async def setup_bot_commands(bot: Bot):
         BotCommand(command="progress", description="📊 Мой прогресс"),
         BotCommand(command="meal_plan", description="🍽️ План питания"),
         BotCommand(command="achievements", description="🏆 Достижения"),
+        BotCommand(command="leaderboard", description="🏅 Таблица лидеров"),
         BotCommand(command="ask", description="🤖 AI ассистент"),
         BotCommand(command="stats", description="📈 Статистика"),
         BotCommand(command="cancel", description="❌ Отмена")
@@ -107,7 +113,8 @@ async def on_startup(dispatcher: Dispatcher):
     logger.info("Starting NutriBuddy Bot...")
     
     # Инициализация базы данных
-    await init_db()
+    with startup_timer.phase("init_db"):
+        await init_db()
     logger.info("Database initialized")
     
     # Настройка команд бота
@@ -132,6 +139,20 @@ async def on_shutdown(dispatcher: Dispatcher):
     """Действия при остановке бота"""
     logger.info("Shutting down NutriBuddy Bot...")
     
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+        await asyncio.gather(warmup_task, return_exceptions=True)
+    
+    # Отложенные отметки напитков пишутся до закрытия пула, затем дорабатывают события
+    from services.drink_buffer import drink_write_buffer
+    from services.event_bus import event_bus
+    from services.delivery import delivery
+    from services.scheduler import scheduler
+    await scheduler.stop()
+    logger.info(f"[DELIVERY] {delivery.snapshot()}")
+    await drink_write_buffer.stop()
+    await event_bus.stop()
+    
     # Закрытие соединения с базой данных
     await close_db()
     logger.info("Database connection closed")
@@ -190,32 +211,64 @@ def register_handlers():
     logger.info("Rate limiting middleware enabled")
     logger.info("All handlers registered")
     
-async def schedule_reminders(reminder_service):
-    """Планировщик напоминаний"""
-    import asyncio
-    while True:
-        try:
-            await reminder_service.check_weekly_reminders()
-            await asyncio.sleep(6 * 3600)  # Проверка каждые 6 часов
-        except Exception as e:
-            logger.error(f"Error in reminder scheduler: {e}")
-            await asyncio.sleep(3600)  # При ошибке ждем 1 час
-
-    # Запуск фоновых задач
-    logger.info("Starting background tasks...")
-    
-    # Напоминания отключены
-    logger.info("Reminders disabled")
-
-async def create_app():
-    """Создание веб-приложения для webhook"""
+def setup_scheduler(storage):
+    """Фоновые задачи: еженедельные напоминания, нормы воды, чистка FSM и агентов"""
+    from services.reminder_service import ReminderService
+    from services.scheduler import scheduler
+    from services.weather import prefetch_active_cities
+    from services.weather_updater import update_all_users_water_goal
+    from utils.config import WEATHER_PREFETCH_INTERVAL
+    from utils.fsm_cleanup import FSMCleanupService
+
+    reminders = ReminderService(bot, redis_client if isinstance(storage, RedisStorage) else None)
+
+    async def weekly_reminders(tz_slice):
+        state = await reminders.check_weekly_reminders(tz_slice)
+        return state["sent"] + state["blocked"] + state["failed"]
+
+    async def agent_cleanup():
+        # Агенты живут в памяти процесса; модуль не загружен — агентов нет
+        agent_module = sys.modules.get("services.langchain_agent")
+        return await agent_module.cleanup_expired_agents() if agent_module else 0
+
+    # Местное время пользователя: задача запускается по срезам часовых поясов
+    scheduler.daily("weekly_reminders", "10:00", weekly_reminders, weekdays=(0,))
+    scheduler.daily("water_goal", "06:00", update_all_users_water_goal)
+    scheduler.every("weather_prefetch", WEATHER_PREFETCH_INTERVAL, prefetch_active_cities)
+    scheduler.every("agent_cleanup", 900, agent_cleanup, exclusive=False)
+    if isinstance(storage, RedisStorage):
+        cleanup = FSMCleanupService(storage)
+
+        async def fsm_cleanup():
+            progress = await cleanup.cleanup_all_expired_data(storage)
+            return progress["scanned"] if progress else 0
+
+        scheduler.every("fsm_cleanup", 300, fsm_cleanup)
+    return scheduler
+
+async def create_app(router=None, ready: asyncio.Event = None):
+    """
+    Создание веб-приложения для webhook.
+    /health отвечает сразу; апдейты, пришедшие до готовности диспетчера (ready),
+    ждут ее до WEBHOOK_READY_TIMEOUT секунд, иначе получают 503 и Telegram их повторит.
+    """
     app = web.Application()
+    ready_timeout = int(os.getenv('WEBHOOK_READY_TIMEOUT', '30'))
     
     # Регистрация webhook handlers
     async def handle_webhook(request):
         """Обработка webhook запросов"""
         if request.method == 'POST':
+            if ready is not None and not ready.is_set():
+                try:
+                    await asyncio.wait_for(ready.wait(), timeout=ready_timeout)
+                except asyncio.TimeoutError:
+                    return web.Response(status=503)
             update_data = await request.json()
+            if router:
+                # Режим кластера: апдейт уходит в очередь воркера своего чата
+                await router.route(update_data)
+                return web.Response(status=200)
             update = Update.model_validate(update_data, context={"bot": dp.bot})
             # Используем bot и update для aiogram 3.x
             await dp.feed_update(dp.bot, update)
@@ -224,64 +277,113 @@ async def create_app():
     
     app.router.add_post('/webhook', handle_webhook)
     app.router.add_get('/health', lambda request: web.Response(text='OK'))
-    
-    # Настройка webhook
-    if WEBHOOK_URL:
-        await dp.bot.set_webhook(
-            url=f"{WEBHOOK_URL}/webhook",
-            drop_pending_updates=True
-        )
-        logger.info(f"Webhook set to {WEBHOOK_URL}/webhook")
-    
-    app.on_startup.append(on_startup)
-    app.on_shutdown.append(on_shutdown)
     return app
 
-async def main():
-    """Главная функция"""
-    global dp, bot
-
-    # Запуск миграций
-    from database.migrations import run_migrations
-    await run_migrations()
+async def start_web_app(app: web.Application) -> web.AppRunner:
+    """Запуск HTTP-сервера (после этого /health уже отвечает)"""
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '0.0.0.0', int(os.getenv('PORT', 8080)))
+    await site.start()
+    logger.info(f"Webhook server started on port {os.getenv('PORT', 8080)}")
+    startup_timer.mark("/health ready")
+    return runner
+
+async def set_webhook():
+    """Настройка webhook"""
+    await bot.set_webhook(
+        url=f"{WEBHOOK_URL}/webhook",
+        drop_pending_updates=True
+    )
+    logger.info(f"Webhook set to {WEBHOOK_URL}/webhook")
 
+def create_bot() -> Bot:
+    """Создание экземпляра бота"""
     # Валидация токена только в production
     validate_token = os.getenv('RAILWAY_ENVIRONMENT') == 'production'
 
-    bot = Bot(
+    return Bot(
         token=TOKEN,
         default=DefaultBotProperties(parse_mode=ParseMode.HTML),
         validate_token=validate_token
     )
 
-    # Redis storage для FSM (обязательный) c fallback
+def create_storage():
+    """Redis storage для FSM (обязательный) c fallback"""
     try:
         redis_client = redis.from_url(REDIS_URL)
-        storage = RedisStorage(redis_client, key_builder=DefaultKeyBuilder(with_bot_id=True))
+        storage = create_redis_storage(redis_client)
         logger.info("Redis storage initialized")
     except Exception as e:
         logger.error(f"Failed to initialize Redis storage: {e}")
         logger.info("Falling back to memory storage (not recommended for production)")
         from aiogram.fsm.storage.memory import MemoryStorage
         storage = MemoryStorage()
+    return storage
+
+async def setup_dispatcher():
+    """Миграции, создание бота и диспетчера, регистрация обработчиков"""
+    global dp, bot
+
+    # Запуск миграций
+    from database.migrations import run_migrations
+    with startup_timer.phase("migrations"):
+        await run_migrations()
+
+    bot = create_bot()
+    storage = create_storage()
 
     dp = Dispatcher(storage=storage, fsm_strategy=FSMStrategy.CHAT)
     dp.bot = bot
 
     # Регистрация обработчиков
-    register_handlers()
+    with startup_timer.phase("register handlers"):
+        register_handlers()
+
+    # Лимиты исходящих запросов и счетчик вызовов API на апдейт
+    from services.delivery import delivery
+    delivery.install(bot, dp)
+
+    # Шина событий: достижения и уведомления обрабатываются вне ответа пользователю
+    from services.event_bus import event_bus
+    from services.event_consumers import register_consumers
+    register_consumers(event_bus, bot)
+    await event_bus.start(redis_client if isinstance(storage, RedisStorage) else None)
+    if isinstance(storage, RedisStorage):
+        from services.goal_bitmaps import goal_bitmaps
+        from services.leaderboard import leaderboard
+        from services.weather import weather_cache
+        leaderboard.bind(redis_client)
+        goal_bitmaps.bind(redis_client)
+        weather_cache.bind(redis_client)
+
+    # Отложенная запись напитков (нужен Redis для потока)
+    from utils.config import DRINK_WRITE_BEHIND
+    if DRINK_WRITE_BEHIND and isinstance(storage, RedisStorage):
+        from services.drink_buffer import drink_write_buffer
+        await drink_write_buffer.start(redis_client)
+
+    await setup_scheduler(storage).start(redis_client if isinstance(storage, RedisStorage) else None)
 
+async def main():
+    """Главная функция"""
+    global warmup_task
     # Запуск в зависимости от режима
     if WEBHOOK_URL:
-        # Режим webhook
-        app = await create_app()
-        runner = web.AppRunner(app)
-        await runner.setup()
-        site = web.TCPSite(runner, '0.0.0.0', int(os.getenv('PORT', 8080)))
-        await site.start()
-        logger.info(f"Webhook server started on port {os.getenv('PORT', 8080)}")
+        # Режим webhook: сначала поднимаем HTTP-сервер, чтобы /health ответил сразу
+        ready = asyncio.Event()
+        runner = await start_web_app(await create_app(ready=ready))
         
         try:
+            await setup_dispatcher()
+            await on_startup(dp)
+            await set_webhook()
+            ready.set()
+            startup_timer.mark("webhook ready")
+            
+            # Тяжелые подсистемы прогреваются в фоне
+            warmup_task = asyncio.create_task(warm_up_modules())
+            
             # Бесконечный цикл для поддержания работы
             while True:
                 await asyncio.sleep(3600)  # Проверка каждую секунду
@@ -292,7 +394,10 @@ async def main():
             await on_shutdown(dp)
     else:
         # Режим polling
+        await setup_dispatcher()
         await on_startup(dp)
+        startup_timer.mark("polling ready")
+        warmup_task = asyncio.create_task(warm_up_modules())
         try:
             await dp.start_polling(
                 drop_pending_updates=True,
@@ -303,6 +408,122 @@ async def main():
         finally:
             await on_shutdown(dp)
 
+async def run_cluster_worker(shard: int, workers: int):
+    """Процесс-воркер кластера: обрабатывает апдейты своего шарда"""
+    import signal
+    from utils.cluster import ShardWorker
+    from utils.config import DRINK_WRITE_BEHIND, OUTBOUND_RATE
+    from services.delivery import delivery
+    from services.drink_buffer import drink_write_buffer
+    from services.event_bus import event_bus
+    from services.event_consumers import register_consumers
+    from services.goal_bitmaps import goal_bitmaps
+    from services.leaderboard import leaderboard
+    from services.weather import weather_cache
+    global dp, bot
+
+    bot = create_bot()
+    storage = create_storage()
+
+    dp = Dispatcher(storage=storage, fsm_strategy=FSMStrategy.CHAT)
+    dp.bot = bot
+    register_handlers()
+    # Лимит Telegram на бота общий для воркеров (токены в Redis); без Redis — доля воркера
+    delivery.configure(rate=OUTBOUND_RATE, redis_client=redis_client, share=workers)
+    delivery.install(bot, dp)
+
+    async def handle_update(update_data):
+        update = Update.model_validate(update_data, context={"bot": bot})
+        await dp.feed_update(bot, update)
+
+    worker = ShardWorker(redis_client, shard, handle_update)
+
+    register_consumers(event_bus, bot)
+    await event_bus.start(redis_client)
+    leaderboard.bind(redis_client)
+    goal_bitmaps.bind(redis_client)
+    weather_cache.bind(redis_client)
+
+    # Поток отложенных записей свой у воркера; потоки упавших воркеров дописывают живые
+    if DRINK_WRITE_BEHIND:
+        await drink_write_buffer.start(redis_client)
+
+    # Планировщик работает на каждом воркере, каждый запуск забирает один из них
+    scheduler = setup_scheduler(storage)
+    await scheduler.start(redis_client)
+    worker_task = asyncio.create_task(worker.run())
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    await stop_event.wait()
+    logger.info(f"Worker {shard} received shutdown signal")
+
+    await worker.stop()
+    worker_task.cancel()
+    await asyncio.gather(worker_task, return_exceptions=True)
+
+    await scheduler.stop()
+    logger.info(f"[DELIVERY] Worker {shard}: {delivery.snapshot()}")
+
+    await drink_write_buffer.stop()
+    await event_bus.stop()
+    await bot.session.close()
+    await close_db()
+    await redis_client.close()
+
+def cluster_worker_entry(shard: int, workers: int):
+    """Точка входа процесса-воркера"""
+    try:
+        asyncio.run(run_cluster_worker(shard, workers))
+    except KeyboardInterrupt:
+        pass
+
+async def cluster_main(workers: int):
+    """Супервизор: webhook + маршрутизация апдейтов по воркерам"""
+    from utils.cluster import Supervisor, UpdateRouter
+    global dp, bot
+
+    router = UpdateRouter(redis_client, workers)
+    runner = await start_web_app(await create_app(router=router))
+
+    # Миграции выполняет только супервизор, до запуска воркеров
+    from database.migrations import run_migrations
+    with startup_timer.phase("migrations"):
+        await run_migrations()
+
+    bot = create_bot()
+    dp = Dispatcher(storage=create_storage(), fsm_strategy=FSMStrategy.CHAT)
+    dp.bot = bot
+
+    supervisor = Supervisor(workers, cluster_worker_entry)
+
+    try:
+        await on_startup(dp)
+        await set_webhook()
+        supervisor.start()
+        logger.info(f"Cluster supervisor started with {workers} workers")
+        logger.info(startup_timer.report())
+        await supervisor.watch()
+    except (KeyboardInterrupt, SystemExit, asyncio.CancelledError):
+        logger.info("Received shutdown signal")
+    finally:
+        await runner.cleanup()
+        supervisor.stop()
+        await on_shutdown(dp)
+
+def run_cluster(workers: int):
+    """Запуск в режиме кластера (webhook + N процессов)"""
+    try:
+        asyncio.run(cluster_main(workers))
+    except KeyboardInterrupt:
+        logger.info("Bot stopped by user")
+    except Exception as e:
+        logger.error(f"Bot crashed: {e}")
+        raise
+
 def run_polling():
     """Запуск в режиме polling"""
     try:
@@ -325,7 +546,11 @@ def run_webhook():
 
 if __name__ == "__main__":
     # Проверка режима запуска
-    if WEBHOOK_URL:
+    from utils.cluster import BOT_WORKERS
+    if WEBHOOK_URL and BOT_WORKERS > 1:
+        logger.info(f"Starting in cluster mode with {BOT_WORKERS} workers")
+        run_cluster(BOT_WORKERS)
+    elif WEBHOOK_URL:
         logger.info("Starting in webhook mode")
         run_webhook()
     else:
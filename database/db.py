@@ -2,9 +2,11 @@
 Подключение к базе данных NutriBuddy.
 Гарантирует создание недостающих колонок и приводит типы к BIGINT через синхронный SQL-запрос.
 """
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from contextlib import asynccontextmanager
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncConnection, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from sqlalchemy import text
+from typing import Optional
 import os
 import logging
 
@@ -32,6 +34,16 @@ engine = create_async_engine(
     poolclass=None if "sqlite" in DATABASE_URL else None,
 )
 
+if engine.dialect.name == "sqlite":
+    from sqlalchemy import event
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        """SQLite проверяет внешние ключи только с PRAGMA foreign_keys=ON на каждом соединении"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 # Создание фабрики сессий
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -64,9 +76,45 @@ def get_session() -> DatabaseSession:
     """Получить сессию базы данных"""
     return DatabaseSession()
 
+@asynccontextmanager
+async def begin_or_reuse(conn: Optional[AsyncConnection] = None):
+    """Использует переданное соединение (общая транзакция миграций) или открывает новую транзакцию"""
+    if conn is not None:
+        yield conn
+    else:
+        async with engine.begin() as new_conn:
+            yield new_conn
+
+# Колонки таблицы users, которые добавляются к старым схемам
+USERS_COLUMNS = [
+    ("daily_activity_goal", "INTEGER DEFAULT 300"),
+    ("neck_cm", "FLOAT"),
+    ("waist_cm", "FLOAT"),
+    ("hip_cm", "FLOAT"),
+    ("wrist_cm", "FLOAT"),
+    ("bicep_cm", "FLOAT"),
+    ("chest_cm", "FLOAT"),
+    ("forearm_cm", "FLOAT"),
+    ("calf_cm", "FLOAT"),
+    ("shoulder_width_cm", "FLOAT"),
+    ("hip_width_cm", "FLOAT"),
+    ("goal_weight", "FLOAT"),
+    ("last_bodyfat", "FLOAT"),
+    ("last_muscle_mass", "FLOAT"),
+    ("last_body_water", "FLOAT"),
+    ("reminder_enabled", "BOOLEAN DEFAULT TRUE"),
+    ("timezone", "VARCHAR(50) DEFAULT 'UTC'")
+]
+
 async def init_db():
     """Инициализация базы данных"""
     try:
+        # Схема уже соответствует коду - пропускаем DDL и проверку колонок
+        from database.schema_state import schema_is_current
+        if await schema_is_current():
+            logger.info("[DB] Схема актуальна, инициализация пропущена")
+            return
+        
         # Создаем таблицы
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
@@ -85,31 +133,18 @@ async def close_db():
     await engine.dispose()
     logger.info("[DB] Соединение с БД закрыто")
 
-async def ensure_columns_exist():
-    """Проверяет и создает недостающие колонки в таблице users"""
+async def ensure_columns_exist(conn: Optional[AsyncConnection] = None):
+    """
+    Проверяет и создает недостающие колонки в таблице users.
+    С conn (общая транзакция миграций) ошибка пробрасывается: иначе отпечаток
+    схемы сохранится, и неудавшийся шаг больше не повторится.
+    """
+    in_migration = conn is not None
     try:
         # Список колонок для проверки и добавления
-        columns_to_add = [
-            ("daily_activity_goal", "INTEGER DEFAULT 300"),
-            ("neck_cm", "FLOAT"),
-            ("waist_cm", "FLOAT"),
-            ("hip_cm", "FLOAT"),
-            ("wrist_cm", "FLOAT"),
-            ("bicep_cm", "FLOAT"),
-            ("chest_cm", "FLOAT"),
-            ("forearm_cm", "FLOAT"),
-            ("calf_cm", "FLOAT"),
-            ("shoulder_width_cm", "FLOAT"),
-            ("hip_width_cm", "FLOAT"),
-            ("goal_weight", "FLOAT"),
-            ("last_bodyfat", "FLOAT"),
-            ("last_muscle_mass", "FLOAT"),
-            ("last_body_water", "FLOAT"),
-            ("reminder_enabled", "BOOLEAN DEFAULT TRUE"),
-            ("timezone", "VARCHAR(50) DEFAULT 'UTC'")
-        ]
+        columns_to_add = USERS_COLUMNS
         
-        async with engine.begin() as conn:
+        async with begin_or_reuse(conn) as conn:
             # Получаем существующие колонки
             if "postgresql" in DATABASE_URL:
                 result = await conn.execute(text("""
@@ -154,7 +189,9 @@ async def ensure_columns_exist():
         
     except Exception as e:
         logger.error(f"[DB] Ошибка при проверке колонок: {e}")
-        # Не прерываем работу, если не удалось добавить колонки
+        if in_migration:
+            raise
+        # Вне миграций не прерываем работу, если не удалось добавить колонки
 
 async def execute_raw_sql(query: str, params: dict = None):
     """Выполнить произвольный SQL-запрос"""
@@ -344,6 +381,7 @@ __all__ = [
     'init_db',
     'close_db',
     'ensure_columns_exist',
+    'begin_or_reuse',
     'execute_raw_sql',
     'get_table_info',
     'check_database_health',
@@ -0,0 +1,177 @@
+"""
+Пакетная запись приемов пищи и напитков.
+
+Строки считаются заранее и вставляются одним INSERT ... VALUES (...), (...)
+RETURNING через Core: без ORM-объектов, identity map и отдельной загрузки
+пользователя (user_id — telegram_id, его проверяет внешний ключ). В PostgreSQL
+вставка — CTE, и тот же запрос возвращает суммы за локальные сутки
+пользователя: один round trip на прием пищи. В SQLite суммы читаются вторым
+запросом в той же транзакции.
+"""
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Table, func, insert, select, true
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from database.db import begin_or_reuse
+from database.models import DrinkEntry, FoodEntry
+from utils.timezone_utils import local_day_bounds
+
+logger = logging.getLogger(__name__)
+
+# Колонки, по которым считаются дневные суммы
+FOOD_TOTALS = ("calories", "protein", "fat", "carbs")
+DRINK_TOTALS = ("amount", "calories")
+
+
+def utc_now() -> datetime:
+    """Текущее время UTC без tzinfo — в таком виде created_at хранится в колонках DateTime"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def utc_day_bounds(user_timezone: Optional[str], now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """Границы текущих локальных суток пользователя в UTC без tzinfo: [начало, конец)"""
+    _, start, end = local_day_bounds([user_timezone], now=now)[0]
+    return start.replace(tzinfo=None), end.replace(tzinfo=None)
+
+
+async def _insert_with_totals(
+    table: Table,
+    rows: Sequence[Dict[str, Any]],
+    user_id: int,
+    totals: Sequence[str],
+    user_timezone: Optional[str],
+    conn: Optional[AsyncConnection],
+) -> Dict[str, Any]:
+    """Вставка строк и суммы totals за сутки: {"ids": [...], "daily_totals": {...}}"""
+    start, end = utc_day_bounds(user_timezone)
+    today = (table.c.user_id == user_id) & (table.c.created_at >= start) & (table.c.created_at < end)
+    returned = [table.c[column] for column in totals]
+    statement = insert(table).values(list(rows)).returning(table.c.id, *returned)
+
+    async with begin_or_reuse(conn) as connection:
+        if connection.dialect.name == "postgresql":
+            # Внешний SELECT не видит строки из CTE: суммы «до вставки» + вставленные строки
+            inserted = statement.cte("inserted")
+            before = select(
+                *(func.coalesce(func.sum(table.c[column]), 0).label(f"day_{column}") for column in totals),
+                func.count().label("day_entries"),
+            ).where(today).subquery("before")
+            result = await connection.execute(
+                select(inserted, before).select_from(inserted.join(before, true()))
+            )
+            records = result.mappings().all()
+            first = records[0] if records else {}
+            daily = {column: float(first.get(f"day_{column}", 0)) for column in totals}
+            for record in records:
+                for column in totals:
+                    daily[column] += record[column] or 0
+            daily["entries"] = first.get("day_entries", 0) + len(records)
+        else:
+            result = await connection.execute(statement)
+            records = result.mappings().all()
+            result = await connection.execute(select(
+                *(func.coalesce(func.sum(table.c[column]), 0).label(column) for column in totals),
+                func.count().label("entries"),
+            ).where(today))
+            summary = result.mappings().one()
+            daily = {column: float(summary[column]) for column in totals}
+            daily["entries"] = summary["entries"]
+
+    return {"ids": [record["id"] for record in records], "daily_totals": daily}
+
+
+async def insert_food_entries(
+    user_id: int,
+    rows: Sequence[Dict[str, Any]],
+    user_timezone: Optional[str] = None,
+    conn: Optional[AsyncConnection] = None,
+) -> Dict[str, Any]:
+    """
+    Вставляет строки food_entries одним запросом. Возвращает id новых строк
+    и КБЖУ за сутки вместе с ними: {"ids", "daily_totals": {calories, protein,
+    fat, carbs, entries}}. Неизвестный user_id — IntegrityError.
+    """
+    if not rows:
+        return {"ids": [], "daily_totals": {}}
+    result = await _insert_with_totals(FoodEntry.__table__, rows, user_id, FOOD_TOTALS, user_timezone, conn)
+    logger.debug(f"[MEAL_WRITE] food_entries: {len(rows)} строк для {user_id}")
+    return result
+
+
+async def insert_drink_entries(
+    user_id: int,
+    rows: Sequence[Dict[str, Any]],
+    user_timezone: Optional[str] = None,
+    conn: Optional[AsyncConnection] = None,
+) -> Dict[str, Any]:
+    """Как insert_food_entries для drink_entries; суммы — {amount, calories, entries}"""
+    if not rows:
+        return {"ids": [], "daily_totals": {}}
+    result = await _insert_with_totals(DrinkEntry.__table__, rows, user_id, DRINK_TOTALS, user_timezone, conn)
+    logger.debug(f"[MEAL_WRITE] drink_entries: {len(rows)} строк для {user_id}")
+    return result
+
+
+async def insert_drink_rows(rows: Sequence[Dict[str, Any]], conn: Optional[AsyncConnection] = None) -> List[int]:
+    """
+    Строки drink_entries разных пользователей одним INSERT ... RETURNING id, без
+    дневных сумм. Строки с write_id, который уже есть в таблице, пропускаются
+    (повторная запись из потока после сбоя не дублирует напитки)
+    """
+    if not rows:
+        return []
+    table = DrinkEntry.__table__
+    async with begin_or_reuse(conn) as connection:
+        if connection.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif connection.dialect.name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            dialect_insert = None
+        if dialect_insert is not None:
+            statement = dialect_insert(table).values(list(rows)).on_conflict_do_nothing(
+                index_elements=[table.c.write_id]
+            )
+        else:
+            statement = insert(table).values(list(rows))
+        result = await connection.execute(statement.returning(table.c.id))
+        return [row[0] for row in result]
+
+
+def food_row(user_id: int, name: str, nutrition: Dict[str, float], meal_type: str,
+             quantity: float, unit: str = 'г', created_at: Optional[datetime] = None) -> Dict[str, Any]:
+    """Строка food_entries со всеми колонками (у многострочного VALUES набор ключей общий)"""
+    return {
+        "user_id": user_id,
+        "food_name": name,
+        "calories": nutrition.get("calories", 0) or 0,
+        "protein": nutrition.get("protein", 0) or 0,
+        "fat": nutrition.get("fat", 0) or 0,
+        "carbs": nutrition.get("carbs", 0) or 0,
+        "fiber": nutrition.get("fiber", 0) or 0,
+        "sugar": nutrition.get("sugar", 0) or 0,
+        "sodium": nutrition.get("sodium", 0) or 0,
+        "meal_type": meal_type,
+        "quantity": quantity,
+        "unit": unit,
+        "created_at": created_at or utc_now(),
+    }
+
+
+def drink_row(user_id: int, name: str, amount_ml: float, calories: float = 0,
+              created_at: Optional[datetime] = None) -> Dict[str, Any]:
+    """Строка drink_entries со всеми колонками"""
+    return {
+        "user_id": user_id,
+        "drink_name": name,
+        "amount": amount_ml,
+        "calories": calories or 0,
+        "sugar": 0,
+        "caffeine": 0,
+        "created_at": created_at or utc_now(),
+        "write_id": None,
+    }
+
@@ -1,31 +1,48 @@
 # Миграции базы данных
 
 async def run_migrations():
-    """Запуск всех миграций базы данных"""
+    """Запуск всех миграций базы данных (пропускается, если отпечаток схемы совпадает)"""
     import logging
+    from database.db import ensure_columns_exist
+    from database.schema_state import migrate_if_needed
     from .create_all_tables import create_all_tables
     from .upgrade_to_drink_entries import upgrade
     from .add_all_missing_columns import add_missing_columns
+    from .add_indexes import add_missing_indexes
+    from .achievement_codes import convert_achievement_ids
     
     logger = logging.getLogger(__name__)
     
-    try:
+    async def apply(conn):
         # 0. Создание всех таблиц если их нет
         logger.info("🔄 Создаем все таблицы...")
-        await create_all_tables()
+        await create_all_tables(conn)
         logger.info("✅ Все таблицы созданы!")
         
         # 1. Миграция water_entries → drink_entries
         logger.info("🔄 Запускаем миграцию water_entries → drink_entries...")
-        await upgrade()
+        await upgrade(conn)
         logger.info("✅ Миграция water_entries завершена!")
         
         # 2. Добавление недостающих колонок во все таблицы
         logger.info("🔄 Добавляем недостающие колонки во все таблицы...")
-        await add_missing_columns()
+        await add_missing_columns(conn)
+        await ensure_columns_exist(conn)
         logger.info("✅ Все колонки добавлены!")
         
-        logger.info("✅ Все миграции успешно завершены!")
+        # 3. Индексы моделей на уже существующих таблицах (create_all их не добавляет)
+        logger.info("🔄 Добавляем недостающие индексы...")
+        await add_missing_indexes(conn)
+        logger.info("✅ Все индексы добавлены!")
+        
+        # 4. Коды достижений вместо ссылки на таблицу achievements
+        logger.info("🔄 Переводим user_achievements.achievement_id на коды достижений...")
+        await convert_achievement_ids(conn)
+        logger.info("✅ Коды достижений сохранены!")
+    
+    try:
+        if await migrate_if_needed(apply):
+            logger.info("✅ Все миграции успешно завершены!")
         
     except Exception as e:
         logger.error(f"❌ Ошибка при миграции: {e}")
@@ -0,0 +1,28 @@
+"""
+Миграция: user_achievements.achievement_id хранит код достижения (строку
+из utils/gamification.py) вместо ссылки на таблицу achievements.
+"""
+import logging
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from database.db import begin_or_reuse
+
+logger = logging.getLogger(__name__)
+
+
+async def convert_achievement_ids(conn: Optional[AsyncConnection] = None):
+    """Снимает внешний ключ и переводит achievement_id в VARCHAR(50) (PostgreSQL)"""
+    async with begin_or_reuse(conn) as conn:
+        if conn.dialect.name != "postgresql":
+            # SQLite хранит строку в колонке любого типа, менять нечего
+            return
+        await conn.execute(text(
+            "ALTER TABLE user_achievements "
+            "DROP CONSTRAINT IF EXISTS user_achievements_achievement_id_fkey"
+        ))
+        await conn.execute(text(
+            "ALTER TABLE user_achievements "
+            "ALTER COLUMN achievement_id TYPE VARCHAR(50) USING achievement_id::text"
+        ))
+    logger.info("✅ user_achievements.achievement_id хранит коды достижений")
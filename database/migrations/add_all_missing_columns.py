@@ -4,67 +4,68 @@
 """
 import asyncio
 import logging
+from typing import Optional
 from sqlalchemy import text
-from database.db import get_session
+from sqlalchemy.ext.asyncio import AsyncConnection
+from database.db import engine, begin_or_reuse
 
 logger = logging.getLogger(__name__)
 
-async def add_missing_columns():
+# Определения колонок для каждой таблицы
+TABLES_COLUMNS = {
+    'weight_entries': [
+        ("body_fat", "FLOAT"),
+        ("muscle_mass", "FLOAT"), 
+        ("body_water", "FLOAT")
+    ],
+    'food_entries': [
+        ("fiber", "FLOAT DEFAULT 0"),
+        ("sugar", "FLOAT DEFAULT 0"),
+        ("sodium", "FLOAT DEFAULT 0"),
+        ("meal_type", "VARCHAR(20) NOT NULL DEFAULT 'snack'"),
+        ("quantity", "FLOAT DEFAULT 1"),
+        ("unit", "VARCHAR(20) DEFAULT 'шт'")
+    ],
+    'drink_entries': [
+        ("sugar", "FLOAT DEFAULT 0"),
+        ("caffeine", "FLOAT DEFAULT 0"),
+        ("write_id", "VARCHAR(128)")
+    ],
+    'activity_entries': [
+        ("distance", "FLOAT"),
+        ("intensity", "VARCHAR(20) DEFAULT 'moderate'")
+    ],
+    'users': [
+        ("daily_activity_goal", "INTEGER DEFAULT 300"),
+        ("neck_cm", "FLOAT"),
+        ("waist_cm", "FLOAT"), 
+        ("hip_cm", "FLOAT"),
+        ("wrist_cm", "FLOAT"),
+        ("bicep_cm", "FLOAT"),
+        ("chest_cm", "FLOAT"),
+        ("forearm_cm", "FLOAT"),
+        ("calf_cm", "FLOAT"),
+        ("shoulder_width_cm", "FLOAT"),
+        ("hip_width_cm", "FLOAT"),
+        ("goal_weight", "FLOAT"),
+        ("created_at", "TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP"),
+        ("updated_at", "TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP")
+    ]
+}
+
+async def add_missing_columns(conn: Optional[AsyncConnection] = None):
     """Добавляет недостающие колонки во все таблицы"""
+    tables_columns = TABLES_COLUMNS
     
-    # Определения колонок для каждой таблицы
-    tables_columns = {
-        'weight_entries': [
-            ("body_fat", "FLOAT"),
-            ("muscle_mass", "FLOAT"), 
-            ("body_water", "FLOAT")
-        ],
-        'food_entries': [
-            ("fiber", "FLOAT DEFAULT 0"),
-            ("sugar", "FLOAT DEFAULT 0"),
-            ("sodium", "FLOAT DEFAULT 0"),
-            ("meal_type", "VARCHAR(20) NOT NULL DEFAULT 'snack'"),
-            ("quantity", "FLOAT DEFAULT 1"),
-            ("unit", "VARCHAR(20) DEFAULT 'шт'")
-        ],
-        'drink_entries': [
-            ("sugar", "FLOAT DEFAULT 0"),
-            ("caffeine", "FLOAT DEFAULT 0")
-        ],
-        'activity_entries': [
-            ("distance", "FLOAT"),
-            ("intensity", "VARCHAR(20) DEFAULT 'moderate'")
-        ],
-        'users': [
-            ("daily_activity_goal", "INTEGER DEFAULT 300"),
-            ("neck_cm", "FLOAT"),
-            ("waist_cm", "FLOAT"), 
-            ("hip_cm", "FLOAT"),
-            ("wrist_cm", "FLOAT"),
-            ("bicep_cm", "FLOAT"),
-            ("chest_cm", "FLOAT"),
-            ("forearm_cm", "FLOAT"),
-            ("calf_cm", "FLOAT"),
-            ("shoulder_width_cm", "FLOAT"),
-            ("hip_width_cm", "FLOAT"),
-            ("goal_weight", "FLOAT"),
-            ("created_at", "TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP"),
-            ("updated_at", "TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP")
-        ]
-    }
-    
-    from database.db import AsyncSessionLocal
-    async with AsyncSessionLocal() as session:
-        try:
-            from database.db import engine
-            
+    try:
+        async with begin_or_reuse(conn) as conn:
             # Получаем существующие колонки для всех таблиц
             existing_columns = {}
             
             if engine.dialect.name == 'postgresql':
                 # PostgreSQL
                 for table_name in tables_columns.keys():
-                    result = await session.execute(text(f"""
+                    result = await conn.execute(text(f"""
                         SELECT column_name 
                         FROM information_schema.columns 
                         WHERE table_name = '{table_name}' 
@@ -74,7 +75,7 @@ async def add_missing_columns():
             else:
                 # SQLite
                 for table_name in tables_columns.keys():
-                    result = await session.execute(text(f"PRAGMA table_info({table_name})"))
+                    result = await conn.execute(text(f"PRAGMA table_info({table_name})"))
                     existing_columns[table_name] = {row[1] for row in result.fetchall()}
             
             # Добавляем недостающие колонки
@@ -95,18 +96,16 @@ async def add_missing_columns():
                                 ADD COLUMN {column_name} {column_type}
                             """
                         
-                        await session.execute(text(alter_sql))
+                        await conn.execute(text(alter_sql))
                         logger.info(f"✅ Добавлена колонка {column_name} в таблицу {table_name}")
                     else:
                         logger.info(f"ℹ️ Колонка {column_name} уже существует в таблице {table_name}")
-            
-            await session.commit()
-            logger.info("✅ Все миграции завершены успешно")
-            
-        except Exception as e:
-            logger.error(f"❌ Ошибка при выполнении миграции: {e}")
-            await session.rollback()
-            raise
+        
+        logger.info("✅ Все миграции завершены успешно")
+        
+    except Exception as e:
+        logger.error(f"❌ Ошибка при выполнении миграции: {e}")
+        raise
 
 if __name__ == "__main__":
     asyncio.run(add_missing_columns())
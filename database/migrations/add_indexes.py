@@ -0,0 +1,24 @@
+"""
+Миграция: индексы моделей на уже существующих таблицах.
+Base.metadata.create_all создает индексы только вместе с новой таблицей.
+"""
+import logging
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncConnection
+from database.db import Base, begin_or_reuse
+
+logger = logging.getLogger(__name__)
+
+
+async def add_missing_indexes(conn: Optional[AsyncConnection] = None):
+    """Создает индексы из моделей, которых еще нет в БД"""
+    import database.models  # noqa: F401 - регистрирует таблицы в Base.metadata
+
+    def create(sync_conn):
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(sync_conn, checkfirst=True)
+
+    async with begin_or_reuse(conn) as conn:
+        await conn.run_sync(create)
+    logger.info("✅ Индексы моделей проверены")
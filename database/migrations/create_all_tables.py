@@ -4,15 +4,17 @@
 """
 import asyncio
 import logging
-from database.db import Base, engine
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncConnection
+from database.db import Base, begin_or_reuse
 
 logger = logging.getLogger(__name__)
 
-async def create_all_tables():
+async def create_all_tables(conn: Optional[AsyncConnection] = None):
     """Создает все таблицы согласно моделям"""
     try:
         # Создаем все таблицы
-        async with engine.begin() as conn:
+        async with begin_or_reuse(conn) as conn:
             await conn.run_sync(Base.metadata.create_all)
         
         logger.info("✅ Все таблицы успешно созданы")
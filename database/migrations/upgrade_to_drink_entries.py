@@ -1,10 +1,12 @@
 """
 Миграция для создания таблицы drink_entries
 """
+from typing import Optional
 from sqlalchemy import text
-from database.db import engine
+from sqlalchemy.ext.asyncio import AsyncConnection
+from database.db import engine, begin_or_reuse
 
-async def upgrade():
+async def upgrade(conn: Optional[AsyncConnection] = None):
     """Создание таблицы drink_entries с миграцией данных"""
     
     # Импортируем engine и DATABASE_URL для актуального состояния
@@ -26,7 +28,7 @@ async def upgrade():
     logger.info(f"[MIGRATION] DATABASE_URL contains postgresql: {is_postgresql}")
     logger.info(f"[MIGRATION] DATABASE_URL length: {len(DATABASE_URL)}")
     
-    async with engine.begin() as conn:
+    async with begin_or_reuse(conn) as conn:
         # Сначала проверяем и исправляем таблицу drink_entries если она существует без нужных колонок
         try:
             if is_postgresql:
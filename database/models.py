@@ -2,7 +2,7 @@
 Модели данных NutriBuddy Bot
 Базовые модели для работы с базой данных через SQLAlchemy
 """
-from sqlalchemy import Column, Integer, BigInteger, String, Float, DateTime, ForeignKey, Boolean, Text
+from sqlalchemy import Column, Integer, BigInteger, String, Float, DateTime, ForeignKey, Boolean, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 
@@ -105,10 +105,17 @@ class DrinkEntry(Base):
     sugar = Column(Float, default=0)
     caffeine = Column(Float, default=0)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    # Запись потока отложенных записей (процесс/id), из которой пришла строка
+    write_id = Column(String(128), nullable=True)
     
     # Связь с пользователем
     user = relationship("User", back_populates="drink_entries")
 
+    # Повторная запись из потока (recover после сбоя XDEL) не создает дублей
+    __table_args__ = (
+        Index('uq_drink_entries_write_id', 'write_id', unique=True),
+    )
+
 class WeightEntry(Base):
     __tablename__ = 'weight_entries'
 
@@ -123,6 +130,11 @@ class WeightEntry(Base):
     # Связь с пользователем
     user = relationship("User", back_populates="weight_entries")
 
+    # Выборка еженедельных напоминаний: NOT EXISTS по весу пользователя за неделю
+    __table_args__ = (
+        Index('idx_weight_entries_user_created', 'user_id', 'created_at'),
+    )
+
 class ActivityEntry(Base):
     __tablename__ = 'activity_entries'
 
@@ -170,12 +182,11 @@ class UserAchievement(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(BigInteger, ForeignKey('users.telegram_id'), nullable=False)
-    achievement_id = Column(Integer, ForeignKey('achievements.id'), nullable=False)
+    achievement_id = Column(String(50), nullable=False)  # код достижения из utils/gamification.py
     earned_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     
     # Связи
     user = relationship("User", back_populates="achievements")
-    achievement = relationship("Achievement")
 
 class MealPlan(Base):
     __tablename__ = 'meal_plans'
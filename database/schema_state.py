@@ -0,0 +1,111 @@
+"""
+Отпечаток схемы БД.
+Если сохраненный в БД отпечаток совпадает с вычисленным по коду, старт пропускает
+миграции, DDL и чтение information_schema. Иначе миграции выполняются в одной
+транзакции под advisory lock (PostgreSQL), чтобы несколько реплик не мешали друг другу.
+"""
+import hashlib
+import logging
+import os
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from database.db import Base, engine, USERS_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Увеличивать при изменении миграций данных (не отражающихся в моделях и списках колонок)
+SCHEMA_REVISION = "2"
+
+# Ключ advisory lock для миграций (любое фиксированное число)
+MIGRATION_LOCK_ID = 7_461_003_001
+
+_fingerprint: Optional[str] = None
+
+
+def compute_schema_fingerprint() -> str:
+    """SHA-256 от описания моделей, списков добавляемых колонок и ревизии миграций"""
+    global _fingerprint
+    if _fingerprint is not None:
+        return _fingerprint
+
+    import database.models  # noqa: F401 - регистрирует таблицы в Base.metadata
+    from database.migrations.add_all_missing_columns import TABLES_COLUMNS
+
+    parts = [f"revision={SCHEMA_REVISION}"]
+    for table in sorted(Base.metadata.tables.values(), key=lambda t: t.name):
+        for column in table.columns:
+            parts.append(f"{table.name}.{column.name}:{column.type}:"
+                         f"{column.nullable}:{column.primary_key}")
+    for table_name in sorted(TABLES_COLUMNS):
+        for column_name, column_def in TABLES_COLUMNS[table_name]:
+            parts.append(f"+{table_name}.{column_name}:{column_def}")
+    for column_name, column_def in USERS_COLUMNS:
+        parts.append(f"+users.{column_name}:{column_def}")
+
+    _fingerprint = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+    return _fingerprint
+
+
+def _force_migrate() -> bool:
+    return os.getenv('SCHEMA_FORCE_MIGRATE', '').lower() in ('1', 'true', 'yes')
+
+
+async def _read_fingerprint(conn: AsyncConnection) -> Optional[str]:
+    result = await conn.execute(text("SELECT fingerprint FROM schema_fingerprint WHERE id = 1"))
+    row = result.first()
+    return row[0] if row else None
+
+
+async def schema_is_current() -> bool:
+    """Один SELECT: совпадает ли схема БД с кодом"""
+    if _force_migrate():
+        return False
+    try:
+        async with engine.connect() as conn:
+            return await _read_fingerprint(conn) == compute_schema_fingerprint()
+    except Exception:
+        # Таблицы отпечатка еще нет (первый запуск)
+        return False
+
+
+async def migrate_if_needed(apply: Callable[[AsyncConnection], Awaitable[None]]) -> bool:
+    """
+    Выполняет apply(conn) в одной транзакции, если отпечаток не совпадает.
+    Возвращает True, если миграции выполнялись.
+    """
+    fingerprint = compute_schema_fingerprint()
+
+    if await schema_is_current():
+        logger.info(f"[DB] Схема актуальна ({fingerprint[:12]}), миграции пропущены")
+        return False
+
+    async with engine.begin() as conn:
+        if engine.dialect.name == 'postgresql':
+            # Другие реплики ждут здесь, пока первая не закончит миграции
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"),
+                               {'lock_id': MIGRATION_LOCK_ID})
+
+        await conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS schema_fingerprint (
+                id INTEGER PRIMARY KEY,
+                fingerprint VARCHAR(64) NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """))
+
+        # Пока ждали блокировку, миграции могла выполнить другая реплика
+        if not _force_migrate() and await _read_fingerprint(conn) == fingerprint:
+            logger.info("[DB] Схема обновлена другой репликой, миграции пропущены")
+            return False
+
+        await apply(conn)
+
+        await conn.execute(text("DELETE FROM schema_fingerprint"))
+        await conn.execute(text("INSERT INTO schema_fingerprint (id, fingerprint) VALUES (1, :fingerprint)"),
+                           {'fingerprint': fingerprint})
+
+    logger.info(f"[DB] Миграции применены, отпечаток схемы {fingerprint[:12]}")
+    return True
@@ -1,22 +1,29 @@
-from . import (
-    universal,             # Универсальные обработчики
-    common,               # Общие команды
-    reply_handlers,        # Обработчики кнопок
-    profile,              # Профиль пользователя
-    drinks,               # Учет воды
-    progress,             # Прогресс
-    activity,             # Активность
-    weight,               # Учет веса
-    meal_plan,            # Планирование питания
-    ai_assistant,          # AI ассистент
-    timezone_handlers,      # Обработчики часовых поясов
-    food,                 # Запись еды (объединена с food_clarification)
-    help,                 # Помощь
-    achievements,         # Достижения
-)
+"""
+Обработчики NutriBuddy Bot.
+Модули загружаются по требованию: импорт пакета не тянет за собой все роутеры
+и их зависимости (LangChain, каталоги блюд), bot.py импортирует только нужные.
+"""
+import importlib
 
 __all__ = [
-    'universal', 'common', 'reply_handlers', 'profile', 'drinks',
-    'progress', 'activity', 'weight', 'meal_plan', 'ai_assistant',
-    'timezone_handlers', 'food', 'help', 'achievements'
+    'universal',           # Универсальные обработчики
+    'common',              # Общие команды
+    'reply_handlers',      # Обработчики кнопок
+    'profile',             # Профиль пользователя
+    'drinks',              # Учет воды
+    'progress',            # Прогресс
+    'activity',            # Активность
+    'weight',              # Учет веса
+    'meal_plan',           # Планирование питания
+    'ai_assistant',        # AI ассистент
+    'timezone_handlers',   # Обработчики часовых поясов
+    'food',                # Запись еды (объединена с food_clarification)
+    'help',                # Помощь
+    'achievements',        # Достижения
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,10 @@
 """
 Обработчик достижений и статистики геймификации
 """
+import html
 import logging
 from aiogram import Router, F
-from aiogram.types import Message
+from aiogram.types import CallbackQuery, Message
 from aiogram.filters import Command
 
 from utils.gamification import gamification
@@ -72,3 +73,41 @@ async def cmd_achievements(message: Message):
         reply_markup=get_main_menu(),
         parse_mode="HTML"
     )
+
+# Заголовки периодов таблицы лидеров
+LEADERBOARD_TITLES = {"week": "за неделю", "month": "за месяц", "all": "за все время"}
+
+
+async def leaderboard_text(user_id: int, period: str = "week") -> str:
+    """Топ-10 и место пользователя"""
+    top = await gamification.get_leaderboard(period, 10)
+    me = await gamification.get_leaderboard_position(user_id, period)
+
+    text = f"🏅 <b>Таблица лидеров {LEADERBOARD_TITLES[period]}</b>\n\n"
+    if not top:
+        text += "Пока никто не получил очков в этом периоде.\n"
+    for entry in top:
+        marker = " ← вы" if entry['telegram_id'] == user_id else ""
+        text += f"{entry['position']}. {html.escape(entry['name'])} — {entry['total_points']} очков{marker}\n"
+
+    if me['position'] is not None:
+        text += f"\n📍 <b>Ваше место:</b> {me['position']} из {me['participants']} ({me['total_points']} очков)"
+    else:
+        text += "\n📍 Получите достижение, чтобы попасть в таблицу"
+    return text
+
+
+@router.message(Command("leaderboard"))
+@router.message(Command("лидеры"))
+async def cmd_leaderboard(message: Message):
+    """Таблица лидеров: /leaderboard [week|month|all]"""
+    parts = (message.text or "").split()
+    period = parts[1] if len(parts) > 1 and parts[1] in LEADERBOARD_TITLES else "week"
+    await message.answer(await leaderboard_text(message.from_user.id, period), parse_mode="HTML")
+
+
+@router.callback_query(F.data == "leaderboard")
+async def callback_leaderboard(callback: CallbackQuery):
+    """Кнопка таблицы лидеров"""
+    await callback.message.answer(await leaderboard_text(callback.from_user.id), parse_mode="HTML")
+    await callback.answer()
@@ -154,6 +154,11 @@ async def process_calories(message: Message, state: FSMContext):
             session.add(activity_entry)
             await session.commit()
         
+        # Достижения проверяются подписчиком события в фоне
+        from services.event_bus import ACTIVITY_LOGGED, publish
+        await publish(ACTIVITY_LOGGED, user.telegram_id, activity_type=activity_type,
+                      duration_min=duration, calories_burned=calories_burned)
+        
         # Получаем статистику за день
         daily_stats = await get_daily_activity_stats(user.telegram_id)
         
@@ -162,10 +167,6 @@ async def process_calories(message: Message, state: FSMContext):
         
         await message.answer(card, reply_markup=get_main_keyboard())
         
-        # Проверяем достижения
-        from handlers.achievements import check_achievements
-        await check_achievements(user.telegram_id, 'activity', duration)
-        
         await state.clear()
         
     except ValueError:
@@ -15,6 +15,7 @@ from database.models import User
 from services.cloudflare_manager import cf_manager
 from services.ai_processor import ai_processor
 from keyboards.main_menu import get_main_menu
+from services.delivery import ReplyProgress
 
 logger = logging.getLogger(__name__)
 router = Router()
@@ -66,79 +67,75 @@ async def handle_ai_message(message: Message, state: FSMContext):
         )
         return
     
-    # Показываем индикатор загрузки
-    loading_msg = await message.answer("🤖 AI думает...")
-    
-    try:
-        # Получаем данные пользователя
-        async with get_session() as session:
-            result = await session.execute(
-                select(User).where(User.telegram_id == message.from_user.id)
+    # Заглушка на время ответа AI; ответ заменяет ее редактированием
+    async with ReplyProgress(message, placeholder="🤖 AI думает...") as reply:
+        try:
+            # Получаем данные пользователя
+            async with get_session() as session:
+                result = await session.execute(
+                    select(User).where(User.telegram_id == message.from_user.id)
+                )
+                user = result.scalar_one_or_none()
+            
+            # Получаем историю диалога
+            data = await state.get_data()
+            conversation_history = data.get('conversation_history', [])
+            message_count = data.get('message_count', 0)
+            
+            # Проверяем лимит сообщений (50)
+            if message_count >= 50:
+                await state.clear()
+                await reply.answer(
+                    "📝 <b>Достигнут лимит сообщений в диалоге (50)</b>\n\n"
+                    "Начните новый диалог командой /ask или нажмите «🤖 AI Ассистент»",
+                    reply_markup=get_main_menu(),
+                    parse_mode="HTML"
+                )
+                return
+            
+            # Формируем контекст для AI
+            context = build_ai_context(user, conversation_history)
+            
+            # Получаем ответ от AI
+            ai_response = await cf_manager.get_assistant_response(
+                user_message=message.text,
+                context=context
             )
-            user = result.scalar_one_or_none()
-        
-        # Получаем историю диалога
-        data = await state.get_data()
-        conversation_history = data.get('conversation_history', [])
-        message_count = data.get('message_count', 0)
-        
-        # Проверяем лимит сообщений (50)
-        if message_count >= 50:
-            await state.clear()
-            await message.answer(
-                "📝 <b>Достигнут лимит сообщений в диалоге (50)</b>\n\n"
-                "Начните новый диалог командой /ask или нажмите «🤖 AI Ассистент»",
-                reply_markup=get_main_menu(),
-                parse_mode="HTML"
+            
+            # Обновляем историю диалога
+            conversation_history.append({
+                'user': message.text,
+                'assistant': ai_response,
+                'timestamp': message.date.isoformat()
+            })
+            
+            # Ограничиваем историю последними 20 сообщениями (для экономии токенов)
+            if len(conversation_history) > 20:
+                conversation_history = conversation_history[-20:]
+            
+            # Увеличиваем счётчик сообщений
+            message_count += 1
+            
+            await state.update_data(
+                conversation_history=conversation_history,
+                message_count=message_count
+            )
+            
+            # Формируем ответ
+            response_text = f"🤖 <b>AI Ассистент</b> ({message_count}/50)\n\n"
+            response_text += f"{ai_response}\n\n"
+            response_text += "💡 <i>Хотите задать ещё вопрос? Просто напишите!</i>\n"
+            response_text += "ℹ️ <i>Для выхода напишите «выход»</i>"
+            
+            # Заглушка редактируется в ответ
+            await reply.answer(response_text, parse_mode="HTML")
+            
+        except Exception as e:
+            logger.error(f"Error in AI conversation: {e}", exc_info=True)
+            await reply.answer(
+                "❌ Произошла ошибка при обработке запроса. Попробуйте ещё раз.",
+                reply_markup=get_main_menu()
             )
-            return
-        
-        # Формируем контекст для AI
-        context = build_ai_context(user, conversation_history)
-        
-        # Получаем ответ от AI
-        ai_response = await cf_manager.get_assistant_response(
-            user_message=message.text,
-            context=context
-        )
-        
-        # Обновляем историю диалога
-        conversation_history.append({
-            'user': message.text,
-            'assistant': ai_response,
-            'timestamp': message.date.isoformat()
-        })
-        
-        # Ограничиваем историю последними 20 сообщениями (для экономии токенов)
-        if len(conversation_history) > 20:
-            conversation_history = conversation_history[-20:]
-        
-        # Увеличиваем счётчик сообщений
-        message_count += 1
-        
-        await state.update_data(
-            conversation_history=conversation_history,
-            message_count=message_count
-        )
-        
-        # Удаляем сообщение о загрузке
-        await loading_msg.delete()
-        
-        # Формируем ответ
-        response_text = f"🤖 <b>AI Ассистент</b> ({message_count}/50)\n\n"
-        response_text += f"{ai_response}\n\n"
-        response_text += "💡 <i>Хотите задать ещё вопрос? Просто напишите!</i>\n"
-        response_text += "ℹ️ <i>Для выхода напишите «выход»</i>"
-        
-        await message.answer(response_text, parse_mode="HTML")
-        
-    except Exception as e:
-        logger.error(f"Error in AI conversation: {e}", exc_info=True)
-        await loading_msg.delete()
-        await message.answer(
-            "❌ Произошла ошибка при обработке запроса. Попробуйте ещё раз.",
-            reply_markup=get_main_menu()
-        )
 
 def build_ai_context(user, conversation_history):
     """Строит контекст для AI"""
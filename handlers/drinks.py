@@ -4,7 +4,6 @@ handlers/drinks.py
 Поддерживает воду, соки, чай, кофе и другие напитки с калориями
 """
 import logging
-from datetime import datetime, timezone
 from aiogram.types import Message, CallbackQuery
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
@@ -12,8 +11,10 @@ from aiogram import F, Router
 from sqlalchemy import select, func
 
 from database.db import get_session
+from database.meal_writes import drink_row
 from database.models import User, DrinkEntry
 from keyboards.main_menu import get_main_menu
+from services.drink_buffer import drink_write_buffer
 from utils.states import DrinkStates, WaterStates
 from utils.drink_parser import parse_drink
 from utils.daily_stats import get_daily_water
@@ -108,16 +109,7 @@ async def process_water_amount(message: Message, state: FSMContext):
                 return
 
             # Создаем запись о напитке (вода)
-            drink_entry = DrinkEntry(
-                user_id=user.telegram_id,
-                drink_name="вода",
-                amount=amount,
-                calories=0,
-                created_at=datetime.now(timezone.utc)
-            )
-
-            session.add(drink_entry)
-            await session.commit()
+            await drink_write_buffer.add(drink_row(user.telegram_id, "вода", amount))
 
             # Получаем статистику за день
             total_today = await get_daily_water(user.telegram_id)
@@ -125,12 +117,9 @@ async def process_water_amount(message: Message, state: FSMContext):
             # Создаем красивую карточку
             card = water_card(amount, total_today, user.daily_water_goal)
 
-            await message.answer(card, reply_markup=get_main_keyboard_v2())
-
-            # Проверяем достижения
-            from handlers.achievements import check_achievements
-            await check_achievements(user.telegram_id, 'water', amount)
+            await message.answer(card, reply_markup=get_main_menu())
 
+            # Достижения проверяются подписчиком события DRINK_LOGGED
             await state.clear()
 
     except ValueError:
@@ -167,16 +156,7 @@ async def process_drink_amount(message: Message, state: FSMContext):
                 return
 
             # Создаем запись о напитке (вода по умолчанию)
-            drink_entry = DrinkEntry(
-                user_id=user.telegram_id,
-                drink_name="вода",
-                amount=amount,
-                calories=0,
-                created_at=datetime.now(timezone.utc)
-            )
-
-            session.add(drink_entry)
-            await session.commit()
+            await drink_write_buffer.add(drink_row(user.telegram_id, "вода", amount))
 
             # Получаем статистику за день
             total_today = await get_daily_water(user.telegram_id)
@@ -184,11 +164,7 @@ async def process_drink_amount(message: Message, state: FSMContext):
             # Создаем красивую карточку
             card = water_card(amount, total_today, user.daily_water_goal)
 
-            await message.answer(card, reply_markup=get_main_keyboard_v2())
-
-            # Проверяем достижения
-            from handlers.achievements import check_achievements
-            await check_achievements(user.telegram_id, 'water', amount)
+            await message.answer(card, reply_markup=get_main_menu())
 
             await state.clear()
 
@@ -240,16 +216,7 @@ async def process_drink(message: Message, state: FSMContext):
                     return
 
                 # Создаем запись о напитке
-                drink_entry = DrinkEntry(
-                    user_id=user.telegram_id,
-                    drink_name=name,
-                    amount=volume,
-                    calories=calories,
-                    created_at=datetime.now(timezone.utc)
-                )
-
-                session.add(drink_entry)
-                await session.commit()
+                await drink_write_buffer.add(drink_row(user.telegram_id, name, volume, calories))
 
                 # Получаем статистику за день
                 total_today = await get_daily_water(user.telegram_id)
@@ -264,11 +231,7 @@ async def process_drink(message: Message, state: FSMContext):
                     user.daily_water_goal
                 )
                 
-                await message.answer(card, reply_markup=get_main_keyboard_v2())
-                
-                # Проверяем достижения
-                from handlers.achievements import check_achievements
-                await check_achievements(user.telegram_id, 'drink', drink_data['amount'])
+                await message.answer(card, reply_markup=get_main_menu())
                 
                 await state.clear()
                 
@@ -357,10 +320,12 @@ async def get_water_stats_by_periods(user_id: int) -> dict:
             total = result.scalar() or 0
             return total
         
+        # Еще не записанные отметки из буфера входят во все периоды
+        pending = drink_write_buffer.pending(user_id)["amount"]
         return {
-            'today': await get_period_stats(today_start),
-            'week': await get_period_stats(week_start),
-            'month': await get_period_stats(month_start)
+            'today': await get_period_stats(today_start) + pending,
+            'week': await get_period_stats(week_start) + pending,
+            'month': await get_period_stats(month_start) + pending
         }
 
 @router.message(Command("quick_water"))
@@ -385,34 +350,25 @@ async def process_quick_water(message: Message):
             amount_str = text.split()[1]
             amount = int(amount_str.replace("мл", ""))
             
-            # Сохраняем как обычную воду
             async with get_session() as session:
                 result = await session.execute(
-                    select(User).where(User.telegram_id == message.from_user.id)
+                    select(User.daily_water_goal).where(User.telegram_id == message.from_user.id)
                 )
-                user = result.scalar_one_or_none()
-                
-                if not user:
-                    await message.answer("❌ Сначала настройте профиль")
-                    return
-                
-                drink_entry = DrinkEntry(
-                    user_id=user.telegram_id,
-                    drink_name="вода",
-                    amount=amount,
-                    calories=0,
-                    created_at=datetime.now(timezone.utc)
-                )
-                
-                session.add(drink_entry)
-                await session.commit()
-                
-                # Получаем статистику
-                total_today = await get_daily_water(user.telegram_id)
-                
-                # Карточка
-                card = water_card(amount, total_today, user.daily_water_goal)
-                await message.answer(card, reply_markup=get_main_keyboard_v2())
+                goal = result.first()
+            
+            if goal is None:
+                await message.answer("❌ Сначала настройте профиль")
+                return
+            
+            # Сохраняем как обычную воду: частые нажатия пишутся пакетом (drink_buffer)
+            await drink_write_buffer.add(drink_row(message.from_user.id, "вода", amount))
+            
+            # Статистика учитывает еще не записанные отметки
+            total_today = await get_daily_water(message.from_user.id)
+            
+            # Карточка
+            card = water_card(amount, total_today, goal[0])
+            await message.answer(card, reply_markup=get_main_menu())
                 
         except (ValueError, IndexError):
             await message.answer("❌ Неверный формат. Попробуйте еще раз:")
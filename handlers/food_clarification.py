@@ -253,6 +253,10 @@ async def handle_weight_input(message: Message, state: FSMContext):
             session.add(food_entry)
             await session.commit()
         
+        # Достижения проверяются подписчиком события в фоне
+        from services.event_bus import FOOD_LOGGED, publish
+        await publish(FOOD_LOGGED, user.telegram_id, meal_type=meal_type, calories=calories)
+        
         # Получаем статистику за день
         from utils.daily_stats import get_daily_nutrition
         daily_stats = await get_daily_nutrition(user.telegram_id)
@@ -272,10 +276,6 @@ async def handle_weight_input(message: Message, state: FSMContext):
         card = meal_card(food_data, user, daily_stats)
         await message.answer(card)
         
-        # Проверяем достижения
-        from handlers.achievements import check_achievements
-        await check_achievements(user.telegram_id, 'food', calories)
-        
         await state.clear()
         
     except Exception as e:
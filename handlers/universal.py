@@ -10,8 +10,8 @@ from sqlalchemy import select, func
 
 from database.db import get_session
 from database.models import User, FoodEntry, DrinkEntry, ActivityEntry
-from services.langchain_agent import get_agent
 from keyboards.main_menu import get_main_menu
+from services.delivery import ReplyProgress
 
 logger = logging.getLogger(__name__)
 router = Router()
@@ -35,17 +35,14 @@ async def universal_message_handler(message: Message, state: FSMContext):
         return  # Пропускаем, это обрабатывает AI Ассистент
 
     try:
-        # Показываем индикатор загрузки
-        loading_msg = await message.answer("🤖 Анализирую...")
+        # Индикатор «печатает» вместо сообщения-заглушки
+        async with ReplyProgress(message):
+            # Получаем агента для пользователя (LangChain загружается при первом обращении)
+            from services.langchain_agent import get_agent
+            agent = await get_agent(user_id, state)
 
-        # Получаем агента для пользователя
-        agent = await get_agent(user_id, state)
-
-        # Обрабатываем сообщение через агента
-        result = await agent.process_message(user_text)
-
-        # Удаляем сообщение о загрузке
-        await loading_msg.delete()
+            # Обрабатываем сообщение через агента
+            result = await agent.process_message(user_text)
 
         # Выводим результат
         await message.answer(result, reply_markup=get_main_menu(), parse_mode="HTML")
@@ -66,24 +63,21 @@ async def universal_photo_handler(message: Message, state: FSMContext):
     user_id = message.from_user.id
 
     try:
-        # Показываем индикатор загрузки
-        loading_msg = await message.answer("📸 Анализирую фото...")
-
-        # Получаем фото (берём наилучшее качество - последнее в списке)
-        photo = message.photo[-1]
-        file_info = await message.bot.get_file(photo.file_id)
-        photo_data = await message.bot.download_file(file_info.file_path)
-        
-        # Читаем байты ОДИН раз и сохраняем
-        photo_bytes = photo_data.read()
-
-        # Распознаём еду через Vision модель (напрямую, без агента)
-        from services.cloudflare_manager import cf_manager
-        from services.ai_processor import ai_processor
+        # Индикатор «печатает» на время загрузки и распознавания
+        async with ReplyProgress(message):
+            # Получаем фото (берём наилучшее качество - последнее в списке)
+            photo = message.photo[-1]
+            file_info = await message.bot.get_file(photo.file_id)
+            photo_data = await message.bot.download_file(file_info.file_path)
+            
+            # Читаем байты ОДИН раз и сохраняем
+            photo_bytes = photo_data.read()
 
-        result = await cf_manager.parse_food_image(photo_bytes)
+            # Распознаём еду через Vision модель (напрямую, без агента)
+            from services.cloudflare_manager import cf_manager
+            from services.ai_processor import ai_processor
 
-        await loading_msg.delete()
+            result = await cf_manager.parse_food_image(photo_bytes)
 
         if result.get("success"):
             # Используем результат напрямую (без повторного вызова parse_food_image)
@@ -103,47 +97,14 @@ async def universal_photo_handler(message: Message, state: FSMContext):
             
             ingredients_text = "\n".join(ingredients_list) if ingredients_list else ""
 
-            # Рассчитываем КБЖУ на основе ингредиентов из базы данных dish_db
-            from services.dish_db import INGREDIENT_DATABASE
-
-            total_calories = 0
-            total_protein = 0
-            total_fat = 0
-            total_carbs = 0
-
-            for ingredient in ingredients:
-                name = ingredient.get("name", "").lower()
-                weight = ingredient.get("weight_grams", 0)
-
-                # Ищем ингредиент в базе данных dish_db
-                nutrition = None
-                for key, value in INGREDIENT_DATABASE.items():
-                    if key.lower() in name or name in key.lower():
-                        nutrition = value
-                        break
+            # Рассчитываем КБЖУ на основе ингредиентов (база dish_db, затем средние по типу)
+            from services.nutrition_resolver import get_nutrition_resolver
 
-                if not nutrition:
-                    # Если не нашли в базе, используем приблизительные значения по типу
-                    ing_type = ingredient.get("type", "")
-                    if "protein" in ing_type:
-                        nutrition = {"calories": 150, "protein": 25, "fat": 5, "carbs": 0}
-                    elif "carb" in ing_type:
-                        nutrition = {"calories": 120, "protein": 3, "fat": 0.5, "carbs": 25}
-                    elif "vegetable" in ing_type:
-                        nutrition = {"calories": 25, "protein": 1, "fat": 0.3, "carbs": 5}
-                    elif "fat" in ing_type:
-                        nutrition = {"calories": 800, "protein": 0, "fat": 90, "carbs": 0}
-                    elif "herb" in ing_type or "spice" in ing_type or "salt" in ing_type:
-                        nutrition = {"calories": 5, "protein": 0.2, "fat": 0.1, "carbs": 1}
-                    elif "dairy" in ing_type:
-                        nutrition = {"calories": 100, "protein": 5, "fat": 5, "carbs": 5}
-                    else:
-                        nutrition = {"calories": 100, "protein": 5, "fat": 3, "carbs": 15}
-
-                total_calories += (nutrition["calories"] * weight) / 100
-                total_protein += (nutrition["protein"] * weight) / 100
-                total_fat += (nutrition["fat"] * weight) / 100
-                total_carbs += (nutrition["carbs"] * weight) / 100
+            totals = get_nutrition_resolver().totals(ingredients)
+            total_calories = totals["calories"]
+            total_protein = totals["protein"]
+            total_fat = totals["fat"]
+            total_carbs = totals["carbs"]
 
             # Определяем meal_type из category
             category = data.get("category", "main")
@@ -292,31 +253,28 @@ async def universal_document_handler(message: Message, state: FSMContext):
         return  # Не изображение, пропускаем
 
     try:
-        # Показываем индикатор загрузки
-        loading_msg = await message.answer("📸 Анализирую изображение...")
-
-        # Получаем файл
-        file_info = await message.bot.get_file(document.file_id)
-        
-        # Логгируем информацию о файле
-        logger.info(f"[DOCUMENT] File ID: {document.file_id}")
-        logger.info(f"[DOCUMENT] File name: {document.file_name}")
-        logger.info(f"[DOCUMENT] MIME type: {document.mime_type}")
-        logger.info(f"[DOCUMENT] File size: {file_info.file_size}")
-        
-        photo_data = await message.bot.download_file(file_info.file_path)
-        
-        # Логгируем размер загруженных данных
-        photo_bytes = photo_data.read()
-        logger.info(f"[DOCUMENT] Downloaded data size: {len(photo_bytes)} bytes")
-
-        # Распознаём еду через Vision модель
-        from services.cloudflare_manager import cf_manager
-        from services.ai_processor import ai_processor
-        
-        result = await cf_manager.parse_food_image(photo_bytes)
-        
-        await loading_msg.delete()
+        # Индикатор «печатает» на время загрузки и распознавания
+        async with ReplyProgress(message):
+            # Получаем файл
+            file_info = await message.bot.get_file(document.file_id)
+            
+            # Логгируем информацию о файле
+            logger.info(f"[DOCUMENT] File ID: {document.file_id}")
+            logger.info(f"[DOCUMENT] File name: {document.file_name}")
+            logger.info(f"[DOCUMENT] MIME type: {document.mime_type}")
+            logger.info(f"[DOCUMENT] File size: {file_info.file_size}")
+            
+            photo_data = await message.bot.download_file(file_info.file_path)
+            
+            # Логгируем размер загруженных данных
+            photo_bytes = photo_data.read()
+            logger.info(f"[DOCUMENT] Downloaded data size: {len(photo_bytes)} bytes")
+
+            # Распознаём еду через Vision модель
+            from services.cloudflare_manager import cf_manager
+            from services.ai_processor import ai_processor
+            
+            result = await cf_manager.parse_food_image(photo_bytes)
 
         if result.get("success"):
             # Используем результат напрямую (без повторного вызова parse_food_image)
@@ -336,43 +294,14 @@ async def universal_document_handler(message: Message, state: FSMContext):
             
             ingredients_text = "\n".join(ingredients_list) if ingredients_list else ""
 
-            # Рассчитываем КБЖУ на основе ингредиентов из базы данных dish_db
-            from services.dish_db import INGREDIENT_DATABASE
-
-            total_calories = 0
-            total_protein = 0
-            total_fat = 0
-            total_carbs = 0
-
-            for ingredient in ingredients:
-                name = ingredient.get("name", "").lower()
-                weight = ingredient.get("weight_grams", 0)
-
-                # Ищем ингредиент в базе данных dish_db
-                nutrition = None
-                for key, value in INGREDIENT_DATABASE.items():
-                    if key.lower() in name or name in key.lower():
-                        nutrition = value
-                        break
+            # Рассчитываем КБЖУ на основе ингредиентов (база dish_db, затем средние по типу)
+            from services.nutrition_resolver import get_nutrition_resolver
 
-                if not nutrition:
-                    # Если не нашли в базе, используем приблизительные значения по типу
-                    ing_type = ingredient.get("type", "")
-                    if "protein" in ing_type:
-                        nutrition = {"calories": 150, "protein": 25, "fat": 5, "carbs": 0}
-                    elif "carb" in ing_type:
-                        nutrition = {"calories": 120, "protein": 3, "fat": 0.5, "carbs": 25}
-                    elif "vegetable" in ing_type:
-                        nutrition = {"calories": 25, "protein": 1, "fat": 0.3, "carbs": 5}
-                    elif "fat" in ing_type:
-                        nutrition = {"calories": 800, "protein": 0, "fat": 90, "carbs": 0}
-                    else:
-                        nutrition = {"calories": 100, "protein": 5, "fat": 3, "carbs": 15}
-
-                total_calories += (nutrition["calories"] * weight) / 100
-                total_protein += (nutrition["protein"] * weight) / 100
-                total_fat += (nutrition["fat"] * weight) / 100
-                total_carbs += (nutrition["carbs"] * weight) / 100
+            totals = get_nutrition_resolver().totals(ingredients)
+            total_calories = totals["calories"]
+            total_protein = totals["protein"]
+            total_fat = totals["fat"]
+            total_carbs = totals["carbs"]
 
             # Определяем meal_type из category
             category = data.get("category", "main")
@@ -73,6 +73,9 @@ async def process_weight(message: Message, state: FSMContext):
             session.add(weight_entry)
             await session.commit()
         
+        from services.event_bus import WEIGHT_LOGGED, publish
+        await publish(WEIGHT_LOGGED, message.from_user.id, weight_kg=weight)
+        
         await state.clear()
         
         text = f"✅ <b>Вес записан: {weight} кг</b>\n\n"
@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional
 from database.db import get_session
 from database.models import ActivityEntry, User
 from sqlalchemy import select
+from services.event_bus import ACTIVITY_LOGGED, publish
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +82,9 @@ async def save_activity(user_id: int, activity_type: str, duration_min: int,
             await session.commit()
             await session.refresh(activity)
             
+            await publish(ACTIVITY_LOGGED, user_id, activity_type=activity_type,
+                          duration_min=duration_min, calories_burned=calories_burned)
+            
             logger.info(f"ActivityEntry saved: {activity_type} for user {user_id}, {calories_burned} cal")
             
             return {
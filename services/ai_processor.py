@@ -3,8 +3,10 @@ AI Processor - использует унифицированный Cloudflare AI
 Принимает пользовательский ввод, контекст и решает, какую модель вызвать
 """
 import logging
+import time
 from typing import Dict, Any, Optional
 from services.cloudflare_manager import cf_manager
+from services.food_text_parser import food_parse_stats, timed_local_parse
 from database.db import get_session
 from database.models import User
 from sqlalchemy import select
@@ -32,8 +34,15 @@ class AIProcessor:
             # Получаем профиль пользователя для контекста
             user_profile = await self._get_user_profile(user_id)
 
-            # Сначала пробуем распарсить еду
-            food_result = await self.ai_manager.parse_food_text(text)
+            # Сначала пробуем распарсить еду: по справочникам, а если не уверены — через LLM
+            local_data, elapsed = timed_local_parse(text)
+            if local_data is not None:
+                food_parse_stats.record("local", elapsed)
+                food_result = {"success": True, "data": local_data, "model": "local_parser"}
+            else:
+                started = time.perf_counter()
+                food_result = await self.ai_manager.parse_food_text(text)
+                food_parse_stats.record("llm", elapsed + time.perf_counter() - started)
             if food_result.get("success") and food_result.get("data"):
                 data = food_result["data"]
                 
@@ -46,15 +55,18 @@ class AIProcessor:
                     # Конвертируем ingredients в food_items формат
                     food_items = []
                     for ing in ingredients:
-                        food_items.append({
+                        item = {
                             "name": ing.get("name", ""),
                             "quantity": ing.get("weight_grams", 0),
                             "unit": "г",
-                            "calories": 0,  # Будет рассчитано позже
-                            "protein": 0,
-                            "fat": 0,
-                            "carbs": 0
-                        })
+                        }
+                        # КБЖУ — на 100 г: обработчики и FoodSaveService умножают на вес/100.
+                        # Локальный парсер дает их сразу, для LLM — будет рассчитано позже
+                        for nutrient in ("calories", "protein", "fat", "carbs"):
+                            item[nutrient] = ing.get(f"{nutrient}_per_100g", 0)
+                            if f"{nutrient}_per_100g" in ing:
+                                item[f"{nutrient}_per_100g"] = ing[f"{nutrient}_per_100g"]
+                        food_items.append(item)
                     
                     return {
                         "intent": "log_food",
@@ -0,0 +1,195 @@
+"""
+services/broadcast.py
+Массовая отправка сообщений с ограничением скорости и контрольными точками.
+
+Получатели выбираются страницами по ключу (telegram_id > курсор), а не
+одним списком: следующая страница читается, пока отправляется текущая.
+Скорость ограничена токенами (BROADCAST_RATE в секунду на бота — у Telegram
+около 30), одновременно отправляется не больше BROADCAST_CONCURRENCY
+сообщений. Ответ 429 (TelegramRetryAfter) приостанавливает всю рассылку на
+retry_after секунд, после чего сообщение отправляется повторно.
+
+После каждой страницы курсор и счетчики пишутся в хэш
+nutribuddy:broadcast:<рассылка>:<запуск>, поэтому прерванный запуск
+продолжается с последней страницы, а завершенный не повторяется.
+Без Redis контрольные точки живут только в памяти процесса.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramAPIError, TelegramForbiddenError, TelegramNetworkError, TelegramRetryAfter,
+)
+
+from utils.config import BROADCAST_CONCURRENCY, BROADCAST_PAGE_SIZE, BROADCAST_RATE
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_PREFIX = "nutribuddy:broadcast"
+# Сколько хранится контрольная точка запуска
+_CHECKPOINT_TTL = 14 * 24 * 3600
+_COUNTERS = ("sent", "blocked", "failed")
+
+# (курсор, размер страницы) -> строки; первый элемент строки — telegram_id
+FetchPage = Callable[[int, int], Awaitable[List[Any]]]
+# строка -> аргументы Bot.send_message кроме chat_id
+Render = Callable[[Any], Dict[str, Any]]
+
+
+class TokenBucket:
+    """Не больше rate выдач в секунду с запасом capacity"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Останавливает выдачу на seconds секунд и обнуляет запас"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+        self._updated = self._paused_until
+
+    async def acquire(self) -> None:
+        """Ждет свободный токен"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class BroadcastSender:
+    """Рассылка name: страницы получателей, лимит скорости, повторы и контрольные точки"""
+
+    def __init__(self, bot: Bot, name: str, redis_client=None, rate: float = BROADCAST_RATE,
+                 concurrency: int = BROADCAST_CONCURRENCY, page_size: int = BROADCAST_PAGE_SIZE,
+                 max_retries: int = 3):
+        self.bot = bot
+        self.name = name
+        self.redis = redis_client
+        self.page_size = page_size
+        self.max_retries = max_retries
+        self.bucket = TokenBucket(rate)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._local: Dict[str, Dict[str, int]] = {}
+        self.counts = {"sent": 0, "blocked": 0, "failed": 0, "retry_after": 0, "pages": 0}
+
+    def bind(self, redis_client) -> None:
+        self.redis = redis_client
+
+    def checkpoint_key(self, run_id: str) -> str:
+        return f"{BROADCAST_PREFIX}:{self.name}:{run_id}"
+
+    async def run(self, run_id: str, fetch_page: FetchPage, render: Render) -> Dict[str, int]:
+        """Отправляет запуск run_id с контрольной точки; возвращает курсор и счетчики"""
+        state = await self._load(run_id)
+        if state["done"]:
+            logger.info(f"[BROADCAST] {self.name}:{run_id} already done: {state}")
+            return state
+
+        started = time.monotonic()
+        if state["cursor"]:
+            logger.info(f"[BROADCAST] Resuming {self.name}:{run_id} after {state['cursor']}: {state}")
+        next_page = asyncio.create_task(fetch_page(state["cursor"], self.page_size))
+        try:
+            while True:
+                rows = await next_page
+                if not rows:
+                    break
+                # Следующая страница читается, пока отправляется эта
+                next_page = asyncio.create_task(fetch_page(rows[-1][0], self.page_size))
+                results = await asyncio.gather(*(self._deliver(row, render) for row in rows))
+                for outcome in results:
+                    state[outcome] += 1
+                state["cursor"] = rows[-1][0]
+                self.counts["pages"] += 1
+                await self._save(run_id, state)
+        finally:
+            if not next_page.done():
+                next_page.cancel()
+
+        state["done"] = 1
+        await self._save(run_id, state)
+        logger.info(f"[BROADCAST] {self.name}:{run_id} done in {time.monotonic() - started:.0f}s: {state}")
+        return state
+
+    async def _deliver(self, row, render: Render) -> str:
+        """Отправка одному получателю: sent, blocked или failed"""
+        chat_id = row[0]
+        async with self._semaphore:
+            message = render(row)
+            for attempt in range(self.max_retries + 1):
+                await self.bucket.acquire()
+                try:
+                    await self.bot.send_message(chat_id, **message)
+                    self.counts["sent"] += 1
+                    return "sent"
+                except TelegramRetryAfter as e:
+                    self.counts["retry_after"] += 1
+                    logger.warning(f"[BROADCAST] {self.name}: flood limit, pausing {e.retry_after}s")
+                    self.bucket.pause(e.retry_after)
+                except TelegramForbiddenError:
+                    self.counts["blocked"] += 1
+                    return "blocked"
+                except TelegramNetworkError as e:
+                    logger.warning(f"[BROADCAST] {self.name}: network error for {chat_id}: {e}")
+                    await asyncio.sleep(2 ** attempt)
+                except TelegramAPIError as e:
+                    logger.warning(f"[BROADCAST] {self.name}: failed to send to {chat_id}: {e}")
+                    break
+                except Exception as e:
+                    logger.error(f"[BROADCAST] {self.name}: unexpected error for {chat_id}: {e}")
+                    break
+        self.counts["failed"] += 1
+        return "failed"
+
+    async def _load(self, run_id: str) -> Dict[str, int]:
+        state = {"cursor": 0, "done": 0, **{counter: 0 for counter in _COUNTERS}}
+        if self.redis is None:
+            state.update(self._local.get(run_id, {}))
+            return state
+        try:
+            saved = await self.redis.hgetall(self.checkpoint_key(run_id))
+        except Exception as e:
+            logger.warning(f"[BROADCAST] Failed to load checkpoint {run_id}: {e}")
+            saved = {}
+        for field, value in (saved or {}).items():
+            field = field.decode() if isinstance(field, bytes) else field
+            if field in state:
+                state[field] = int(value)
+        return state
+
+    async def _save(self, run_id: str, state: Dict[str, int]) -> None:
+        if self.redis is None:
+            self._local[run_id] = dict(state)
+            return
+        key = self.checkpoint_key(run_id)
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hset(key, mapping=state)
+            pipe.expire(key, _CHECKPOINT_TTL)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"[BROADCAST] Failed to save checkpoint {run_id}: {e}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Счетчики за время жизни процесса и текущая пауза по 429"""
+        return {
+            **self.counts,
+            "rate": self.bucket.rate,
+            "paused_s": round(max(0.0, self.bucket._paused_until - time.monotonic()), 1),
+        }
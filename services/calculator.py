@@ -5,7 +5,12 @@
 - Рекомендации ВОЗ/ФАО
 - Руководства по питанию USDA
 """
-from typing import Tuple
+from typing import Optional, Tuple
+
+# Поправка нормы воды на жару
+HOT_WEATHER_C = 25
+HEAT_BONUS_ML_PER_C = 100
+MAX_HEAT_BONUS_ML = 1000
 
 
 def calculate_bmr(weight: float, height: float, age: int, gender: str) -> float:
@@ -116,13 +121,14 @@ def calculate_macros(calories: int, goal: str, weight: float) -> Tuple[int, int,
     return protein_grams, fat_grams, carb_grams
 
 
-def calculate_water_intake(weight: float, activity_level: str) -> int:
+def calculate_water_intake(weight: float, activity_level: str, temperature: Optional[float] = None) -> int:
     """
     Рассчитывает суточную потребность в воде.
     
     Args:
         weight: Вес в кг
         activity_level: Уровень активности
+        temperature: Температура воздуха в городе пользователя, °C (None — без поправки)
     
     Returns:
         int: Потребность в воде в мл
@@ -141,7 +147,12 @@ def calculate_water_intake(weight: float, activity_level: str) -> int:
     
     bonus = activity_bonus.get(activity_level, 500)
     
-    return int(base_water + bonus)
+    # В жару: +100 мл на каждый градус выше 25°C, но не больше 1 л
+    heat_bonus = 0
+    if temperature is not None and temperature > HOT_WEATHER_C:
+        heat_bonus = min(MAX_HEAT_BONUS_ML, (temperature - HOT_WEATHER_C) * HEAT_BONUS_ML_PER_C)
+    
+    return int(base_water + bonus + heat_bonus)
 
 
 def calculate_ideal_weight(height: float, gender: str, frame_size: str = 'medium') -> float:
@@ -4,9 +4,10 @@ Cloudflare LLM обёртка для LangChain с поддержкой function
 """
 import os
 import logging
-from typing import List, Dict, Any, Optional
-from langchain_cloudflare import ChatCloudflareWorkersAI
-from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
+
+if TYPE_CHECKING:
+    from langchain_core.messages import AIMessage
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,9 @@ class CloudflareLLM:
                 "Please set CLOUDFLARE_ACCOUNT_ID and CLOUDFLARE_API_TOKEN environment variables."
             )
         
+        # LangChain импортируется только при первом создании LLM
+        from langchain_cloudflare import ChatCloudflareWorkersAI
+        
         self.llm = ChatCloudflareWorkersAI(
             account_id=self.account_id,
             api_token=self.api_token,
@@ -33,7 +37,7 @@ class CloudflareLLM:
         )
         logger.info(f"✅ Cloudflare LLM initialized: {model}")
 
-    async def ainvoke(self, messages: List[Dict[str, str]], tools: Optional[List[Dict]] = None) -> AIMessage:
+    async def ainvoke(self, messages: List[Dict[str, str]], tools: Optional[List[Dict]] = None) -> "AIMessage":
         """
         Вызов модели с поддержкой инструментов (function calling)
         
@@ -47,6 +51,8 @@ class CloudflareLLM:
         if not self.llm:
             raise RuntimeError("Cloudflare LLM not initialized")
         
+        from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
+        
         try:
             # Конвертируем сообщения в формат LangChain
             lc_messages = []
@@ -74,5 +80,11 @@ class CloudflareLLM:
         """Проверяет доступность LLM"""
         return self.llm is not None
 
-# Глобальный экземпляр для использования во всём приложении
-cloudflare_llm = CloudflareLLM()
+_cloudflare_llm: Optional[CloudflareLLM] = None
+
+def get_cloudflare_llm() -> CloudflareLLM:
+    """Глобальный экземпляр LLM, создается при первом обращении"""
+    global _cloudflare_llm
+    if _cloudflare_llm is None:
+        _cloudflare_llm = CloudflareLLM()
+    return _cloudflare_llm
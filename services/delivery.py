@@ -0,0 +1,363 @@
+"""
+services/delivery.py
+Исходящие запросы к Bot API: лимиты, повтор после 429 и счетчики вызовов.
+
+Все запросы бота проходят через OutboundMiddleware сессии. Отправка и
+редактирование сообщений ждут токен своего чата (OUTBOUND_CHAT_RATE в
+секунду с запасом OUTBOUND_CHAT_BURST) и общий токен бота (OUTBOUND_RATE):
+ожидание общего токена — очередь в порядке прихода. В кластере общий токен
+выдает SharedTokenBucket в Redis, один на все воркеры, поэтому воркер с
+рассылкой (BroadcastSender, BROADCAST_RATE) берет почти весь лимит бота, а не
+1/N; без Redis воркер ограничен своей долей. Ответ 429 (TelegramRetryAfter)
+приостанавливает чат на retry_after секунд, и запрос повторяется.
+UpdateCallsMiddleware считает вызовы API на апдейт.
+
+ReplyProgress заменяет схему «сообщение-заглушка, delete(), answer()» (три
+вызова): пока идет обработка, показывается действие чата (typing), которое
+отправляется только если обработка дольше CHAT_ACTION_DELAY, — быстрый ответ
+стоит один вызов. С placeholder заглушка редактируется в итоговый ответ
+(два вызова), частые update() склеиваются в одно редактирование.
+"""
+import asyncio
+import contextvars
+import logging
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from aiogram import BaseMiddleware
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware
+from aiogram.enums import ChatAction
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
+from aiogram.types import InlineKeyboardMarkup, Message
+
+from services.broadcast import TokenBucket
+from utils.config import OUTBOUND_CHAT_BURST, OUTBOUND_CHAT_RATE, OUTBOUND_RATE
+
+logger = logging.getLogger(__name__)
+
+# Методы, на которые действуют лимиты сообщений Telegram
+_LIMITED_PREFIXES = ("send", "edit", "copy", "forward")
+_UNLIMITED_METHODS = {"sendChatAction"}
+# Сколько чатов хранят свои счетчики токенов
+_MAX_CHAT_BUCKETS = 10000
+
+# Общий лимит бота в Redis (хэш tokens/ts/paused, время в мс по часам Redis)
+OUTBOUND_BUCKET_KEY = "nutribuddy:outbound:bucket"
+_BUCKET_KEY_TTL_MS = 60000
+
+# Берет токен: 0 — выдан, иначе сколько мс ждать
+_TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local clock = redis.call('time')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local state = redis.call('hmget', KEYS[1], 'tokens', 'ts', 'paused')
+local paused = tonumber(state[3]) or 0
+if now < paused then
+    return paused - now
+end
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate / 1000)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+end
+redis.call('hset', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('pexpire', KEYS[1], ARGV[3])
+return wait
+"""
+
+# Останавливает выдачу на ARGV[1] мс и обнуляет запас
+_PAUSE_SCRIPT = """
+local clock = redis.call('time')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local until_ms = now + tonumber(ARGV[1])
+local paused = tonumber(redis.call('hget', KEYS[1], 'paused')) or 0
+if until_ms > paused then
+    redis.call('hset', KEYS[1], 'paused', until_ms, 'tokens', 0, 'ts', until_ms)
+end
+redis.call('pexpire', KEYS[1], math.max(tonumber(ARGV[2]), until_ms - now + tonumber(ARGV[2])))
+return 0
+"""
+
+# Через сколько секунд обработки показывать действие чата и как часто его повторять
+# (Telegram показывает действие 5 секунд)
+CHAT_ACTION_DELAY = 1.0
+CHAT_ACTION_INTERVAL = 4.5
+# Не чаще одного редактирования заглушки за столько секунд
+EDIT_INTERVAL = 1.0
+
+# Счетчик вызовов API текущего апдейта
+_update_calls: contextvars.ContextVar[Optional[Dict[str, int]]] = contextvars.ContextVar(
+    "update_calls", default=None
+)
+
+
+class SharedTokenBucket:
+    """
+    Не больше rate выдач в секунду на все процессы: счетчик токенов в Redis.
+    Если Redis недоступен, выдает токены локальный fallback (доля процесса).
+    """
+
+    def __init__(self, redis_client, rate: float, fallback: TokenBucket,
+                 capacity: Optional[float] = None, key: str = OUTBOUND_BUCKET_KEY):
+        self.redis = redis_client
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.fallback = fallback
+        self.key = key
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Останавливает выдачу на seconds секунд во всех процессах"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self.fallback.pause(seconds)
+        asyncio.ensure_future(self._pause_shared(seconds))
+
+    async def _pause_shared(self, seconds: float) -> None:
+        try:
+            await self.redis.eval(_PAUSE_SCRIPT, 1, self.key, int(seconds * 1000), _BUCKET_KEY_TTL_MS)
+        except Exception as e:
+            logger.warning(f"[DELIVERY] Failed to pause shared bucket: {e}")
+
+    async def acquire(self) -> None:
+        """Ждет свободный токен; в процессе ждет один запрос, остальные — в очереди за ним"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                try:
+                    wait_ms = int(await self.redis.eval(
+                        _TAKE_SCRIPT, 1, self.key, self.rate, self.capacity, _BUCKET_KEY_TTL_MS
+                    ))
+                except Exception as e:
+                    logger.warning(f"[DELIVERY] Shared bucket unavailable, using local share: {e}")
+                    await self.fallback.acquire()
+                    return
+                if wait_ms <= 0:
+                    return
+                await asyncio.sleep(wait_ms / 1000)
+
+
+class Delivery:
+    """Лимиты исходящих запросов и статистика вызовов Bot API"""
+
+    def __init__(self, rate: float = OUTBOUND_RATE, chat_rate: float = OUTBOUND_CHAT_RATE,
+                 chat_burst: int = OUTBOUND_CHAT_BURST, max_retries: int = 3,
+                 window: int = 1000, log_every: int = 1000):
+        self.bucket = TokenBucket(rate)
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.max_retries = max_retries
+        self._chats: "OrderedDict[Any, TokenBucket]" = OrderedDict()
+        self._log_every = log_every
+        self._per_update: Deque[int] = deque(maxlen=window)
+        self.methods: Dict[str, int] = {}
+        self.counts = {"calls": 0, "updates": 0, "retry_after": 0, "throttled": 0}
+
+    def configure(self, rate: Optional[float] = None, redis_client=None, share: int = 1) -> None:
+        """
+        Меняет общий лимит бота. С redis_client лимит rate общий для всех
+        процессов (SharedTokenBucket), а при недоступном Redis процесс
+        ограничен долей rate / share
+        """
+        rate = rate if rate is not None else self.bucket.rate
+        if redis_client is not None:
+            self.bucket = SharedTokenBucket(redis_client, rate, TokenBucket(rate / share))
+        else:
+            self.bucket = TokenBucket(rate / share)
+
+    def install(self, bot, dispatcher=None) -> None:
+        """Подключает middleware к сессии бота и к апдейтам диспетчера"""
+        bot.session.middleware(OutboundMiddleware(self))
+        if dispatcher is not None:
+            dispatcher.update.outer_middleware(UpdateCallsMiddleware(self))
+
+    def _chat_bucket(self, chat_id) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            bucket = self._chats[chat_id] = TokenBucket(self.chat_rate, self.chat_burst)
+            while len(self._chats) > _MAX_CHAT_BUCKETS:
+                self._chats.popitem(last=False)
+        else:
+            self._chats.move_to_end(chat_id)
+        return bucket
+
+    async def request(self, make_request: Callable[..., Awaitable[Any]], bot, method) -> Any:
+        """Запрос к API с лимитами и повтором после 429"""
+        name = getattr(method, "__api_method__", type(method).__name__)
+        limited = name.startswith(_LIMITED_PREFIXES) and name not in _UNLIMITED_METHODS
+        chat_id = getattr(method, "chat_id", None)
+        chat_bucket = self._chat_bucket(chat_id) if limited and chat_id is not None else None
+
+        for attempt in range(self.max_retries + 1):
+            if limited:
+                started = time.monotonic()
+                if chat_bucket is not None:
+                    await chat_bucket.acquire()
+                await self.bucket.acquire()
+                if time.monotonic() - started > 0.05:
+                    self.counts["throttled"] += 1
+            self._count(name)
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                if attempt == self.max_retries:
+                    raise
+                self.counts["retry_after"] += 1
+                logger.warning(f"[DELIVERY] {name} to {chat_id}: flood limit, retry in {e.retry_after}s")
+                if limited:
+                    # Следующая попытка ждет токен, выдача которого приостановлена
+                    (chat_bucket or self.bucket).pause(e.retry_after)
+                else:
+                    await asyncio.sleep(e.retry_after)
+
+    def _count(self, name: str) -> None:
+        self.counts["calls"] += 1
+        self.methods[name] = self.methods.get(name, 0) + 1
+        calls = _update_calls.get()
+        if calls is not None:
+            calls["calls"] += 1
+
+    async def track_update(self, handler, event, data) -> Any:
+        """Выполняет обработку апдейта и запоминает число вызовов API за нее"""
+        calls = {"calls": 0}
+        token = _update_calls.set(calls)
+        try:
+            return await handler(event, data)
+        finally:
+            _update_calls.reset(token)
+            self._per_update.append(calls["calls"])
+            self.counts["updates"] += 1
+            if self.counts["updates"] % self._log_every == 0:
+                logger.info(f"[DELIVERY] {self.snapshot()}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Вызовы API всего и на апдейт (среднее, p50, p99), по методам, срабатывания лимитов"""
+        ordered = sorted(self._per_update)
+        per_update = {"avg": 0.0, "p50": 0, "p99": 0}
+        if ordered:
+            per_update = {
+                "avg": round(sum(ordered) / len(ordered), 2),
+                "p50": ordered[len(ordered) // 2],
+                "p99": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+            }
+        return {**self.counts, "calls_per_update": per_update, "methods": dict(self.methods)}
+
+
+class OutboundMiddleware(BaseRequestMiddleware):
+    """Middleware сессии бота: все запросы к API идут через Delivery.request"""
+
+    def __init__(self, delivery: Delivery):
+        self.delivery = delivery
+
+    async def __call__(self, make_request, bot, method):
+        return await self.delivery.request(make_request, bot, method)
+
+
+class UpdateCallsMiddleware(BaseMiddleware):
+    """Внешний middleware апдейтов: счетчик вызовов API на апдейт"""
+
+    def __init__(self, delivery: Delivery):
+        self.delivery = delivery
+
+    async def __call__(self, handler, event, data):
+        return await self.delivery.track_update(handler, event, data)
+
+
+delivery = Delivery()
+
+
+class ReplyProgress:
+    """
+    Индикатор обработки сообщения и ответ на него:
+
+        async with ReplyProgress(message) as reply:
+            result = await long_operation()
+            await reply.answer(result, reply_markup=...)
+    """
+
+    def __init__(self, message: Message, action: str = ChatAction.TYPING,
+                 placeholder: Optional[str] = None):
+        self.message = message
+        self.action = action
+        self.placeholder_text = placeholder
+        self._placeholder: Optional[Message] = None
+        self._action_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._pending_text: Optional[str] = None
+        self._shown_text = placeholder
+        self._last_edit = 0.0
+
+    async def __aenter__(self) -> "ReplyProgress":
+        if self.placeholder_text:
+            self._placeholder = await self.message.answer(self.placeholder_text)
+            self._last_edit = time.monotonic()
+        else:
+            self._action_task = asyncio.create_task(self._keep_action())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._stop()
+
+    def update(self, text: str) -> None:
+        """Новый текст заглушки; частые изменения склеиваются в одно редактирование"""
+        if self._placeholder is None:
+            return
+        self._pending_text = text
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush())
+
+    async def answer(self, text: str, **kwargs) -> Any:
+        """Итоговый ответ: редактирование заглушки, если разметка это позволяет, иначе сообщение"""
+        self._stop()
+        placeholder, self._placeholder = self._placeholder, None
+        markup = kwargs.get("reply_markup")
+        # Клавиатуру ответа (ReplyKeyboardMarkup) нельзя добавить редактированием
+        if placeholder is not None and (markup is None or isinstance(markup, InlineKeyboardMarkup)):
+            try:
+                return await placeholder.edit_text(text, **kwargs)
+            except TelegramBadRequest as e:
+                logger.warning(f"[DELIVERY] Failed to edit placeholder, sending new message: {e}")
+        result = await self.message.answer(text, **kwargs)
+        if placeholder is not None:
+            try:
+                await placeholder.delete()
+            except TelegramBadRequest:
+                pass
+        return result
+
+    def _stop(self) -> None:
+        for task in (self._action_task, self._flush_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._action_task = self._flush_task = None
+
+    async def _keep_action(self) -> None:
+        await asyncio.sleep(CHAT_ACTION_DELAY)
+        while True:
+            try:
+                await self.message.bot.send_chat_action(self.message.chat.id, self.action)
+            except Exception as e:
+                logger.debug(f"[DELIVERY] Chat action failed: {e}")
+            await asyncio.sleep(CHAT_ACTION_INTERVAL)
+
+    async def _flush(self) -> None:
+        while self._pending_text is not None and self._placeholder is not None:
+            await asyncio.sleep(max(0.0, self._last_edit + EDIT_INTERVAL - time.monotonic()))
+            text, self._pending_text = self._pending_text, None
+            if text is None or text == self._shown_text:
+                continue
+            try:
+                await self._placeholder.edit_text(text)
+                self._shown_text = text
+            except Exception as e:
+                logger.debug(f"[DELIVERY] Placeholder edit failed: {e}")
+            self._last_edit = time.monotonic()
@@ -0,0 +1,149 @@
+"""
+services/dish_matcher.py
+Векторизованная оценка схожести набора ингредиентов со всеми блюдами каталога.
+
+Признаки блюд (названия ингредиентов, ключевые слова, название) собираются один
+раз в словарь строк и три бинарные CSR-матрицы «признак × блюдо». Для каждого
+ингредиента запроса находятся признаки, связанные с ним подстрокой в любую
+сторону, после чего вклад (0.4 / 0.3 / 0.5) добавляется сразу ко всем блюдам.
+Баллы совпадают с calculate_dish_similarity из services.dish_db.
+"""
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Вклады совпадений, как в calculate_dish_similarity
+INGREDIENT_WEIGHT = 0.4
+KEYWORD_WEIGHT = 0.3
+NAME_WEIGHT = 0.5
+
+_SEPARATOR = "\x00"
+
+
+class _BinaryCSR:
+    """Разреженная бинарная матрица «признак × блюдо» в формате CSR"""
+
+    __slots__ = ("indptr", "indices", "n_cols")
+
+    def __init__(self, rows: List[List[int]], n_cols: int):
+        lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+        self.indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.indptr[1:])
+        self.indices = np.fromiter(
+            (col for row in rows for col in row), dtype=np.int32, count=int(self.indptr[-1])
+        )
+        self.n_cols = n_cols
+
+    def any_of(self, row_ids: np.ndarray) -> np.ndarray:
+        """Булев вектор по столбцам: есть ли в столбце хотя бы одна из строк"""
+        hit = np.zeros(self.n_cols, dtype=bool)
+        if row_ids.size:
+            starts = self.indptr[row_ids]
+            ends = self.indptr[row_ids + 1]
+            hit[np.concatenate([self.indices[s:e] for s, e in zip(starts, ends)])] = True
+        return hit
+
+
+class DishSimilarityMatrix:
+    """Оценка ингредиентов против всех блюд каталога одной операцией"""
+
+    def __init__(self, dishes: Dict[str, Dict]):
+        self.dish_keys: List[str] = list(dishes)
+        n_dishes = len(self.dish_keys)
+
+        vocabulary: Dict[str, int] = {}
+        ingredient_rows: List[List[int]] = []
+        keyword_rows: List[List[int]] = []
+        name_rows: List[List[int]] = []
+
+        def feature(text: str) -> int:
+            text = text.lower()
+            if text not in vocabulary:
+                vocabulary[text] = len(vocabulary)
+                for rows in (ingredient_rows, keyword_rows, name_rows):
+                    rows.append([])
+            return vocabulary[text]
+
+        for dish_id, dish in enumerate(dishes.values()):
+            for ingredient in dish.get("ingredients", []):
+                ingredient_rows[feature(ingredient["name"])].append(dish_id)
+            for keyword in dish.get("keywords", []):
+                keyword_rows[feature(keyword)].append(dish_id)
+            name_rows[feature(dish.get("name", ""))].append(dish_id)
+
+        self.vocabulary = vocabulary
+        self.ingredients = _BinaryCSR([sorted(set(row)) for row in ingredient_rows], n_dishes)
+        self.keywords = _BinaryCSR([sorted(set(row)) for row in keyword_rows], n_dishes)
+        self.names = _BinaryCSR([sorted(set(row)) for row in name_rows], n_dishes)
+
+        # Все признаки одной строкой: поиск «запрос внутри признака» через str.find
+        texts = list(vocabulary)
+        self._haystack = _SEPARATOR.join(texts)
+        self._offsets: List[int] = []
+        offset = 0
+        for text in texts:
+            self._offsets.append(offset)
+            offset += len(text) + 1
+        self._matching_features = lru_cache(maxsize=4096)(self._find_matching_features)
+
+    def _find_matching_features(self, query: str) -> np.ndarray:
+        """Id признаков f, для которых f in query или query in f"""
+        if not query:
+            return np.arange(len(self.vocabulary), dtype=np.int64)
+        matched = set()
+        # query внутри признака
+        position = self._haystack.find(query)
+        while position != -1:
+            matched.add(bisect_right(self._offsets, position) - 1)
+            position = self._haystack.find(query, position + 1)
+        # признак внутри query: перебираем подстроки запроса
+        length = len(query)
+        for start in range(length):
+            for end in range(start + 1, length + 1):
+                feature_id = self.vocabulary.get(query[start:end])
+                if feature_id is not None:
+                    matched.add(feature_id)
+        empty_id = self.vocabulary.get("")
+        if empty_id is not None:
+            matched.add(empty_id)
+        return np.fromiter(matched, dtype=np.int64, count=len(matched))
+
+    def scores(self, ingredients: List[str]) -> np.ndarray:
+        """Баллы схожести (0..1) списка ингредиентов со всеми блюдами"""
+        score = np.zeros(len(self.dish_keys), dtype=np.float64)
+        if not ingredients:
+            return score
+        for ingredient in ingredients:
+            features = self._matching_features(ingredient.lower())
+            score += INGREDIENT_WEIGHT * self.ingredients.any_of(features)
+            score += KEYWORD_WEIGHT * self.keywords.any_of(features)
+            score += NAME_WEIGHT * self.names.any_of(features)
+        return np.minimum(score / len(ingredients), 1.0)
+
+    def top_k(self, ingredients: List[str], k: int = 5, threshold: float = 0.0) -> List[Tuple[str, float]]:
+        """
+        [(ключ блюда, балл)] лучших k блюд с баллом >= threshold и > 0, по убыванию
+        балла, при равенстве — в порядке каталога (первое совпадает с best)
+        """
+        score = self.scores(ingredients)
+        k = min(k, score.size)
+        if k <= 0:
+            return []
+        # k-й по величине балл за O(n); все блюда не ниже него — кандидаты с равными баллами
+        kth = np.partition(score, score.size - k)[score.size - k]
+        candidates = np.flatnonzero(score >= max(kth, threshold))
+        candidates = candidates[np.lexsort((candidates, -score[candidates]))][:k]
+        return [(self.dish_keys[i], float(score[i])) for i in candidates if score[i] > 0]
+
+    def best(self, ingredients: List[str], threshold: float = 0.0) -> Tuple[str, float]:
+        """Лучшее блюдо (первое по каталогу при равенстве) или (None, 0.0)"""
+        score = self.scores(ingredients)
+        if not score.size:
+            return None, 0.0
+        best_id = int(np.argmax(score))
+        best_score = float(score[best_id])
+        if best_score > 0 and best_score >= threshold:
+            return self.dish_keys[best_id], best_score
+        return None, 0.0
@@ -0,0 +1,108 @@
+"""
+services/dish_search.py
+Инвертированный индекс для поиска блюд по названию и ключевым словам.
+
+Индекс строится один раз: n-граммы (1–3 символа) → блюда.
+Кандидаты находятся пересечением постингов n-грамм запроса и проверяются
+подстрокой, поэтому набор результатов совпадает с прежним линейным поиском
+(`query in name or query in keyword`), а ранжирование ставит точные совпадения
+выше префиксных и префиксные выше прочих вхождений.
+"""
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+_TOKEN_RE = re.compile(r"\w+")
+_MAX_GRAM = 3
+
+# Ранги совпадений (меньше — лучше)
+RANK_EXACT = 0          # запрос совпадает с названием или ключевым словом
+RANK_PREFIX = 1         # название/ключевое слово начинается с запроса
+RANK_TOKEN = 2          # запрос совпадает со словом или началом слова
+RANK_SUBSTRING = 3      # запрос встречается внутри строки
+
+
+def tokenize(text: str) -> List[str]:
+    """Слова в нижнем регистре"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _grams(text: str, n: int) -> Set[str]:
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class DishSearchIndex:
+    """Индекс поиска по `name` и `keywords` блюд"""
+
+    __slots__ = ("dishes", "texts", "gram_postings")
+
+    def __init__(self, dishes: Dict[str, Dict]):
+        # Блюда в порядке каталога; id блюда — позиция в этом списке
+        self.dishes: List[Dict] = list(dishes.values())
+        # Для каждого блюда: строки поиска в нижнем регистре (название первым)
+        self.texts: List[Tuple[str, ...]] = []
+        self.gram_postings: Dict[str, Set[int]] = {}
+
+        for dish_id, dish in enumerate(self.dishes):
+            texts = tuple(dict.fromkeys(
+                [dish["name"].lower()] + [keyword.lower() for keyword in dish.get("keywords", [])]
+            ))
+            self.texts.append(texts)
+            for text in texts:
+                for n in range(1, _MAX_GRAM + 1):
+                    for gram in _grams(text, n):
+                        self.gram_postings.setdefault(gram, set()).add(dish_id)
+
+    def _candidates(self, query: str) -> Set[int]:
+        """Блюда, содержащие все n-граммы запроса (надмножество результатов)"""
+        n = min(len(query), _MAX_GRAM)
+        postings = []
+        for gram in _grams(query, n):
+            posting = self.gram_postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return candidates
+
+    @staticmethod
+    def _rank(query: str, texts: Tuple[str, ...]) -> Optional[int]:
+        """Ранг лучшего совпадения запроса с одной из строк блюда"""
+        best = None
+        for text in texts:
+            if query not in text:
+                continue
+            if text == query:
+                return RANK_EXACT
+            if text.startswith(query):
+                rank = RANK_PREFIX
+            elif any(token.startswith(query) for token in tokenize(text)):
+                rank = RANK_TOKEN
+            else:
+                rank = RANK_SUBSTRING
+            if best is None or rank < best:
+                best = rank
+        return best
+
+    def search_ranked(self, query: str) -> List[Tuple[int, Dict]]:
+        """[(ранг, блюдо)] по возрастанию ранга, внутри ранга — порядок каталога"""
+        query = query.lower()
+        if not query:
+            return [(RANK_SUBSTRING, dish) for dish in self.dishes]
+
+        ranked = []
+        for dish_id in self._candidates(query):
+            rank = self._rank(query, self.texts[dish_id])
+            if rank is not None:
+                ranked.append((rank, dish_id))
+        ranked.sort()
+        return [(rank, self.dishes[dish_id]) for rank, dish_id in ranked]
+
+    def search(self, query: str) -> List[Dict]:
+        """Блюда, в названии или ключевых словах которых встречается запрос"""
+        return [dish for _, dish in self.search_ranked(query)]
+
@@ -0,0 +1,322 @@
+"""
+services/drink_buffer.py
+Отложенная запись (write-behind) быстрых отметок воды и напитков.
+
+Каждая отметка сразу дописывается в поток Redis (XADD) и в буфер процесса,
+а в drink_entries попадает пакетом — раз в DRINK_FLUSH_MS или когда у
+пользователя набралось DRINK_FLUSH_ITEMS записей. После записи в БД
+элементы удаляются из потока (неудачное удаление повторяется). У каждой
+строки есть write_id (процесс/id в потоке) с уникальным индексом, поэтому
+запись, оставшаяся в потоке после сбоя XDEL, при восстановлении второй раз
+не вставляется. Поток свой у каждого процесса
+(nutribuddy:drink_writes:<хост:pid:суффикс>), и процесс держит его аренду,
+продлевая ее в цикле сброса. Поток, аренда которого истекла (процесс упал),
+забирает другой процесс: берет аренду себе, дописывает записи в БД
+(recover) и удаляет поток. Поток живого процесса не трогает никто, поэтому
+записи не дублируются.
+
+Незаписанные отметки видит только процесс, который их принял: в кластере
+апдейты одного чата всегда приходят в один воркер, и дневные суммы
+(utils.daily_stats) добавляют его буфер к данным из БД.
+
+Без DRINK_WRITE_BEHIND=1 или без Redis add() пишет в БД сразу.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from services.event_bus import DRINK_LOGGED, publish
+from utils.config import DRINK_FLUSH_ITEMS, DRINK_FLUSH_MS
+
+logger = logging.getLogger(__name__)
+
+DRINK_STREAM_PREFIX = "nutribuddy:drink_writes"
+# Множество потоков всех процессов
+DRINK_STREAMS_KEY = f"{DRINK_STREAM_PREFIX}:streams"
+# Срок аренды потока, секунды; продлевается втрое чаще
+_LEASE_TTL = 30
+# Сколько записей потока читается за раз при восстановлении
+_RECOVER_BATCH = 500
+
+
+def stream_key(instance: str) -> str:
+    """Ключ потока отложенных записей процесса"""
+    return f"{DRINK_STREAM_PREFIX}:{instance}"
+
+
+def lease_key(stream: str) -> str:
+    """Ключ аренды потока (значение — имя процесса-владельца)"""
+    return f"{DRINK_STREAM_PREFIX}:lease:{stream[len(DRINK_STREAM_PREFIX) + 1:]}"
+
+
+def write_id(stream: str, entry_id: str) -> str:
+    """Ключ строки drink_entries, записанной из потока: процесс/id записи"""
+    return f"{stream[len(DRINK_STREAM_PREFIX) + 1:]}/{entry_id}"
+
+
+def _dump_row(row: Dict[str, Any]) -> str:
+    return json.dumps({**row, "created_at": row["created_at"].isoformat()}, ensure_ascii=False)
+
+
+def _load_row(raw) -> Dict[str, Any]:
+    row = json.loads(raw)
+    row["created_at"] = datetime.fromisoformat(row["created_at"])
+    return row
+
+
+class DrinkWriteBuffer:
+    """Буфер отметок напитков по пользователям с пакетной записью в drink_entries"""
+
+    def __init__(self, flush_ms: int = DRINK_FLUSH_MS, max_items: int = DRINK_FLUSH_ITEMS,
+                 window: int = 1000, log_every: int = 100):
+        self.flush_interval = flush_ms / 1000
+        self.max_items = max_items
+        self.redis = None
+        self.instance: Optional[str] = None
+        self.key: Optional[str] = None
+        self._lease_renewed = 0.0
+        # id своего потока, записанные в БД, но не удаленные из потока
+        self._unacked: List[str] = []
+        # user_id -> [(id в потоке, строка drink_entries)]
+        self._buffers: Dict[int, List[Tuple[Optional[str], Dict[str, Any]]]] = {}
+        # Строки, которые сейчас пишутся в БД (еще видны в дневных суммах)
+        self._in_flight: Dict[int, List[Dict[str, Any]]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._log_every = log_every
+        self.counts = {"added": 0, "flushes": 0, "flushed_rows": 0, "failed_flushes": 0,
+                       "recovered": 0, "dropped": 0}
+        self._flush_latencies: Deque[float] = deque(maxlen=window)
+        self._started_at = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        return self._task is not None
+
+    async def start(self, redis_client):
+        """Берет аренду своего потока, дописывает потоки упавших процессов и запускает цикл сброса"""
+        if self._task is not None:
+            return
+        from utils.cluster import instance_id
+
+        self.redis = redis_client
+        self.instance = instance_id()
+        self.key = stream_key(self.instance)
+        await self._renew_lease()
+        await self.recover_orphans()
+        self._started_at = time.monotonic()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"[WRITE_BEHIND] Started on {self.key}: flush every "
+                    f"{self.flush_interval * 1000:.0f} ms or {self.max_items} items")
+
+    async def stop(self):
+        """Останавливает цикл и сбрасывает буфер в БД"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        await self.flush()
+        await self._ack([])
+        try:
+            if not await self.redis.xlen(self.key):
+                await self._drop_stream(self.key)
+            # Иначе аренда истечет, и оставшиеся записи допишет другой процесс
+        except Exception as e:
+            logger.warning(f"[WRITE_BEHIND] Failed to release {self.key}: {e}")
+        logger.info(f"[WRITE_BEHIND] Stopped: {self.snapshot()}")
+
+    async def add(self, row: Dict[str, Any]) -> None:
+        """Отметка напитка (строка database.meal_writes.drink_row)"""
+        if not self.enabled:
+            from database.meal_writes import insert_drink_rows
+            await insert_drink_rows([row])
+            await publish(DRINK_LOGGED, row["user_id"], amount=row["amount"], calories=row["calories"])
+            return
+
+        entry_id = await self.redis.xadd(self.key, {"row": _dump_row(row)})
+        if isinstance(entry_id, bytes):
+            entry_id = entry_id.decode()
+        row = {**row, "write_id": write_id(self.key, entry_id)}
+        buffer = self._buffers.setdefault(row["user_id"], [])
+        buffer.append((entry_id, row))
+        self.counts["added"] += 1
+        if len(buffer) >= self.max_items:
+            self._wakeup.set()
+
+    def pending(self, user_id: int) -> Dict[str, float]:
+        """Еще не записанные в БД объем и калории пользователя (read-your-writes)"""
+        rows = [row for _, row in self._buffers.get(user_id, ())]
+        rows.extend(self._in_flight.get(user_id, ()))
+        return {
+            "amount": sum(row["amount"] for row in rows),
+            "calories": sum(row["calories"] for row in rows),
+            "entries": len(rows),
+        }
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+                if self._unacked:
+                    await self._ack([])
+                if time.monotonic() - self._lease_renewed >= _LEASE_TTL / 3:
+                    await self._renew_lease()
+                    await self.recover_orphans()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[WRITE_BEHIND] Flush loop error: {e}")
+
+    async def _renew_lease(self):
+        await self.redis.set(lease_key(self.key), self.instance, ex=_LEASE_TTL)
+        await self.redis.sadd(DRINK_STREAMS_KEY, self.key)
+        self._lease_renewed = time.monotonic()
+
+    async def recover_orphans(self) -> int:
+        """Дописывает в БД потоки процессов, аренда которых истекла; возвращает число записей"""
+        recovered = 0
+        for stream in await self.redis.smembers(DRINK_STREAMS_KEY):
+            stream = stream.decode() if isinstance(stream, bytes) else stream
+            if stream == self.key:
+                continue
+            # Аренда есть — владелец жив или поток уже восстанавливает другой процесс
+            if not await self.redis.set(lease_key(stream), self.instance, nx=True, ex=_LEASE_TTL):
+                continue
+            try:
+                recovered += await self.recover(stream)
+                await self._drop_stream(stream)
+            except Exception as e:
+                # Аренда истечет, и поток заберут снова
+                logger.error(f"[WRITE_BEHIND] Recovery from {stream} failed: {e}")
+        return recovered
+
+    async def _drop_stream(self, stream: str):
+        await self.redis.srem(DRINK_STREAMS_KEY, stream)
+        await self.redis.delete(stream, lease_key(stream))
+
+    async def flush(self) -> int:
+        """Пишет весь буфер одним INSERT; при ошибке строки возвращаются в буфер"""
+        async with self._flush_lock:
+            if not self._buffers:
+                return 0
+            batch, self._buffers = self._buffers, {}
+            self._in_flight = {user_id: [row for _, row in items] for user_id, items in batch.items()}
+            entries = [item for items in batch.values() for item in items]
+            started = time.perf_counter()
+            try:
+                written = await self._write([row for _, row in entries])
+            except Exception as e:
+                # Строки остаются в потоке; возвращаем их в начало буферов
+                self.counts["failed_flushes"] += 1
+                logger.error(f"[WRITE_BEHIND] Flush of {len(entries)} rows failed: {e}")
+                for user_id, items in batch.items():
+                    self._buffers[user_id] = items + self._buffers.get(user_id, [])
+                return 0
+            finally:
+                self._in_flight = {}
+
+            self._flush_latencies.append(time.perf_counter() - started)
+            self.counts["flushes"] += 1
+            self.counts["flushed_rows"] += written
+            await self._ack([entry_id for entry_id, _ in entries if entry_id])
+            # Одно событие на пользователя за сброс
+            for user_id, items in batch.items():
+                await publish(DRINK_LOGGED, user_id, amount=sum(row["amount"] for _, row in items),
+                              calories=sum(row["calories"] for _, row in items), entries=len(items))
+            if self.counts["flushes"] % self._log_every == 0:
+                logger.info(f"[WRITE_BEHIND] {self.snapshot()}")
+            return written
+
+    async def _write(self, rows: List[Dict[str, Any]]) -> int:
+        """Пакетная вставка; если пакет отклонен внешним ключом, пишет строки по одной"""
+        from sqlalchemy.exc import IntegrityError
+        from database.meal_writes import insert_drink_rows
+
+        try:
+            return len(await insert_drink_rows(rows))
+        except IntegrityError:
+            written = 0
+            for row in rows:
+                try:
+                    await insert_drink_rows([row])
+                    written += 1
+                except IntegrityError:
+                    # Пользователь удален, пока запись ждала в буфере
+                    self.counts["dropped"] += 1
+                    logger.warning(f"[WRITE_BEHIND] Dropped drink for missing user {row['user_id']}")
+            return written
+
+    async def _ack(self, entry_ids: List[str], stream: Optional[str] = None):
+        """Удаляет записанные в БД записи из потока; для своего потока неудачное удаление повторяется"""
+        stream = stream or self.key
+        own = stream == self.key
+        if own and self._unacked:
+            entry_ids, self._unacked = self._unacked + list(entry_ids), []
+        if not entry_ids or self.redis is None:
+            return
+        try:
+            await self.redis.xdel(stream, *entry_ids)
+        except Exception as e:
+            # Записи останутся в потоке, но recover их не продублирует: write_id уже в БД
+            logger.error(f"[WRITE_BEHIND] Failed to trim {len(entry_ids)} entries from {stream}: {e}")
+            if own:
+                self._unacked = list(entry_ids)
+
+    async def recover(self, stream: Optional[str] = None) -> int:
+        """Дописывает в БД записи потока (по умолчанию своего), оставшиеся после падения процесса"""
+        stream = stream or self.key
+        recovered = 0
+        last_id = "-"
+        while True:
+            # «(id» — граница без самой записи (Redis 6.2+), как XAUTOCLAIM в event_bus
+            start = last_id if last_id == "-" else f"({last_id}"
+            entries = await self.redis.xrange(stream, min=start, max="+", count=_RECOVER_BATCH)
+            if not entries:
+                break
+            ids, rows = [], []
+            for entry_id, fields in entries:
+                entry_id = entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+                raw = fields.get(b"row", fields.get("row"))
+                ids.append(entry_id)
+                try:
+                    rows.append({**_load_row(raw), "write_id": write_id(stream, entry_id)})
+                except (TypeError, ValueError, KeyError) as e:
+                    logger.error(f"[WRITE_BEHIND] Malformed stream entry {entry_id}: {e}")
+            recovered += await self._write(rows)
+            await self._ack(ids, stream)
+            if stream != self.key:
+                await self.redis.expire(lease_key(stream), _LEASE_TTL)
+            last_id = ids[-1]
+        if recovered:
+            self.counts["recovered"] += recovered
+            logger.info(f"[WRITE_BEHIND] Recovered {recovered} drinks from {stream}")
+        return recovered
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Счетчики, размер пакета, частота и задержка сброса"""
+        ordered = sorted(self._flush_latencies)
+        flushes = self.counts["flushes"]
+        uptime = time.monotonic() - self._started_at
+        return {
+            **self.counts,
+            "pending": sum(len(items) for items in self._buffers.values()),
+            "avg_batch": round(self.counts["flushed_rows"] / flushes, 2) if flushes else 0.0,
+            "flushes_per_min": round(flushes / uptime * 60, 2) if uptime else 0.0,
+            "flush_p50_ms": round(ordered[len(ordered) // 2] * 1000, 2) if ordered else 0.0,
+            "flush_p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 2)
+            if ordered else 0.0,
+        }
+
+
+drink_write_buffer = DrinkWriteBuffer()
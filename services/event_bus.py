@@ -0,0 +1,264 @@
+"""
+services/event_bus.py
+Внутренняя шина доменных событий.
+
+Сервисы записи (еда, напитки, вес, активность) публикуют событие после
+commit и сразу отвечают пользователю; достижения, уведомления и прочие
+подписчики обрабатываются в фоне пулом из EVENT_WORKERS задач. У каждого
+воркера своя очередь, события пользователя всегда попадают к одному
+воркеру и обрабатываются по порядку (проверка достижений не идет
+параллельно для одного пользователя).
+
+Без Redis события идут через ограниченные очереди процесса (при
+переполнении событие отбрасывается и учитывается в счетчиках). С Redis
+событие пишется в поток nutribuddy:events и читается группой потребителей:
+каждое событие обрабатывает одна реплика, подтверждение (XACK) — после
+всех подписчиков. Потребитель называется по процессу (хост:pid:суффикс),
+поэтому имена не совпадают у контейнеров и перезапусков. Зависшие у упавшей
+реплики события забираются периодически (XAUTOCLAIM), заодно удаляются
+давно неактивные потребители без необработанных событий.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from utils.config import EVENT_QUEUE_SIZE, EVENT_STREAM_MAXLEN, EVENT_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# Типы событий
+FOOD_LOGGED = "food.logged"
+DRINK_LOGGED = "drink.logged"
+WEIGHT_LOGGED = "weight.logged"
+ACTIVITY_LOGGED = "activity.logged"
+ACHIEVEMENT_UNLOCKED = "achievement.unlocked"
+
+EVENT_STREAM = "nutribuddy:events"
+EVENT_GROUP = "consumers"
+# Через сколько миллисекунд событие упавшей реплики можно забрать
+_CLAIM_IDLE_MS = 60000
+# Как часто забирать зависшие события, секунды
+_CLAIM_INTERVAL = 30
+# Потребитель без событий, неактивный дольше этого, удаляется из группы (мс)
+_CONSUMER_IDLE_MS = 3600 * 1000
+
+Handler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class EventBus:
+    """Публикация событий и их обработка пулом воркеров"""
+
+    def __init__(self, workers: int = EVENT_WORKERS, queue_size: int = EVENT_QUEUE_SIZE,
+                 window: int = 1000, log_every: int = 1000):
+        self.workers = workers
+        self.redis = None
+        self.consumer: Optional[str] = None
+        # Прочитанные из потока и еще не подтвержденные этим процессом события
+        self._held: set = set()
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._queues: List[asyncio.Queue] = [
+            asyncio.Queue(maxsize=max(1, queue_size // workers)) for _ in range(workers)
+        ]
+        self._tasks: List[asyncio.Task] = []
+        self._log_every = log_every
+        self.counts = {"published": 0, "handled": 0, "failed": 0, "dropped": 0, "claimed": 0}
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._lags: Deque[float] = deque(maxlen=window)
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def subscribe(self, event_type: str, handler: Handler) -> None:
+        """Подписчик на тип события ("*" — на все события)"""
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    async def publish(self, event_type: str, user_id: int, **data) -> None:
+        """Публикует событие; вызывать после commit. Ошибки публикации не прерывают запись"""
+        if not self.running:
+            return
+        event = {"type": event_type, "user_id": user_id, "ts": time.time(), **data}
+        self.counts["published"] += 1
+        if self.redis is not None:
+            try:
+                await self.redis.xadd(
+                    EVENT_STREAM, {"event": json.dumps(event, ensure_ascii=False, default=str)},
+                    maxlen=EVENT_STREAM_MAXLEN, approximate=True
+                )
+                return
+            except Exception as e:
+                logger.warning(f"[EVENT_BUS] Redis publish failed, handling {event_type} locally: {e}")
+        try:
+            self._queue_for(event).put_nowait((None, event))
+        except asyncio.QueueFull:
+            self.counts["dropped"] += 1
+            logger.warning(f"[EVENT_BUS] Queue full, dropped {event_type} for {user_id}")
+
+    async def start(self, redis_client=None, consumer: Optional[str] = None):
+        """Запускает воркеры; с redis_client — чтение из группы потребителей потока"""
+        if self.running:
+            return
+        from utils.cluster import instance_id
+
+        self.consumer = consumer or instance_id()
+        if redis_client is not None:
+            try:
+                await redis_client.xgroup_create(EVENT_STREAM, EVENT_GROUP, id="0", mkstream=True)
+            except Exception as e:
+                if "BUSYGROUP" not in str(e):
+                    logger.error(f"[EVENT_BUS] Failed to create group, using local queue: {e}")
+                    redis_client = None
+            self.redis = redis_client
+        self._tasks = [asyncio.create_task(self._worker(queue)) for queue in self._queues]
+        if self.redis is not None:
+            self._tasks.append(asyncio.create_task(self._read_stream()))
+        backend = "redis stream" if self.redis is not None else "local queue"
+        logger.info(f"[EVENT_BUS] Started {self.workers} workers on {backend}")
+
+    async def stop(self, timeout: float = 10.0):
+        """Дожидается обработки очереди (не дольше timeout) и останавливает воркеры"""
+        if not self.running:
+            return
+        try:
+            await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in self._queues)), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"[EVENT_BUS] {self._queued()} events left unprocessed on stop")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info(f"[EVENT_BUS] Stopped: {self.snapshot()}")
+
+    async def _read_stream(self):
+        """Переносит события из группы потребителей в локальную очередь воркеров"""
+        claimed_at = 0.0
+        while True:
+            if time.monotonic() - claimed_at >= _CLAIM_INTERVAL:
+                await self._claim_stale()
+                await self._forget_consumers()
+                claimed_at = time.monotonic()
+            try:
+                response = await self.redis.xreadgroup(
+                    EVENT_GROUP, self.consumer, {EVENT_STREAM: ">"}, count=self.workers * 4, block=1000
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[EVENT_BUS] Stream read error: {e}")
+                await asyncio.sleep(1)
+                continue
+            for _, entries in response or ():
+                for entry_id, fields in entries:
+                    await self._enqueue(entry_id, fields)
+
+    async def _claim_stale(self):
+        """Забирает события, которые прочитала и не подтвердила упавшая реплика"""
+        start = "0-0"
+        try:
+            while True:
+                result = await self.redis.xautoclaim(
+                    EVENT_STREAM, EVENT_GROUP, self.consumer, _CLAIM_IDLE_MS, start_id=start, count=100
+                )
+                start, entries = result[0], result[1]
+                for entry_id, fields in entries:
+                    if entry_id in self._held:
+                        # Свое событие ждет воркера дольше _CLAIM_IDLE_MS
+                        continue
+                    self.counts["claimed"] += 1
+                    await self._enqueue(entry_id, fields)
+                if not entries or start in ("0-0", b"0-0"):
+                    break
+        except Exception as e:
+            logger.warning(f"[EVENT_BUS] Failed to claim stale events: {e}")
+
+    async def _forget_consumers(self):
+        """Удаляет из группы потребителей завершившихся процессов (без необработанных событий)"""
+        try:
+            for info in await self.redis.xinfo_consumers(EVENT_STREAM, EVENT_GROUP):
+                name = info.get("name")
+                name = name.decode() if isinstance(name, bytes) else name
+                if name != self.consumer and not info.get("pending") and info.get("idle", 0) > _CONSUMER_IDLE_MS:
+                    await self.redis.xgroup_delconsumer(EVENT_STREAM, EVENT_GROUP, name)
+        except Exception as e:
+            logger.warning(f"[EVENT_BUS] Failed to clean up consumers: {e}")
+
+    async def _enqueue(self, entry_id, fields):
+        raw = fields.get(b"event", fields.get("event")) if fields else None
+        try:
+            event = json.loads(raw)
+        except (TypeError, ValueError) as e:
+            logger.error(f"[EVENT_BUS] Malformed event {entry_id}: {e}")
+            await self._ack(entry_id)
+            return
+        # Ограниченная очередь: чтение из потока ждет свободных воркеров
+        self._held.add(entry_id)
+        await self._queue_for(event).put((entry_id, event))
+
+    def _queue_for(self, event: Dict[str, Any]) -> asyncio.Queue:
+        """Очередь воркера пользователя события"""
+        return self._queues[hash(event.get("user_id")) % len(self._queues)]
+
+    def _queued(self) -> int:
+        return sum(queue.qsize() for queue in self._queues)
+
+    async def _ack(self, entry_id):
+        self._held.discard(entry_id)
+        try:
+            await self.redis.xack(EVENT_STREAM, EVENT_GROUP, entry_id)
+        except Exception as e:
+            logger.warning(f"[EVENT_BUS] Failed to ack {entry_id}: {e}")
+
+    async def _worker(self, queue: asyncio.Queue):
+        while True:
+            entry_id, event = await queue.get()
+            try:
+                await self._dispatch(event)
+            finally:
+                if entry_id is not None:
+                    await self._ack(entry_id)
+                queue.task_done()
+
+    async def _dispatch(self, event: Dict[str, Any]):
+        started = time.perf_counter()
+        self._lags.append(max(0.0, time.time() - event.get("ts", time.time())))
+        handlers = self._handlers.get(event["type"], []) + self._handlers.get("*", [])
+        for handler in handlers:
+            try:
+                await handler(event)
+            except Exception as e:
+                self.counts["failed"] += 1
+                logger.error(f"[EVENT_BUS] {getattr(handler, '__name__', handler)} failed on "
+                             f"{event['type']} for {event.get('user_id')}: {e}")
+        self._latencies.append(time.perf_counter() - started)
+        self.counts["handled"] += 1
+        if self.counts["handled"] % self._log_every == 0:
+            logger.info(f"[EVENT_BUS] {self.snapshot()}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Счетчики, длина очереди, время обработки и задержка от публикации"""
+        def percentiles(values) -> Tuple[float, float]:
+            ordered = sorted(values)
+            if not ordered:
+                return 0.0, 0.0
+            return (round(ordered[len(ordered) // 2] * 1000, 2),
+                    round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 2))
+
+        handle_p50, handle_p99 = percentiles(self._latencies)
+        lag_p50, lag_p99 = percentiles(self._lags)
+        return {
+            **self.counts,
+            "queued": self._queued(),
+            "handle_p50_ms": handle_p50, "handle_p99_ms": handle_p99,
+            "lag_p50_ms": lag_p50, "lag_p99_ms": lag_p99,
+        }
+
+
+event_bus = EventBus()
+
+
+async def publish(event_type: str, user_id: int, **data) -> None:
+    """Публикация в общую шину процесса"""
+    await event_bus.publish(event_type, user_id, **data)
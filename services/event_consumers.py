@@ -0,0 +1,109 @@
+"""
+services/event_consumers.py
+Подписчики шины событий: битовые карты целей, достижения, таблица лидеров
+и уведомления.
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict
+
+from services.event_bus import (
+    ACHIEVEMENT_UNLOCKED, ACTIVITY_LOGGED, DRINK_LOGGED, FOOD_LOGGED, WEIGHT_LOGGED,
+    EventBus, publish,
+)
+
+logger = logging.getLogger(__name__)
+
+# Событие записи -> действие GamificationSystem.check_achievements
+ACHIEVEMENT_ACTIONS = {
+    FOOD_LOGGED: "meal",
+    DRINK_LOGGED: "water",
+    WEIGHT_LOGGED: "weight",
+    ACTIVITY_LOGGED: "activity",
+}
+
+
+# Отметки уже объявленных достижений: достижение разблокируется один раз, поэтому
+# срока достаточно, чтобы перекрыть одновременные проверки
+ACHIEVEMENT_UNLOCK_PREFIX = "nutribuddy:achievement_unlocked"
+ACHIEVEMENT_UNLOCK_TTL = 7 * 24 * 3600
+
+
+# Событие записи -> цели, сумму которых оно меняет (services/goal_bitmaps.py)
+GOAL_UPDATES = {
+    FOOD_LOGGED: ("calories", "meals"),
+    DRINK_LOGGED: ("water",),
+    ACTIVITY_LOGGED: ("activity",),
+}
+
+
+async def update_goal_bits_on_event(event: Dict[str, Any]) -> None:
+    """Биты выполненных за сегодня целей — до проверки достижений"""
+    from services.goal_bitmaps import update_goal_bits
+    await update_goal_bits(event["user_id"], GOAL_UPDATES[event["type"]])
+
+
+async def check_achievements_on_event(event: Dict[str, Any]) -> None:
+    """Проверка достижений после записи; новые достижения — событие ACHIEVEMENT_UNLOCKED"""
+    from utils.gamification import gamification_system
+
+    data = {**event, "time": datetime.fromtimestamp(event["ts"])}
+    unlocked = await gamification_system.check_achievements(
+        event["user_id"], ACHIEVEMENT_ACTIONS[event["type"]], data
+    )
+    for achievement in unlocked:
+        if await _first_unlock(event["user_id"], achievement.id):
+            await publish(ACHIEVEMENT_UNLOCKED, event["user_id"], achievement_id=achievement.id)
+
+
+async def _first_unlock(user_id: int, achievement_id: str) -> bool:
+    """
+    Отметка разблокировки в Redis (SET NX): события одного пользователя на разных
+    репликах могут проверяться одновременно, а уведомление и очки — один раз
+    """
+    from services.event_bus import event_bus
+
+    if event_bus.redis is None:
+        return True
+    try:
+        return bool(await event_bus.redis.set(
+            f"{ACHIEVEMENT_UNLOCK_PREFIX}:{user_id}:{achievement_id}", 1, nx=True, ex=ACHIEVEMENT_UNLOCK_TTL
+        ))
+    except Exception as e:
+        logger.warning(f"[ACHIEVEMENT] Failed to mark {achievement_id} for {user_id}: {e}")
+        return True
+
+
+async def award_leaderboard_points(event: Dict[str, Any]) -> None:
+    """Очки нового достижения в таблицы лидеров (ZINCRBY)"""
+    from services.leaderboard import leaderboard
+    from utils.gamification import gamification_system
+
+    achievement = gamification_system.achievements.get(event["achievement_id"])
+    if achievement is not None:
+        await leaderboard.award(event["user_id"], achievement.points)
+
+
+def make_achievement_notifier(bot):
+    """Отправка сообщения о новом достижении"""
+    async def notify_achievement(event: Dict[str, Any]) -> None:
+        from utils.gamification import format_achievement_message, gamification_system
+
+        achievement = gamification_system.achievements.get(event["achievement_id"])
+        if achievement is None:
+            return
+        await bot.send_message(event["user_id"], format_achievement_message(achievement))
+
+    return notify_achievement
+
+
+def register_consumers(bus: EventBus, bot=None) -> None:
+    """Подписывает обработчики; без бота уведомления не отправляются"""
+    # Подписчики события вызываются по порядку: сначала биты целей
+    for event_type in GOAL_UPDATES:
+        bus.subscribe(event_type, update_goal_bits_on_event)
+    for event_type in ACHIEVEMENT_ACTIONS:
+        bus.subscribe(event_type, check_achievements_on_event)
+    bus.subscribe(ACHIEVEMENT_UNLOCKED, award_leaderboard_points)
+    if bot is not None:
+        bus.subscribe(ACHIEVEMENT_UNLOCKED, make_achievement_notifier(bot))
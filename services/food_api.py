@@ -4,14 +4,45 @@ API для поиска продуктов и блюд
 """
 from typing import List, Dict, Optional
 import logging
-from services.dish_db import search_dishes_by_name, get_dish_nutrition
-from services.translator import translate_to_russian
 
 logger = logging.getLogger(__name__)
 
+def _dish_variant(dish: Dict, product_name: str) -> Dict:
+    """Вариант из каталога готовых блюд (КБЖУ на 100 г)"""
+    nutrition = dish.get('nutrition_per_100', {})
+    return {
+        'id': dish.get('name', product_name),
+        'name': dish.get('name', product_name),
+        'name_en': dish.get('name_en', [product_name])[0] if dish.get('name_en') else product_name,
+        'category': dish.get('category', 'main'),
+        'calories': nutrition.get('calories', 0),
+        'protein': nutrition.get('protein', 0),
+        'fat': nutrition.get('fat', 0),
+        'carbs': nutrition.get('carbs', 0),
+        'default_weight': dish.get('default_weight', 100),
+        'source': 'dish_db'
+    }
+
+def _off_variant(product: Dict) -> Dict:
+    """Вариант из локального каталога OpenFoodFacts (КБЖУ на 100 г)"""
+    name = f"{product['name']} ({product['brands'].split(',')[0].strip()})" if product['brands'] else product['name']
+    return {
+        'id': f"off:{product['code']}" if product['code'] else name,
+        'name': name,
+        'name_en': product['name'],
+        'category': 'product',
+        'calories': round(product['calories'], 1),
+        'protein': round(product['protein'], 1),
+        'fat': round(product['fat'], 1),
+        'carbs': round(product['carbs'], 1),
+        'default_weight': 100,
+        'source': 'openfoodfacts'
+    }
+
 async def get_product_variants(product_name: str) -> List[Dict]:
     """
-    Получить варианты продуктов по названию
+    Получить варианты продуктов по названию: готовые блюда, затем
+    фасованные продукты из локального каталога OpenFoodFacts
     
     Args:
         product_name: Название продукта для поиска
@@ -19,33 +50,23 @@ async def get_product_variants(product_name: str) -> List[Dict]:
     Returns:
         List[Dict]: Список вариантов с информацией о питательности
     """
+    # Каталог блюд загружается при первом поиске, а не при старте бота
+    from services.dish_db import find_dishes
+    from services.off_catalog import off_catalog
+    
     try:
         # Ищем блюда по названию
-        dishes = search_dishes_by_name(product_name)
+        variants = [_dish_variant(dish, product_name) for dish in find_dishes(product_name)]
         
-        if not dishes:
+        # Фасованные и брендовые продукты — локальный каталог, без запроса к AI
+        if not variants:
+            variants = [_off_variant(product) for product in off_catalog.search(product_name)]
+        
+        if not variants:
             logger.warning(f"Продукт '{product_name}' не найден в базе")
             return []
         
-        # Конвертируем блюда в формат вариантов
-        variants = []
-        for dish in dishes:
-            nutrition = get_dish_nutrition(dish.get('name', product_name))
-            
-            variant = {
-                'id': dish.get('name', product_name),
-                'name': dish.get('name', product_name),
-                'name_en': dish.get('name_en', [product_name])[0] if dish.get('name_en') else product_name,
-                'category': dish.get('category', 'main'),
-                'calories': nutrition.get('calories', 0),
-                'protein': nutrition.get('protein', 0),
-                'fat': nutrition.get('fat', 0),
-                'carbs': nutrition.get('carbs', 0),
-                'default_weight': dish.get('default_weight', 100)
-            }
-            variants.append(variant)
-        
-        logger.info(f"Найдено {len(variants)} вариантов для '{product_name}'")
+        logger.info(f"Найдено {len(variants)} вариантов для '{product_name}' ({variants[0]['source']})")
         return variants
         
     except Exception as e:
@@ -63,8 +84,10 @@ def get_product_nutrition(product_name: str, weight: float = 100) -> Dict:
     Returns:
         Dict: Информация о питательности
     """
+    from services.dish_db import find_dishes
+    
     try:
-        dishes = search_dishes_by_name(product_name)
+        dishes = find_dishes(product_name)
         
         if not dishes:
             return {
@@ -74,10 +97,21 @@ def get_product_nutrition(product_name: str, weight: float = 100) -> Dict:
                 'carbs': 0
             }
         
-        # Берем первый найденный вариант
-        nutrition = get_dish_nutrition(dishes[0].get('name', product_name), weight)
+        # Берем первый найденный вариант; find_dishes возвращает записи каталога,
+        # а не ключи, поэтому КБЖУ считаем по nutrition_per_100, как в _dish_variant
+        dish = dishes[0]
+        nutrition = dish.get('nutrition_per_100', {})
+        factor = weight / 100.0
         
-        return nutrition
+        return {
+            'calories': nutrition.get('calories', 0) * factor,
+            'protein': nutrition.get('protein', 0) * factor,
+            'fat': nutrition.get('fat', 0) * factor,
+            'carbs': nutrition.get('carbs', 0) * factor,
+            'weight': weight,
+            'dish_name': dish.get('name', product_name),
+            'category': dish.get('category', 'main')
+        }
         
     except Exception as e:
         logger.error(f"Ошибка при получении питательности для '{product_name}': {e}")
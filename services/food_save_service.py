@@ -4,13 +4,12 @@
 """
 
 import logging
-import re
 from typing import Dict, Any, List, Optional
-from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
-from database.db import get_session
-from database.models import User, FoodEntry
+from database.meal_writes import food_row, insert_food_entries, utc_now
+from services.event_bus import FOOD_LOGGED, publish
+from utils.quantity_lexer import parse_quantity
 from utils.unit_converter import convert_to_grams
 
 logger = logging.getLogger(__name__)
@@ -19,94 +18,91 @@ class FoodSaveService:
     """Унифицированный сервис сохранения еды"""
 
     @staticmethod
-    async def save_food_to_db(
+    def build_food_rows(
         user_id: int,
         food_items: List[Dict[str, Any]],
         meal_type: str = "main"
+    ) -> List[Dict[str, Any]]:
+        """Строки food_entries для продуктов от AI (вес в граммах, КБЖУ с учетом веса)"""
+        created_at = utc_now()
+        rows = []
+        for item in food_items:
+            # Конвертируем вес в граммы
+            quantity_str = item.get('quantity', '100 г')
+            unit = item.get('unit')
+
+            # Число и единица из строки quantity («150 г», «1,5 кг», «две штуки»)
+            try:
+                if isinstance(quantity_str, str):
+                    quantity, quantity_unit = parse_quantity(quantity_str)
+                    quantity = float(quantity) if quantity is not None else 100.0
+                    unit = unit or quantity_unit
+                else:
+                    quantity = float(quantity_str) if quantity_str else 100.0
+            except (ValueError, TypeError):
+                quantity = 100.0
+            unit = unit or 'г'
+
+            weight_grams = convert_to_grams(item.get('name', ''), quantity, unit)
+
+            # Рассчитываем КБЖУ с учётом веса
+            factor = weight_grams / 100.0
+            nutrition = {
+                'calories': item.get('calories', 0) * factor,
+                'protein': item.get('protein', 0) * factor,
+                'fat': item.get('fat', 0) * factor,
+                'carbs': item.get('carbs', 0) * factor,
+                'fiber': item.get('fiber', 0),
+                'sugar': item.get('sugar', 0),
+                'sodium': item.get('sodium', 0),
+            }
+            rows.append(food_row(
+                user_id, item.get('name', 'Неизвестный продукт'), nutrition, meal_type,
+                quantity=weight_grams, created_at=created_at
+            ))
+        return rows
+
+    @staticmethod
+    async def save_food_to_db(
+        user_id: int,
+        food_items: List[Dict[str, Any]],
+        meal_type: str = "main",
+        user_timezone: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Сохраняет еду в базу данных
+        Сохраняет еду в базу данных одним INSERT ... RETURNING
 
         Args:
             user_id: Telegram ID пользователя
             food_items: Список продуктов от AI
             meal_type: Тип приема пищи
+            user_timezone: Часовой пояс для дневных сумм (по умолчанию UTC)
 
         Returns:
-            Dict с результатом сохранения
+            Dict с результатом сохранения, id записей и КБЖУ за день
         """
         try:
-            async with get_session() as session:
-                # Получаем пользователя
-                user_result = await session.execute(
-                    select(User).where(User.telegram_id == user_id)
-                )
-                user = user_result.scalar_one_or_none()
-
-                if not user:
-                    return {
-                        "success": False,
-                        "error": "Пользователь не найден"
-                    }
-
-                total_calories = 0
-
-                # Сохраняем продукты
-                for item in food_items:
-                    # Конвертируем вес в граммы
-                    quantity_str = item.get('quantity', '100 г')
-                    unit = item.get('unit', 'г')
+            rows = FoodSaveService.build_food_rows(user_id, food_items, meal_type)
+            written = await insert_food_entries(user_id, rows, user_timezone)
+            total_calories = sum(row['calories'] for row in rows)
+            await publish(FOOD_LOGGED, user_id, meal_type=meal_type, entry_ids=written["ids"],
+                          calories=total_calories)
 
-                    # Извлекаем число из строки quantity
-                    try:
-                        if isinstance(quantity_str, str):
-                            match = re.search(r'[-+]?\d*\.?\d+', quantity_str)
-                            if match:
-                                quantity = float(match.group())
-                            else:
-                                quantity = 100.0
-                        else:
-                            quantity = float(quantity_str) if quantity_str else 100.0
-                    except (ValueError, TypeError):
-                        quantity = 100.0
+            logger.info(f"[FOOD_SAVE] Сохранен прием пищи: {meal_type}, {len(rows)} продуктов")
 
-                    weight_grams = convert_to_grams(item.get('name', ''), quantity, unit)
-
-                    # Рассчитываем КБЖУ с учётом веса
-                    factor = weight_grams / 100.0
-                    food_calories = item.get('calories', 0) * factor
-                    food_protein = item.get('protein', 0) * factor
-                    food_fat = item.get('fat', 0) * factor
-                    food_carbs = item.get('carbs', 0) * factor
-                    total_calories += food_calories
-
-                    # Создаем запись еды
-                    food_entry = FoodEntry(
-                        user_id=user.telegram_id,
-                        food_name=item.get('name', 'Неизвестный продукт'),
-                        calories=food_calories,
-                        protein=food_protein,
-                        fat=food_fat,
-                        carbs=food_carbs,
-                        fiber=item.get('fiber', 0),
-                        sugar=item.get('sugar', 0),
-                        sodium=item.get('sodium', 0),
-                        meal_type=meal_type,
-                        quantity=weight_grams,
-                        unit='г',
-                        created_at=datetime.now()
-                    )
-                    session.add(food_entry)
-
-                await session.commit()
-
-                logger.info(f"[FOOD_SAVE] Сохранен прием пищи: {meal_type}, {len(food_items)} продуктов")
-
-                return {
-                    "success": True,
-                    "message": f"Сохранено {len(food_items)} продуктов на {total_calories:.0f} ккал"
-                }
+            return {
+                "success": True,
+                "message": f"Сохранено {len(rows)} продуктов на {total_calories:.0f} ккал",
+                "entry_ids": written["ids"],
+                "daily_totals": written["daily_totals"]
+            }
 
+        except IntegrityError:
+            # user_id ссылается на users.telegram_id
+            return {
+                "success": False,
+                "error": "Пользователь не найден"
+            }
         except Exception as e:
             logger.error(f"[FOOD_SAVE] Ошибка сохранения еды: {e}")
             return {
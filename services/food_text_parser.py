@@ -0,0 +1,252 @@
+"""
+services/food_text_parser.py
+Локальный разбор описания еды без обращения к LLM.
+
+«2 яйца и хлеб», «гречка 200 г, котлета», «борщ со сметаной» разбираются
+по справочникам бота: текст делится на позиции по союзам и запятым,
+количество и единица берутся из utils.quantity_lexer, название ищется среди
+блюд (COMPOSITE_DISHES) и ингредиентов (NutritionResolver), вес — по единице,
+весу штуки (UNIT_WEIGHTS) или порции блюда. У каждой позиции есть
+уверенность; если уверенность всего разбора ниже порога, вызывающий код
+отправляет текст в LLM.
+"""
+import logging
+import re
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from utils.quantity_lexer import NUMBER, UNIT, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Ниже этой уверенности текст разбирает LLM
+LOCAL_PARSE_CONFIDENCE = 0.8
+
+# Позиции разделяются запятыми, «и», «плюс»; «с»/«со» — только если вся позиция не блюдо
+_ITEM_SPLIT_RE = re.compile(r"\s*(?:[,;+\n]|\bи\b|\bплюс\b|\bа\s+также\b)\s*", re.IGNORECASE)
+_WITH_SPLIT_RE = re.compile(r"\s+(?:с|со)\s+", re.IGNORECASE)
+
+# Слова, которые не относятся к названию продукта
+FILLER_WORDS = frozenset({
+    'я', 'съел', 'съела', 'съели', 'поел', 'поела', 'ел', 'ела', 'скушал', 'скушала',
+    'съесть', 'покушал', 'покушала', 'на', 'в', 'за', 'завтрак', 'обед', 'ужин', 'перекус',
+    'сегодня', 'утром', 'днем', 'вечером', 'еще', 'немного', 'порция', 'порцию', 'порции',
+    'порций', 'тарелка', 'тарелку', 'тарелки', 'примерно', 'около', 'где-то',
+})
+
+# Уверенность по способу совпадения названия (как в NutritionResolver)
+MATCH_CONFIDENCE = {
+    "exact": 1.0,
+    "lemma": 1.0,
+    "lemma_phrase": 0.85,
+    "substring": 0.6,
+    "partial": 0.4,
+}
+
+# Уверенность в весе по источнику
+WEIGHT_CONFIDENCE = {
+    "mass": 1.0,        # г, кг, мл, л
+    "measure": 0.9,     # ложка, стакан, кусок...
+    "piece": 0.95,      # N штук × вес штуки
+    "portion": 0.9,     # порция блюда
+    "one_piece": 0.85,  # без количества: одна штука
+    "bare_grams": 0.85,  # «рис 150» — число без единицы
+    "guess": 0.3,
+}
+
+_MASS_UNITS = frozenset({'г', 'кг', 'мл', 'л'})
+
+# Число без единицы от этого значения считается граммами
+_BARE_GRAMS_MIN = 10
+
+
+def split_items(text: str) -> List[str]:
+    """Позиции описания: «2 яйца и хлеб, чай» → ['2 яйца', 'хлеб', 'чай']"""
+    return [item for item in _ITEM_SPLIT_RE.split(text.strip()) if item]
+
+
+def _item_parts(tokens) -> Tuple[Optional[Any], Optional[str], str]:
+    """(количество, единица, название) позиции; название — слова без служебных"""
+    amount = unit = None
+    words = []
+    for token in tokens:
+        if token.kind == NUMBER:
+            if amount is None:
+                amount = token.value
+        elif token.kind == UNIT:
+            if unit is None:
+                unit = token.value
+        elif token.value not in FILLER_WORDS:
+            words.append(token.text)
+    return amount, unit, " ".join(words)
+
+
+def _match_name(name: str) -> Optional[Tuple[str, str, float]]:
+    """("dish" или "ingredient", ключ, уверенность) для названия"""
+    from services.dish_db import match_dish_key
+    from services.nutrition_resolver import get_nutrition_resolver
+
+    lowered = name.lower()
+    dish = match_dish_key(lowered)
+    ingredient = get_nutrition_resolver().find_key(lowered)
+    dish_score = MATCH_CONFIDENCE[dish[1]] if dish else 0.0
+    ingredient_score = MATCH_CONFIDENCE[ingredient[1]] if ingredient else 0.0
+    if not dish_score and not ingredient_score:
+        return None
+    # При равной уверенности блюдо: у него есть порция и готовый КБЖУ
+    if dish_score >= ingredient_score:
+        return "dish", dish[0], dish_score
+    return "ingredient", ingredient[0], ingredient_score
+
+
+def _item_weight(name: str, kind: str, key: str, whole_match: bool, amount, unit: Optional[str]) -> Tuple[float, str]:
+    """(вес в граммах, источник веса) позиции"""
+    from services.dish_db import COMPOSITE_DISHES
+    from utils.unit_converter import GRAMS_PER_UNIT, find_unit_weight
+
+    count = amount if amount is not None else 1
+    if unit is not None and unit != 'шт':
+        if unit not in GRAMS_PER_UNIT:
+            return 0, "guess"
+        return count * GRAMS_PER_UNIT[unit], "mass" if unit in _MASS_UNITS else "measure"
+    if unit is None and amount is not None and amount >= _BARE_GRAMS_MIN:
+        return amount, "bare_grams"
+    counted = amount is not None or unit is not None
+    if kind == "dish":
+        # Вес штуки — только для блюда целиком («2 котлеты»), не для слова внутри («омлет из 3 яиц»)
+        piece = find_unit_weight(name, whole_name=True)
+        if piece is not None:
+            return count * piece, "piece" if counted else "one_piece"
+        if whole_match or not counted:
+            return count * COMPOSITE_DISHES[key]["default_weight"], "portion"
+        return 0, "guess"
+    piece = find_unit_weight(name) or find_unit_weight(key)
+    if piece is not None:
+        return count * piece, "piece" if counted else "one_piece"
+    return 0, "guess"
+
+
+def _parse_item(text: str) -> Optional[Dict[str, Any]]:
+    """Одна позиция: название, вес, КБЖУ (на 100 г и итог на вес) и уверенность или None"""
+    from services.dish_db import COMPOSITE_DISHES
+    from services.nutrition_resolver import NUTRIENTS, get_nutrition_resolver
+
+    amount, unit, name = _item_parts(tokenize(text))
+    if not name:
+        return None
+    match = _match_name(name)
+    if match is None:
+        return None
+    kind, key, match_confidence = match
+    whole_match = match_confidence == MATCH_CONFIDENCE["lemma"]
+    weight, weight_source = _item_weight(name, kind, key, whole_match, amount, unit)
+    if weight <= 0:
+        return None
+
+    if kind == "dish":
+        dish = COMPOSITE_DISHES[key]
+        per_100 = {nutrient: dish["nutrition_per_100"][nutrient] for nutrient in NUTRIENTS}
+        display_name, item_type = dish["name"], dish["category"]
+    else:
+        resolved = get_nutrition_resolver().resolve(key)
+        per_100 = {nutrient: resolved[nutrient] for nutrient in NUTRIENTS}
+        display_name, item_type = key, resolved["type"]
+
+    item = {
+        "name": display_name,
+        "weight_grams": round(weight),
+        "type": item_type,
+        "source": kind,
+        "key": key,
+        "confidence": round(match_confidence * WEIGHT_CONFIDENCE[weight_source], 3),
+    }
+    for nutrient in NUTRIENTS:
+        item[f"{nutrient}_per_100g"] = per_100[nutrient]
+        # Итог на вес позиции, как estimated_calories
+        item[nutrient] = round(per_100[nutrient] * weight / 100, 1)
+    return item
+
+
+def parse_food_text_local(text: str, min_confidence: float = LOCAL_PARSE_CONFIDENCE) -> Optional[Dict[str, Any]]:
+    """
+    Разбор описания еды по справочникам. Результат в формате data
+    cf_manager.parse_food_text ({ingredients, estimated_calories, confidence})
+    или None, если хоть одна позиция не распознана или уверенность ниже порога.
+    """
+    if not text or not text.strip():
+        return None
+    items = []
+    for part in split_items(text):
+        item = _parse_item(part)
+        if item is None or item["confidence"] < min_confidence:
+            # «гречка с курицей» — не блюдо целиком, пробуем по частям
+            pieces = _WITH_SPLIT_RE.split(part)
+            if len(pieces) < 2:
+                return None
+            for piece in pieces:
+                item = _parse_item(piece)
+                if item is None or item["confidence"] < min_confidence:
+                    return None
+                items.append(item)
+        else:
+            items.append(item)
+    if not items:
+        return None
+    return {
+        "ingredients": items,
+        "estimated_calories": round(sum(item["calories"] for item in items)),
+        "confidence": min(item["confidence"] for item in items),
+    }
+
+
+# =============================================================================
+# Статистика: доля локальных ответов и задержка по путям
+# =============================================================================
+class FoodParseStats:
+    """Доля разборов без LLM и перцентили задержки для каждого пути"""
+
+    def __init__(self, window: int = 1000, log_every: int = 500):
+        self.counts: Dict[str, int] = {}
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._window = window
+        self._log_every = log_every
+
+    def record(self, path: str, seconds: float) -> None:
+        """path: "local" — ответ локальным парсером, "llm" — запрос ушел в LLM"""
+        self.counts[path] = self.counts.get(path, 0) + 1
+        latencies = self._latencies.get(path)
+        if latencies is None:
+            latencies = self._latencies[path] = deque(maxlen=self._window)
+        latencies.append(seconds)
+        if sum(self.counts.values()) % self._log_every == 0:
+            logger.info(f"[FOOD_PARSER] {self.snapshot()}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        total = sum(self.counts.values())
+        paths = {}
+        for path, latencies in self._latencies.items():
+            ordered = sorted(latencies)
+            paths[path] = {
+                "count": self.counts[path],
+                "p50_ms": round(ordered[len(ordered) // 2] * 1000, 2),
+                "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 2),
+            }
+        return {
+            "local_hit_rate": round(self.counts.get("local", 0) / total, 3) if total else 0.0,
+            "paths": paths,
+        }
+
+
+food_parse_stats = FoodParseStats()
+
+
+def timed_local_parse(text: str) -> Tuple[Optional[Dict[str, Any]], float]:
+    """Локальный разбор и его длительность в секундах"""
+    started = time.perf_counter()
+    try:
+        result = parse_food_text_local(text)
+    except Exception as e:
+        logger.warning(f"[FOOD_PARSER] Ошибка локального разбора {text!r}: {e}")
+        result = None
+    return result, time.perf_counter() - started
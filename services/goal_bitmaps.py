@@ -0,0 +1,280 @@
+"""
+services/goal_bitmaps.py
+Выполнение дневных целей в битовых картах Redis: один бит на день на цель.
+
+Ключ nutribuddy:goals:<цель>:<telegram_id>, бит с номером «дней от
+EPOCH_DAY» по локальной дате пользователя. Год по цели — 46 байт. Бит
+ставится, когда дневная сумма пересекает порог (подписчик событий записи);
+серии, количество дней и идеальные дни за любое окно считаются одним
+GETRANGE на цель и битовыми операциями над числом.
+
+Цели: logged — была любая запись, calories/water — не меньше 90% цели,
+activity — от 30 минут, meals — от 3 приемов пищи. Заполнение из истории:
+
+    python -m services.goal_bitmaps backfill --days 365
+"""
+import argparse
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+GOALS_PREFIX = "nutribuddy:goals"
+EPOCH_DAY = date(2024, 1, 1)
+
+LOGGED = "logged"
+CALORIES = "calories"
+WATER = "water"
+ACTIVITY = "activity"
+MEALS = "meals"
+GOALS = (LOGGED, CALORIES, WATER, ACTIVITY, MEALS)
+# Цели идеального дня
+PERFECT_DAY = (CALORIES, WATER, ACTIVITY, MEALS)
+
+# Доля дневной цели, с которой цель считается выполненной
+GOAL_SHARE = 0.9
+ACTIVITY_MINUTES = 30
+MEALS_PER_DAY = 3
+
+
+def goal_key(goal: str, user_id: int) -> str:
+    return f"{GOALS_PREFIX}:{goal}:{user_id}"
+
+
+def day_offset(day: date) -> int:
+    """Номер бита дня"""
+    return (day - EPOCH_DAY).days
+
+
+def goal_met(goal: str, total: float, daily_calorie_goal: Optional[float] = None,
+             daily_water_goal: Optional[float] = None) -> bool:
+    """Выполнена ли цель при дневной сумме total (ккал, мл, минуты или приемы пищи)"""
+    if goal == CALORIES:
+        return bool(daily_calorie_goal) and total >= daily_calorie_goal * GOAL_SHARE
+    if goal == WATER:
+        return bool(daily_water_goal) and total >= daily_water_goal * GOAL_SHARE
+    if goal == ACTIVITY:
+        return total >= ACTIVITY_MINUTES
+    if goal == MEALS:
+        return total >= MEALS_PER_DAY
+    return total > 0
+
+
+def window_mask(data: bytes, first_byte: int, start: int, days: int) -> int:
+    """Биты дней [start, start + days) из байтов GETRANGE с first_byte; младший бит — последний день"""
+    base = first_byte * 8
+    # Ключ может быть короче окна: недостающие байты — нули
+    bits = max(len(data) * 8, start + days - base)
+    value = (int.from_bytes(data, "big") if data else 0) << (bits - len(data) * 8)
+    return (value >> (bits - (start - base) - days)) & ((1 << days) - 1)
+
+
+def trailing_ones(mask: int) -> int:
+    """Длина серии единиц в младших битах (последние дни окна)"""
+    return ((mask ^ (mask + 1)).bit_length() - 1)
+
+
+class GoalBitmaps:
+    """Отметки выполнения целей и запросы по окнам дней"""
+
+    def __init__(self, redis_client=None):
+        self.redis = redis_client
+
+    def bind(self, redis_client) -> None:
+        self.redis = redis_client
+
+    async def mark(self, user_id: int, goals: Iterable[str], day: date) -> None:
+        """Ставит биты выполненных целей за день"""
+        goals = list(goals)
+        if self.redis is None or not goals:
+            return
+        offset = day_offset(day)
+        pipe = self.redis.pipeline(transaction=False)
+        for goal in goals:
+            pipe.setbit(goal_key(goal, user_id), offset, 1)
+        await pipe.execute()
+
+    async def masks(self, user_id: int, goals: Sequence[str], end_day: date, days: int) -> Dict[str, int]:
+        """Маски окна из days дней, заканчивающегося end_day: младший бит — end_day"""
+        if self.redis is None or days <= 0:
+            return {goal: 0 for goal in goals}
+        start = day_offset(end_day) - days + 1
+        first_byte = max(0, start) // 8
+        last_byte = day_offset(end_day) // 8
+        pipe = self.redis.pipeline(transaction=False)
+        for goal in goals:
+            pipe.getrange(goal_key(goal, user_id), first_byte, last_byte)
+        results = await pipe.execute()
+        masks = {}
+        for goal, data in zip(goals, results):
+            data = data.encode("latin-1") if isinstance(data, str) else (data or b"")
+            if start < 0:
+                # Окно начинается раньше EPOCH_DAY: этих дней в картах нет
+                masks[goal] = window_mask(data, first_byte, 0, days + start) if days + start > 0 else 0
+            else:
+                masks[goal] = window_mask(data, first_byte, start, days)
+        return masks
+
+    async def streak(self, user_id: int, goal: str, end_day: date, max_days: int = 365) -> int:
+        """Серия дней подряд с выполненной целью, заканчивающаяся end_day"""
+        mask = (await self.masks(user_id, [goal], end_day, max_days))[goal]
+        return trailing_ones(mask)
+
+    async def all_met(self, user_id: int, goals: Sequence[str], end_day: date, days: int) -> bool:
+        """Все цели выполнены в каждый из days дней до end_day включительно"""
+        masks = await self.masks(user_id, goals, end_day, days)
+        combined = (1 << days) - 1
+        for goal in goals:
+            combined &= masks[goal]
+        return combined == (1 << days) - 1
+
+    async def count(self, user_id: int, goals: Sequence[str], end_day: date, days: int) -> int:
+        """Сколько дней окна выполнены все цели goals"""
+        masks = await self.masks(user_id, goals, end_day, days)
+        combined = (1 << days) - 1
+        for goal in goals:
+            combined &= masks[goal]
+        return bin(combined).count("1")
+
+    async def backfill(self, days: int = 365, now: Optional[datetime] = None) -> int:
+        """Заполняет карты из истории за days дней; возвращает число пользователей"""
+        from sqlalchemy import func, select
+        from database.db import engine
+        from database.models import ActivityEntry, DrinkEntry, FoodEntry, User
+        from utils.timezone_utils import zone_or_utc
+
+        now = now or datetime.now(timezone.utc)
+        since = (now - timedelta(days=days + 1)).replace(tzinfo=None)
+        users: Dict[int, Any] = {}
+        # (пользователь, цель) -> {локальная дата: сумма}
+        totals: Dict[tuple, Dict[date, float]] = {}
+
+        async with engine.connect() as conn:
+            result = await conn.stream(select(
+                User.telegram_id, User.timezone, User.daily_calorie_goal, User.daily_water_goal
+            ))
+            async for telegram_id, tz_name, calorie_goal, water_goal in result:
+                users[telegram_id] = (zone_or_utc(tz_name), calorie_goal, water_goal)
+
+            sources = (
+                (CALORIES, FoodEntry, FoodEntry.calories),
+                (MEALS, FoodEntry, func.count()),
+                (WATER, DrinkEntry, DrinkEntry.amount),
+                (ACTIVITY, ActivityEntry, ActivityEntry.duration),
+            )
+            for goal, model, value in sources:
+                # Суммы по часам UTC: локальная дата часа зависит только от пояса пользователя
+                hour = func.strftime('%Y-%m-%d %H:00:00', model.created_at) \
+                    if engine.dialect.name == "sqlite" else func.date_trunc('hour', model.created_at)
+                aggregate = value if goal == MEALS else func.sum(value)
+                result = await conn.stream(
+                    select(model.user_id, hour, aggregate)
+                    .where(model.created_at >= since)
+                    .group_by(model.user_id, hour)
+                )
+                async for user_id, hour_value, amount in result:
+                    if user_id not in users:
+                        continue
+                    if isinstance(hour_value, str):
+                        hour_value = datetime.fromisoformat(hour_value)
+                    local_day = hour_value.replace(tzinfo=timezone.utc).astimezone(users[user_id][0]).date()
+                    for bucket in (goal, LOGGED):
+                        per_day = totals.setdefault((user_id, bucket), {})
+                        per_day[local_day] = per_day.get(local_day, 0) + (amount or 0)
+
+        # Окно выравнивается по байтам, чтобы записать его целиком одним SETRANGE
+        first_offset = max(0, day_offset(now.date()) - days) // 8 * 8
+        last_offset = day_offset(now.date()) + 1
+        width = last_offset - first_offset
+        pipe = self.redis.pipeline(transaction=False)
+        written = set()
+        for (user_id, goal), per_day in totals.items():
+            _, calorie_goal, water_goal = users[user_id]
+            mask = 0
+            for day, total in per_day.items():
+                offset = day_offset(day) - first_offset
+                if 0 <= offset < width and goal_met(goal, total, calorie_goal, water_goal):
+                    mask |= 1 << (width - 1 - offset)
+            padded = (width + 7) // 8 * 8
+            pipe.setrange(goal_key(goal, user_id), first_offset // 8,
+                          (mask << (padded - width)).to_bytes(padded // 8, "big"))
+            written.add(user_id)
+            if len(pipe) >= 1000:
+                await pipe.execute()
+        await pipe.execute()
+        logger.info(f"[GOALS] Backfilled {days} days for {len(written)} users")
+        return len(written)
+
+
+goal_bitmaps = GoalBitmaps()
+
+
+async def update_goal_bits(user_id: int, goals: Sequence[str]) -> List[str]:
+    """
+    Пересчитывает сегодняшние суммы по целям goals и ставит биты выполненных.
+    Возвращает выполненные цели (вместе с logged)
+    """
+    from sqlalchemy import func, select
+    from database.db import get_session
+    from database.meal_writes import utc_day_bounds
+    from database.models import ActivityEntry, DrinkEntry, FoodEntry, User
+    from utils.timezone_utils import get_user_local_date
+
+    columns = {
+        CALORIES: (FoodEntry, func.sum(FoodEntry.calories)),
+        MEALS: (FoodEntry, func.count(FoodEntry.id)),
+        WATER: (DrinkEntry, func.sum(DrinkEntry.amount)),
+        ACTIVITY: (ActivityEntry, func.sum(ActivityEntry.duration)),
+    }
+    async with get_session() as session:
+        result = await session.execute(
+            select(User.timezone, User.daily_calorie_goal, User.daily_water_goal)
+            .where(User.telegram_id == user_id)
+        )
+        user = result.first()
+        if user is None:
+            return []
+        tz_name, calorie_goal, water_goal = user
+        start, end = utc_day_bounds(tz_name)
+        met = [LOGGED]
+        for goal in goals:
+            model, aggregate = columns[goal]
+            total = await session.execute(select(aggregate).where(
+                model.user_id == user_id, model.created_at >= start, model.created_at < end
+            ))
+            if goal_met(goal, total.scalar() or 0, calorie_goal, water_goal):
+                met.append(goal)
+
+    await goal_bitmaps.mark(user_id, met, get_user_local_date(tz_name or 'UTC'))
+    return met
+
+
+async def _backfill_command(days: int):
+    import os
+    import redis.asyncio as redis
+    from database.db import close_db
+
+    client = redis.from_url(os.environ["REDIS_URL"])
+    goal_bitmaps.bind(client)
+    try:
+        users = await goal_bitmaps.backfill(days)
+        print(f"goal bitmaps backfilled: {users} users, {days} days")
+    finally:
+        await close_db()
+        await client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Битовые карты выполнения целей")
+    parser.add_argument("command", choices=["backfill"], help="backfill — заполнить из истории")
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    asyncio.run(_backfill_command(args.days))
+
+
+if __name__ == "__main__":
+    main()
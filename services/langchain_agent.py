@@ -21,7 +21,7 @@ from database.db import get_session
 from database.models import User
 from services.ai_processor import ai_processor
 from services.weather import get_weather
-from services.cloudflare_llm import cloudflare_llm
+from services.cloudflare_llm import get_cloudflare_llm
 from utils.daily_stats import get_daily_stats
 
 logger = logging.getLogger(__name__)
@@ -45,7 +45,7 @@ class LangChainAgent:
         self.last_used = time.time()
 
         # LLM встроенный
-        self.llm = cloudflare_llm
+        self.llm = get_cloudflare_llm()
 
         # Создаем промпт в формате ReAct для create_react_agent
         # create_react_agent автоматически заполняет {tools} и {tool_names}
@@ -452,8 +452,8 @@ async def get_agent(user_id: int, state: FSMContext) -> LangChainAgent:
         
         return agent
 
-async def cleanup_expired_agents():
-    """Очищает устаревших агентов"""
+async def cleanup_expired_agents() -> int:
+    """Очищает устаревших агентов; возвращает их число"""
     async with _agents_lock:
         current_time = time.time()
         expired_users = []
@@ -465,6 +465,7 @@ async def cleanup_expired_agents():
         for user_id in expired_users:
             del _agents[user_id]
             logger.info(f"[AGENT] Cleaned up expired agent for user {user_id}")
+        return len(expired_users)
 
 # Методы для обработки разных типов сообщений
 def add_processing_methods(cls):
@@ -490,70 +491,14 @@ def add_processing_methods(cls):
             analysis = result.get("analysis", {})
             ingredients = analysis.get("ingredients", [])
             
-            # База калорийности для расчёта КБЖУ
-            nutrition_db = {
-                "chicken": {"calories": 165, "protein": 31, "fat": 3.6, "carbs": 0},
-                "chicken breast": {"calories": 165, "protein": 31, "fat": 3.6, "carbs": 0},
-                "beef": {"calories": 250, "protein": 26, "fat": 15, "carbs": 0},
-                "fish": {"calories": 206, "protein": 22, "fat": 12, "carbs": 0},
-                "salmon": {"calories": 208, "protein": 20, "fat": 13, "carbs": 0},
-                "tuna": {"calories": 144, "protein": 23, "fat": 5, "carbs": 0},
-                "egg": {"calories": 155, "protein": 13, "fat": 11, "carbs": 1.1},
-                "eggs": {"calories": 155, "protein": 13, "fat": 11, "carbs": 1.1},
-                "rice": {"calories": 130, "protein": 2.7, "fat": 0.3, "carbs": 28},
-                "pasta": {"calories": 131, "protein": 5, "fat": 1.1, "carbs": 25},
-                "potato": {"calories": 77, "protein": 2, "fat": 0.1, "carbs": 17},
-                "potatoes": {"calories": 77, "protein": 2, "fat": 0.1, "carbs": 17},
-                "bread": {"calories": 265, "protein": 9, "fat": 3.2, "carbs": 49},
-                "vegetable": {"calories": 25, "protein": 1, "fat": 0.3, "carbs": 5},
-                "vegetables": {"calories": 25, "protein": 1, "fat": 0.3, "carbs": 5},
-                "tomato": {"calories": 18, "protein": 0.9, "fat": 0.2, "carbs": 3.9},
-                "cucumber": {"calories": 15, "protein": 0.7, "fat": 0.1, "carbs": 3.6},
-                "lettuce": {"calories": 15, "protein": 1.4, "fat": 0.2, "carbs": 2.9},
-                "cabbage": {"calories": 25, "protein": 1.3, "fat": 0.1, "carbs": 6},
-                "carrot": {"calories": 41, "protein": 0.9, "fat": 0.2, "carbs": 10},
-                "broccoli": {"calories": 34, "protein": 2.8, "fat": 0.4, "carbs": 7},
-                "oil": {"calories": 884, "protein": 0, "fat": 100, "carbs": 0},
-                "butter": {"calories": 717, "protein": 0.9, "fat": 81, "carbs": 0.1},
-                "cheese": {"calories": 402, "protein": 25, "fat": 33, "carbs": 1.3},
-                "fruit": {"calories": 52, "protein": 0.3, "fat": 0.2, "carbs": 14},
-                "apple": {"calories": 52, "protein": 0.3, "fat": 0.2, "carbs": 14},
-                "banana": {"calories": 89, "protein": 1.1, "fat": 0.3, "carbs": 23},
-            }
-            
-            # Рассчитываем КБЖУ
-            total_calories = 0
-            total_protein = 0
-            total_fat = 0
-            total_carbs = 0
-            
-            for ingredient in ingredients:
-                name = ingredient.get("name", "").lower()
-                weight = ingredient.get("weight_grams", 0)
-                
-                nutrition = None
-                for key, value in nutrition_db.items():
-                    if key in name:
-                        nutrition = value
-                        break
-                
-                if not nutrition:
-                    ing_type = ingredient.get("type", "")
-                    if "protein" in ing_type:
-                        nutrition = {"calories": 150, "protein": 25, "fat": 5, "carbs": 0}
-                    elif "carb" in ing_type:
-                        nutrition = {"calories": 120, "protein": 3, "fat": 0.5, "carbs": 25}
-                    elif "vegetable" in ing_type:
-                        nutrition = {"calories": 25, "protein": 1, "fat": 0.3, "carbs": 5}
-                    elif "fat" in ing_type:
-                        nutrition = {"calories": 800, "protein": 0, "fat": 90, "carbs": 0}
-                    else:
-                        nutrition = {"calories": 100, "protein": 5, "fat": 3, "carbs": 15}
-                
-                total_calories += (nutrition["calories"] * weight) / 100
-                total_protein += (nutrition["protein"] * weight) / 100
-                total_fat += (nutrition["fat"] * weight) / 100
-                total_carbs += (nutrition["carbs"] * weight) / 100
+            # Рассчитываем КБЖУ (единый индекс ингредиентов, затем средние по типу)
+            from services.nutrition_resolver import get_nutrition_resolver
+
+            totals = get_nutrition_resolver().totals(ingredients)
+            total_calories = totals["calories"]
+            total_protein = totals["protein"]
+            total_fat = totals["fat"]
+            total_carbs = totals["carbs"]
 
             dish_name = analysis.get("dish_name", "блюдо")
 
@@ -600,13 +545,3 @@ def add_processing_methods(cls):
 # Применяем декоратор к уже существующему классу
 LangChainAgent = add_processing_methods(LangChainAgent)
 
-# Фоновая задача для очистки
-async def start_cleanup_task():
-    """Запускает фоновую задачу очистки"""
-    while True:
-        try:
-            await cleanup_expired_agents()
-            await asyncio.sleep(900)  # 15 минут
-        except Exception as e:
-            logger.error(f"[AGENT] Error in cleanup task: {e}")
-            await asyncio.sleep(60)  # 1 минута при ошибке
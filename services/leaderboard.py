@@ -0,0 +1,231 @@
+"""
+services/leaderboard.py
+Таблица лидеров по очкам достижений в sorted set Redis.
+
+Ключи: за все время, за календарную неделю (ISO) и месяц UTC. Недельный и
+месячный ключи истекают через период после своего окончания, чтобы
+прошлый период еще можно было посмотреть. Очки начисляются ZINCRBY при
+получении достижения (подписчик события ACHIEVEMENT_UNLOCKED); место
+пользователя — ZREVRANK, топ — ZREVRANGE, то есть O(log N) и O(log N + limit).
+События шины доставляются как минимум один раз, поэтому после сбоев
+таблицу можно пересчитать из user_achievements:
+
+    python -m services.leaderboard rebuild
+"""
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LEADERBOARD_PREFIX = "nutribuddy:leaderboard"
+PERIODS = ("all", "week", "month")
+# Сколько элементов пишется за один вызов ZADD при пересчете
+_REBUILD_CHUNK = 1000
+
+
+def period_key(period: str, now: Optional[datetime] = None) -> Tuple[str, Optional[datetime]]:
+    """Ключ таблицы периода и момент, после которого он истекает (None — бессрочно)"""
+    now = now or datetime.now(timezone.utc)
+    if period == "all":
+        return f"{LEADERBOARD_PREFIX}:all", None
+    day = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
+    if period == "week":
+        year, week, weekday = now.isocalendar()
+        end = day + timedelta(days=8 - weekday)
+        return f"{LEADERBOARD_PREFIX}:week:{year}-W{week:02d}", end + timedelta(days=7)
+    if period == "month":
+        start = day.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1)
+        return f"{LEADERBOARD_PREFIX}:month:{now:%Y-%m}", end + timedelta(days=31)
+    raise ValueError(f"Unknown leaderboard period: {period}")
+
+
+def _user_id(member) -> int:
+    return int(member.decode() if isinstance(member, bytes) else member)
+
+
+class Leaderboard:
+    """Очки пользователей по периодам; без Redis методы возвращают пустые результаты"""
+
+    names_key = f"{LEADERBOARD_PREFIX}:names"
+    counts_key = f"{LEADERBOARD_PREFIX}:counts"
+
+    def __init__(self, redis_client=None):
+        self.redis = redis_client
+
+    def bind(self, redis_client) -> None:
+        self.redis = redis_client
+
+    async def award(self, user_id: int, points: int, earned_at: Optional[datetime] = None) -> None:
+        """Начисляет очки во все периоды одним pipeline"""
+        if self.redis is None or not points:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        for period in PERIODS:
+            key, expires_at = period_key(period, earned_at)
+            pipe.zincrby(key, points, user_id)
+            if expires_at is not None:
+                pipe.expireat(key, expires_at)
+        pipe.hincrby(self.counts_key, user_id, 1)
+        await pipe.execute()
+
+    async def top(self, period: str = "all", limit: int = 10) -> List[Dict[str, Any]]:
+        """Первые limit мест: position, telegram_id, name, achievements_count, total_points"""
+        if self.redis is None:
+            return []
+        key, _ = period_key(period)
+        entries = await self.redis.zrevrange(key, 0, limit - 1, withscores=True)
+        if not entries:
+            return []
+        user_ids = [_user_id(member) for member, _ in entries]
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hmget(self.names_key, user_ids)
+        pipe.hmget(self.counts_key, user_ids)
+        names, counts = await pipe.execute()
+        names = [name.decode() if isinstance(name, bytes) else name for name in names]
+        missing = [user_id for user_id, name in zip(user_ids, names) if name is None]
+        if missing:
+            loaded = await self._load_names(missing)
+            names = [name if name is not None else loaded.get(user_id) for user_id, name in zip(user_ids, names)]
+
+        return [
+            {
+                'position': position,
+                'telegram_id': user_id,
+                'name': name or f"User_{user_id}",
+                'achievements_count': int(count or 0),
+                'total_points': int(score),
+            }
+            for position, (user_id, name, count, (_, score)) in enumerate(zip(user_ids, names, counts, entries), 1)
+        ]
+
+    async def position(self, user_id: int, period: str = "all") -> Dict[str, Any]:
+        """Место пользователя: position (None — нет очков), total_points, participants"""
+        if self.redis is None:
+            return {'position': None, 'total_points': 0, 'participants': 0}
+        key, _ = period_key(period)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zrevrank(key, user_id)
+        pipe.zscore(key, user_id)
+        pipe.zcard(key)
+        rank, score, participants = await pipe.execute()
+        return {
+            'position': rank + 1 if rank is not None else None,
+            'total_points': int(score or 0),
+            'participants': participants,
+        }
+
+    async def _load_names(self, user_ids: List[int]) -> Dict[int, str]:
+        """Имена пользователей, которых еще нет в хэше имен (кэшируются в Redis)"""
+        from sqlalchemy import select
+        from database.db import get_session
+        from database.models import User
+
+        async with get_session() as session:
+            result = await session.execute(
+                select(User.telegram_id, User.first_name).where(User.telegram_id.in_(user_ids))
+            )
+            names = {telegram_id: first_name for telegram_id, first_name in result if first_name}
+        if names:
+            await self.redis.hset(self.names_key, mapping=names)
+        return names
+
+    async def rebuild(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Пересчет всех таблиц из user_achievements; ключи подменяются атомарно (RENAME)"""
+        from sqlalchemy import select
+        from database.db import engine
+        from database.models import User, UserAchievement
+        from utils.gamification import gamification_system
+
+        now = now or datetime.now(timezone.utc)
+        keys = {period: period_key(period, now) for period in PERIODS}
+        scores: Dict[str, Dict[int, int]] = {period: {} for period in PERIODS}
+        counts: Dict[int, int] = {}
+        names: Dict[int, str] = {}
+
+        query = select(
+            UserAchievement.user_id, UserAchievement.achievement_id, UserAchievement.earned_at, User.first_name
+        ).join(User, User.telegram_id == UserAchievement.user_id)
+        async with engine.connect() as conn:
+            result = await conn.stream(query)
+            async for user_id, achievement_id, earned_at, first_name in result:
+                achievement = gamification_system.achievements.get(str(achievement_id))
+                if achievement is None:
+                    continue
+                if first_name:
+                    names[user_id] = first_name
+                counts[user_id] = counts.get(user_id, 0) + 1
+                earned = earned_at or now
+                if earned.tzinfo is None:
+                    earned = earned.replace(tzinfo=timezone.utc)
+                for period in PERIODS:
+                    if period == "all" or period_key(period, earned)[0] == keys[period][0]:
+                        scores[period][user_id] = scores[period].get(user_id, 0) + achievement.points
+
+        for period, (key, expires_at) in keys.items():
+            await self._replace_zset(key, scores[period], expires_at)
+        await self._replace_hash(self.counts_key, counts)
+        if names:
+            await self.redis.hset(self.names_key, mapping=names)
+
+        totals = {period: len(scores[period]) for period in PERIODS}
+        logger.info(f"[LEADERBOARD] Rebuilt from DB: {totals} users per period")
+        return totals
+
+    async def _replace_zset(self, key: str, scores: Dict[int, int], expires_at: Optional[datetime]):
+        if not scores:
+            await self.redis.delete(key)
+            return
+        staging = f"{key}:rebuild"
+        await self.redis.delete(staging)
+        items = list(scores.items())
+        for start in range(0, len(items), _REBUILD_CHUNK):
+            await self.redis.zadd(staging, dict(items[start:start + _REBUILD_CHUNK]))
+        await self.redis.rename(staging, key)
+        if expires_at is not None:
+            await self.redis.expireat(key, expires_at)
+
+    async def _replace_hash(self, key: str, values: Dict[int, int]):
+        if not values:
+            await self.redis.delete(key)
+            return
+        staging = f"{key}:rebuild"
+        await self.redis.delete(staging)
+        items = list(values.items())
+        for start in range(0, len(items), _REBUILD_CHUNK):
+            await self.redis.hset(staging, mapping=dict(items[start:start + _REBUILD_CHUNK]))
+        await self.redis.rename(staging, key)
+
+
+leaderboard = Leaderboard()
+
+
+async def _rebuild_command():
+    import os
+    import redis.asyncio as redis
+    from database.db import close_db
+
+    client = redis.from_url(os.environ["REDIS_URL"])
+    leaderboard.bind(client)
+    try:
+        totals = await leaderboard.rebuild()
+        print(f"leaderboard rebuilt: {totals}")
+    finally:
+        await close_db()
+        await client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Таблица лидеров в Redis")
+    parser.add_argument("command", choices=["rebuild"], help="rebuild — пересчитать из user_achievements")
+    parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    asyncio.run(_rebuild_command())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+services/nutrition_resolver.py
+Единый поиск КБЖУ ингредиента по названию.
+
+Один скомпилированный индекс по INGREDIENT_DATABASE и английским названиям,
+которые возвращает Vision-модель. Порядок поиска:
+точное совпадение → леммы → самая длинная известная подстрока (автомат
+Ахо–Корасик) → название внутри известного ключа → средние значения по типу.
+Результаты поиска по названию кэшируются на процесс.
+"""
+import logging
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from utils.morphology import LemmaIndex
+from utils.text_match import SubstringMatcher
+
+logger = logging.getLogger(__name__)
+
+# Английские названия от Vision-модели (на 100 г)
+ENGLISH_INGREDIENTS = {
+    "chicken": {"calories": 165, "protein": 31, "fat": 3.6, "carbs": 0, "type": "protein"},
+    "chicken breast": {"calories": 165, "protein": 31, "fat": 3.6, "carbs": 0, "type": "protein"},
+    "beef": {"calories": 250, "protein": 26, "fat": 15, "carbs": 0, "type": "protein"},
+    "fish": {"calories": 206, "protein": 22, "fat": 12, "carbs": 0, "type": "protein"},
+    "salmon": {"calories": 208, "protein": 20, "fat": 13, "carbs": 0, "type": "protein"},
+    "tuna": {"calories": 144, "protein": 23, "fat": 5, "carbs": 0, "type": "protein"},
+    "egg": {"calories": 155, "protein": 13, "fat": 11, "carbs": 1.1, "type": "protein"},
+    "eggs": {"calories": 155, "protein": 13, "fat": 11, "carbs": 1.1, "type": "protein"},
+    "rice": {"calories": 130, "protein": 2.7, "fat": 0.3, "carbs": 28, "type": "carb"},
+    "pasta": {"calories": 131, "protein": 5, "fat": 1.1, "carbs": 25, "type": "carb"},
+    "potato": {"calories": 77, "protein": 2, "fat": 0.1, "carbs": 17, "type": "carb"},
+    "potatoes": {"calories": 77, "protein": 2, "fat": 0.1, "carbs": 17, "type": "carb"},
+    "bread": {"calories": 265, "protein": 9, "fat": 3.2, "carbs": 49, "type": "carb"},
+    "vegetable": {"calories": 25, "protein": 1, "fat": 0.3, "carbs": 5, "type": "vegetable"},
+    "vegetables": {"calories": 25, "protein": 1, "fat": 0.3, "carbs": 5, "type": "vegetable"},
+    "tomato": {"calories": 18, "protein": 0.9, "fat": 0.2, "carbs": 3.9, "type": "vegetable"},
+    "cucumber": {"calories": 15, "protein": 0.7, "fat": 0.1, "carbs": 3.6, "type": "vegetable"},
+    "lettuce": {"calories": 15, "protein": 1.4, "fat": 0.2, "carbs": 2.9, "type": "vegetable"},
+    "cabbage": {"calories": 25, "protein": 1.3, "fat": 0.1, "carbs": 6, "type": "vegetable"},
+    "carrot": {"calories": 41, "protein": 0.9, "fat": 0.2, "carbs": 10, "type": "vegetable"},
+    "broccoli": {"calories": 34, "protein": 2.8, "fat": 0.4, "carbs": 7, "type": "vegetable"},
+    "oil": {"calories": 884, "protein": 0, "fat": 100, "carbs": 0, "type": "fat"},
+    "butter": {"calories": 717, "protein": 0.9, "fat": 81, "carbs": 0.1, "type": "fat"},
+    "cheese": {"calories": 402, "protein": 25, "fat": 33, "carbs": 1.3, "type": "dairy"},
+    "fruit": {"calories": 52, "protein": 0.3, "fat": 0.2, "carbs": 14, "type": "fruit"},
+    "apple": {"calories": 52, "protein": 0.3, "fat": 0.2, "carbs": 14, "type": "fruit"},
+    "banana": {"calories": 89, "protein": 1.1, "fat": 0.3, "carbs": 23, "type": "fruit"},
+}
+
+# Средние значения по типу ингредиента, если название не найдено (первое совпадение)
+TYPE_FALLBACKS = (
+    (("protein",), {"calories": 150, "protein": 25, "fat": 5, "carbs": 0}),
+    (("carb",), {"calories": 120, "protein": 3, "fat": 0.5, "carbs": 25}),
+    (("vegetable",), {"calories": 25, "protein": 1, "fat": 0.3, "carbs": 5}),
+    (("fat",), {"calories": 800, "protein": 0, "fat": 90, "carbs": 0}),
+    (("herb", "spice", "salt"), {"calories": 5, "protein": 0.2, "fat": 0.1, "carbs": 1}),
+    (("dairy",), {"calories": 100, "protein": 5, "fat": 5, "carbs": 5}),
+)
+DEFAULT_NUTRITION = {"calories": 100, "protein": 5, "fat": 3, "carbs": 15}
+
+NUTRIENTS = ("calories", "protein", "fat", "carbs")
+
+
+class NutritionResolver:
+    """КБЖУ ингредиента по названию с единым индексом и кэшем"""
+
+    def __init__(self, catalog: Dict[str, Dict], memo_size: int = 4096):
+        self.catalog = catalog
+        self._lemmas = LemmaIndex(catalog, "nutrition")
+        self._matcher = SubstringMatcher(catalog)
+        self.find_key = lru_cache(maxsize=memo_size)(self._find_key)
+
+    def _find_key(self, name: str) -> Optional[Tuple[str, str]]:
+        """(ключ каталога, способ) для названия в нижнем регистре или None"""
+        name = name.strip()
+        if not name:
+            return None
+        if name in self.catalog:
+            return name, "exact"
+        key = self._lemmas.get(name)
+        if key:
+            return key, "lemma"
+        key = self._lemmas.find_key_in(name)
+        if key:
+            return key, "lemma_phrase"
+        key = self._matcher.longest_in(name)
+        if key:
+            return key, "substring"
+        # Название внутри ключа: берем самый короткий
+        key = self._matcher.shortest_containing(name)
+        if key:
+            return key, "partial"
+        return None
+
+    def resolve(self, name: str, ingredient_type: str = "", fallback: bool = True) -> Optional[Dict]:
+        """
+        КБЖУ на 100 г: {calories, protein, fat, carbs, type, key, method}.
+        Без совпадения — средние значения по типу (или None при fallback=False).
+        """
+        found = self.find_key(name.lower())
+        if found:
+            key, method = found
+            nutrition = self.catalog[key]
+            result = {nutrient: nutrition[nutrient] for nutrient in NUTRIENTS}
+            result.update(type=nutrition.get("type", ingredient_type), key=key, method=method)
+            return result
+        if not fallback:
+            return None
+        result = dict(type_fallback(ingredient_type))
+        result.update(type=ingredient_type, key=None, method="type")
+        return result
+
+    def resolve_many(self, ingredients: List[Dict]) -> List[Dict]:
+        """
+        КБЖУ для списка ингредиентов {name, weight_grams, type} с учетом веса.
+        Каждый элемент: КБЖУ на 100 г, key, method и nutrients за вес ингредиента.
+        """
+        results = []
+        for ingredient in ingredients:
+            resolved = self.resolve(ingredient.get("name", ""), ingredient.get("type", "") or "")
+            weight = ingredient.get("weight_grams", 0) or 0
+            resolved["weight"] = weight
+            resolved["total"] = {nutrient: resolved[nutrient] * weight / 100 for nutrient in NUTRIENTS}
+            results.append(resolved)
+        return results
+
+    def totals(self, ingredients: List[Dict]) -> Dict[str, float]:
+        """Суммарные КБЖУ списка ингредиентов {name, weight_grams, type}"""
+        totals = {nutrient: 0 for nutrient in NUTRIENTS}
+        for resolved in self.resolve_many(ingredients):
+            for nutrient in NUTRIENTS:
+                totals[nutrient] += resolved["total"][nutrient]
+        return totals
+
+    def warm_up(self) -> None:
+        """Строит индекс лемм заранее (иначе — при первом поиске)"""
+        len(self._lemmas)
+
+    def cache_info(self) -> Dict:
+        info = self.find_key.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+
+def type_fallback(ingredient_type: str) -> Dict:
+    """Средние КБЖУ на 100 г по типу ингредиента"""
+    ingredient_type = ingredient_type or ""
+    for markers, nutrition in TYPE_FALLBACKS:
+        if any(marker in ingredient_type for marker in markers):
+            return nutrition
+    return DEFAULT_NUTRITION
+
+
+_resolver: Optional[NutritionResolver] = None
+
+
+def get_nutrition_resolver() -> NutritionResolver:
+    """Общий резолвер процесса (индекс строится при первом вызове)"""
+    global _resolver
+    if _resolver is None:
+        from services.dish_db import INGREDIENT_DATABASE
+        catalog = dict(INGREDIENT_DATABASE)
+        for key, nutrition in ENGLISH_INGREDIENTS.items():
+            catalog.setdefault(key, nutrition)
+        _resolver = NutritionResolver(catalog)
+        logger.info(f"[NUTRITION] Индекс ингредиентов: {len(catalog)} ключей")
+    return _resolver
@@ -0,0 +1,299 @@
+"""
+services/off_catalog.py
+Локальный каталог OpenFoodFacts (SQLite + FTS5) для фасованных продуктов.
+
+Импорт потоково читает дамп OpenFoodFacts (JSONL или CSV, можно .gz) и пишет
+пачками в SQLite, поэтому память не зависит от размера дампа. Названия
+индексируются леммами (utils.morphology), так что «молока» находит «молоко»
+точным термом FTS5. Файл открывается только на чтение с mmap.
+
+    python -m services.off_catalog openfoodfacts-products.jsonl.gz
+    python -m services.off_catalog en.openfoodfacts.org.products.csv.gz --country russia --out data/off_catalog.sqlite
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+from utils.config import OFF_CATALOG_PATH
+from utils.morphology import lemmatize_tokens
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+_BATCH_SIZE = 5000
+_MMAP_SIZE = 256 * 1024 * 1024
+_CANDIDATES = 50
+
+# Предпочтительные поля названия в дампе
+_NAME_FIELDS = ("product_name_ru", "product_name", "product_name_en", "generic_name_ru", "generic_name")
+_NUTRIENT_FIELDS = {
+    "calories": ("energy-kcal_100g",),
+    "protein": ("proteins_100g",),
+    "fat": ("fat_100g",),
+    "carbs": ("carbohydrates_100g",),
+}
+
+_SCHEMA = """
+CREATE TABLE products (
+    id INTEGER PRIMARY KEY,
+    code TEXT UNIQUE,
+    name TEXT NOT NULL,
+    brands TEXT,
+    terms TEXT NOT NULL,
+    brand_terms TEXT,
+    calories REAL NOT NULL,
+    protein REAL,
+    fat REAL,
+    carbs REAL
+);
+CREATE VIRTUAL TABLE products_fts USING fts5(
+    terms, brand_terms,
+    content='products', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+"""
+
+
+# =============================================================================
+# Импорт
+# =============================================================================
+def _open_dump(path: str) -> io.TextIOBase:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace", newline="")
+    return open(path, "r", encoding="utf-8", errors="replace", newline="")
+
+
+def _to_float(value) -> Optional[float]:
+    if value in (None, ""):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if 0 <= number < 10000 else None
+
+
+def _product_row(record: Dict, nutriments: Dict, country: Optional[str]) -> Optional[tuple]:
+    """Строка таблицы products или None, если продукт без названия/калорий"""
+    if country:
+        countries = f"{record.get('countries_tags') or ''} {record.get('countries_en') or ''} {record.get('countries') or ''}"
+        if country not in countries.lower():
+            return None
+    name = next((str(record[field]).strip() for field in _NAME_FIELDS if record.get(field)), "")
+    if not name:
+        return None
+    nutrients = {
+        nutrient: next((_to_float(nutriments.get(field)) for field in fields if field in nutriments), None)
+        for nutrient, fields in _NUTRIENT_FIELDS.items()
+    }
+    if nutrients["calories"] is None:
+        return None
+    name = name[:200]
+    brands = str(record.get("brands") or "")[:200]
+    return (
+        str(record.get("code") or "") or None, name, brands, " ".join(lemmatize_tokens(name)), " ".join(lemmatize_tokens(brands)),
+        nutrients["calories"], nutrients["protein"], nutrients["fat"], nutrients["carbs"],
+    )
+
+
+def iter_dump_rows(path: str, country: Optional[str] = None) -> Iterator[tuple]:
+    """Потоково читает дамп OpenFoodFacts (JSONL или CSV/TSV) и выдает строки products"""
+    country = country.lower() if country else None
+    with _open_dump(path) as dump:
+        if ".jsonl" in path or ".json" in path:
+            for line in dump:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                row = _product_row(record, record.get("nutriments") or {}, country)
+                if row:
+                    yield row
+        else:
+            csv.field_size_limit(sys.maxsize)
+            for record in csv.DictReader(dump, delimiter="\t", quoting=csv.QUOTE_NONE):
+                row = _product_row(record, record, country)
+                if row:
+                    yield row
+
+
+def import_dump(dump_path: str, out_path: str = OFF_CATALOG_PATH, country: Optional[str] = None,
+                batch_size: int = _BATCH_SIZE) -> int:
+    """
+    Импортирует дамп в новый файл каталога и атомарно заменяет старый.
+    Возвращает число продуктов.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    tmp_path = f"{out_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    started = time.monotonic()
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.executescript(_SCHEMA)
+        insert = "INSERT OR IGNORE INTO products(code, name, brands, terms, brand_terms, calories, protein, fat, carbs) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        batch = []
+        seen = 0
+        for row in iter_dump_rows(dump_path, country):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                conn.executemany(insert, batch)
+                conn.commit()
+                seen += len(batch)
+                batch.clear()
+                if seen % (batch_size * 20) == 0:
+                    logger.info(f"[OFF] Импортировано {seen} продуктов")
+        if batch:
+            conn.executemany(insert, batch)
+            conn.commit()
+
+        conn.execute("INSERT INTO products_fts(products_fts) VALUES ('rebuild')")
+        conn.execute("INSERT INTO products_fts(products_fts) VALUES ('optimize')")
+        conn.commit()
+        total = conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, out_path)
+    logger.info(f"[OFF] Каталог {out_path}: {total} продуктов за {time.monotonic() - started:.0f}с")
+    return total
+
+
+# =============================================================================
+# Поиск
+# =============================================================================
+class OFFCatalog:
+    """Поиск продуктов в локальном каталоге OpenFoodFacts (только чтение)"""
+
+    def __init__(self, path: str = OFF_CATALOG_PATH):
+        self.path = path
+        self._local = threading.local()
+
+    @property
+    def available(self) -> bool:
+        return os.path.exists(self.path)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Соединение потока; файл переоткрывается, если его заменил новый импорт"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.mtime == mtime:
+            return conn
+        if conn is not None:
+            conn.close()
+        conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+        self._local.conn = conn
+        self._local.mtime = mtime
+        return conn
+
+    @staticmethod
+    def _fts_queries(lemmas: List[str]) -> List[str]:
+        """
+        Запросы FTS5 от точного к широкому: леммы в названии, леммы в названии
+        или бренде, последнее слово как префикс (пользователь не дописал слово).
+        Префикс только у последнего слова: префиксы длиннее индекса prefix='2 3'
+        перебирают все термы и стоят миллисекунды.
+        """
+        exact = " ".join(f'"{lemma}"' for lemma in lemmas)
+        prefix = " ".join([f'"{lemma}"' for lemma in lemmas[:-1]] + [f'"{lemmas[-1]}"*'])
+        return [f"{{terms}} : ({exact})", exact, prefix]
+
+    @staticmethod
+    def _score(name: str, terms: str, text: str, lemmas: List[str]) -> tuple:
+        """Ключ сортировки кандидатов: точное название, начало названия, покрытие слов, краткость"""
+        terms = terms.split()
+        covered = sum(1 for lemma in lemmas if lemma in terms)
+        return (name.lower() == text, terms[:1] == lemmas[:1], covered, -len(name))
+
+    def search(self, text: str, limit: int = 5) -> List[Dict]:
+        """
+        Продукты по названию/бренду, лучшие первыми; КБЖУ на 100 г.
+
+        Каждый запрос FTS5 отдает не больше _CANDIDATES строк (id, название,
+        леммы), которые ранжируются здесь же, и только для лучших читаются
+        КБЖУ: полная сортировка bm25 по всем совпадениям частого слова
+        («молоко») стоит десятки миллисекунд.
+        """
+        text = text.lower().strip()
+        lemmas = lemmatize_tokens(text)[:8]
+        if not lemmas:
+            return []
+        try:
+            conn = self._connection()
+            if conn is None:
+                return []
+            candidates = {}
+            for query in self._fts_queries(lemmas):
+                for product_id, name, terms in conn.execute(
+                    "SELECT p.id, p.name, p.terms FROM products_fts JOIN products p ON p.id = products_fts.rowid "
+                    "WHERE products_fts MATCH ? LIMIT ?",
+                    (query, _CANDIDATES),
+                ):
+                    candidates.setdefault(product_id, (name, terms))
+                if len(candidates) >= limit:
+                    break
+            best = sorted(candidates, key=lambda product_id: self._score(*candidates[product_id], text, lemmas),
+                          reverse=True)[:limit]
+            if not best:
+                return []
+            rows = conn.execute(
+                f"SELECT id, code, name, brands, calories, protein, fat, carbs FROM products "
+                f"WHERE id IN ({','.join('?' * len(best))})",
+                best,
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"[OFF] Ошибка поиска '{text}': {e}")
+            return []
+        order = {product_id: position for position, product_id in enumerate(best)}
+        rows.sort(key=lambda row: order[row["id"]])
+        return [
+            {
+                "code": row["code"],
+                "name": row["name"],
+                "brands": row["brands"] or "",
+                "calories": row["calories"],
+                "protein": row["protein"] or 0,
+                "fat": row["fat"] or 0,
+                "carbs": row["carbs"] or 0,
+            }
+            for row in rows
+        ]
+
+
+off_catalog = OFFCatalog()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Импорт дампа OpenFoodFacts в локальный каталог")
+    parser.add_argument("dump", help="openfoodfacts-products.jsonl[.gz] или *.products.csv[.gz]")
+    parser.add_argument("--out", default=OFF_CATALOG_PATH)
+    parser.add_argument("--country", help="оставить только продукты страны (например, russia)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    total = import_dump(args.dump, args.out, args.country)
+    print(f"{total} products -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,73 +2,61 @@
 Система напоминаний для NutriBuddy Bot
 """
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, List
-from sqlalchemy import select, and_
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from sqlalchemy import exists, select
 from aiogram import Bot
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.types import Message
 
-from database.db import get_session
+from database.db import engine
 from database.models import User, WeightEntry
+from services.broadcast import BroadcastSender
 from utils.body_composition import calculate_body_composition, get_body_composition_recommendations
 
 logger = logging.getLogger(__name__)
 
-class ReminderService:
-    """Сервис напоминаний"""
-    
-    def __init__(self, bot: Bot):
-        self.bot = bot
-    
-    async def check_weekly_reminders(self):
-        """Проверка еженедельных напоминаний"""
-        logger.info("🔔 Проверка еженедельных напоминаний")
-        
-        async with get_session() as session:
-            # Получаем всех пользователей с включенными напоминаниями
-            result = await session.execute(
-                select(User).where(User.reminder_enabled == True)
-            )
-            users = result.scalars().all()
-            
-            for user in users:
-                if await self._should_send_weekly_reminder(user):
-                    await self._send_weekly_reminder(user)
-    
-    async def _should_send_weekly_reminder(self, user: User) -> bool:
-        """Проверка нужно ли отправлять еженедельное напоминание"""
-        try:
-            # Проверяем когда последний раз пользователь обновлял вес/обхваты
-            week_ago = datetime.now() - timedelta(days=7)
-            
-            async with get_session() as session:
-                # Проверяем вес
-                weight_result = await session.execute(
-                    select(WeightEntry).where(
-                        and_(
-                            WeightEntry.user_id == user.telegram_id,
-                            WeightEntry.created_at >= week_ago
-                        )
-                    ).order_by(WeightEntry.created_at.desc())
-                )
-                recent_weight = weight_result.scalar_one_or_none()
-            
-            # Если нет записей за последнюю неделю, отправляем напоминание
-            if recent_weight is None:
-                logger.info(f"📅 Пользователю {user.telegram_id} нужно напоминание об обновлении данных")
-                return True
-            
-            return False
-            
-        except Exception as e:
-            logger.error(f"❌ Ошибка при проверке напоминания для {user.telegram_id}: {e}")
-            return False
-    
-    async def _send_weekly_reminder(self, user: User):
-        """Отправка еженедельного напоминания"""
-        try:
-            text = f"""📅 <b>Еженедельное обновление данных</b>
+WEEKLY_REMINDER_KEYBOARD = InlineKeyboardMarkup(inline_keyboard=[
+    [
+        InlineKeyboardButton(text="⚖️ Обновить вес", callback_data="weekly_update_weight"),
+        InlineKeyboardButton(text="📏 Обновить обхваты", callback_data="weekly_update_measurements")
+    ],
+    [
+        InlineKeyboardButton(text="📊 Мой прогресс", callback_data="weekly_progress"),
+        InlineKeyboardButton(text="🔕 Пропустить", callback_data="weekly_skip")
+    ]
+])
+
+
+async def due_weekly_reminders(since: datetime, after_id: int, limit: int, tz_slice=None) -> List[Any]:
+    """
+    Страница пользователей с напоминаниями, у которых нет записи веса с since
+    (с tz_slice — только из часовых поясов среза планировщика).
+    Один запрос с NOT EXISTS, порядок и курсор — telegram_id
+    """
+    recent_weight = exists().where(
+        WeightEntry.user_id == User.telegram_id,
+        WeightEntry.created_at >= since
+    )
+    query = (
+        select(
+            User.telegram_id, User.first_name, User.daily_calorie_goal, User.daily_protein_goal,
+            User.daily_fat_goal, User.daily_carbs_goal, User.daily_steps_goal
+        )
+        .where(User.reminder_enabled == True, User.telegram_id > after_id, ~recent_weight)
+        .order_by(User.telegram_id)
+        .limit(limit)
+    )
+    if tz_slice is not None:
+        query = query.where(tz_slice.condition(User.timezone))
+    async with engine.connect() as conn:
+        result = await conn.execute(query)
+        return result.all()
+
+
+def weekly_reminder_message(user) -> Dict[str, Any]:
+    """Текст и клавиатура еженедельного напоминания для строки due_weekly_reminders"""
+    text = f"""📅 <b>Еженедельное обновление данных</b>
 
 👋 Привет, {user.first_name or 'Пользователь'}!
 
@@ -92,29 +80,32 @@ class ReminderService:
 • Шаги: {user.daily_steps_goal or 10000}
 
 🚀 <b>Обновить данные?</b>"""
-            
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [
-                    InlineKeyboardButton(text="⚖️ Обновить вес", callback_data="weekly_update_weight"),
-                    InlineKeyboardButton(text="📏 Обновить обхваты", callback_data="weekly_update_measurements")
-                ],
-                [
-                    InlineKeyboardButton(text="📊 Мой прогресс", callback_data="weekly_progress"),
-                    InlineKeyboardButton(text="🔕 Пропустить", callback_data="weekly_skip")
-                ]
-            ])
-            
-            await self.bot.send_message(
-                user.telegram_id,
-                text,
-                reply_markup=keyboard,
-                parse_mode="HTML"
-            )
-            
-            logger.info(f"✅ Отправлено еженедельное напоминание пользователю {user.telegram_id}")
-            
-        except Exception as e:
-            logger.error(f"❌ Ошибка при отправке напоминания {user.telegram_id}: {e}")
+    return {"text": text, "reply_markup": WEEKLY_REMINDER_KEYBOARD, "parse_mode": "HTML"}
+
+
+class ReminderService:
+    """Сервис напоминаний"""
+    
+    def __init__(self, bot: Bot, redis_client=None):
+        self.bot = bot
+        self.weekly = BroadcastSender(bot, "weekly_reminder", redis_client)
+    
+    async def check_weekly_reminders(self, tz_slice=None, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Еженедельные напоминания тем, кто не обновлял вес 7 дней; с tz_slice —
+        пользователям среза часовых поясов планировщика. Запуск — ISO-неделя
+        (и срез): повторный вызов продолжает прерванную рассылку или ничего не делает
+        """
+        now = now or (tz_slice.scheduled_at if tz_slice is not None else datetime.now(timezone.utc))
+        year, week, _ = (tz_slice.local_date if tz_slice is not None else now).isocalendar()
+        run_id = f"{year}-W{week:02d}" + (f":{tz_slice.key}" if tz_slice is not None else "")
+        since = (now - timedelta(days=7)).replace(tzinfo=None)
+        logger.info(f"🔔 Проверка еженедельных напоминаний {run_id}")
+
+        async def fetch_page(after_id: int, limit: int) -> List[Any]:
+            return await due_weekly_reminders(since, after_id, limit, tz_slice)
+
+        return await self.weekly.run(run_id, fetch_page, weekly_reminder_message)
 
 async def create_body_composition_report(user: User) -> str:
     """Создание отчета о составе тела"""
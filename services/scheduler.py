@@ -0,0 +1,356 @@
+"""
+services/scheduler.py
+Планировщик фоновых задач: периодические и по местному времени пользователей.
+
+Задача по местному времени («ежедневно в 06:00») запускается отдельно для
+каждого смещения от UTC: раз в 15 минут (смещения поясов кратны 15
+минутам) часовые пояса пользователей группируются по текущему смещению, и
+задача получает TimezoneSlice только тех поясов, где сейчас время запуска.
+Задача сама выбирает пользователей среза условием tz_slice.condition(...),
+а не перебирает всех.
+
+Запуски разносятся случайной задержкой до jitter секунд. Планировщик
+работает на каждой реплике; каждый запуск (задача + период или срез)
+забирается SET NX в Redis, поэтому его выполняет одна реплика. Задачи с
+exclusive=False (состояние процесса) выполняются на каждой реплике.
+
+Срез забирается арендой на LEASE_TTL секунд, которую реплика продлевает,
+пока идет запуск. Успешный запуск помечается выполненным; при ошибке
+аренда снимается, а если реплика упала — истекает. Незавершенные срезы
+пробуются снова на каждом шаге в течение CATCH_UP после времени запуска,
+и задача продолжает с сохраненного места (контрольная точка рассылки).
+По каждой задаче считаются запуски, ошибки, обработанные записи (задача
+возвращает их число), длительность и задержка от планового времени.
+"""
+import asyncio
+import logging
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set
+
+from utils.config import SCHEDULER_JITTER
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_PREFIX = "nutribuddy:scheduler"
+# Шаг проверки задач по местному времени, секунды
+TICK = 900
+# Как долго кэшируется список часовых поясов пользователей, секунды
+_ZONES_TTL = 3600
+# Сколько живет отметка выполненного запуска по местному времени (сутки среза + запас)
+_SLICE_DONE_TTL = 2 * 24 * 3600
+# Аренда запуска среза, секунды; продлевается втрое чаще
+LEASE_TTL = 120
+# Сколько секунд после времени запуска повторяются незавершенные срезы
+CATCH_UP = 6 * 3600
+
+# Снимаем/продлеваем аренду, только если она все еще наша
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class TimezoneSlice:
+    """Часовые пояса с одним смещением от UTC, где сейчас время запуска задачи"""
+
+    def __init__(self, offset: timedelta, zones: Sequence[Optional[str]], scheduled_at: datetime):
+        self.offset = offset
+        self.zones = tuple(zones)
+        self.scheduled_at = scheduled_at
+
+    @property
+    def local_date(self):
+        return (self.scheduled_at + self.offset).date()
+
+    @property
+    def key(self) -> str:
+        """Смещение вида +0300"""
+        minutes = int(self.offset.total_seconds() // 60)
+        return f"{'+' if minutes >= 0 else '-'}{abs(minutes) // 60:02d}{abs(minutes) % 60:02d}"
+
+    def condition(self, column):
+        """Условие SQL на колонку часового пояса (NULL — UTC)"""
+        from sqlalchemy import or_
+
+        names = [zone for zone in self.zones if zone is not None]
+        if None in self.zones:
+            return or_(column.in_(names), column.is_(None))
+        return column.in_(names)
+
+    def __repr__(self) -> str:
+        return f"TimezoneSlice({self.key}, {len(self.zones)} zones, {self.local_date})"
+
+
+class Job:
+    """Задача: every — период в секундах, либо at — местное время «ЧЧ:ММ»"""
+
+    def __init__(self, name: str, func: Callable[..., Awaitable[Any]], every: Optional[int] = None,
+                 at: Optional[str] = None, weekdays: Optional[Sequence[int]] = None,
+                 jitter: int = SCHEDULER_JITTER, exclusive: bool = True):
+        self.name = name
+        self.func = func
+        self.every = every
+        self.weekdays = set(weekdays) if weekdays is not None else None
+        self.jitter = jitter
+        self.exclusive = exclusive
+        self.at_minute = None
+        if at is not None:
+            hours, minutes = (int(part) for part in at.split(":"))
+            # Время запуска округляется вниз до шага проверки
+            self.at_minute = (hours * 60 + minutes) // (TICK // 60) * (TICK // 60)
+
+    def minutes_late(self, local: datetime) -> Optional[int]:
+        """
+        На сколько минут местное время начала шага позже времени запуска, если
+        оно в пределах CATCH_UP того же дня; иначе None
+        """
+        if self.weekdays is not None and local.weekday() not in self.weekdays:
+            return None
+        late = local.hour * 60 + local.minute - self.at_minute
+        return late if 0 <= late < CATCH_UP // 60 else None
+
+
+class Scheduler:
+    """Периодические задачи и задачи по местному времени с отметками запусков в Redis"""
+
+    def __init__(self):
+        self.redis = None
+        self.jobs: Dict[str, Job] = {}
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._runs: Set[asyncio.Task] = set()
+        # Срезы, которые сейчас выполняет эта реплика, и выполненные (без Redis)
+        self._active: Set[str] = set()
+        self._done: Dict[str, float] = {}
+        self._zones: Optional[List[Optional[str]]] = None
+        self._zones_loaded = 0.0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def every(self, name: str, seconds: int, func: Callable[[], Awaitable[Any]],
+              jitter: int = SCHEDULER_JITTER, exclusive: bool = True) -> None:
+        """Задача раз в seconds секунд (периоды выровнены по часам UTC)"""
+        self._add(Job(name, func, every=seconds, jitter=jitter, exclusive=exclusive))
+
+    def daily(self, name: str, at: str, func: Callable[[TimezoneSlice], Awaitable[Any]],
+              weekdays: Optional[Sequence[int]] = None, jitter: int = SCHEDULER_JITTER) -> None:
+        """Задача в местное время at (weekdays: 0 — понедельник) для каждого среза поясов"""
+        self._add(Job(name, func, at=at, weekdays=weekdays, jitter=jitter))
+
+    def _add(self, job: Job) -> None:
+        self.jobs[job.name] = job
+        self.stats[job.name] = {
+            "runs": 0, "failed": 0, "skipped": 0, "processed": 0,
+            "last_processed": 0, "last_duration_s": 0.0, "last_lag_s": 0.0, "max_lag_s": 0.0,
+            "last_run_at": None,
+        }
+
+    async def start(self, redis_client=None):
+        """Запускает циклы задач; без redis_client запуски не согласуются между репликами"""
+        if self.running:
+            return
+        self.redis = redis_client
+        for job in self.jobs.values():
+            if job.every:
+                self._tasks.append(asyncio.create_task(self._interval_loop(job)))
+        if any(job.at_minute is not None for job in self.jobs.values()):
+            self._tasks.append(asyncio.create_task(self._local_loop()))
+        logger.info(f"[SCHEDULER] Started {len(self.jobs)} jobs: {', '.join(self.jobs)}")
+
+    async def stop(self):
+        """Останавливает циклы и прерывает текущие запуски"""
+        if not self.running:
+            return
+        tasks = [*self._tasks, *self._runs]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._runs.clear()
+        logger.info(f"[SCHEDULER] Stopped: {self.snapshot()}")
+
+    async def _interval_loop(self, job: Job):
+        jitter = min(job.jitter, job.every / 2)
+        while True:
+            slot = int(time.time() // job.every) + 1
+            scheduled = slot * job.every
+            await asyncio.sleep(max(0.0, scheduled - time.time()) + random.uniform(0, jitter))
+            if not job.exclusive or await self._claim(f"{job.name}:{slot}", job.every * 2):
+                # Следующий период считается после завершения: запуски не накладываются
+                await self._run(job, scheduled)
+            else:
+                self.stats[job.name]["skipped"] += 1
+
+    async def _local_loop(self):
+        while True:
+            slot = int(time.time() // TICK) * TICK
+            try:
+                await self._start_slices(datetime.fromtimestamp(slot, timezone.utc))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[SCHEDULER] Failed to plan local-time jobs: {e}")
+            await asyncio.sleep(max(0.0, slot + TICK - time.time()))
+
+    async def _start_slices(self, slot_at: datetime):
+        """Запускает задачи для срезов, где в начале шага slot_at наступило их время"""
+        from utils.timezone_utils import group_by_utc_offset
+
+        groups = group_by_utc_offset(await self._zone_names(), slot_at)
+        now = time.time()
+        self._done = {key: until for key, until in self._done.items() if until > now}
+        for job in self.jobs.values():
+            if job.at_minute is None:
+                continue
+            for offset, zones in groups.items():
+                late = job.minutes_late(slot_at + offset)
+                if late is None:
+                    continue
+                scheduled_at = slot_at - timedelta(minutes=late)
+                task = asyncio.create_task(
+                    self._run_slice(job, TimezoneSlice(offset, zones, scheduled_at), retry=late > 0)
+                )
+                self._runs.add(task)
+                task.add_done_callback(self._runs.discard)
+
+    async def _run_slice(self, job: Job, tz_slice: TimezoneSlice, retry: bool = False):
+        """Запуск среза под арендой; повтор (retry) — для среза, который еще не выполнен"""
+        run_key = f"{job.name}:{tz_slice.local_date}:{tz_slice.key}"
+        if run_key in self._active or run_key in self._done:
+            return
+        await asyncio.sleep(random.uniform(0, job.jitter))
+        token = await self._lease(run_key)
+        if token is None:
+            if not retry:
+                self.stats[job.name]["skipped"] += 1
+            return
+
+        self._active.add(run_key)
+        keeper = asyncio.create_task(self._keep_lease(run_key, token))
+        done = False
+        try:
+            if retry:
+                logger.info(f"[SCHEDULER] Retrying {job.name} {tz_slice!r}")
+            done = await self._run(job, tz_slice.scheduled_at.timestamp(), tz_slice)
+        finally:
+            keeper.cancel()
+            self._active.discard(run_key)
+            await self._finish(run_key, token, done)
+
+    async def _zone_names(self) -> List[Optional[str]]:
+        """Различные часовые пояса пользователей (кэш на _ZONES_TTL)"""
+        if self._zones is not None and time.monotonic() - self._zones_loaded < _ZONES_TTL:
+            return self._zones
+        from sqlalchemy import distinct, select
+        from database.db import engine
+        from database.models import User
+
+        try:
+            async with engine.connect() as conn:
+                result = await conn.execute(select(distinct(User.timezone)))
+                self._zones = [zone for zone, in result]
+            self._zones_loaded = time.monotonic()
+        except Exception as e:
+            logger.error(f"[SCHEDULER] Failed to load user timezones: {e}")
+        return self._zones or []
+
+    async def _lease(self, run_key: str) -> Optional[str]:
+        """Аренда среза для этой реплики; None — срез выполнен или его выполняет другая реплика"""
+        from utils.cluster import instance_id
+
+        if self.redis is None:
+            return instance_id()
+        key = f"{SCHEDULER_PREFIX}:{run_key}"
+        try:
+            if await self.redis.set(key, instance_id(), nx=True, ex=LEASE_TTL):
+                return instance_id()
+        except Exception as e:
+            logger.warning(f"[SCHEDULER] Failed to lease {run_key}: {e}")
+        return None
+
+    async def _keep_lease(self, run_key: str, token: str):
+        while True:
+            await asyncio.sleep(LEASE_TTL / 3)
+            if self.redis is None:
+                continue
+            try:
+                if not await self.redis.eval(_RENEW_SCRIPT, 1, f"{SCHEDULER_PREFIX}:{run_key}", token, LEASE_TTL):
+                    logger.warning(f"[SCHEDULER] Lost lease for {run_key}")
+                    return
+            except Exception as e:
+                logger.warning(f"[SCHEDULER] Failed to renew lease for {run_key}: {e}")
+
+    async def _finish(self, run_key: str, token: str, done: bool):
+        """Выполненный срез помечается до конца суток, иначе аренда снимается для повтора"""
+        key = f"{SCHEDULER_PREFIX}:{run_key}"
+        if done:
+            self._done[run_key] = time.time() + _SLICE_DONE_TTL
+        if self.redis is None:
+            return
+        try:
+            if done:
+                await self.redis.set(key, "done", ex=_SLICE_DONE_TTL)
+            else:
+                await self.redis.eval(_RELEASE_SCRIPT, 1, key, token)
+        except Exception as e:
+            logger.warning(f"[SCHEDULER] Failed to finish {run_key}: {e}")
+
+    async def _claim(self, run_key: str, ttl: float) -> bool:
+        """Забирает запуск для этой реплики; при недоступном Redis запуск пропускается"""
+        if self.redis is None:
+            return True
+        try:
+            return bool(await self.redis.set(
+                f"{SCHEDULER_PREFIX}:{run_key}", os.getpid(), nx=True, ex=int(ttl)
+            ))
+        except Exception as e:
+            logger.warning(f"[SCHEDULER] Failed to claim {run_key}: {e}")
+            return False
+
+    async def _run(self, job: Job, scheduled_at: float, *args) -> bool:
+        """Выполняет задачу и обновляет ее метрики; False — задача завершилась ошибкой"""
+        stats = self.stats[job.name]
+        label = f"{job.name}{f' {args[0]!r}' if args else ''}"
+        started = time.time()
+        lag = max(0.0, started - scheduled_at)
+        processed = 0
+        ok = True
+        try:
+            processed = int(await job.func(*args) or 0)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            ok = False
+            stats["failed"] += 1
+            logger.error(f"[SCHEDULER] {label} failed: {e}")
+        duration = time.time() - started
+        stats["runs"] += 1
+        stats["processed"] += processed
+        stats["last_processed"] = processed
+        stats["last_duration_s"] = round(duration, 2)
+        stats["last_lag_s"] = round(lag, 2)
+        stats["max_lag_s"] = max(stats["max_lag_s"], round(lag, 2))
+        stats["last_run_at"] = datetime.fromtimestamp(started, timezone.utc).isoformat(timespec="seconds")
+        logger.info(f"[SCHEDULER] {label}: processed={processed} in {duration:.1f}s, lag {lag:.1f}s")
+        return ok
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Метрики по задачам"""
+        return {name: dict(stats) for name, stats in self.stats.items()}
+
+
+scheduler = Scheduler()
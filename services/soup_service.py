@@ -5,9 +5,12 @@ import logging
 from datetime import datetime, timezone
 from typing import Dict, Optional
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
-from database.db import get_session
-from database.models import User, FoodEntry
+from database.db import engine, get_session
+from database.meal_writes import drink_row, food_row, insert_drink_entries, insert_food_entries, utc_now
+from database.models import FoodEntry
+from services.event_bus import DRINK_LOGGED, FOOD_LOGGED, publish
 from utils.unit_converter import convert_to_grams
 
 logger = logging.getLogger(__name__)
@@ -104,12 +107,14 @@ def get_soup_nutrition(dish_name: str, volume_ml: float) -> dict:
             for key, value in SOUP_NUTRITION_DEFAULTS.items()
         }
 
-async def save_soup(user_id: int, dish_name: str, volume_ml: float, meal_type: str = "soup"):
+async def save_soup(user_id: int, dish_name: str, volume_ml: float, meal_type: str = "soup",
+                    user_timezone: Optional[str] = None):
     """
-    Сохраняет суп как прием пищи и как запись жидкости
+    Сохраняет суп как прием пищи и как запись жидкости (одна транзакция,
+    по одному INSERT ... RETURNING на таблицу)
     
     Returns:
-        dict с ID созданных записей
+        dict с ID созданных записей и суммами за день
     """
     try:
         # Рассчитываем КБЖУ
@@ -119,118 +124,68 @@ async def save_soup(user_id: int, dish_name: str, volume_ml: float, meal_type: s
         water_content = get_soup_water_content(dish_name)
         water_volume = volume_ml * water_content
         
-        async with get_session() as session:
-            # Получаем пользователя
-            result = await session.execute(
-                select(User).where(User.telegram_id == user_id)
-            )
-            user = result.scalar_one_or_none()
-            
-            if not user:
-                raise ValueError(f"User {user_id} not found")
-            
-            # 1. Сохраняем как прием пищи (FoodEntry)
-            meal = FoodEntry(
-                user_id=user.id,
-                meal_type=meal_type,
-                date=datetime.now(timezone.utc).date(),
-                created_at=datetime.now(timezone.utc),
-                calories=nutrition['calories'],
-                protein=nutrition['protein'],
-                fat=nutrition['fat'],
-                carbs=nutrition['carbs'],
-                ai_description=f"{dish_name} ({volume_ml} мл)"
-            )
-            session.add(meal)
-            await session.flush()
-            
-            # 3. Сохраняем как запись воды (если есть поддержка)
-            try:
-                from database.models import DrinkEntry
-                
-                drink_entry = DrinkEntry(
-                    user_id=user.id,
-                    date=datetime.now(timezone.utc).date(),
-                    volume_ml=water_volume,
-                    name=dish_name,
-                    calories=nutrition['calories'],
-                    created_at=datetime.now(timezone.utc)
-                )
-                session.add(drink_entry)
-                
-            except ImportError:
-                # Если модели DrinkEntry нет, просто логируем
-                logger.info(f"[SOUP] Water volume calculated: {water_volume}ml for {dish_name}")
-            
-            await session.commit()
-            
-            logger.info(f"[SOUP] Saved soup: {dish_name} {volume_ml}ml for user {user_id}")
-            
-            return {
-                'meal_id': meal.id,
-                'water_volume': water_volume,
-                'nutrition': nutrition
-            }
+        created_at = utc_now()
+        meal = food_row(user_id, dish_name, nutrition, meal_type, quantity=volume_ml, unit='мл',
+                        created_at=created_at)
+        # Калории супа уже в food_entries — жидкость пишется без них
+        drink = drink_row(user_id, dish_name, water_volume, created_at=created_at)
+        
+        async with engine.begin() as conn:
+            food_written = await insert_food_entries(user_id, [meal], user_timezone, conn=conn)
+            drink_written = await insert_drink_entries(user_id, [drink], user_timezone, conn=conn)
+        
+        await publish(FOOD_LOGGED, user_id, meal_type=meal_type, entry_ids=food_written['ids'],
+                      calories=nutrition['calories'])
+        await publish(DRINK_LOGGED, user_id, amount=water_volume, calories=0)
+        
+        logger.info(f"[SOUP] Saved soup: {dish_name} {volume_ml}ml for user {user_id}")
+        
+        return {
+            'meal_id': food_written['ids'][0],
+            'drink_id': drink_written['ids'][0],
+            'water_volume': water_volume,
+            'nutrition': nutrition,
+            'daily_totals': {'food': food_written['daily_totals'], 'drink': drink_written['daily_totals']}
+        }
             
+    except IntegrityError:
+        raise ValueError(f"User {user_id} not found")
     except Exception as e:
         logger.error(f"[SOUP] Error saving soup: {e}")
         raise
 
-async def save_drink(user_id: int, drink_name: str, volume_ml: float, calories: float = 0):
+async def save_drink(user_id: int, drink_name: str, volume_ml: float, calories: float = 0,
+                     user_timezone: Optional[str] = None):
     """
     Сохраняет напиток как запись воды/жидкости
     
     Args:
-        user_id: ID пользователя
+        user_id: Telegram ID пользователя
         drink_name: Название напитка
         volume_ml: Объем в мл
         calories: Калории (для напитков с калориями)
+        user_timezone: Часовой пояс для дневных сумм
         
     Returns:
-        dict с информацией о сохранении
+        dict с информацией о сохранении и суммами за день
     """
     try:
-        async with get_session() as session:
-            # Получаем пользователя
-            result = await session.execute(
-                select(User).where(User.telegram_id == user_id)
-            )
-            user = result.scalar_one_or_none()
-            
-            if not user:
-                raise ValueError(f"User {user_id} not found")
-            
-            # Сохраняем как запись воды/жидкости
-            try:
-                from database.models import DrinkEntry
-                
-                drink_entry = DrinkEntry(
-                    user_id=user.id,
-                    date=datetime.now(timezone.utc).date(),
-                    volume_ml=volume_ml,
-                    name=drink_name,
-                    calories=calories,  
-                    created_at=datetime.now(timezone.utc)
-                )
-                session.add(drink_entry)
-                await session.commit()
-                
-                logger.info(f"[DRINK] Saved drink: {drink_name} {volume_ml}ml for user {user_id}")
-                
-                return {
-                    'drink_id': drink_entry.id,
-                    'volume_ml': volume_ml,
-                    'calories': calories
-                }
-                
-            except ImportError:
-                # Если модели DrinkEntry нет, просто логируем
-                logger.info(f"[DRINK] Drink logged: {drink_name} {volume_ml}ml for user {user_id}")
-                return {
-                    'volume_ml': volume_ml,
-                    'calories': calories
-                }
+        written = await insert_drink_entries(
+            user_id, [drink_row(user_id, drink_name, volume_ml, calories)], user_timezone
+        )
+        await publish(DRINK_LOGGED, user_id, amount=volume_ml, calories=calories)
+        
+        logger.info(f"[DRINK] Saved drink: {drink_name} {volume_ml}ml for user {user_id}")
+        
+        return {
+            'drink_id': written['ids'][0],
+            'volume_ml': volume_ml,
+            'calories': calories,
+            'daily_totals': written['daily_totals']
+        }
             
+    except IntegrityError:
+        raise ValueError(f"User {user_id} not found")
     except Exception as e:
         logger.error(f"[DRINK] Error saving drink: {e}")
         raise
@@ -5,351 +5,70 @@
 ✅ Кэширование переводов
 """
 import logging
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Optional
+
+from utils.catalog import load_catalog
+from utils.text_match import SubstringMatcher
 
 logger = logging.getLogger(__name__)
 
 # ==================== ПРЕМИУМ НАПОЛНЕНИЕ AI → БАЗА ====================
-AI_TO_DB_MAPPING = {
-    # РЫБА (отдельно от мяса!)
-    "salmon": "лосось",
-    "grilled salmon": "лосось жареный",
-    "baked salmon": "лосось запеченный",
-    "salmon fillet": "лосось",
-    "trout": "форель",
-    "grilled trout": "форель жареная",
-    "tuna": "тунец",
-    "cod": "треска",
-    "mackerel": "скумбрия",
-    "herring": "сельдь",
-    "fish": "рыба",
-    "grilled fish": "рыба жареная",
-    "baked fish": "рыба запеченная",
-    
-    # СУПЫ (отдельно от основного блюда!)
-    "borscht": "борщ",
-    "beet soup": "борщ",
-    "russian borscht": "борщ",
-    "shchi": "щи",
-    "cabbage soup": "щи",
-    "solyanka": "солянка",
-    "ukha": "уха",
-    "fish soup": "уха",
-    "chicken soup": "куриный суп",
-    "mushroom soup": "грибной суп",
-    "pea soup": "гороховый суп",
-    "noodle soup": "суп с лапшой",
-    
-    # МЯСО (только натурящее мясо)
-    "beef": "говядина",
-    "pork": "свинина",
-    "lamb": "баранина",
-    "veal": "телятина",
-    "grilled beef": "говядина жареная",
-    "fried pork": "свинина жареная",
-    
-    # ПТИЦА
-    "chicken": "курица",
-    "grilled chicken": "курица жареная",
-    "baked chicken": "курица запеченная",
-    "chicken breast": "куриная грудка",
-    "turkey": "индейка",
-    
-    # ПАСТА И ГАРНИРЫ
-    "pasta": "макароны",
-    "spaghetti": "спагетти",
-    "pasta with salmon": "макароны с лососем",
-    "pasta with chicken": "макароны с курицей",
-    "rice": "рис",
-    "buckwheat": "гречка",
-    "potatoes": "картофель",
-    "mashed potatoes": "картофельное пюре",
-    "fried potatoes": "картофель жареный",
-    
-    # САЛАТЫ
-    "salad": "салат",
-    "green salad": "салат",
-    "mixed salad": "салат",
-    "caesar salad": "салат цезарь",
-    "greek salad": "греческий салат",
-    "olivier salad": "салат оливье",
-    
-    # ХЛЕБ
-    "bread": "хлеб",
-    "white bread": "хлеб пшеничный",
-    "black bread": "хлеб ржаной",
-    "bun": "булка",
-    
-    # Блюда - Итальянская кухня
-    "spaghetti": "спагетти",
-    "spaghetti pasta": "спагетти",
-    "pasta spaghetti": "спагетти",
-    "spaghetti with tomato sauce": "спагетти с томатным соусом",
-    "spaghetti with meat sauce": "спагетти с мясным соусом",
-    "spaghetti bolognese": "спагетти болоньезе",
-    "pasta": "паста",
-    "macaroni": "макарон",
-    "penne": "пенне",
-    "fusilli": "фузилли",
-    
-    # Блюда - Азиатская кухня
-    "sushi": "суши",
-    "rolls": "роллы",
-    "ramen": "рамен",
-    "udon": "удон",
-    "wok": "вок",
-    "stir fry": "жаркое",
-    "fried rice": "жареный рис",
-    "noodles": "лапша",
-    
-    # Блюда - Мексиканская кухня
-    "tacos": "тако",
-    "burrito": "буррито",
-    "quesadilla": "кесадилья",
-    "nachos": "начос",
-    "enchilada": "энчилада",
-    
-    # Блюда - Американская кухня
-    "burger": "бургер",
-    "hamburger": "гамбургер",
-    "cheeseburger": "чизбургер",
-    "hot dog": "хот-дог",
-    "pizza": "пицца",
-    "steak": "стейк",
-    "ribs": "ребра",
-    
-    # Овощи
-    "tomato": "помидор",
-    "tomatoes": "помидоры",
-    "cucumber": "огурец",
-    "carrot": "морковь",
-    "onion": "лук",
-    "garlic": "чеснок",
-    "potato": "картофель",
-    "cabbage": "капуста",
-    "broccoli": "брокколи",
-    "cauliflower": "цветная капуста",
-    "pepper": "перец",
-    "bell pepper": "болгарский перец",
-    "spinach": "шпинат",
-    "lettuce": "салат листовой",
-    "mushrooms": "грибы",
-    "corn": "кукуруза",
-    "peas": "горох",
-    "beans": "фасоль",
-    
-    # Фрукты
-    "apple": "яблоко",
-    "banana": "банан",
-    "orange": "апельсин",
-    "lemon": "лимон",
-    "grape": "виноград",
-    "strawberry": "клубника",
-    "blueberry": "черника",
-    "raspberry": "малина",
-    "watermelon": "арбуз",
-    "melon": "дыня",
-    "pineapple": "ананас",
-    "mango": "манго",
-    "kiwi": "киви",
-    "pear": "груша",
-    "peach": "персик",
-    "plum": "слива",
-    "cherry": "вишня",
-    
-    # Молочные продукты
-    "milk": "молоко",
-    "cheese": "сыр",
-    "yogurt": "йогурт",
-    "kefir": "кефир",
-    "sour cream": "сметана",
-    "butter": "масло сливочное",
-    "cream": "сливки",
-    "cottage cheese": "творог",
-    
-    # Мясные продукты
-    "meat": "мясо",
-    "chicken breast": "куриная грудка",
-    "turkey breast": "индейка грудка",
-    "beef steak": "говяжий стейк",
-    "pork chop": "свиная отбивная",
-    "lamb chop": "баранья отбивная",
-    "sausage": "колбаса",
-    "sausages": "колбасы",
-    "ham": "ветчина",
-    "bacon": "бекон",
-    
-    # Рыба и морепродукты
-    "shrimp": "креветки",
-    "crab": "краб",
-    "squid": "кальмар",
-    "mussels": "мидии",
-    "oysters": "устрицы",
-    "salmon": "лосось",
-    "tuna": "тунец",
-    "cod": "треска",
-    "herring": "сельдь",
-    "mackerel": "скумбрия",
-    
-    # Хлебобулочные изделия
-    "bread": "хлеб",
-    "roll": "булочка",
-    "baguette": "багет",
-    "croissant": "круассан",
-    "toast": "тост",
-    "sandwich": "сэндвич",
-    "burger bun": "булочка для бургера",
-    
-    # Кондитерские изделия
-    "cake": "торт",
-    "pie": "пирог",
-    "cookie": "печенье",
-    "biscuit": "печенье",
-    "chocolate": "шоколад",
-    "candy": "конфеты",
-    "ice cream": "мороженое",
-    "pudding": "пудинг",
-    "mousse": "мусс",
-    
-    # Напитки
-    "coffee": "кофе",
-    "tea": "чай",
-    "juice": "сок",
-    "water": "вода",
-    "soda": "газировка",
-    "lemonade": "лимонад",
-    "smoothie": "смузи",
-    "milkshake": "милкшейк",
-    
-    # Специи и приправы
-    "salt": "соль",
-    "pepper": "перец",
-    "sugar": "сахар",
-    "honey": "мёд",
-    "ketchup": "кетчуп",
-    "mayonnaise": "майонез",
-    "mustard": "горчица",
-    "soy sauce": "соевый соус",
-    
-    # Закуски
-    "chips": "чипсы",
-    "nuts": "орехи",
-    "popcorn": "попкорн",
-    "olives": "оливки",
-    "pickles": "соленья",
-    
-    # Блюда быстрого приготовления
-    "pizza": "пицца",
-    "burger": "бургер",
-    "hot dog": "хот-дог",
-    "sandwich": "сэндвич",
-    "wrap": "рап",
-    "panini": "панини",
-    
-    # Японская кухня
-    "sushi": "суши",
-    "sashimi": "сашими",
-    "rolls": "роллы",
-    "tempura": "темпура",
-    "teriyaki": "терияки",
-    "wasabi": "васаби",
-    "ginger": "имбирь",
-    
-    # Китайская кухня
-    "fried rice": "жареный рис",
-    "sweet and sour": "кисло-сладкий",
-    "kung pao": "кунао",
-    "dumplings": "пельмени",
-    "wonton": "вонтон",
-    
-    # Индийская кухня
-    "curry": "карри",
-    "tikka": "тикка",
-    "naan": "нан",
-    "samosa": "самоса",
-    "biryani": "бирьяни",
-    
-    # Итальянская кухня
-    "risotto": "риотто",
-    "lasagna": "лазанья",
-    "carbonara": "карбонара",
-    " Alfredo": "альфредо",
-    "pesto": "песто",
-    
-    # Мексиканская кухня
-    "guacamole": "гуакамоле",
-    "salsa": "сальса",
-    "jalapeno": "халапеньо",
-    "tortilla": "тортилья",
-    
-    # Греческая кухня
-    "gyro": "гиро",
-    "souvlaki": "сувлаки",
-    "tzatziki": "дзадзики",
-    "feta": "фета",
-    
-    # Французская кухня
-    "croissant": "круассан",
-    "baguette": "багет",
-    "crepe": "блинчик",
-    "quiche": "киш",
-    "ratatouille": "рататуй",
-    
-    # Тайская кухня
-    "pad thai": "пад тай",
-    "tom yum": "том ям",
-    "green curry": "зеленое карри",
-    "red curry": "красное карри",
-    
-    # Корейская кухня
-    "kimchi": "кимчи",
-    "bibimbap": "пибимпап",
-    "bulgogi": "булгоги",
-    "kalbi": "кальби",
-    
-    # Вьетнамская кухня
-    "pho": "фо",
-    "banh mi": "бань ми",
-    "spring rolls": "спринг-роллы",
-    
-    # Ближневосточная кухня
-    "hummus": "хумус",
-    "falafel": "фалафель",
-    "shawarma": "шаверма",
-    "tabbouleh": "табуле",
-    "baklava": "баклава",
-    
-    # Здоровое питание
-    "quinoa": "киноа",
-    "avocado": "авокадо",
-    "granola": "гранола",
-    "oatmeal": "овсянка",
-    "smoothie bowl": "смузи боул",
-    
-    # Десерты
-    "cheesecake": "чизкейк",
-    "brownie": "брауни",
-    "cupcake": "кекс",
-    "muffin": "маффин",
-    "tiramisu": "тирамису",
-    "panna cotta": "панна котта",
-    
-    # Алкогольные напитки
-    "wine": "вино",
-    "beer": "пиво",
-    "cocktail": "коктейль",
-    "whiskey": "виски",
-    "vodka": "водка",
-    "gin": "джин",
-    "rum": "ром",
-    "tequila": "текила",
-}
+# Справочник в catalogs/ai_to_db_mapping.json (дополняется add_translation)
+AI_TO_DB_MAPPING = load_catalog("ai_to_db_mapping")
 
 # Обратное отображение для поиска
 DB_TO_AI_MAPPING = {v: k for k, v in AI_TO_DB_MAPPING.items()}
 
-# Кэш для переведенных продуктов
-_translation_cache = {}
+# Размер кэша переводов на направление (промахи тоже кэшируются)
+TRANSLATION_CACHE_SIZE = 4096
+
+
+class TranslationEngine:
+    """
+    Перевод по словарю: точное совпадение, затем самый длинный ключ внутри
+    названия, затем самый короткий ключ, содержащий название. Поиск идет по
+    автомату из всех ключей словаря, результаты — в ограниченном LRU-кэше.
+    """
+
+    def __init__(self, mapping: Dict[str, str], cache_size: int = TRANSLATION_CACHE_SIZE):
+        self.mapping = mapping
+        self._matcher = SubstringMatcher(mapping)
+        self.lookup = lru_cache(maxsize=cache_size)(self._lookup)
+
+    def _lookup(self, normalized_name: str) -> Optional[str]:
+        """Перевод нормализованного названия или None"""
+        if not normalized_name:
+            return None
+        if normalized_name in self.mapping:
+            return self.mapping[normalized_name]
+        key = self._matcher.longest_in(normalized_name) or self._matcher.shortest_containing(normalized_name)
+        return self.mapping[key] if key else None
+
+    def translate(self, product_name: str) -> str:
+        """Перевод названия или само название, если перевода нет"""
+        if not product_name:
+            return product_name
+        translated = self.lookup(product_name.lower().strip())
+        return translated if translated is not None else product_name
+
+    def add(self, key: str, value: str) -> None:
+        """Добавляет перевод: ключ дописывается в автомат, кэш сбрасывается"""
+        self.mapping[key] = value
+        self._matcher.add(key)
+        self.lookup.cache_clear()
+
+    def cache_clear(self) -> None:
+        self.lookup.cache_clear()
+
+    def cache_info(self) -> Dict[str, int]:
+        info = self.lookup.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
+
+
+_to_russian = TranslationEngine(AI_TO_DB_MAPPING)
+_to_english = TranslationEngine(DB_TO_AI_MAPPING)
+
 
 def translate_to_russian(product_name: str) -> str:
     """
@@ -361,31 +80,7 @@ def translate_to_russian(product_name: str) -> str:
     Returns:
         str: Название продукта на русском
     """
-    if not product_name:
-        return product_name
-    
-    # Нормализуем название
-    normalized_name = product_name.lower().strip()
-    
-    # Проверяем кэш
-    if normalized_name in _translation_cache:
-        return _translation_cache[normalized_name]
-    
-    # Ищем точное совпадение
-    if normalized_name in AI_TO_DB_MAPPING:
-        translated = AI_TO_DB_MAPPING[normalized_name]
-        _translation_cache[normalized_name] = translated
-        return translated
-    
-    # Ищем частичное совпадение
-    for ai_name, russian_name in AI_TO_DB_MAPPING.items():
-        if ai_name in normalized_name or normalized_name in ai_name:
-            _translation_cache[normalized_name] = russian_name
-            return russian_name
-    
-    # Если не нашли, возвращаем оригинал
-    _translation_cache[normalized_name] = product_name
-    return product_name
+    return _to_russian.translate(product_name)
 
 def translate_to_english(product_name: str) -> str:
     """
@@ -397,23 +92,7 @@ def translate_to_english(product_name: str) -> str:
     Returns:
         str: Название продукта на английском
     """
-    if not product_name:
-        return product_name
-    
-    # Нормализуем название
-    normalized_name = product_name.lower().strip()
-    
-    # Ищем точное совпадение
-    if normalized_name in DB_TO_AI_MAPPING:
-        return DB_TO_AI_MAPPING[normalized_name]
-    
-    # Ищем частичное совпадение
-    for russian_name, ai_name in DB_TO_AI_MAPPING.items():
-        if russian_name in normalized_name or normalized_name in russian_name:
-            return ai_name
-    
-    # Если не нашли, возвращаем оригинал
-    return product_name
+    return _to_english.translate(product_name)
 
 def get_all_translations() -> Dict[str, str]:
     """Возвращает все переводы"""
@@ -427,11 +106,8 @@ def add_translation(english: str, russian: str):
         english: Название на английском
         russian: Название на русском
     """
-    AI_TO_DB_MAPPING[english.lower()] = russian
-    DB_TO_AI_MAPPING[russian.lower()] = english
-    
-    # Очищаем кэш
-    _translation_cache.clear()
+    _to_russian.add(english.lower(), russian)
+    _to_english.add(russian.lower(), english)
     
     logger.info(f"[TRANSLATOR] Added translation: {english} → {russian}")
 
@@ -464,7 +140,11 @@ def get_translation_stats() -> Dict[str, int]:
     """Возвращает статистику переводов"""
     return {
         "total_translations": len(AI_TO_DB_MAPPING),
-        "cache_size": len(_translation_cache),
+        "cache_size": _to_russian.cache_info()["size"] + _to_english.cache_info()["size"],
+        "cache": {
+            "to_russian": _to_russian.cache_info(),
+            "to_english": _to_english.cache_info(),
+        },
         "categories": {
             "fish": len([k for k in AI_TO_DB_MAPPING.keys() if any(f in k for f in ["salmon", "tuna", "cod", "fish"])]),
             "meat": len([k for k in AI_TO_DB_MAPPING.keys() if any(f in k for f in ["beef", "pork", "chicken", "meat"])]),
@@ -477,7 +157,8 @@ def get_translation_stats() -> Dict[str, int]:
 
 def clear_cache():
     """Очищает кэш переводов"""
-    _translation_cache.clear()
+    _to_russian.cache_clear()
+    _to_english.cache_clear()
     logger.info("[TRANSLATOR] Cache cleared")
 
 def preload_common_translations():
@@ -494,6 +175,3 @@ def preload_common_translations():
         translate_to_russian(product)  # Это загрузит в кэш
     
     logger.info(f"[TRANSLATOR] Preloaded {len(common_products)} common translations")
-
-# Инициализация при импорте
-preload_common_translations()
@@ -1,61 +1,64 @@
 """
 Сервис погоды для NutriBuddy
 [WEATHER] Использует WeatherAPI.com (1M запросов/месяц бесплатно)
-[WEATHER] Кэширование на день
+[WEATHER] Двухуровневый кэш: LRU процесса + Redis
+
+Запись кэша свежая WEATHER_TTL секунд (у каждой записи свой срок с разбросом
+±10%, чтобы записи не истекали одновременно), затем еще до WEATHER_STALE_TTL
+отдается устаревшей, а обновление идет в фоне. В сеть ждут только город без
+записи или с записью старше WEATHER_STALE_TTL; одновременные запросы одного
+города делят один запрос к API. Запись в Redis (nutribuddy:weather:<город>)
+общая для реплик и переживает перезапуск. Погода городов недавно активных
+пользователей обновляется заранее (prefetch_active_cities в планировщике).
 """
 import aiohttp
 import asyncio
+import json
 import os
 import logging
-from datetime import date
-from typing import Dict
+import random
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional
+
+from utils.config import (
+    WEATHER_LRU_SIZE, WEATHER_PREFETCH_ACTIVE_HOURS, WEATHER_PREFETCH_INTERVAL,
+    WEATHER_STALE_TTL, WEATHER_TTL,
+)
 
 logger = logging.getLogger(__name__)
 
 WEATHERAPI_KEY = os.getenv("WEATHERAPI_KEY")  # Получите на https://www.weatherapi.com
 
-# Кэш: {город: (дата, данные_о_погоде)}
-_weather_cache: Dict[str, tuple[date, Dict]] = {}
+WEATHER_PREFIX = "nutribuddy:weather"
+# Одновременных запросов к API при предзагрузке
+_PREFETCH_CONCURRENCY = 10
 
 
-async def get_temperature(city: str) -> float:
-    """
-    Получает температуру через WeatherAPI.com с кэшированием на день.
-    Возвращает 20.0 при ошибке.
-    """
-    weather_data = await get_weather(city)
-    return weather_data.get('temp', 20.0)
+def city_key(city: str) -> str:
+    """Ключ города в кэше"""
+    return city.strip().lower()
 
 
-async def get_weather(city: str) -> Dict:
-    """
-    Получает полные данные о погоде через WeatherAPI.com с кэшированием на день.
-    Возвращает полный словарь с температурой, условиями, влажностью, ветром.
-    """
-    today = date.today()
-    city_clean = city.strip().lower()
-
-    # Проверка кэша
-    if city_clean in _weather_cache:
-        cache_date, weather_data = _weather_cache[city_clean]
-        if cache_date == today:
-            logger.info(f"[CACHE] Using cached weather for {city}: {weather_data.get('temp', 'N/A')}°C")
-            return weather_data
-        else:
-            del _weather_cache[city_clean]
-
-    # Если нет ключа API
+def default_weather(city: str) -> Dict:
+    """Данные по умолчанию, когда погода недоступна"""
+    return {
+        'temp': 20.0,
+        'condition': 'неизвестно',
+        'humidity': 50,
+        'wind': 3.0,
+        'timezone': 'UTC',
+        'localtime': None,
+        'city': city
+    }
+
+
+async def fetch_weather(city: str) -> Optional[Dict]:
+    """Запрос к WeatherAPI.com; None — ошибка или нет ключа API"""
     if not WEATHERAPI_KEY:
         logger.warning("[WARNING] WEATHERAPI_KEY not set, using default weather data")
-        return {
-            'temp': 20.0,
-            'condition': 'неизвестно',
-            'humidity': 50,
-            'wind': 3.0,
-            'timezone': 'UTC',
-            'localtime': None,
-            'city': city
-        }
+        return None
 
     try:
         url = "http://api.weatherapi.com/v1/current.json"
@@ -69,11 +72,11 @@ async def get_weather(city: str) -> Dict:
             async with session.get(url, params=params, timeout=10) as resp:
                 if resp.status == 200:
                     data = await resp.json()
-                    
+
                     # Извлечение необходимых данных
                     current = data["current"]
                     location = data.get("location", {})
-                    
+
                     weather_data = {
                         'temp': float(current["temp_c"]),
                         'condition': current["condition"]["text"],
@@ -86,12 +89,10 @@ async def get_weather(city: str) -> Dict:
                         'localtime': location.get("localtime"),
                         'city': location.get("name", city)
                     }
-                    
-                    # Кэширование результата
-                    _weather_cache[city_clean] = (today, weather_data)
+
                     logger.info(f"[WEATHER] WeatherAPI for {city}: {weather_data['temp']}°C, {weather_data['condition']}")
                     return weather_data
-                    
+
                 elif resp.status == 429:
                     logger.warning("[WARNING] WeatherAPI rate limit exceeded (429)")
                 else:
@@ -101,14 +102,200 @@ async def get_weather(city: str) -> Dict:
         logger.warning("[WARNING] WeatherAPI timeout")
     except Exception as e:
         logger.error(f"[ERROR] WeatherAPI exception: {e}")
+    return None
 
-    # Fallback
-    return {
-        'temp': 20.0,
-        'condition': 'неизвестно',
-        'humidity': 50,
-        'wind': 3.0,
-        'timezone': 'UTC',
-        'localtime': None,
-        'city': city
-    }
+
+class WeatherCache:
+    """Погода по городам: LRU процесса, Redis и запросы к API с фоновым обновлением"""
+
+    def __init__(self, redis_client=None, max_size: int = WEATHER_LRU_SIZE,
+                 ttl: int = WEATHER_TTL, stale_ttl: int = WEATHER_STALE_TTL):
+        self.redis = redis_client
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._local: "OrderedDict[str, Dict]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.counts = {"hits": 0, "redis_hits": 0, "stale": 0, "misses": 0,
+                       "fetches": 0, "errors": 0, "prefetched": 0}
+
+    def bind(self, redis_client) -> None:
+        self.redis = redis_client
+
+    async def get(self, city: str, fallback: bool = True) -> Optional[Dict]:
+        """Погода города; ждет API только без пригодной записи.
+        Без записи и ответа API — default_weather, а с fallback=False — None"""
+        key = city_key(city)
+        now = time.time()
+        entry = self._local_get(key)
+        if entry is None or entry["expires_at"] <= now:
+            remote = (await self._redis_get([key])).get(key)
+            if remote is not None and (entry is None or remote["expires_at"] > entry["expires_at"]):
+                entry = remote
+                self._local_put(key, entry)
+                if entry["expires_at"] > now:
+                    self.counts["redis_hits"] += 1
+                    return entry["data"]
+
+        if entry is not None:
+            if entry["expires_at"] > now:
+                self.counts["hits"] += 1
+                return entry["data"]
+            if entry["stale_until"] > now:
+                self.counts["stale"] += 1
+                self._refresh_in_background(key, city)
+                return entry["data"]
+
+        self.counts["misses"] += 1
+        fresh = await self._load(key, city)
+        if fresh is not None:
+            return fresh["data"]
+        # API недоступен: старые данные лучше данных по умолчанию
+        if entry is not None:
+            return entry["data"]
+        return default_weather(city) if fallback else None
+
+    async def prefetch(self, cities: Iterable[str], horizon: float,
+                       concurrency: int = _PREFETCH_CONCURRENCY) -> int:
+        """Обновляет города без записи или с записью, которая истечет в ближайшие horizon секунд"""
+        cities_by_key = {city_key(city): city for city in cities if city and city_key(city)}
+        entries = await self._redis_get(list(cities_by_key))
+        deadline = time.time() + horizon
+        due = []
+        for key, city in cities_by_key.items():
+            entry = entries.get(key) or self._local_get(key)
+            if entry is None or entry["expires_at"] < deadline:
+                due.append((key, city))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def refresh(key: str, city: str) -> bool:
+            async with semaphore:
+                return await self._load(key, city) is not None
+
+        refreshed = sum(await asyncio.gather(*(refresh(key, city) for key, city in due)))
+        self.counts["prefetched"] += refreshed
+        return refreshed
+
+    def _refresh_in_background(self, key: str, city: str) -> None:
+        if self._running_fetch(key) is None:
+            asyncio.ensure_future(self._load(key, city))
+
+    def _running_fetch(self, key: str) -> Optional[asyncio.Future]:
+        task = self._inflight.get(key)
+        # Задача другого цикла событий (asyncio.run в инструментах агента) недоступна
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+
+    async def _load(self, key: str, city: str) -> Optional[Dict]:
+        """Запрос к API, общий для одновременных вызовов по городу"""
+        task = self._running_fetch(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(key, city))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._inflight.pop(key, None)
+                                   if self._inflight.get(key) is done else None)
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(self, key: str, city: str) -> Optional[Dict]:
+        self.counts["fetches"] += 1
+        data = await fetch_weather(city)
+        if data is None:
+            self.counts["errors"] += 1
+            return None
+        now = time.time()
+        entry = {
+            "data": data,
+            "expires_at": now + self.ttl * random.uniform(0.9, 1.1),
+            "stale_until": now + self.stale_ttl,
+        }
+        self._local_put(key, entry)
+        if self.redis is not None:
+            try:
+                await self.redis.set(f"{WEATHER_PREFIX}:{key}", json.dumps(entry, ensure_ascii=False),
+                                     ex=self.stale_ttl)
+            except Exception as e:
+                logger.warning(f"[WEATHER] Redis cache write failed for {city}: {e}")
+        return entry
+
+    def _local_get(self, key: str) -> Optional[Dict]:
+        entry = self._local.get(key)
+        if entry is not None:
+            self._local.move_to_end(key)
+        return entry
+
+    def _local_put(self, key: str, entry: Dict) -> None:
+        self._local[key] = entry
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+    async def _redis_get(self, keys: List[str]) -> Dict[str, Dict]:
+        if self.redis is None or not keys:
+            return {}
+        entries = {}
+        try:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                values = await self.redis.mget([f"{WEATHER_PREFIX}:{key}" for key in chunk])
+                for key, raw in zip(chunk, values):
+                    if raw:
+                        entries[key] = json.loads(raw)
+        except Exception as e:
+            logger.warning(f"[WEATHER] Redis cache read failed: {e}")
+        return entries
+
+    def snapshot(self) -> Dict[str, int]:
+        """Счетчики попаданий и запросов к API"""
+        return {**self.counts, "local_size": len(self._local), "inflight": len(self._inflight)}
+
+
+weather_cache = WeatherCache()
+
+
+async def get_temperature(city: str) -> float:
+    """
+    Получает температуру через WeatherAPI.com с кэшированием.
+    Возвращает 20.0 при ошибке.
+    """
+    weather_data = await get_weather(city)
+    return weather_data.get('temp', 20.0)
+
+
+async def get_measured_temperature(city: str) -> Optional[float]:
+    """Температура из кэша или API; None, если погода недоступна (без 20.0 по умолчанию)"""
+    weather_data = await weather_cache.get(city, fallback=False)
+    return weather_data.get('temp') if weather_data is not None else None
+
+
+async def get_weather(city: str) -> Dict:
+    """
+    Получает полные данные о погоде через WeatherAPI.com с кэшированием.
+    Возвращает полный словарь с температурой, условиями, влажностью, ветром.
+    """
+    return await weather_cache.get(city)
+
+
+async def prefetch_active_cities(hours: int = WEATHER_PREFETCH_ACTIVE_HOURS) -> int:
+    """
+    Обновляет погоду городов пользователей, которые записывали еду или напитки
+    за последние hours часов, пока записи кэша не истекли. Возвращает число городов
+    """
+    from sqlalchemy import distinct, select, union
+    from database.db import engine
+    from database.models import DrinkEntry, FoodEntry, User
+
+    if not WEATHERAPI_KEY:
+        return 0
+    since = (datetime.now(timezone.utc) - timedelta(hours=hours)).replace(tzinfo=None)
+    active = union(
+        select(FoodEntry.user_id).where(FoodEntry.created_at >= since),
+        select(DrinkEntry.user_id).where(DrinkEntry.created_at >= since),
+    ).subquery()
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(distinct(User.city)).where(User.city.isnot(None), User.telegram_id.in_(select(active.c.user_id)))
+        )
+        cities = [city for city, in result]
+    # Запас в полпериода: следующий запуск может сдвинуться на jitter
+    return await weather_cache.prefetch(cities, WEATHER_PREFETCH_INTERVAL * 1.5)
@@ -1,75 +1,128 @@
 """
 services/weather_updater.py
 Фоновая задача для ежедневного обновления нормы воды всех пользователей.
+
+Пользователи читаются страницами по ключу (telegram_id > курсор) короткими
+запросами, без ORM-объектов и долгой транзакции. Температура запрашивается
+один раз на город за запуск, новые города страницы — параллельно (не больше
+WATER_GOAL_WEATHER_CONCURRENCY запросов). Изменившиеся нормы страницы
+записываются одним UPDATE ... FROM (VALUES ...).
 """
 import asyncio
 import logging
-from datetime import datetime, timezone
-from sqlalchemy import select
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import BigInteger, Float, bindparam, column, select, update, values
 
-from database.db import get_session
+from database.db import begin_or_reuse, engine
+from database.meal_writes import utc_now
 from database.models import User
 from services.calculator import calculate_water_intake
-from services.weather import get_temperature
+from services.weather import city_key, get_measured_temperature
 from utils.activity_normalizer import normalize_activity_level
+from utils.config import WATER_GOAL_PAGE_SIZE, WATER_GOAL_WEATHER_CONCURRENCY
 
 logger = logging.getLogger(__name__)
 
-async def update_all_users_water_goal():
-    """
-    Обновляет daily_water_goal для всех пользователей, у которых указан город.
-    Группирует пользователей по городам для оптимизации запросов к API.
-    Запросы к API кэшируются на день, поэтому повторные обращения к тому же городу
-    в течение дня не создают лишней нагрузки.
-    """
-    async with get_session() as session:
-        # Получаем всех пользователей, у которых есть город
-        result = await session.execute(
-            select(User).where(User.city.isnot(None))
-        )
-        users = result.scalars().all()
-
-        # Группируем пользователей по городам для оптимизации запросов
-        city_users = {}
-        for user in users:
-            if user.city not in city_users:
-                city_users[user.city] = []
-            city_users[user.city].append(user)
-
-        logger.info(f"[WORLD] Обновляем нормы воды для {len(users)} пользователей в {len(city_users)} городах")
-
-        # Обрабатываем каждый город отдельно
-        for city, city_user_list in city_users.items():
+
+async def fetch_temperatures(cities: Sequence[str], concurrency: int = WATER_GOAL_WEATHER_CONCURRENCY,
+                             known: Optional[Dict[str, Optional[float]]] = None) -> Dict[str, Optional[float]]:
+    """Температура городов, которых нет в known: {ключ города: °C или None, если погода недоступна}"""
+    known = known if known is not None else {}
+    pending = {}
+    for city in cities:
+        key = city_key(city)
+        if key and key not in known and key not in pending:
+            pending[key] = city
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(key: str, city: str):
+        async with semaphore:
             try:
-                # Получаем температуру один раз для всех пользователей города
-                temperature = await get_temperature(city)
-                logger.info(f"[TEMP] Температура в {city}: {temperature}°C для {len(city_user_list)} пользователей")
+                known[key] = await get_measured_temperature(city)
+            except Exception as e:
+                logger.error(f"[ERROR] Ошибка получения погоды для города {city}: {e}")
+                known[key] = None
 
-                # Обновляем норму воды для всех пользователей города
-                for user in city_user_list:
-                    try:
-                        # Нормализуем уровень активности
-                        normalized_activity = normalize_activity_level(user.activity_level)
+    await asyncio.gather(*(fetch(key, city) for key, city in pending.items()))
+    return known
 
-                        # Рассчитываем новую норму воды
-                        water_goal = calculate_water_intake(
-                            weight=user.weight,
-                            activity_level=normalized_activity
-                        )
 
-                        # Обновляем норму воды
-                        user.daily_water_goal = water_goal
-                        # Обновляем updated_at без timezone для PostgreSQL
-                        user.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+async def apply_water_goals(goals: Sequence[Tuple[int, float]], conn=None) -> int:
+    """Записывает нормы воды [(telegram_id, мл), ...] одним запросом; возвращает их число"""
+    if not goals:
+        return 0
+    now = utc_now()
+    async with begin_or_reuse(conn) as connection:
+        if connection.dialect.name == "postgresql":
+            new_goals = values(
+                column("telegram_id", BigInteger), column("goal", Float), name="new_goals"
+            ).data(list(goals))
+            await connection.execute(
+                update(User)
+                .where(User.telegram_id == new_goals.c.telegram_id)
+                .values(daily_water_goal=new_goals.c.goal, updated_at=now)
+            )
+        else:
+            # SQLite не поддерживает имена колонок у VALUES: executemany в одной транзакции
+            await connection.execute(
+                update(User)
+                .where(User.telegram_id == bindparam("b_telegram_id"))
+                .values(daily_water_goal=bindparam("b_goal"), updated_at=now),
+                [{"b_telegram_id": telegram_id, "b_goal": goal} for telegram_id, goal in goals]
+            )
+    return len(goals)
 
-                    except Exception as e:
-                        logger.error(f"[ERROR] Ошибка обновления нормы воды для пользователя {user.id}: {e}")
-                        continue
 
-                await session.commit()
+async def _users_page(after_id: int, limit: int, tz_slice=None) -> List[tuple]:
+    query = (
+        select(User.telegram_id, User.city, User.weight, User.activity_level, User.daily_water_goal)
+        .where(User.city.isnot(None), User.weight.isnot(None), User.telegram_id > after_id)
+        .order_by(User.telegram_id)
+        .limit(limit)
+    )
+    if tz_slice is not None:
+        query = query.where(tz_slice.condition(User.timezone))
+    async with engine.connect() as conn:
+        result = await conn.execute(query)
+        return result.all()
 
-            except Exception as e:
-                logger.error(f"[ERROR] Ошибка получения погоды для города {city}: {e}")
+
+async def update_all_users_water_goal(tz_slice=None, page_size: int = WATER_GOAL_PAGE_SIZE) -> int:
+    """
+    Обновляет daily_water_goal с учетом погоды для всех пользователей, у которых
+    указан город (с tz_slice — только для часовых поясов среза планировщика).
+    Возвращает число пользователей, у которых норма изменилась.
+    """
+    temperatures: Dict[str, Optional[float]] = {}
+    after_id = 0
+    users = updated = 0
+
+    while True:
+        rows = await _users_page(after_id, page_size, tz_slice)
+        if not rows:
+            break
+        after_id = rows[-1].telegram_id
+        users += len(rows)
+        await fetch_temperatures([row.city for row in rows], known=temperatures)
+
+        goals = []
+        for row in rows:
+            temperature = temperatures.get(city_key(row.city))
+            if temperature is None:
+                # Погода недоступна: норма остается прежней
                 continue
+            water_goal = calculate_water_intake(
+                weight=row.weight,
+                activity_level=normalize_activity_level(row.activity_level),
+                temperature=temperature
+            )
+            if water_goal != row.daily_water_goal:
+                goals.append((row.telegram_id, water_goal))
+        try:
+            updated += await apply_water_goals(goals)
+        except Exception as e:
+            logger.error(f"[ERROR] Ошибка записи норм воды после {rows[0].telegram_id}: {e}")
 
-    logger.info(f"[DONE] Обновление норм воды завершено для {len(city_users)} городов")
+    logger.info(f"[DONE] Нормы воды: {updated} изменено из {users} пользователей в {len(temperatures)} городах")
+    return updated
@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional, List
 from database.db import get_session
 from database.models import WeightEntry, User
 from sqlalchemy import select, func
+from services.event_bus import WEIGHT_LOGGED, publish
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,8 @@ async def save_weight(user_id: int, weight_kg: float) -> Dict[str, Any]:
             await session.commit()
             await session.refresh(weight_entry)
 
+            await publish(WEIGHT_LOGGED, user_id, weight_kg=weight_kg)
+
             logger.info(f"Weight saved: {weight_kg}kg for user {user_id}")
 
             return {
@@ -0,0 +1,7 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("BOT_TOKEN", "1:test")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
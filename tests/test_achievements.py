@@ -0,0 +1,46 @@
+"""Разблокировка достижений: коды из utils/gamification.py сохраняются в user_achievements"""
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from database.db import Base, engine, get_session
+from database.models import User, UserAchievement
+from utils.gamification import gamification_system
+
+
+@pytest.fixture
+def db():
+    async def reset():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        async with get_session() as session:
+            session.add(User(telegram_id=42, first_name="Аня"))
+
+    asyncio.run(reset())
+
+
+def test_first_meal_is_unlocked_once(db):
+    async def scenario():
+        data = {"time": datetime(2026, 1, 1, 12, 0)}
+        first = await gamification_system.check_achievements(42, "meal", data)
+        again = await gamification_system.check_achievements(42, "meal", data)
+        async with get_session() as session:
+            rows = (await session.execute(
+                select(UserAchievement.achievement_id).where(UserAchievement.user_id == 42)
+            )).scalars().all()
+        return first, again, rows
+
+    first, again, rows = asyncio.run(scenario())
+    assert "first_meal" in [a.id for a in first]
+    assert "first_meal" not in [a.id for a in again]
+    assert rows.count("first_meal") == 1
+
+
+def test_achievement_id_column_stores_codes():
+    # PostgreSQL не примет "first_meal" в INTEGER-колонку со ссылкой на achievements.id
+    column = UserAchievement.__table__.c.achievement_id
+    assert column.type.python_type is str
+    assert not column.foreign_keys
@@ -0,0 +1,56 @@
+"""Общий лимит исходящих запросов в кластере"""
+import asyncio
+
+from services.broadcast import TokenBucket
+from services.delivery import Delivery, SharedTokenBucket
+
+
+class FakeBucketRedis:
+    """Выдает токены, как _TAKE_SCRIPT: rate в секунду на всех клиентов"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = 0
+
+    async def eval(self, script, numkeys, key, *args):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("redis down")
+        return 0
+
+
+def test_cluster_worker_keeps_the_bot_wide_rate():
+    delivery = Delivery()
+    delivery.configure(rate=30, redis_client=FakeBucketRedis(), share=4)
+
+    assert isinstance(delivery.bucket, SharedTokenBucket)
+    # Воркер с рассылкой может взять весь лимит бота, а не 30 / 4
+    assert delivery.bucket.rate == 30
+    assert delivery.bucket.fallback.rate == 7.5
+
+
+def test_shared_bucket_takes_tokens_from_redis():
+    redis = FakeBucketRedis()
+    bucket = SharedTokenBucket(redis, 30, TokenBucket(7.5))
+
+    async def take(n):
+        for _ in range(n):
+            await bucket.acquire()
+
+    asyncio.run(take(5))
+    assert redis.calls == 5
+
+
+def test_shared_bucket_falls_back_to_local_share():
+    fallback = TokenBucket(7.5, capacity=2)
+    bucket = SharedTokenBucket(FakeBucketRedis(fail=True), 30, fallback)
+
+    asyncio.run(bucket.acquire())
+    assert fallback._tokens < 2
+
+
+def test_without_redis_rate_is_split():
+    delivery = Delivery()
+    delivery.configure(rate=30, share=4)
+    assert isinstance(delivery.bucket, TokenBucket)
+    assert delivery.bucket.rate == 7.5
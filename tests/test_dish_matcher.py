@@ -0,0 +1,26 @@
+"""Определение блюда по ингредиентам: лучшее совпадение и альтернативы"""
+from services.dish_db import COMPOSITE_DISHES, dish_identifier, find_best_match, find_top_matches
+
+
+def _ingredients(dish_key):
+    return [ingredient["name"] for ingredient in COMPOSITE_DISHES[dish_key]["ingredients"]]
+
+
+def test_top_matches_start_with_best_match_and_are_sorted():
+    for dish_key in list(COMPOSITE_DISHES)[:50]:
+        ingredients = _ingredients(dish_key)
+        matches = find_top_matches(ingredients, 5)
+        best = find_best_match(ingredients)
+        assert matches[0]["dish_key"] == best["dish_key"]
+        scores = [match["match_score"] for match in matches]
+        assert scores == sorted(scores, reverse=True)
+        assert all(score >= 0.3 for score in scores)
+
+
+def test_identify_dish_returns_alternatives():
+    dish_key = next(iter(COMPOSITE_DISHES))
+    result = dish_identifier.identify_dish(_ingredients(dish_key), alternatives=2)
+    assert result["method"] == "composite_match"
+    assert result["dish"]["match_score"] == result["confidence"]
+    assert len(result["alternatives"]) <= 2
+    assert result["dish"]["dish_key"] not in [match["dish_key"] for match in result["alternatives"]]
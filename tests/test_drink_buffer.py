@@ -0,0 +1,102 @@
+"""Отложенная запись напитков: сбой XDEL после записи в БД не дает дублей"""
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select
+
+from database.db import Base, engine
+from database.meal_writes import drink_row
+from database.models import DrinkEntry, User
+from services.drink_buffer import DrinkWriteBuffer, stream_key
+
+
+class FakeStreamRedis:
+    """XADD/XRANGE/XDEL одного процесса; первые fail_xdel удалений падают"""
+
+    def __init__(self, fail_xdel: int = 0):
+        self.streams = {}
+        self.fail_xdel = fail_xdel
+        self._seq = 0
+
+    async def xadd(self, key, fields):
+        self._seq += 1
+        entry_id = f"{self._seq}-0"
+        self.streams.setdefault(key, []).append((entry_id, {k.encode(): v for k, v in fields.items()}))
+        return entry_id.encode()
+
+    async def xrange(self, key, min="-", max="+", count=None):
+        entries = self.streams.get(key, [])
+        if min != "-":
+            after = int(min.lstrip("(").split("-")[0])
+            entries = [e for e in entries if int(e[0].split("-")[0]) > after]
+        return entries[:count]
+
+    async def xdel(self, key, *ids):
+        if self.fail_xdel:
+            self.fail_xdel -= 1
+            raise ConnectionError("redis timeout")
+        self.streams[key] = [e for e in self.streams.get(key, []) if e[0] not in ids]
+
+    async def xlen(self, key):
+        return len(self.streams.get(key, []))
+
+
+@pytest.fixture
+def db():
+    async def reset():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(User.__table__.insert().values(telegram_id=7))
+
+    asyncio.run(reset())
+
+
+async def _drink_count():
+    async with engine.connect() as conn:
+        return (await conn.execute(select(func.count()).select_from(DrinkEntry.__table__))).scalar()
+
+
+def _buffer(redis):
+    buffer = DrinkWriteBuffer()
+    buffer.redis = redis
+    buffer.instance = "host:1:abcd1234"
+    buffer.key = stream_key(buffer.instance)
+    return buffer
+
+
+def test_failed_trim_is_not_written_twice(db):
+    async def scenario():
+        redis = FakeStreamRedis(fail_xdel=1)
+        buffer = _buffer(redis)
+        buffer._task = asyncio.get_running_loop().create_future()  # включенный буфер без цикла сброса
+        for amount in (200, 300):
+            await buffer.add(drink_row(7, "вода", amount, created_at=datetime(2026, 1, 1, 12)))
+        await buffer.flush()
+        left_in_stream = await redis.xlen(buffer.key)
+
+        # Процесс упал; другой процесс дописывает его поток
+        other = _buffer(redis)
+        recovered = await other.recover(buffer.key)
+        return left_in_stream, recovered, other.counts["dropped"], await _drink_count()
+
+    left_in_stream, recovered, dropped, rows = asyncio.run(scenario())
+    assert left_in_stream == 2
+    assert recovered == 0
+    # Уже записанные строки пропускаются, а не отклоняются как чужие
+    assert dropped == 0
+    assert rows == 2
+
+
+def test_failed_trim_is_retried(db):
+    async def scenario():
+        redis = FakeStreamRedis(fail_xdel=1)
+        buffer = _buffer(redis)
+        buffer._task = asyncio.get_running_loop().create_future()
+        await buffer.add(drink_row(7, "вода", 250))
+        await buffer.flush()
+        await buffer._ack([])
+        return await redis.xlen(buffer.key)
+
+    assert asyncio.run(scenario()) == 0
@@ -0,0 +1,22 @@
+"""Поиск продуктов и блюд в services/food_api.py"""
+import pytest
+
+from services.dish_db import COMPOSITE_DISHES, find_dish_key
+from services.food_api import get_product_nutrition
+
+
+def test_product_nutrition_scales_dish_by_weight():
+    dish = COMPOSITE_DISHES[find_dish_key("борщ")]
+    per_100 = dish["nutrition_per_100"]
+
+    nutrition = get_product_nutrition("борщ", 250)
+
+    assert nutrition["dish_name"] == dish["name"]
+    assert nutrition["weight"] == 250
+    assert nutrition["calories"] == pytest.approx(per_100["calories"] * 2.5)
+    assert nutrition["protein"] == pytest.approx(per_100["protein"] * 2.5)
+
+
+def test_product_nutrition_unknown_product_is_zero():
+    nutrition = get_product_nutrition("несуществующий продукт xyz", 100)
+    assert nutrition["calories"] == 0
@@ -0,0 +1,50 @@
+"""Локальный разбор еды: от текста до строк food_entries без LLM"""
+import asyncio
+
+import pytest
+
+from services.ai_processor import ai_processor
+from services.food_save_service import FoodSaveService
+from services.food_text_parser import parse_food_text_local
+
+
+@pytest.fixture
+def local_only(monkeypatch):
+    async def no_profile(user_id):
+        return ""
+
+    async def no_llm(*args, **kwargs):
+        raise AssertionError("текст должен разбираться локально")
+
+    monkeypatch.setattr(ai_processor, "_get_user_profile", no_profile)
+    monkeypatch.setattr(ai_processor.ai_manager, "parse_food_text", no_llm)
+
+
+def test_parser_keeps_per_100g_and_totals():
+    item = parse_food_text_local("гречка 200 г")["ingredients"][0]
+    assert item["weight_grams"] == 200
+    assert item["calories"] == pytest.approx(item["calories_per_100g"] * 2)
+
+
+def test_local_path_saves_calories_for_parsed_weight(local_only):
+    result = asyncio.run(ai_processor.process_text_input("гречка 200 г", user_id=1))
+    assert result["intent"] == "log_food"
+    assert result["parameters"]["model_used"] == "local_parser"
+
+    item = result["parameters"]["food_items"][0]
+    # Обработчики показывают calories как «на 100г» и умножают на вес/100
+    assert item["calories"] == item["calories_per_100g"]
+    assert item["quantity"] == 200
+
+    row = FoodSaveService.build_food_rows(1, [item])[0]
+    assert row["quantity"] == 200
+    assert row["calories"] == pytest.approx(item["calories_per_100g"] * 2)
+
+
+def test_local_path_several_items(local_only):
+    result = asyncio.run(ai_processor.process_text_input("2 яйца и гречка 150 г", user_id=1))
+    items = result["parameters"]["food_items"]
+    parsed = parse_food_text_local("2 яйца и гречка 150 г")
+
+    rows = FoodSaveService.build_food_rows(1, items)
+    assert sum(row["calories"] for row in rows) == pytest.approx(parsed["estimated_calories"], abs=1)
@@ -0,0 +1,50 @@
+"""Парсеры воды и напитков на общем лексере количеств"""
+import pytest
+
+from utils.drink_parser import extract_volume
+from utils.quantity_lexer import numbers
+from utils.water_parser import parse_water_amount
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2 стакана", 500),
+    ("1/2 стакана", 125),
+    ("3/4 л", 750),
+    ("1 1/2 стакана", 375),
+    ("два с половиной литра", 2500),
+    ("2 с половиной стакана", 625),
+    ("пол-литра", 500),
+    ("300", 300),
+    ("1.5", 1500),
+    ("-5", None),
+    ("-200 мл", None),
+    ("0 мл", None),
+])
+def test_parse_water_amount(text, expected):
+    assert parse_water_amount(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("капучино 300 мл", 300),
+    ("1/2 стакана сока", 125),
+    ("два стакана молока", 500),
+    ("1 1/2 стакана сока", 375),
+    ("полтора литра воды", 1500),
+    ("кофе -200 мл", None),
+])
+def test_extract_volume(text, expected):
+    assert extract_volume(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1/2", [0.5]),
+    ("давление 120/80", [120, 80]),
+    ("2-3 стакана", [2, 3]),
+    ("1 1/2", [1.5]),
+    ("2 3/4 стакана", [2.75]),
+    ("два с половиной", [2.5]),
+    ("1 5/4", [1, 1.25]),
+    ("с половиной", [0.5]),
+])
+def test_fractions_and_ranges(text, expected):
+    assert numbers(text) == expected
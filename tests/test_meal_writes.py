@@ -0,0 +1,34 @@
+"""Пакетная запись приема пищи через FoodSaveService"""
+import asyncio
+
+import pytest
+
+from database.db import Base, engine
+from database.models import User
+from services.food_save_service import FoodSaveService
+
+ITEMS = [{"name": "гречка", "calories": 110, "protein": 4, "fat": 1, "carbs": 21, "quantity": 200}]
+
+
+@pytest.fixture
+def db():
+    async def reset():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(User.__table__.insert().values(telegram_id=5))
+
+    asyncio.run(reset())
+
+
+def test_meal_is_saved_with_daily_totals(db):
+    result = asyncio.run(FoodSaveService.save_food_to_db(5, ITEMS, "lunch"))
+    assert result["success"]
+    assert len(result["entry_ids"]) == 1
+    assert result["daily_totals"]["calories"] == pytest.approx(220)
+
+
+def test_unknown_user_is_rejected_by_foreign_key(db):
+    # На SQLite внешние ключи проверяются только с PRAGMA foreign_keys=ON (database/db.py)
+    result = asyncio.run(FoodSaveService.save_food_to_db(6, ITEMS, "lunch"))
+    assert result == {"success": False, "error": "Пользователь не найден"}
@@ -0,0 +1,58 @@
+"""Пересчет норм воды: недоступная погода не меняет норму"""
+import asyncio
+
+import pytest
+
+import services.weather as weather
+from database.db import Base, engine, get_session
+from database.models import User
+from services import weather_updater
+from services.calculator import calculate_water_intake
+
+
+@pytest.fixture
+def weather_api(monkeypatch):
+    async def fetch_weather(city):
+        if city == "Москва":
+            return None  # API недоступен
+        return {**weather.default_weather(city), "temp": 32.0}
+
+    monkeypatch.setattr(weather, "weather_cache", weather.WeatherCache())
+    monkeypatch.setattr(weather, "fetch_weather", fetch_weather)
+
+
+@pytest.fixture
+def users(weather_api):
+    async def reset():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        async with get_session() as session:
+            session.add_all([
+                User(telegram_id=1, city="Москва", weight=70, activity_level="medium", daily_water_goal=1234),
+                User(telegram_id=2, city="Сочи", weight=70, activity_level="medium", daily_water_goal=1234),
+            ])
+
+    asyncio.run(reset())
+
+
+def _goals():
+    async def read():
+        async with get_session() as session:
+            return {user.telegram_id: user.daily_water_goal for user in
+                    (await session.execute(User.__table__.select())).all()}
+    return asyncio.run(read())
+
+
+def test_failed_fetch_is_none_not_default(weather_api):
+    temperatures = asyncio.run(weather_updater.fetch_temperatures(["Москва", "Сочи"]))
+    assert temperatures == {"москва": None, "сочи": 32.0}
+
+
+def test_failed_fetch_keeps_city_goals(users):
+    updated = asyncio.run(weather_updater.update_all_users_water_goal())
+
+    goals = _goals()
+    assert updated == 1
+    assert goals[1] == 1234
+    assert goals[2] == calculate_water_intake(weight=70, activity_level="medium", temperature=32.0)
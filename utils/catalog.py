@@ -0,0 +1,257 @@
+"""
+Справочники в файлах данных (catalogs/*.json) и компактные записи для них.
+
+Файл справочника: {"catalog": имя, "version": N, "entries": {ключ: значение}}.
+Повторяющиеся ключи на любом уровне — ошибка, а не молчаливая перезапись.
+Строгая проверка всех файлов запускается при сборке образа, при старте бота
+файлы читаются быстрым парсером (orjson) без нее:
+
+    python -m utils.catalog
+"""
+import json
+import logging
+import os
+import sys
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from orjson import loads as _fast_loads
+except ImportError:  # pragma: no cover - orjson указан в requirements.txt
+    _fast_loads = json.loads
+
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "catalogs")
+
+# Поддерживаемые версии формата файлов
+CATALOG_VERSIONS = {
+    "dishes": 1,
+    "ingredients": 1,
+    "ai_to_db_mapping": 1,
+    "drinks": 1,
+    "unit_weights": 1,
+    "city_timezones": 1,
+}
+
+
+class CatalogError(ValueError):
+    """Ошибка в файле справочника"""
+
+
+# =============================================================================
+# Записи со __slots__ (вместо словаря на каждую запись)
+# =============================================================================
+class SlottedRecord(Mapping):
+    """
+    Неизменяемая запись со __slots__ и интерфейсом словаря только для чтения:
+    record["name"], record.get("keywords", []), dict(record). Незаданные поля
+    (и поля со значением None) в словарь не входят.
+    """
+
+    __slots__ = ()
+    _fields: tuple = ()
+    # Вложенные записи: поле → класс записи (для списка — класс элементов)
+    _nested: Dict[str, type] = {}
+
+    def __init__(self, **values):
+        unknown = values.keys() - self._fields
+        if unknown:
+            raise CatalogError(f"{type(self).__name__}: неизвестные поля {sorted(unknown)}")
+        setattr_ = object.__setattr__
+        for field, value in values.items():
+            setattr_(self, field, value)
+
+    @classmethod
+    def from_entry(cls, entry: Dict[str, Any], strings: Optional[Dict[str, str]] = None) -> "SlottedRecord":
+        """
+        Запись из значения справочника (обычного dict) со вложенными записями.
+        strings — общий словарь строк: одинаковые названия, типы и категории
+        хранятся одним объектом, как константы в .pyc.
+        """
+        if not isinstance(entry, dict):
+            raise CatalogError(f"{cls.__name__}: ожидался объект, получено {entry!r}")
+        unknown = entry.keys() - cls._fields
+        if unknown:
+            raise CatalogError(f"{cls.__name__}: неизвестные поля {sorted(unknown)}")
+        strings = {} if strings is None else strings
+        record = object.__new__(cls)
+        setattr_ = object.__setattr__
+        for field, value in entry.items():
+            if type(value) is str:
+                value = strings.setdefault(value, value)
+            elif field in cls._nested:
+                nested = cls._nested[field]
+                if type(value) is list:
+                    value = [nested.from_entry(item, strings) for item in value]
+                elif value is not None:
+                    value = nested.from_entry(value, strings)
+            elif type(value) is list:
+                value = [strings.setdefault(item, item) if type(item) is str else item for item in value]
+            setattr_(record, field, value)
+        return record
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            value = getattr(self, key, None)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._fields:
+            value = getattr(self, key, None)
+            if value is not None:
+                return value
+        return default
+
+    def __contains__(self, key) -> bool:
+        return key in self._fields and getattr(self, key, None) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (field for field in self._fields if getattr(self, field, None) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        return (_rebuild_record, (type(self), self.to_dict()))
+
+    def copy(self) -> Dict[str, Any]:
+        """Изменяемая копия верхнего уровня (как dict.copy())"""
+        return dict(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Глубокая копия из обычных dict/list (для JSON и FSM)"""
+        return {key: _plain(value) for key, value in self.items()}
+
+
+def _rebuild_record(cls, values):
+    return cls.from_entry(values)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, SlottedRecord):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+class NutritionFacts(SlottedRecord):
+    """КБЖУ на 100 г"""
+    __slots__ = _fields = ("calories", "protein", "fat", "carbs")
+
+
+class IngredientRecord(SlottedRecord):
+    """Ингредиент: КБЖУ на 100 г и тип"""
+    __slots__ = _fields = ("calories", "protein", "fat", "carbs", "type")
+
+
+class DishIngredient(SlottedRecord):
+    """Доля ингредиента в блюде"""
+    __slots__ = _fields = ("name", "type", "percent")
+
+
+class DishRecord(SlottedRecord):
+    """Готовое блюдо каталога"""
+    __slots__ = _fields = (
+        "name", "name_en", "category", "default_weight", "nutrition_per_100", "ingredients", "keywords",
+    )
+    _nested = {"nutrition_per_100": NutritionFacts, "ingredients": DishIngredient}
+
+
+# =============================================================================
+# Загрузка и проверка
+# =============================================================================
+def _reject_duplicates(filename: str) -> Callable:
+    def hook(pairs):
+        result = {}
+        for key, value in pairs:
+            if key in result:
+                raise CatalogError(f"{filename}: повторяющийся ключ {key!r}")
+            result[key] = value
+        return result
+    return hook
+
+
+def read_catalog_file(name: str, directory: str = CATALOG_DIR, strict: bool = False) -> Dict[str, Any]:
+    """
+    Читает и проверяет файл справочника; возвращает entries как обычные dict.
+    strict=True — стандартный json с проверкой повторяющихся ключей (медленнее).
+    """
+    filename = f"{name}.json"
+    path = os.path.join(directory, filename)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        if strict:
+            document = json.loads(data.decode("utf-8"), object_pairs_hook=_reject_duplicates(filename))
+        else:
+            document = _fast_loads(data)
+    except FileNotFoundError:
+        raise CatalogError(f"справочник {name} не найден: {path}") from None
+    except ValueError as e:  # JSONDecodeError (json и orjson) и ошибки кодировки
+        raise CatalogError(f"{filename}: некорректный JSON: {e}") from None
+
+    if document.get("catalog") != name:
+        raise CatalogError(f"{filename}: ожидался справочник {name!r}, в файле {document.get('catalog')!r}")
+    expected = CATALOG_VERSIONS.get(name)
+    if document.get("version") != expected:
+        raise CatalogError(f"{filename}: версия {document.get('version')!r}, поддерживается {expected!r}")
+    entries = document.get("entries")
+    if not isinstance(entries, dict):
+        raise CatalogError(f"{filename}: нет раздела entries")
+    return entries
+
+
+def load_catalog(name: str, record: Optional[type] = None, strict: bool = False) -> Dict[str, Any]:
+    """
+    Справочник как dict; значения-объекты превращаются в записи record.
+    Одинаковые строки во всем справочнике хранятся одним объектом.
+    """
+    entries = read_catalog_file(name, strict=strict)
+    strings: Dict[str, str] = {}
+    if record is not None:
+        return {key: record.from_entry(value, strings) for key, value in entries.items()}
+    return {
+        key: strings.setdefault(value, value) if isinstance(value, str) else value
+        for key, value in entries.items()
+    }
+
+
+# Типы записей справочников (None — значения как есть)
+CATALOG_RECORDS = {
+    "dishes": DishRecord,
+    "ingredients": IngredientRecord,
+    "ai_to_db_mapping": None,
+    "drinks": None,
+    "unit_weights": None,
+    "city_timezones": None,
+}
+
+
+def validate_catalogs() -> Dict[str, int]:
+    """Строго загружает все справочники; CatalogError при первой ошибке"""
+    return {name: len(load_catalog(name, record, strict=True)) for name, record in CATALOG_RECORDS.items()}
+
+
+def main() -> int:
+    try:
+        sizes = validate_catalogs()
+    except CatalogError as e:
+        print(f"catalog error: {e}", file=sys.stderr)
+        return 1
+    for name, size in sizes.items():
+        print(f"{name}: {size} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
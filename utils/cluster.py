@@ -0,0 +1,285 @@
+"""
+Горизонтальное масштабирование NutriBuddy Bot.
+
+Супервизор принимает webhook и раскладывает обновления по очередям Redis
+(шард = chat_id % N), воркеры-процессы разбирают каждый свою очередь.
+Все обновления одного чата попадают в один процесс и обрабатываются строго
+по очереди, поэтому порядок FSM сохраняется. Воркер переносит апдейт из
+очереди в свой список обрабатываемых (BLMOVE) и удаляет его оттуда после
+обработки; после падения воркер при старте возвращает недообработанные
+апдейты в очередь. Фоновые задачи запускает
+services.scheduler на каждом воркере, каждый запуск забирает один из них.
+"""
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Количество процессов-воркеров (0/1 — обычный однопроцессный режим)
+BOT_WORKERS = int(os.getenv('BOT_WORKERS', '0'))
+# Сколько обновлений один воркер обрабатывает одновременно (разные чаты)
+WORKER_CONCURRENCY = int(os.getenv('WORKER_CONCURRENCY', '32'))
+
+UPDATES_QUEUE_PREFIX = "nutribuddy:updates"
+
+# Ключи апдейта, в которых лежит объект с чатом (в порядке приоритета)
+_CHAT_CARRIERS = (
+    'message', 'edited_message', 'channel_post', 'edited_channel_post',
+    'business_message', 'edited_business_message',
+    'my_chat_member', 'chat_member', 'chat_join_request',
+    'message_reaction', 'message_reaction_count', 'chat_boost', 'removed_chat_boost',
+)
+
+# Ключи апдейта без чата — шардируем по пользователю
+_USER_CARRIERS = (
+    'inline_query', 'chosen_inline_result', 'shipping_query',
+    'pre_checkout_query', 'poll_answer',
+)
+
+
+_INSTANCE_ID: Optional[str] = None
+
+
+def instance_id() -> str:
+    """Имя процесса, уникальное среди контейнеров и перезапусков: хост:pid:случайный суффикс"""
+    global _INSTANCE_ID
+    if _INSTANCE_ID is None:
+        _INSTANCE_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    return _INSTANCE_ID
+
+
+def get_update_chat_id(update_data: Dict[str, Any]) -> Optional[int]:
+    """Извлекает chat_id (или user_id для апдейтов без чата) из сырого апдейта"""
+    for key in _CHAT_CARRIERS:
+        payload = update_data.get(key)
+        if payload and isinstance(payload.get('chat'), dict):
+            return payload['chat'].get('id')
+
+    callback = update_data.get('callback_query')
+    if callback:
+        message = callback.get('message') or {}
+        chat = message.get('chat') or {}
+        if chat.get('id') is not None:
+            return chat['id']
+        return (callback.get('from') or {}).get('id')
+
+    for key in _USER_CARRIERS:
+        payload = update_data.get(key)
+        if payload:
+            user = payload.get('from') or payload.get('user') or {}
+            return user.get('id')
+
+    return None
+
+
+def shard_for_update(update_data: Dict[str, Any], workers: int) -> int:
+    """Номер воркера для апдейта; апдейты без чата распределяются по update_id"""
+    if workers <= 1:
+        return 0
+    chat_id = get_update_chat_id(update_data)
+    if chat_id is None:
+        chat_id = update_data.get('update_id', 0)
+    return abs(int(chat_id)) % workers
+
+
+def queue_key(shard: int) -> str:
+    """Ключ очереди обновлений для шарда"""
+    return f"{UPDATES_QUEUE_PREFIX}:{shard}"
+
+
+def processing_key(shard: int) -> str:
+    """Ключ списка апдейтов шарда, которые воркер взял, но еще не обработал"""
+    return f"{UPDATES_QUEUE_PREFIX}:{shard}:processing"
+
+
+class UpdateRouter:
+    """Раскладывает входящие webhook-апдейты по очередям воркеров"""
+
+    def __init__(self, redis_client, workers: int):
+        self.redis = redis_client
+        self.workers = workers
+        self.routed = 0
+
+    async def route(self, update_data: Dict[str, Any]) -> int:
+        """Кладет апдейт в очередь своего шарда, возвращает номер шарда"""
+        shard = shard_for_update(update_data, self.workers)
+        await self.redis.lpush(queue_key(shard), json.dumps(update_data, ensure_ascii=False))
+        self.routed += 1
+        return shard
+
+    async def get_backlog(self) -> Dict[int, int]:
+        """Длины очередей всех шардов"""
+        pipe = self.redis.pipeline(transaction=False)
+        for shard in range(self.workers):
+            pipe.llen(queue_key(shard))
+        lengths = await pipe.execute()
+        return dict(enumerate(lengths))
+
+
+class ShardWorker:
+    """
+    Читает очередь своего шарда и передает апдейты в диспетчер.
+    Разные чаты обрабатываются параллельно (до WORKER_CONCURRENCY), апдейты
+    одного чата — последовательно, в порядке поступления. Место в пределе
+    WORKER_CONCURRENCY занимается до чтения апдейта, поэтому задач не больше.
+    """
+
+    def __init__(self, redis_client, shard: int,
+                 handle_update: Callable[[Dict[str, Any]], Awaitable[Any]],
+                 concurrency: int = WORKER_CONCURRENCY):
+        self.redis = redis_client
+        self.shard = shard
+        self.handle_update = handle_update
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._chat_locks: Dict[Any, asyncio.Lock] = {}
+        self._chat_pending: Dict[Any, int] = {}
+        self._tasks: set = set()
+        self._running = False
+        self.processed = 0
+        self.failed = 0
+
+    async def recover(self) -> int:
+        """Возвращает в начало очереди апдейты, взятые прошлым процессом шарда и не обработанные"""
+        key, processing = queue_key(self.shard), processing_key(self.shard)
+        recovered = 0
+        # Слева в списке новые апдейты: каждый следующий встает в очередь перед предыдущим
+        while await self.redis.lmove(processing, key, "LEFT", "RIGHT") is not None:
+            recovered += 1
+        if recovered:
+            logger.warning(f"[CLUSTER] Worker {self.shard} requeued {recovered} unfinished updates")
+        return recovered
+
+    async def run(self):
+        """Основной цикл чтения очереди"""
+        self._running = True
+        key, processing = queue_key(self.shard), processing_key(self.shard)
+        await self.recover()
+        logger.info(f"[CLUSTER] Worker {self.shard} listening on {key}")
+
+        while self._running:
+            await self._semaphore.acquire()
+            try:
+                raw = await self.redis.blmove(key, processing, 5, "RIGHT", "LEFT")
+            except asyncio.CancelledError:
+                self._semaphore.release()
+                raise
+            except Exception as e:
+                self._semaphore.release()
+                logger.error(f"[CLUSTER] Worker {self.shard} queue error: {e}")
+                await asyncio.sleep(1)
+                continue
+
+            if raw is None:
+                self._semaphore.release()
+                continue
+
+            try:
+                update_data = json.loads(raw)
+            except (TypeError, ValueError) as e:
+                self._semaphore.release()
+                logger.error(f"[CLUSTER] Worker {self.shard} got malformed update: {e}")
+                await self._ack(raw)
+                continue
+
+            chat_id = get_update_chat_id(update_data)
+            if chat_id is None:
+                chat_id = f"update:{update_data.get('update_id')}"
+
+            # Блокировка берется в порядке создания задач (asyncio.Lock — FIFO)
+            lock = self._chat_locks.setdefault(chat_id, asyncio.Lock())
+            self._chat_pending[chat_id] = self._chat_pending.get(chat_id, 0) + 1
+            task = asyncio.create_task(self._process(chat_id, lock, update_data, raw))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _process(self, chat_id, lock: asyncio.Lock, update_data: Dict[str, Any], raw):
+        """Обработка одного апдейта с сохранением порядка внутри чата; место семафора уже занято"""
+        try:
+            async with lock:
+                try:
+                    await self.handle_update(update_data)
+                    self.processed += 1
+                except Exception as e:
+                    self.failed += 1
+                    logger.error(f"[CLUSTER] Worker {self.shard} failed update "
+                                 f"{update_data.get('update_id')}: {e}")
+            # Ошибка обработчика тоже завершает апдейт: повтор дал бы ту же ошибку
+            await self._ack(raw)
+        finally:
+            self._semaphore.release()
+            self._chat_pending[chat_id] -= 1
+            if self._chat_pending[chat_id] == 0:
+                del self._chat_pending[chat_id]
+                del self._chat_locks[chat_id]
+
+    async def _ack(self, raw):
+        try:
+            await self.redis.lrem(processing_key(self.shard), 1, raw)
+        except Exception as e:
+            # Апдейт останется в списке и будет повторен после перезапуска воркера
+            logger.error(f"[CLUSTER] Worker {self.shard} failed to ack update: {e}")
+
+    async def stop(self):
+        """Останавливает чтение очереди и дожидается начатых апдейтов"""
+        self._running = False
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info(f"[CLUSTER] Worker {self.shard} stopped: "
+                    f"processed={self.processed}, failed={self.failed}")
+
+
+class Supervisor:
+    """Запускает и перезапускает процессы-воркеры"""
+
+    def __init__(self, workers: int, target: Callable[[int, int], None]):
+        self.workers = workers
+        self.target = target
+        self._ctx = multiprocessing.get_context('spawn')
+        self._processes: Dict[int, multiprocessing.Process] = {}
+        self._restarts: Dict[int, float] = {}
+
+    def _spawn(self, shard: int):
+        process = self._ctx.Process(
+            target=self.target,
+            args=(shard, self.workers),
+            name=f"nutribuddy-worker-{shard}",
+            daemon=True
+        )
+        process.start()
+        self._processes[shard] = process
+        logger.info(f"[CLUSTER] Started worker {shard} (pid {process.pid})")
+
+    def start(self):
+        """Запускает все воркеры"""
+        for shard in range(self.workers):
+            self._spawn(shard)
+
+    async def watch(self, interval: float = 5.0):
+        """Следит за воркерами и перезапускает упавшие (не чаще раза в 10 секунд)"""
+        while True:
+            await asyncio.sleep(interval)
+            for shard, process in list(self._processes.items()):
+                if process.is_alive():
+                    continue
+                now = time.monotonic()
+                if now - self._restarts.get(shard, 0) < 10:
+                    continue
+                logger.error(f"[CLUSTER] Worker {shard} exited with code {process.exitcode}, restarting")
+                self._restarts[shard] = now
+                self._spawn(shard)
+
+    def stop(self, timeout: float = 30.0):
+        """Останавливает воркеры (SIGTERM, затем ожидание)"""
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in self._processes.values():
+            process.join(timeout)
+        logger.info("[CLUSTER] All workers stopped")
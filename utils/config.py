@@ -25,3 +25,49 @@ FOOD_CACHE_LIMIT = int(os.getenv('FOOD_CACHE_LIMIT', '200'))
 
 # FSM cleanup
 FSM_DATA_TTL = int(os.getenv('FSM_DATA_TTL', '3600'))  # 1 час
+FSM_STATE_TTL = int(os.getenv('FSM_STATE_TTL', str(FSM_DATA_TTL)))
+# Большие объекты (анализы фото) хранятся в отдельных ключах со своим TTL
+FSM_BLOB_TTL = int(os.getenv('FSM_BLOB_TTL', str(FSM_DATA_TTL)))
+
+# Локальный каталог OpenFoodFacts (python -m services.off_catalog <дамп>)
+OFF_CATALOG_PATH = os.getenv('OFF_CATALOG_PATH', 'data/off_catalog.sqlite')
+
+# Отложенная запись напитков (services/drink_buffer.py): буфер в памяти + поток Redis
+DRINK_WRITE_BEHIND = os.getenv('DRINK_WRITE_BEHIND', '0') == '1'
+DRINK_FLUSH_MS = int(os.getenv('DRINK_FLUSH_MS', '500'))
+DRINK_FLUSH_ITEMS = int(os.getenv('DRINK_FLUSH_ITEMS', '50'))
+
+# Внутренняя шина событий (services/event_bus.py)
+EVENT_WORKERS = int(os.getenv('EVENT_WORKERS', '4'))
+EVENT_QUEUE_SIZE = int(os.getenv('EVENT_QUEUE_SIZE', '1000'))
+# Длина потока событий в Redis (приблизительная обрезка)
+EVENT_STREAM_MAXLEN = int(os.getenv('EVENT_STREAM_MAXLEN', '100000'))
+
+# Рассылки (services/broadcast.py): лимит Telegram ~30 сообщений в секунду на бота
+BROADCAST_RATE = float(os.getenv('BROADCAST_RATE', '25'))
+BROADCAST_CONCURRENCY = int(os.getenv('BROADCAST_CONCURRENCY', '8'))
+# Получателей на страницу выборки; контрольная точка пишется после каждой страницы
+BROADCAST_PAGE_SIZE = int(os.getenv('BROADCAST_PAGE_SIZE', '500'))
+
+# Планировщик фоновых задач (services/scheduler.py): случайная задержка запуска, секунды
+SCHEDULER_JITTER = int(os.getenv('SCHEDULER_JITTER', '60'))
+
+# Пересчет норм воды (services/weather_updater.py): пользователей на страницу и UPDATE,
+# одновременных запросов погоды
+WATER_GOAL_PAGE_SIZE = int(os.getenv('WATER_GOAL_PAGE_SIZE', '500'))
+WATER_GOAL_WEATHER_CONCURRENCY = int(os.getenv('WATER_GOAL_WEATHER_CONCURRENCY', '10'))
+
+# Кэш погоды (services/weather.py): свежесть записи и сколько еще ее можно отдавать
+# устаревшей с обновлением в фоне, секунды
+WEATHER_TTL = int(os.getenv('WEATHER_TTL', '1800'))
+WEATHER_STALE_TTL = int(os.getenv('WEATHER_STALE_TTL', '21600'))
+WEATHER_LRU_SIZE = int(os.getenv('WEATHER_LRU_SIZE', '2000'))
+# Предзагрузка погоды городов пользователей, активных за последние часы
+WEATHER_PREFETCH_INTERVAL = int(os.getenv('WEATHER_PREFETCH_INTERVAL', '900'))
+WEATHER_PREFETCH_ACTIVE_HOURS = int(os.getenv('WEATHER_PREFETCH_ACTIVE_HOURS', '24'))
+
+# Исходящие запросы к Bot API (services/delivery.py): сообщений в секунду на бота
+# (в кластере — общий счетчик в Redis для всех воркеров) и на чат
+OUTBOUND_RATE = float(os.getenv('OUTBOUND_RATE', '30'))
+OUTBOUND_CHAT_RATE = float(os.getenv('OUTBOUND_CHAT_RATE', '1'))
+OUTBOUND_CHAT_BURST = int(os.getenv('OUTBOUND_CHAT_BURST', '3'))
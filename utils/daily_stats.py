@@ -41,7 +41,9 @@ async def get_daily_water(user_id: int, user_timezone: str = 'UTC') -> int:
                     func.date(DrinkEntry.created_at) == today_local
                 )
             )
-            return result.scalar() or 0
+            # Отметки, которые еще ждут записи в буфере (services/drink_buffer.py)
+            from services.drink_buffer import drink_write_buffer
+            return (result.scalar() or 0) + drink_write_buffer.pending(user_id)["amount"]
             
     except Exception as e:
         logger.error(f"Error getting daily water for user {user_id}: {e}")
@@ -79,7 +81,8 @@ async def get_daily_drink_calories(user_id: int, user_timezone: str = 'UTC') ->
                     func.date(DrinkEntry.created_at) == today_local
                 )
             )
-            return result.scalar() or 0
+            from services.drink_buffer import drink_write_buffer
+            return (result.scalar() or 0) + drink_write_buffer.pending(user_id)["calories"]
             
     except Exception as e:
         logger.error(f"Error getting daily drink calories for user {user_id}: {e}")
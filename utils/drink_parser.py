@@ -1,43 +1,20 @@
 """
 Парсер напитков - определение объёма и калорийности
 """
-import re
 import logging
 from typing import Dict, Tuple, Optional
 
+from utils.catalog import load_catalog
+from utils.morphology import LemmaIndex, lemmatize_word
+from utils.quantity_lexer import TERM, quantities, tokenize
+
 logger = logging.getLogger(__name__)
 
 # База калорийности напитков (на 100 мл)
-DRINK_CALORIES_DB = {
-    'сок': 45,           # Средняя калорийность сока
-    'апельсиновый сок': 45,
-    'яблочный сок': 42,
-    'томатный сок': 18,
-    'ананасовый сок': 50,
-    'виноградный сок': 60,
-    'компот': 25,        # Компот с сахаром
-    'чай': 2,            # Чай без сахара
-    'чай с сахаром': 30,
-    'кофе': 2,           # Кофе без сахара
-    'кофе с сахаром': 15,
-    'кофе с молоком': 25,
-    'молоко': 42,        # Молоко 2.5%
-    'кефир': 35,
-    'ряженка': 40,
-    'йогурт': 60,
-    'газировка': 40,     # Кола, Пепси
-    'кола': 40,
-    'пепси': 40,
-    'лимонад': 35,
-    'минералка': 0,      # Минеральная вода
-    'газировка': 40,
-    'смузи': 80,
-    'коктейль': 120,
-    'какао': 75,
-    'горячий шоколад': 75,
-}
+# Справочник в catalogs/drinks.json
+DRINK_CALORIES_DB = load_catalog("drinks")
 
-# Единицы измерения и их эквиваленты в мл
+# Единицы измерения (канонические формы utils.quantity_lexer) и их эквиваленты в мл
 VOLUME_UNITS = {
     'мл': 1,
     'л': 1000,
@@ -75,6 +52,60 @@ DRINK_SYNONYMS = {
     'шоколадный напиток': 'какао',
 }
 
+# Ключевые слова для угадывания напитка (порядок — приоритет)
+DRINK_KEYWORDS = {
+    'кофе': 'кофе',
+    'капучино': 'кофе с молоком',
+    'латте': 'кофе с молоком',
+    'чай': 'чай',
+    'сок': 'сок',
+    'молоко': 'молоко',
+    'кефир': 'кефир',
+    'ряженка': 'ряженка',
+    'йогурт': 'йогурт',
+    'кола': 'кола',
+    'пепси': 'пепси',
+    'газировка': 'кола',
+    'минералка': 'минералка',
+    'вода': 'минералка',
+    'смузи': 'смузи',
+    'коктейль': 'коктейль',
+    'какао': 'какао',
+    'шоколад': 'какао',
+    'компот': 'компот',
+    'лимонад': 'лимонад',
+}
+_KEYWORD_ORDER = {keyword: order for order, keyword in enumerate(DRINK_KEYWORDS)}
+_KEYWORD_DRINKS = list(DRINK_KEYWORDS.values())
+_KEYWORD_LENGTHS = sorted({len(keyword) for keyword in DRINK_KEYWORDS})
+
+# Напитки и синонимы по леммам; из нескольких совпадений берется самое длинное
+_drink_lemmas = LemmaIndex(DRINK_CALORIES_DB, "drinks")
+_drink_synonym_lemmas = LemmaIndex(DRINK_SYNONYMS.items(), "drink_synonyms")
+
+
+def find_drink_name(text: str) -> Optional[str]:
+    """Ключ DRINK_CALORIES_DB для текста («апельсинового сока» → «апельсиновый сок»)"""
+    text = text.lower().strip()
+    if text in DRINK_CALORIES_DB:
+        return text
+    drink = _drink_lemmas.find_in(text)
+    synonym = _drink_synonym_lemmas.find_in(text)
+    if drink and (not synonym or drink[2] >= synonym[2]):
+        return drink[0]
+    if synonym:
+        return synonym[0]
+    return None
+
+
+def get_calories_per_100ml(drink_name: str) -> float:
+    """Калорийность напитка на 100 мл (0 — неизвестный напиток)"""
+    if drink_name in DRINK_CALORIES_DB:
+        return DRINK_CALORIES_DB[drink_name]
+    key = _drink_lemmas.get(drink_name)
+    return DRINK_CALORIES_DB[key] if key else 0
+
+
 def parse_drink_input(text: str) -> Tuple[Optional[str], Optional[int], Optional[float]]:
     """
     Парсит ввод напитка
@@ -88,12 +119,13 @@ def parse_drink_input(text: str) -> Tuple[Optional[str], Optional[int], Optional
     try:
         text = text.lower().strip()
         
-        # Ищем напиток в тексте
-        drink_name = None
-        for drink in DRINK_CALORIES_DB.keys():
-            if drink in text:
-                drink_name = drink
-                break
+        # Ищем напиток в тексте: сначала по леммам, затем по подстроке
+        drink_name = find_drink_name(text)
+        if not drink_name:
+            for drink in DRINK_CALORIES_DB.keys():
+                if drink in text:
+                    drink_name = drink
+                    break
         
         # Проверяем синонимы
         if not drink_name:
@@ -136,36 +168,25 @@ def guess_drink_from_text(text: str) -> Optional[str]:
     Returns:
         str: Название напитка или None
     """
-    keywords = {
-        'кофе': 'кофе',
-        'капучино': 'кофе с молоком',
-        'латте': 'кофе с молоком',
-        'чай': 'чай',
-        'сок': 'сок',
-        'молоко': 'молоко',
-        'кефир': 'кефир',
-        'ряженка': 'ряженка',
-        'йогурт': 'йогурт',
-        'кола': 'кола',
-        'пепси': 'пепси',
-        'газировка': 'кола',
-        'минералка': 'минералка',
-        'вода': 'минералка',
-        'смузи': 'смузи',
-        'коктейль': 'коктейль',
-        'какао': 'какао',
-        'шоколад': 'какао',
-        'компот': 'компот',
-        'лимонад': 'лимонад',
-    }
-    
-    text_lower = text.lower()
-    
-    for keyword, drink in keywords.items():
-        if keyword in text_lower:
-            return drink
+    # Слово текста начинается с ключевого слова («кофейку», «сока»)
+    # или его лемма совпадает с ним («колу» → «кола»); при нескольких
+    # совпадениях побеждает слово, которое раньше в DRINK_KEYWORDS
+    terms = [token.value for token in tokenize(text) if token.kind == TERM]
+    best = None
+    for term in terms:
+        for length in _KEYWORD_LENGTHS:
+            if length > len(term):
+                break
+            order = _KEYWORD_ORDER.get(term[:length])
+            if order is not None and (best is None or order < best):
+                best = order
+    if best is None:
+        for term in terms:
+            order = _KEYWORD_ORDER.get(lemmatize_word(term))
+            if order is not None and (best is None or order < best):
+                best = order
     
-    return None
+    return _KEYWORD_DRINKS[best] if best is not None else None
 
 def extract_volume(text: str) -> Optional[int]:
     """
@@ -177,47 +198,14 @@ def extract_volume(text: str) -> Optional[int]:
     Returns:
         int: Объём в мл или None
     """
-    # Ищем паттерны: "200 мл", "0.5 л", "стакан", "бутылка" и т.д.
-    patterns = [
-        r'(\d+(?:\.\d+)?)\s*мл',
-        r'(\d+(?:\.\d+)?)\s*л',
-        r'(\d+)\s*стакан',
-        r'(\d+)\s*чашка',
-        r'(\d+)\s*бутылка',
-        r'(\d+)\s*банка',
-        r'(\d+)\s*пакет',
-        r'(\d+)\s*флакон',
-        r'(\d+)\s*рюмка',
-        r'(\d+)\s*шот',
-        r'(\d+)\s*стопка',
-        r'стакан',
-        r'чашка',
-        r'бутылка',
-        r'банка',
-        r'рюмка',
-        r'шот',
-        r'стопка',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text.lower())
-        if match:
-            if match.groups():
-                # Если есть число
-                value = float(match.group(1))
-                unit = pattern.split(r'(\d+(?:\.\d+)?)\s*')[1].strip()
-                
-                if unit in ['мл']:
-                    return int(value)
-                elif unit in ['л']:
-                    return int(value * 1000)
-                elif unit in VOLUME_UNITS:
-                    return int(value * VOLUME_UNITS[unit])
-            else:
-                # Если нет числа (например, просто "стакан")
-                unit = pattern.strip()
-                if unit in VOLUME_UNITS:
-                    return VOLUME_UNITS[unit]
+    # Число с единицей («200 мл», «0.5 л», «два стакана») важнее единицы без числа
+    pairs = [(amount, unit) for amount, unit, _ in quantities(text) if unit in VOLUME_UNITS]
+    for amount, unit in pairs:
+        if amount is not None:
+            # «-200 мл», «0 л» — не объем
+            return int(amount * VOLUME_UNITS[unit]) if amount > 0 else None
+    if pairs:
+        return VOLUME_UNITS[pairs[0][1]]
     
     return None
 
@@ -265,7 +253,7 @@ def calculate_calories(drink_name: str, volume_ml: int) -> float:
     Returns:
         float: Калории
     """
-    calories_per_100ml = DRINK_CALORIES_DB.get(drink_name, 0)
+    calories_per_100ml = get_calories_per_100ml(drink_name)
     return (calories_per_100ml * volume_ml) / 100
 
 def format_drink_info(drink_name: str, volume_ml: int, calories: float) -> str:
@@ -342,7 +330,7 @@ def get_nutrition_info(drink_name: str, volume_ml: int) -> Dict:
         dict: Нутритивная информация
     """
     calories = calculate_calories(drink_name, volume_ml)
-    calories_per_100ml = DRINK_CALORIES_DB.get(drink_name, 0)
+    calories_per_100ml = get_calories_per_100ml(drink_name)
     
     # Базовая информация о БЖУ для напитков
     nutrition = {
@@ -3,13 +3,125 @@
 """
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.storage.redis import RedisStorage
 
+from utils.fsm_storage import put_blob, get_blob, delete_blob
+
 logger = logging.getLogger(__name__)
 
+class FSMKeySweeper:
+    """
+    Инкрементальный обход ключей FSM через SCAN.
+    TTL и EXPIRE отправляются пачками в pipeline (2 запроса на пачку вместо 2-3 на ключ),
+    курсор сохраняется в Redis после каждой пачки, поэтому прерванный обход
+    продолжается с того же места. Скорость ограничена max_keys_per_second.
+    """
+    
+    CHECKPOINT_PREFIX = "nutribuddy:fsm_sweep"
+    
+    def __init__(self, redis, match: str = "fsm:*", batch_size: int = 1000,
+                 max_keys_per_second: int = 50000, name: str = "cleanup"):
+        self.redis = redis
+        self.match = match
+        self.batch_size = batch_size
+        self.max_keys_per_second = max_keys_per_second
+        self.checkpoint_key = f"{self.CHECKPOINT_PREFIX}:{name}"
+        self.progress: Dict[str, Any] = {}
+    
+    async def _load_checkpoint(self) -> int:
+        """Курсор прерванного обхода (0 - начать сначала)"""
+        cursor = await self.redis.get(self.checkpoint_key)
+        return int(cursor) if cursor else 0
+    
+    async def sweep(self, ttl_seconds: Optional[int] = None, resume: bool = True) -> Dict[str, Any]:
+        """
+        Обходит ключи FSM и собирает статистику TTL.
+        Если задан ttl_seconds, ключам без TTL выставляется EXPIRE.
+        """
+        cursor = await self._load_checkpoint() if resume else 0
+        started = time.monotonic()
+        self.progress = {
+            'cursor': cursor,
+            'resumed': cursor != 0,
+            'batches': 0,
+            'scanned': 0,
+            'with_ttl': 0,
+            'without_ttl': 0,
+            'expired': 0,
+            'ttl_set': 0,
+            'keys_per_second': 0.0,
+            'finished': False,
+        }
+        
+        while True:
+            batch_started = time.monotonic()
+            cursor, keys = await self.redis.scan(cursor=cursor, match=self.match, count=self.batch_size)
+            cursor = int(cursor)
+            
+            if keys:
+                await self._process_batch(keys, ttl_seconds)
+            
+            self.progress['batches'] += 1
+            self.progress['cursor'] = cursor
+            elapsed = time.monotonic() - started
+            if elapsed > 0:
+                self.progress['keys_per_second'] = round(self.progress['scanned'] / elapsed, 1)
+            
+            if cursor == 0:
+                await self.redis.delete(self.checkpoint_key)
+                break
+            
+            await self.redis.set(self.checkpoint_key, cursor)
+            
+            if self.progress['batches'] % 100 == 0:
+                logger.info(f"[CLEANUP] FSM sweep progress: {self.progress['scanned']} keys, "
+                            f"{self.progress['keys_per_second']} keys/s")
+            
+            # Ограничение скорости, чтобы не занимать Redis целиком
+            if self.max_keys_per_second and keys:
+                min_duration = len(keys) / self.max_keys_per_second
+                pause = min_duration - (time.monotonic() - batch_started)
+                if pause > 0:
+                    await asyncio.sleep(pause)
+            else:
+                await asyncio.sleep(0)
+        
+        self.progress['finished'] = True
+        self.progress['duration'] = round(time.monotonic() - started, 3)
+        return self.progress
+    
+    async def _process_batch(self, keys: List, ttl_seconds: Optional[int]):
+        """TTL для пачки ключей одним pipeline, затем EXPIRE для ключей без TTL"""
+        pipe = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.ttl(key)
+        ttls = await pipe.execute()
+        
+        without_ttl = []
+        for key, ttl in zip(keys, ttls):
+            if ttl == -2:
+                # Ключ истек между SCAN и TTL
+                self.progress['expired'] += 1
+            elif ttl == -1:
+                without_ttl.append(key)
+            else:
+                self.progress['with_ttl'] += 1
+        
+        self.progress['scanned'] += len(keys)
+        self.progress['without_ttl'] += len(without_ttl)
+        
+        if ttl_seconds and without_ttl:
+            pipe = self.redis.pipeline(transaction=False)
+            for key in without_ttl:
+                pipe.expire(key, ttl_seconds)
+            results = await pipe.execute()
+            self.progress['ttl_set'] += sum(1 for result in results if result)
+
+
 class FSMCleanupService:
     """Сервис очистки устаревших данных FSM"""
     
@@ -44,6 +156,9 @@ class FSMCleanupService:
             # Удаляем устаревшие данные
             if expired_keys:
                 for key in expired_keys:
+                    ref = photo_analysis[key].get('ref')
+                    if ref:
+                        await delete_blob(state, ref)
                     del photo_analysis[key]
                     logger.info(f"[CLEANUP] Cleaned up expired photo analysis: {key}")
                 
@@ -53,51 +168,23 @@ class FSMCleanupService:
         except Exception as e:
             logger.error(f"Error cleaning up photo data: {e}")
     
-    async def cleanup_all_expired_data(self, storage: RedisStorage):
-        """Очищает все устаревшие данные FSM"""
+    async def cleanup_all_expired_data(self, storage: RedisStorage) -> Optional[Dict[str, Any]]:
+        """
+        Выставляет TTL ключам FSM, у которых его нет (инкрементально, через SCAN).
+        Возвращает прогресс обхода, при ошибке — None
+        """
         try:
-            # Получаем все ключи из Redis
-            keys = await storage.redis.keys("fsm:*")
-            
-            current_time = datetime.now(timezone.utc)
-            cleaned_count = 0
-            
-            for key in keys:
-                try:
-                    data = await storage.get_data(key=key)
-                    
-                    if not data:
-                        continue
-                    
-                    # Проверяем время последнего обновления
-                    ttl = await storage.redis.ttl(key)
-                    if ttl == -1:  # Нет TTL
-                        # Устанавливаем TTL если данных нет больше часа
-                        await storage.redis.expire(key, self.ttl)
-                        cleaned_count += 1
-                
-                except Exception:
-                    # Пропускаем ключи с ошибками
-                    continue
+            sweeper = FSMKeySweeper(storage.redis)
+            progress = await sweeper.sweep(ttl_seconds=self.ttl)
             
-            if cleaned_count > 0:
-                logger.info(f"[CLEANUP] Set TTL for {cleaned_count} FSM keys")
+            if progress['ttl_set'] > 0:
+                logger.info(f"[CLEANUP] Set TTL for {progress['ttl_set']} FSM keys "
+                            f"({progress['scanned']} scanned in {progress['duration']}s)")
+            return progress
         
         except Exception as e:
             logger.error(f"Error in FSM cleanup: {e}")
-
-# Глобальная функция для периодической очистки
-async def periodic_fsm_cleanup(storage: RedisStorage):
-    """Периодическая очистка FSM данных"""
-    cleanup_service = FSMCleanupService(storage)
-    
-    while True:
-        try:
-            await cleanup_service.cleanup_all_expired_data(storage)
-            await asyncio.sleep(300)  # Каждые 5 минут
-        except Exception as e:
-            logger.error(f"Error in periodic cleanup: {e}")
-            await asyncio.sleep(60)  # При ошибке ждем 1 минуту
+            return None
 
 # Утилиты для работы с FSM
 class FSMUtils:
@@ -167,34 +254,16 @@ class FSMUtils:
     async def get_fsm_stats(storage: RedisStorage) -> Dict[str, int]:
         """Получает статистику FSM"""
         try:
-            keys = await storage.redis.keys("fsm:*")
+            sweeper = FSMKeySweeper(storage.redis, name="stats")
+            progress = await sweeper.sweep(resume=False)
             
-            stats = {
-                'total_states': len(keys),
-                'states_with_ttl': 0,
-                'states_without_ttl': 0,
-                'expired_states': 0
+            return {
+                'total_states': progress['scanned'],
+                'states_with_ttl': progress['with_ttl'],
+                'states_without_ttl': progress['without_ttl'],
+                'expired_states': progress['expired']
             }
             
-            current_time = datetime.now(timezone.utc)
-            
-            for key in keys:
-                try:
-                    ttl = await storage.redis.ttl(key)
-                    
-                    if ttl == -1:
-                        stats['states_without_ttl'] += 1
-                    else:
-                        stats['states_with_ttl'] += 1
-                        
-                        if ttl <= 0:
-                            stats['expired_states'] += 1
-                
-                except Exception:
-                    continue
-            
-            return stats
-            
         except Exception as e:
             logger.error(f"Error getting FSM stats: {e}")
             return {}
@@ -203,13 +272,22 @@ class FSMUtils:
     async def force_cleanup_all(storage: RedisStorage):
         """Принудительная очистка всех данных FSM"""
         try:
-            keys = await storage.redis.keys("fsm:*")
+            deleted = 0
+            batch = []
             
-            if keys:
-                await storage.redis.delete(*keys)
-                logger.info(f"[CLEANUP] Force deleted {len(keys)} FSM keys")
+            async for key in storage.redis.scan_iter(match="fsm:*", count=1000):
+                batch.append(key)
+                if len(batch) >= 1000:
+                    deleted += await storage.redis.delete(*batch)
+                    batch = []
+            
+            if batch:
+                deleted += await storage.redis.delete(*batch)
             
-            return len(keys)
+            if deleted:
+                logger.info(f"[CLEANUP] Force deleted {deleted} FSM keys")
+            
+            return deleted
             
         except Exception as e:
             logger.error(f"Error in force cleanup: {e}")
@@ -225,10 +303,9 @@ class FSMMonitor:
     async def get_active_states(self) -> List[Dict]:
         """Получает список активных состояний"""
         try:
-            keys = await storage.redis.keys("fsm:*")
             active_states = []
             
-            for key in keys:
+            async for key in self.storage.redis.scan_iter(match="fsm:*", count=1000):
                 try:
                     data = await self.storage.get_data(key=key)
                     state = await self.storage.get_state(key=key)
@@ -316,19 +393,21 @@ class PhotoDataManager:
     
     @staticmethod
     async def store_photo_analysis(state: FSMContext, analysis_id: str, analysis_data: Dict):
-        """Сохраняет данные анализа фото"""
+        """Сохраняет данные анализа фото (в данных FSM остается только ссылка)"""
         try:
-            data = await state.get_data()
+            created_at = datetime.now(timezone.utc).isoformat()
+            ref = await put_blob(state, f"photo:{analysis_id}", analysis_data)
             
-            if 'photo_analysis' not in data:
-                data['photo_analysis'] = {}
+            if ref:
+                entry = {'ref': ref, 'created_at': created_at}
+            else:
+                entry = {**analysis_data, 'created_at': created_at}
             
-            data['photo_analysis'][analysis_id] = {
-                **analysis_data,
-                'created_at': datetime.now(timezone.utc).isoformat()
-            }
+            data = await state.get_data()
+            photo_analysis = data.get('photo_analysis', {})
+            photo_analysis[analysis_id] = entry
             
-            await state.update_data(data)
+            await state.update_data(photo_analysis=photo_analysis)
             logger.info(f"[PHOTO] Stored analysis: {analysis_id}")
             
         except Exception as e:
@@ -340,8 +419,19 @@ class PhotoDataManager:
         try:
             data = await state.get_data()
             photo_analysis = data.get('photo_analysis', {})
+            entry = photo_analysis.get(analysis_id, {})
+            
+            if 'ref' not in entry:
+                return entry
+            
+            analysis_data = await get_blob(state, entry['ref'])
+            if analysis_data is None:
+                # Ключ истек - убираем висячую ссылку
+                del photo_analysis[analysis_id]
+                await state.update_data(photo_analysis=photo_analysis)
+                return {}
             
-            return photo_analysis.get(analysis_id, {})
+            return {**analysis_data, 'created_at': entry['created_at']}
             
         except Exception as e:
             logger.error(f"Error getting photo analysis: {e}")
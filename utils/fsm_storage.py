@@ -0,0 +1,81 @@
+"""
+Настройка Redis-хранилища FSM: компактная сериализация, TTL ключей
+и вынос больших объектов в отдельные истекающие ключи
+"""
+import json
+import logging
+from typing import Any, Optional
+
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.redis import RedisStorage, DefaultKeyBuilder
+
+from utils.config import FSM_STATE_TTL, FSM_DATA_TTL, FSM_BLOB_TTL
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    def fsm_json_dumps(data: Any) -> bytes:
+        """Сериализация данных FSM (orjson, без пробелов, нестроковые ключи разрешены)"""
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    fsm_json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson указан в requirements.txt
+    logger.warning("orjson is not installed, FSM data will be stored as plain JSON")
+
+    def fsm_json_dumps(data: Any) -> str:
+        """Сериализация данных FSM (компактный JSON)"""
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+
+    fsm_json_loads = json.loads
+
+
+def create_redis_storage(redis_client) -> RedisStorage:
+    """Создает RedisStorage с TTL для state/data и компактной сериализацией"""
+    return RedisStorage(
+        redis_client,
+        key_builder=DefaultKeyBuilder(with_bot_id=True),
+        state_ttl=FSM_STATE_TTL,
+        data_ttl=FSM_DATA_TTL,
+        json_loads=fsm_json_loads,
+        json_dumps=fsm_json_dumps,
+    )
+
+
+def _blob_key(state: FSMContext, name: str) -> Optional[str]:
+    """Ключ отдельного объекта рядом с ключами FSM пользователя (только для Redis)"""
+    storage = state.storage
+    if not isinstance(storage, RedisStorage):
+        return None
+    return storage.key_builder.build(state.key, f"blob:{name}")
+
+
+async def put_blob(state: FSMContext, name: str, value: Any, ttl: int = FSM_BLOB_TTL) -> Optional[str]:
+    """
+    Сохраняет объект в отдельный ключ с TTL и возвращает ссылку на него.
+    None — хранилище не Redis, объект нужно держать в данных FSM.
+    """
+    key = _blob_key(state, name)
+    if key is None:
+        return None
+    await state.storage.redis.set(key, fsm_json_dumps(value), ex=ttl)
+    return key
+
+
+async def get_blob(state: FSMContext, ref: str) -> Optional[Any]:
+    """Читает объект по ссылке; None — ключ истек или удален"""
+    storage = state.storage
+    if not isinstance(storage, RedisStorage):
+        return None
+    raw = await storage.redis.get(ref)
+    if raw is None:
+        return None
+    return fsm_json_loads(raw)
+
+
+async def delete_blob(state: FSMContext, ref: str):
+    """Удаляет объект по ссылке"""
+    storage = state.storage
+    if isinstance(storage, RedisStorage):
+        await storage.redis.delete(ref)
@@ -2,13 +2,16 @@
 Система геймификации и достижений для NutriBuddy Bot с сохранением в БД
 """
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 from enum import Enum
-from sqlalchemy import select, func
+from sqlalchemy import select
 
 logger = logging.getLogger(__name__)
 
+# Действия, после которых проверяются серии и цели (битовые карты — O(1) на проверку)
+GOAL_CHECK_ACTIONS = frozenset({"daily_check", "meal", "water", "activity"})
+
 class AchievementType(Enum):
     """Типы достижений"""
     FIRST_MEAL = "first_meal"
@@ -139,7 +142,7 @@ class GamificationSystem:
                     # Проверяем, не получено ли уже достижение
                     existing_result = await session.execute(
                         select(UserAchievement).where(
-                            UserAchievement.user_id == user.id,
+                            UserAchievement.user_id == user.telegram_id,
                             UserAchievement.achievement_id == achievement_id
                         )
                     )
@@ -152,12 +155,12 @@ class GamificationSystem:
                     if await self._check_achievement_condition(user, achievement, action, data, session):
                         # Сохраняем достижение в БД
                         user_achievement = UserAchievement(
-                            user_id=user.id,
+                            user_id=user.telegram_id,
                             achievement_id=achievement_id,
                             earned_at=datetime.utcnow()
                         )
                         session.add(user_achievement)
-                        session.commit()
+                        await session.commit()
                         
                         unlocked.append(achievement)
                         logger.info(f"[ACHIEVEMENT] User {user_id} unlocked: {achievement.name}")
@@ -177,37 +180,37 @@ class GamificationSystem:
             return action == "meal" and condition["count"] == 1
         
         elif achievement.type == AchievementType.WEEK_STREAK:
-            if action != "daily_check":
+            if action not in GOAL_CHECK_ACTIONS:
                 return False
             # Проверяем серию дней
-            streak_days = await self._get_user_streak(user.id, session)
+            streak_days = await self._get_user_streak(user)
             return streak_days >= condition["days"]
         
         elif achievement.type == AchievementType.MONTH_STREAK:
-            if action != "daily_check":
+            if action not in GOAL_CHECK_ACTIONS:
                 return False
-            streak_days = await self._get_user_streak(user.id, session)
+            streak_days = await self._get_user_streak(user)
             return streak_days >= condition["days"]
         
         elif achievement.type == AchievementType.CALORIE_GOAL:
-            if action != "daily_check":
+            if action not in GOAL_CHECK_ACTIONS:
                 return False
-            return await self._check_goal_streak(user.id, "calories", condition["days"], session)
+            return await self._check_goal_streak(user, "calories", condition["days"])
         
         elif achievement.type == AchievementType.WATER_GOAL:
-            if action != "daily_check":
+            if action not in GOAL_CHECK_ACTIONS:
                 return False
-            return await self._check_goal_streak(user.id, "water", condition["days"], session)
+            return await self._check_goal_streak(user, "water", condition["days"])
         
         elif achievement.type == AchievementType.ACTIVITY_GOAL:
-            if action != "daily_check":
+            if action not in GOAL_CHECK_ACTIONS:
                 return False
-            return await self._check_goal_streak(user.id, "activity", condition["days"], session)
+            return await self._check_goal_streak(user, "activity", condition["days"])
         
         elif achievement.type == AchievementType.PERFECT_DAY:
-            if action != "daily_check":
+            if action not in GOAL_CHECK_ACTIONS:
                 return False
-            return await self._check_perfect_day(user.id, session)
+            return await self._check_perfect_day(user)
         
         elif achievement.type == AchievementType.EARLY_BIRD:
             if action != "meal":
@@ -225,197 +228,36 @@ class GamificationSystem:
         
         return False
     
-    async def _get_user_streak(self, user_id: int, session) -> int:
-        """Получает серию дней использования бота"""
-        try:
-            from database.models import FoodEntry, DrinkEntry, ActivityEntry
-            from database.db import get_session
-            from datetime import date
-
-            # Получаем пользователя
-            from sqlalchemy import select
-            result = await session.execute(
-                select(User).where(User.telegram_id == user_id)
-            )
-            user = result.scalar_one_or_none()
-            
-            if not user:
-                return 0
-            
-            user_id = user.id  # Используем внутренний ID пользователя
-            today = date.today()
-            streak = 0
-
-            # Проверяем каждый день назад
-            for i in range(365):  # Максимум год назад
-                check_date = today - timedelta(days=i)
-
-                # Проверяем, была ли активность в этот день
-                food_result = await session.execute(
-                    select(FoodEntry).where(
-                        FoodEntry.user_id == user_id,
-                        func.cast(FoodEntry.created_at, func.date()) == check_date
-                    ).limit(1)
-                )
-                food_entry = food_result.scalar_one_or_none()
-                
-                drink_result = await session.execute(
-                    select(DrinkEntry).where(
-                        DrinkEntry.user_id == user_id,
-                        func.cast(DrinkEntry.created_at, func.date()) == check_date
-                    ).limit(1)
-                )
-                drink_entry = drink_result.scalar_one_or_none()
-                
-                activity_result = await session.execute(
-                    select(ActivityEntry).where(
-                        ActivityEntry.user_id == user_id,
-                        func.cast(ActivityEntry.created_at, func.date()) == check_date
-                    ).limit(1)
-                )
-                activity_entry = activity_result.scalar_one_or_none()
-
-                if food_entry or drink_entry or activity_entry:
-                    streak += 1
-                else:
-                    break
-
-            return streak
+    @staticmethod
+    def _local_today(user):
+        from utils.timezone_utils import get_user_local_date
+        return get_user_local_date(getattr(user, 'timezone', None) or 'UTC')
 
+    async def _get_user_streak(self, user) -> int:
+        """Серия дней подряд с записями (еда, напитки, активность) по битовым картам"""
+        try:
+            from services.goal_bitmaps import LOGGED, goal_bitmaps
+            return await goal_bitmaps.streak(user.telegram_id, LOGGED, self._local_today(user))
         except Exception as e:
-            logger.error(f"Error calculating streak for user {user_id}: {e}")
+            logger.error(f"Error calculating streak for user {user.telegram_id}: {e}")
             return 0
     
-    async def _check_goal_streak(self, user_id: int, goal_type: str, days: int, session) -> bool:
-        """Проверяет серию выполнения целей"""
+    async def _check_goal_streak(self, user, goal_type: str, days: int) -> bool:
+        """Цель goal_type (calories, water, activity) выполнена каждый из последних days дней"""
         try:
-            from database.models import User
-            from datetime import date, timedelta
-            from sqlalchemy import select, func
-
-            # Получаем пользователя
-            result = await session.execute(
-                select(User).where(User.telegram_id == user_id)
-            )
-            user = result.scalar_one_or_none()
-            
-            if not user:
-                return False
-
-            today = date.today()
-
-            for i in range(days):
-                check_date = today - timedelta(days=i)
-                
-                # Получаем статистику за день напрямую
-                food_result = await session.execute(
-                    select(
-                        func.sum(FoodEntry.calories),
-                        func.sum(FoodEntry.protein)
-                    ).where(
-                        FoodEntry.user_id == user.id,
-                        func.cast(FoodEntry.created_at, func.date()) == check_date
-                    )
-                )
-                food_stats = food_result.first()
-                calories = food_stats[0] or 0
-                
-                water_result = await session.execute(
-                    select(func.sum(DrinkEntry.amount)).where(
-                        DrinkEntry.user_id == user.id,
-                        func.cast(DrinkEntry.created_at, func.date()) == check_date
-                    )
-                )
-                water = water_result.scalar() or 0
-                
-                activity_result = await session.execute(
-                    select(
-                        func.sum(ActivityEntry.duration),
-                        func.count(ActivityEntry.id)
-                    ).where(
-                        ActivityEntry.user_id == user.id,
-                        func.cast(ActivityEntry.created_at, func.date()) == check_date
-                    )
-                )
-                activity_stats = activity_result.first()
-                activity_minutes = activity_stats[0] or 0
-
-                if goal_type == "calories":
-                    goal_met = calories >= user.daily_calorie_goal * 0.9  # 90% от цели
-                elif goal_type == "water":
-                    goal_met = water >= user.daily_water_goal * 0.9
-                elif goal_type == "activity":
-                    goal_met = activity_minutes >= 30  # Минимум 30 минут
-                else:
-                    goal_met = False
-
-                if not goal_met:
-                    return False
-
-            return True
-
+            from services.goal_bitmaps import goal_bitmaps
+            return await goal_bitmaps.all_met(user.telegram_id, [goal_type], self._local_today(user), days)
         except Exception as e:
-            logger.error(f"Error checking goal streak for user {user_id}: {e}")
+            logger.error(f"Error checking goal streak for user {user.telegram_id}: {e}")
             return False
     
-    async def _check_perfect_day(self, user_id: int, session) -> bool:
-        """Проверяет идеальный день"""
+    async def _check_perfect_day(self, user) -> bool:
+        """Сегодня выполнены цели по калориям, воде, активности и приемам пищи"""
         try:
-            from database.models import User, FoodEntry, DrinkEntry, ActivityEntry
-            from datetime import date
-            from sqlalchemy import select, func
-
-            # Получаем пользователя
-            result = await session.execute(
-                select(User).where(User.telegram_id == user_id)
-            )
-            user = result.scalar_one_or_none()
-            
-            if not user:
-                return False
-
-            today = date.today()
-            
-            # Получаем статистику за сегодня
-            food_result = await session.execute(
-                select(
-                    func.sum(FoodEntry.calories),
-                    func.count(FoodEntry.id)
-                ).where(
-                    FoodEntry.user_id == user.id,
-                    func.cast(FoodEntry.created_at, func.date()) == today
-                )
-            )
-            food_stats = food_result.first()
-            calories = food_stats[0] or 0
-            meals_count = food_stats[1] or 0
-            
-            water_result = await session.execute(
-                select(func.sum(DrinkEntry.amount)).where(
-                    DrinkEntry.user_id == user.id,
-                    func.cast(DrinkEntry.created_at, func.date()) == today
-                )
-            )
-            water = water_result.scalar() or 0
-            
-            activity_result = await session.execute(
-                select(func.sum(ActivityEntry.duration)).where(
-                    ActivityEntry.user_id == user.id,
-                    func.cast(ActivityEntry.created_at, func.date()) == today
-                )
-            )
-            activity_minutes = activity_result.scalar() or 0
-
-            # Проверяем все цели
-            calorie_goal_met = calories >= user.daily_calorie_goal * 0.9
-            water_goal_met = water >= user.daily_water_goal * 0.9
-            activity_goal_met = activity_minutes >= 30
-            has_meals = meals_count >= 3  # Минимум 3 приема пищи
-
-            return calorie_goal_met and water_goal_met and activity_goal_met and has_meals
-
+            from services.goal_bitmaps import PERFECT_DAY, goal_bitmaps
+            return await goal_bitmaps.all_met(user.telegram_id, PERFECT_DAY, self._local_today(user), 1)
         except Exception as e:
-            logger.error(f"Error checking perfect day for user {user_id}: {e}")
+            logger.error(f"Error checking perfect day for user {user.telegram_id}: {e}")
             return False
     
     async def get_user_achievements(self, user_id: int) -> List[Dict]:
@@ -433,7 +275,7 @@ class GamificationSystem:
                     return []
                 
                 result = await session.execute(
-                    select(UserAchievement).where(UserAchievement.user_id == user.id)
+                    select(UserAchievement).where(UserAchievement.user_id == user.telegram_id)
                     .order_by(UserAchievement.earned_at.desc())
                 )
                 achievements = result.scalars().all()
@@ -510,46 +352,23 @@ class GamificationSystem:
             return {}
     
     async def get_leaderboard(self, period: str = "all", limit: int = 10) -> List[Dict]:
-        """Получает таблицу лидеров"""
+        """Получает таблицу лидеров (period: all, week, month) из sorted set Redis"""
         try:
-            from database.db import get_session
-            from database.models import User, UserAchievement
-            from sqlalchemy import func
-            
-            async with get_session() as session:
-                # Получаем всех пользователей с их достижениями
-                query = select(
-                    User.telegram_id,
-                    User.first_name,
-                    func.count(UserAchievement.id).label('achievements_count'),
-                    func.sum(self.achievements['achievement_id'].points).label('total_points')
-                ).outerjoin(UserAchievement).group_by(User.id)
-                
-                # Фильтрация по периоду (TODO: добавить фильтрацию по дате)
-                if period == "week":
-                    pass  # TODO: добавить фильтрацию за неделю
-                elif period == "month":
-                    pass  # TODO: добавить фильтрацию за месяц
-                
-                result = await session.execute(query.order_by(func.sum(UserAchievement.points).desc()).limit(limit))
-                results = result.all()
-                
-                leaderboard = []
-                for i, (telegram_id, first_name, achievements_count, total_points) in enumerate(results, 1):
-                    leaderboard.append({
-                        'position': i,
-                        'telegram_id': telegram_id,
-                        'name': first_name or f"User_{telegram_id}",
-                        'achievements_count': achievements_count or 0,
-                        'total_points': total_points or 0
-                    })
-                
-                return leaderboard
-                
+            from services.leaderboard import leaderboard
+            return await leaderboard.top(period, limit)
         except Exception as e:
             logger.error(f"Error getting leaderboard: {e}")
             return []
 
+    async def get_leaderboard_position(self, user_id: int, period: str = "all") -> Dict:
+        """Место пользователя в таблице лидеров"""
+        try:
+            from services.leaderboard import leaderboard
+            return await leaderboard.position(user_id, period)
+        except Exception as e:
+            logger.error(f"Error getting leaderboard position for {user_id}: {e}")
+            return {'position': None, 'total_points': 0, 'participants': 0}
+
     async def get_user_stats(self, user_id: int) -> dict:
         """Возвращает статистику пользователя для достижений"""
         try:
@@ -607,7 +426,7 @@ class GamificationSystem:
                 weight_count = weight_result.scalar() or 0
 
                 # Считаем серию дней
-                streak_days = await self._get_user_streak(user.id, session)
+                streak_days = await self._get_user_streak(user)
 
                 return {
                     'level': level_info['level'],
@@ -0,0 +1,125 @@
+"""
+Нормализация русских названий продуктов через леммы (pymorphy3).
+
+Анализатор один на процесс и создается при первом обращении; разбор слов
+кэшируется в LRU, поэтому повторяющиеся слова («курицей», «помидоров»)
+разбираются один раз. LemmaIndex строит по справочнику словарь
+«нормализованная фраза → ключ», и поиск становится обращением к dict
+вместо перебора всех ключей с проверкой подстроки.
+"""
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[а-яёa-z0-9]+")
+_CYRILLIC_RE = re.compile(r"[а-я]")
+
+_analyzer = None
+_analyzer_failed = False
+
+
+def get_morph_analyzer():
+    """Общий MorphAnalyzer процесса или None, если pymorphy3 недоступен"""
+    global _analyzer, _analyzer_failed
+    if _analyzer is None and not _analyzer_failed:
+        try:
+            import pymorphy3
+            _analyzer = pymorphy3.MorphAnalyzer()
+        except Exception as e:  # pragma: no cover - pymorphy3 указан в requirements.txt
+            _analyzer_failed = True
+            logger.warning(f"[MORPH] pymorphy3 недоступен, леммы не используются: {e}")
+    return _analyzer
+
+
+@lru_cache(maxsize=65536)
+def lemmatize_word(word: str) -> str:
+    """Нормальная форма слова в нижнем регистре (ё → е)"""
+    word = word.lower().replace("ё", "е")
+    if not _CYRILLIC_RE.search(word):
+        return word
+    analyzer = get_morph_analyzer()
+    if analyzer is None:
+        return word
+    return analyzer.parse(word)[0].normal_form.replace("ё", "е")
+
+
+def lemmatize_tokens(text: str) -> List[str]:
+    """Леммы слов текста по порядку"""
+    return [lemmatize_word(word) for word in _WORD_RE.findall(text.lower())]
+
+
+@lru_cache(maxsize=16384)
+def normalize_phrase(text: str) -> str:
+    """Фраза из лемм через пробел: «куриной грудкой» → «куриный грудка»"""
+    return " ".join(lemmatize_tokens(text))
+
+
+def morphology_cache_info() -> Dict:
+    """Статистика кэшей лемматизации"""
+    words = lemmatize_word.cache_info()
+    phrases = normalize_phrase.cache_info()
+    return {
+        "words": {"hits": words.hits, "misses": words.misses, "size": words.currsize},
+        "phrases": {"hits": phrases.hits, "misses": phrases.misses, "size": phrases.currsize},
+    }
+
+
+class LemmaIndex:
+    """
+    Индекс ключей справочника по леммам.
+
+    Элементы — ключи справочника или пары (фраза, значение). Строится при
+    первом обращении (чтобы импорт модулей не загружал словари pymorphy3).
+    При совпадении лемм у нескольких фраз побеждает первая по порядку.
+    """
+
+    def __init__(self, entries: Iterable[Union[str, Tuple[str, Any]]], name: str = ""):
+        self._entries = entries
+        self.name = name
+        self._index: Optional[Dict[str, Any]] = None
+        self._max_words = 0
+
+    def _build(self) -> Dict[str, Any]:
+        index: Dict[str, Any] = {}
+        for entry in self._entries:
+            text, value = (entry, entry) if isinstance(entry, str) else entry
+            phrase = normalize_phrase(text)
+            if phrase and phrase not in index:
+                index[phrase] = value
+                self._max_words = max(self._max_words, phrase.count(" ") + 1)
+        self._index = index
+        logger.debug(f"[MORPH] Индекс {self.name or 'lemma'}: {len(index)} фраз")
+        return index
+
+    @property
+    def index(self) -> Dict[str, Any]:
+        return self._index if self._index is not None else self._build()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def get(self, text: str) -> Optional[Any]:
+        """Значение фразы, леммы которой совпадают с леммами всего текста"""
+        return self.index.get(normalize_phrase(text))
+
+    def find_in(self, text: str) -> Optional[Tuple[Any, int, int]]:
+        """
+        Самая длинная (затем самая левая) фраза справочника внутри текста.
+        Возвращает (значение, номер первого слова, число слов) или None.
+        """
+        index = self.index
+        lemmas = lemmatize_tokens(text)
+        for size in range(min(self._max_words, len(lemmas)), 0, -1):
+            for start in range(len(lemmas) - size + 1):
+                key = index.get(" ".join(lemmas[start:start + size]))
+                if key is not None:
+                    return key, start, size
+        return None
+
+    def find_key_in(self, text: str) -> Optional[Any]:
+        """Значение самой длинной фразы справочника внутри текста"""
+        found = self.find_in(text)
+        return found[0] if found else None
@@ -2,27 +2,11 @@
 Парсер русских чисел, записанных словами.
 Поддерживает числа до 1 000 000 (миллион), составные и падежные формы.
 """
-import re
+from utils.quantity_lexer import MULTIPLIER_WORDS, NUMBER, NUMBER_WORDS, TERM, tokenize
 
-# Словари соответствия слов и чисел
-UNITS = {
-    'ноль': 0, 'один': 1, 'одна': 1, 'два': 2, 'две': 2, 'три': 3,
-    'четыре': 4, 'пять': 5, 'шесть': 6, 'семь': 7, 'восемь': 8,
-    'девять': 9, 'десять': 10, 'одиннадцать': 11, 'двенадцать': 12,
-    'тринадцать': 13, 'четырнадцать': 14, 'пятнадцать': 15,
-    'шестнадцать': 16, 'семнадцать': 17, 'восемнадцать': 18,
-    'девятнадцать': 19, 'двадцать': 20, 'тридцать': 30,
-    'сорок': 40, 'пятьдесят': 50, 'шестьдесят': 60,
-    'семьдесят': 70, 'восемьдесят': 80, 'девяносто': 90,
-    'сто': 100, 'двести': 200, 'триста': 300, 'четыреста': 400,
-    'пятьсот': 500, 'шестьсот': 600, 'семьсот': 700,
-    'восемьсот': 800, 'девятьсот': 900
-}
-
-THOUSANDS = {
-    'тысяча': 1000, 'тысячи': 1000, 'тысяч': 1000,
-    'миллион': 1_000_000, 'миллиона': 1_000_000, 'миллионов': 1_000_000
-}
+# Словари соответствия слов и чисел (общие с лексером utils.quantity_lexer)
+UNITS = NUMBER_WORDS
+THOUSANDS = MULTIPLIER_WORDS
 
 # Слова для половин и четвертей (для длительности)
 FRACTIONS = {
@@ -40,41 +24,24 @@ def parse_russian_number(text: str) -> int | float | None:
     Возвращает число или None, если не удалось распознать.
     Поддерживает составные числа (например, "двадцать пять тысяч сто двадцать три").
     """
-    text = text.lower().strip()
+    tokens = tokenize(text)
+
     # Сначала ищем цифры – если есть, возвращаем их как int/float
-    digit_match = re.search(r'\d+(?:[.,]\d+)?', text)
-    if digit_match:
-        num_str = digit_match.group().replace(',', '.')
-        return float(num_str) if '.' in num_str else int(num_str)
+    for token in tokens:
+        if token.kind == NUMBER and not token.spelled:
+            return token.value
 
     # Обработка дробных слов (полчаса, полтора и т.п.)
+    words = {token.text.lower() for token in tokens}
     for word, value in FRACTIONS.items():
-        if word in text:
+        if word in words:
             return value
 
-    # Разбиваем текст на слова и пытаемся собрать число
-    words = re.findall(r'\b[а-яё]+\b', text)
-    if not words:
+    # Число словами в начале текста (союз «и» пропускаем)
+    for token in tokens:
+        if token.kind == TERM and token.value == 'и':
+            continue
+        if token.kind == NUMBER and token.value != 0:
+            return token.value
         return None
-
-    total = 0
-    current = 0
-    for word in words:
-        if word in UNITS:
-            current += UNITS[word]
-        elif word in THOUSANDS:
-            if current == 0:
-                current = 1
-            total += current * THOUSANDS[word]
-            current = 0
-        else:
-            # Если слово не число, прерываем сбор (мы ищем число в начале)
-            # Но можно попробовать продолжить, если слово является союзом (и)
-            if word == 'и':
-                continue
-            else:
-                # Если встретилось нечисловое слово, значит число закончилось
-                break
-
-    total += current
-    return total if total != 0 else None
+    return None
@@ -0,0 +1,311 @@
+"""
+utils/quantity_lexer.py
+Общий лексер количеств для разбора пользовательского ввода.
+
+Один скомпилированный regex за один проход превращает текст в типизированные
+токены: NUMBER (цифры, дроби «1/2» и «1 1/2», числа словами: «двадцать пять»,
+«полтора», «два с половиной», «2 тысячи»),
+UNIT (единица измерения в канонической форме: «стаканов» → «стакан»,
+«чайной ложки» → «чайная ложка», «пол-литра» → 0.5 + «л») и TERM (остальные
+слова — названия продуктов и напитков). Парсеры воды, напитков, единиц и чисел
+работают с токенами, а не разбирают текст своими регулярками.
+"""
+import re
+from functools import lru_cache
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+NUMBER = "number"
+UNIT = "unit"
+TERM = "term"
+
+# Числа словами (составляются: «сто двадцать пять»)
+NUMBER_WORDS = {
+    'ноль': 0, 'один': 1, 'одна': 1, 'одно': 1, 'одну': 1, 'два': 2, 'две': 2, 'три': 3,
+    'четыре': 4, 'пять': 5, 'шесть': 6, 'семь': 7, 'восемь': 8,
+    'девять': 9, 'десять': 10, 'одиннадцать': 11, 'двенадцать': 12,
+    'тринадцать': 13, 'четырнадцать': 14, 'пятнадцать': 15,
+    'шестнадцать': 16, 'семнадцать': 17, 'восемнадцать': 18,
+    'девятнадцать': 19, 'двадцать': 20, 'тридцать': 30,
+    'сорок': 40, 'пятьдесят': 50, 'шестьдесят': 60,
+    'семьдесят': 70, 'восемьдесят': 80, 'девяносто': 90,
+    'сто': 100, 'двести': 200, 'триста': 300, 'четыреста': 400,
+    'пятьсот': 500, 'шестьсот': 600, 'семьсот': 700,
+    'восемьсот': 800, 'девятьсот': 900
+}
+
+MULTIPLIER_WORDS = {
+    'тысяча': 1000, 'тысячи': 1000, 'тысяч': 1000, 'тысячу': 1000,
+    'миллион': 1_000_000, 'миллиона': 1_000_000, 'миллионов': 1_000_000
+}
+
+# Дробные количества; «пол» также префикс единицы: «пол-литра», «полстакана»
+FRACTION_WORDS = {
+    'пол': 0.5,
+    'половина': 0.5,
+    'половину': 0.5,
+    'половиной': 0.5,  # «два с половиной»
+    'полтора': 1.5,
+    'полторы': 1.5,
+    'четверть': 0.25,
+}
+
+# Единицы измерения: каноническая форма → словоформы и сокращения
+UNIT_FORMS = {
+    'мл': ('мл', 'ml', 'миллилитр', 'миллилитра', 'миллилитров'),
+    'л': ('л', 'l', 'литр', 'литра', 'литров', 'литре'),
+    'г': ('г', 'гр', 'g', 'gram', 'grams', 'грамм', 'грамма', 'граммов', 'граммы'),
+    'кг': ('кг', 'kg', 'кило', 'килограмм', 'килограмма', 'килограммов'),
+    'шт': ('шт', 'штука', 'штуки', 'штук', 'штуку'),
+    'стакан': ('стакан', 'стакана', 'стаканов', 'стаканы'),
+    'чашка': ('чашка', 'чашки', 'чашек', 'чашку'),
+    'кружка': ('кружка', 'кружки', 'кружек', 'кружку'),
+    'бутылка': ('бутылка', 'бутылки', 'бутылок', 'бутылку'),
+    'банка': ('банка', 'банки', 'банок', 'банку'),
+    'пакет': ('пакет', 'пакета', 'пакетов'),
+    'флакон': ('флакон', 'флакона', 'флаконов'),
+    'рюмка': ('рюмка', 'рюмки', 'рюмок', 'рюмку'),
+    'шот': ('шот', 'шота', 'шотов'),
+    'стопка': ('стопка', 'стопки', 'стопок', 'стопку'),
+    'ложка': ('ложка', 'ложки', 'ложек', 'ложку'),
+    'щепотка': ('щепотка', 'щепотки', 'щепоток', 'щепотку'),
+    'пучок': ('пучок', 'пучка', 'пучков'),
+    'кусок': ('кусок', 'куска', 'кусков'),
+    'ломтик': ('ломтик', 'ломтика', 'ломтиков'),
+    'горсть': ('горсть', 'горсти', 'горстей'),
+}
+
+# Уточнения ложки перед единицей: «чайная ложка», «столовых ложек»
+_SPOON_KINDS = {
+    'чайная': 'чайная ложка', 'чайной': 'чайная ложка', 'чайные': 'чайная ложка',
+    'чайных': 'чайная ложка', 'чайную': 'чайная ложка',
+    'столовая': 'ложка', 'столовой': 'ложка', 'столовые': 'ложка',
+    'столовых': 'ложка', 'столовую': 'ложка',
+}
+
+_UNITS = {form: unit for unit, forms in UNIT_FORMS.items() for form in forms}
+
+# Все особые слова одной таблицей: слово → (вид, значение)
+_NUMERAL, _MULTIPLIER, _FRACTION = "numeral", "multiplier", "fraction"
+_WORDS = {
+    **{form: (UNIT, unit) for form, unit in _UNITS.items()},
+    **{word: (_FRACTION, value) for word, value in FRACTION_WORDS.items()},
+    **{word: (_MULTIPLIER, value) for word, value in MULTIPLIER_WORDS.items()},
+    **{word: (_NUMERAL, value) for word, value in NUMBER_WORDS.items()},
+}
+
+# Число цифрами (знак — только в начале слова, «2-3» это два числа), простая дробь
+# из однозначных чисел («1/2», «3/4»; «120/80» — два числа) или слово
+_TOKEN_RE = re.compile(
+    r"(?P<number>(?:(?<![^\s(])[-+])?(?:(?<![\d.,/])[1-9]/[1-9](?![\d/])|\d+(?:[.,]\d+)?|[.,]\d+))"
+    r"|(?P<word>[^\W\d_]+(?:-[^\W\d_]+)*)"
+)
+
+
+class Token(NamedTuple):
+    kind: str      # NUMBER, UNIT или TERM
+    value: Any     # число, каноническая единица или слово в нижнем регистре
+    text: str      # исходный фрагмент текста
+    start: int
+    end: int
+
+    @property
+    def spelled(self) -> bool:
+        """Число записано словами («пять», но не «5» и не «2 тысячи»)"""
+        return self.kind == NUMBER and not (self.text[0].isdigit() or self.text[0] in '+-.,')
+
+
+_new_token = tuple.__new__  # Token без проверки аргументов NamedTuple (горячий путь)
+
+
+def _digits_value(text: str):
+    if '/' in text:
+        numerator, denominator = text.lstrip('+-').split('/')
+        value = int(numerator) / int(denominator)
+        return -value if text[0] == '-' else value
+    text = text.replace(',', '.')
+    return float(text) if '.' in text else int(text)
+
+
+def _can_extend(current: int, value: int) -> bool:
+    """Можно ли дописать слово-число к текущей сотне: «двадцать» + «пять», но не «пять» + «десять»"""
+    if current == 0:
+        return True
+    if value < 10:
+        return current % 10 == 0 and not 10 <= current % 100 < 20
+    if value < 100:
+        return current % 100 == 0
+    return False
+
+
+class _Lexer:
+    """Состояние одного прохода: готовые токены и незавершенное число словами"""
+
+    __slots__ = ("text", "tokens", "total", "current", "multiplier", "start", "end")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens: List[Token] = []
+        self.total = self.current = self.multiplier = 0
+        self.start = self.end = -1
+
+    def _spaces_only(self, end: int, start: int) -> bool:
+        return end == start or self.text[end:start].isspace()
+
+    def _last_adjacent(self, kind: str, start: int) -> Optional[Token]:
+        """Предыдущий токен нужного типа, если между ним и start только пробелы"""
+        if self.tokens and self.tokens[-1].kind == kind and self._spaces_only(self.tokens[-1].end, start):
+            return self.tokens[-1]
+        return None
+
+    def flush(self) -> None:
+        """Завершает число словами"""
+        if self.start < 0:
+            return
+        self.tokens.append(Token(NUMBER, self.total + self.current, self.text[self.start:self.end], self.start, self.end))
+        self.total = self.current = self.multiplier = 0
+        self.start = self.end = -1
+
+    def number_word(self, value: int, start: int, end: int) -> None:
+        if self.start >= 0 and not (self._spaces_only(self.end, start) and _can_extend(self.current, value)):
+            self.flush()
+        if self.start < 0:
+            self.start = start
+        self.current += value
+        self.end = end
+
+    def multiplier_word(self, value: int, start: int, end: int) -> bool:
+        """«пять тысяч», «2 тысячи», «тысяча»; False — слово не продолжает число"""
+        if (self.start >= 0 and self._spaces_only(self.end, start) and (self.current or not self.total)
+                and (not self.multiplier or value < self.multiplier)):
+            self.total += (self.current or 1) * value
+            self.current = 0
+            self.multiplier = value
+            self.end = end
+            return True
+        self.flush()
+        last = self._last_adjacent(NUMBER, start)
+        if last is not None:
+            self.tokens[-1] = Token(NUMBER, last.value * value, self.text[last.start:end], last.start, end)
+            return True
+        return False
+
+    def unit(self, unit: str, start: int, end: int) -> None:
+        self.flush()
+        last = self._last_adjacent(TERM, start) if unit == 'ложка' else None
+        if last is not None and last.value in _SPOON_KINDS:
+            self.tokens[-1] = Token(UNIT, _SPOON_KINDS[last.value], self.text[last.start:end], last.start, end)
+        else:
+            self.tokens.append(_new_token(Token, (UNIT, unit, self.text[start:end], start, end)))
+
+    def word(self, word: str, start: int, end: int) -> None:
+        entry = _WORDS.get(word)
+        if entry is None:
+            if self.start >= 0:
+                self.flush()
+            # «пол-литра», «полстакана», «полкило»
+            unit = _UNITS.get(word[3:].lstrip('-')) if word.startswith('пол') else None
+            if unit is not None:
+                self.tokens.append(_new_token(Token, (NUMBER, 0.5, self.text[start:start + 3], start, start + 3)))
+                self.tokens.append(_new_token(Token, (UNIT, unit, self.text[start:end], start, end)))
+            else:
+                self.tokens.append(_new_token(Token, (TERM, word, self.text[start:end], start, end)))
+            return
+        kind, value = entry
+        if kind == UNIT:
+            self.unit(value, start, end)
+        elif kind == _NUMERAL:
+            self.number_word(value, start, end)
+        elif kind == _MULTIPLIER:
+            if not self.multiplier_word(value, start, end):
+                # «тысяча» без числа перед ней — сама число
+                self.start, self.end = start, end
+                self.total = self.multiplier = value
+        else:
+            self.flush()
+            if word == 'половиной' and self.with_half(start, end):
+                return
+            self.tokens.append(_new_token(Token, (NUMBER, value, self.text[start:end], start, end)))
+
+    def with_half(self, start: int, end: int) -> bool:
+        """«два с половиной» → 2.5: целое число и «с» прямо перед «половиной»"""
+        conjunction = self._last_adjacent(TERM, start)
+        if conjunction is None or conjunction.value != 'с' or len(self.tokens) < 2:
+            return False
+        number = self.tokens[-2]
+        if (number.kind != NUMBER or not isinstance(number.value, int) or number.value <= 0
+                or not self._spaces_only(number.end, conjunction.start)):
+            return False
+        self.tokens[-2:] = [Token(NUMBER, number.value + 0.5, self.text[number.start:end], number.start, end)]
+        return True
+
+    def digits(self, digits: str, start: int, end: int) -> None:
+        """Число цифрами; простая дробь после целого — смешанное число: «1 1/2» → 1.5"""
+        value = _digits_value(digits)
+        if '/' in digits and 0 < value < 1:
+            last = self._last_adjacent(NUMBER, start)
+            if last is not None and isinstance(last.value, int) and last.value > 0 and not last.spelled:
+                self.tokens[-1] = Token(NUMBER, last.value + value, self.text[last.start:end], last.start, end)
+                return
+        self.tokens.append(_new_token(Token, (NUMBER, value, digits, start, end)))
+
+
+@lru_cache(maxsize=4096)
+def tokenize(text: str) -> Tuple[Token, ...]:
+    """Токены текста за один проход (результат кэшируется, токены неизменяемы)"""
+    lexer = _Lexer(text)
+    for match in _TOKEN_RE.finditer(text):
+        start, end = match.span()
+        if match.lastindex == 1:
+            if lexer.start >= 0:
+                lexer.flush()
+            lexer.digits(match.group(), start, end)
+        else:
+            word = match.group().lower()
+            lexer.word(word.replace('ё', 'е') if 'ё' in word else word, start, end)
+    lexer.flush()
+    return tuple(lexer.tokens)
+
+
+def numbers(text: str) -> List[Any]:
+    """Все числа текста (цифрами и словами) по порядку"""
+    return [token.value for token in tokenize(text) if token.kind == NUMBER]
+
+
+def quantities(text: str) -> List[Tuple[Optional[Any], str, Token]]:
+    """
+    Пары (число или None, единица, токен единицы) для всех единиц текста:
+    «2 стакана и 300 мл» → [(2, 'стакан', …), (300, 'мл', …)].
+    Число берется, если стоит прямо перед единицей.
+    """
+    tokens = tokenize(text)
+    pairs = []
+    for index, token in enumerate(tokens):
+        if token.kind != UNIT:
+            continue
+        previous = tokens[index - 1] if index else None
+        amount = previous.value if previous is not None and previous.kind == NUMBER else None
+        pairs.append((amount, token.value, token))
+    return pairs
+
+
+def parse_quantity(text: str) -> Tuple[Optional[Any], Optional[str]]:
+    """
+    Количество и единица из строки вроде «150 г», «1,5 кг», «две штуки», «стакан»:
+    (число, единица). Без единицы — (число, None), без числа — (1, единица).
+    """
+    tokens = tokenize(text)
+    for index, token in enumerate(tokens):
+        if token.kind == NUMBER:
+            following = tokens[index + 1] if index + 1 < len(tokens) else None
+            return token.value, following.value if following is not None and following.kind == UNIT else None
+        if token.kind == UNIT:
+            return 1, token.value
+    return None, None
+
+
+def canonical_unit(text: str) -> Optional[str]:
+    """Каноническая единица из строки: «граммов» → «г», «ч. ложки» → None"""
+    for token in tokenize(text):
+        if token.kind == UNIT:
+            return token.value
+    return None
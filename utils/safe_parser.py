@@ -5,6 +5,8 @@ import re
 import logging
 from typing import Tuple, Optional, List
 
+from utils.quantity_lexer import numbers
+
 logger = logging.getLogger(__name__)
 
 def safe_parse_float(text: str, field_name: str = "число") -> Tuple[Optional[float], Optional[str]]:
@@ -90,18 +92,8 @@ def extract_multiple_numbers(text: str, max_count: int = 5) -> list:
         list: Список найденных чисел
     """
     try:
-        numbers = re.findall(r'[-+]?\d*\.?\d+', text)
-        # Конвертируем в float, затем в int если целые
-        result = []
-        for num_str in numbers[:max_count]:
-            try:
-                if '.' in num_str:
-                    result.append(float(num_str))
-                else:
-                    result.append(int(num_str))
-            except ValueError:
-                continue
-        return result
+        # Числа цифрами и словами («1,5», «двадцать пять»); целые остаются int
+        return numbers(text)[:max_count]
     except Exception as e:
         logger.error(f"Error extracting numbers from '{text}': {e}")
         return []
@@ -0,0 +1,90 @@
+"""
+Профилирование запуска бота: длительность фаз старта и фоновый прогрев
+"""
+import asyncio
+import importlib
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Модули, которые не нужны для ответа /health и загружаются после старта
+WARMUP_MODULES = (
+    'services.dish_db',
+    'services.translator',
+    'services.cloudflare_manager',
+    'services.ai_processor',
+    'services.langchain_agent',
+)
+
+
+class StartupTimer:
+    """Таймер фаз запуска (время отсчитывается от импорта модуля)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.milestones: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        """Замер длительности фазы"""
+        phase_started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - phase_started
+            self.phases.append((name, duration))
+            logger.info(f"[STARTUP] {name}: {duration * 1000:.0f} ms")
+
+    def mark(self, name: str):
+        """Отметка момента относительно старта процесса"""
+        elapsed = time.perf_counter() - self.started
+        self.milestones.append((name, elapsed))
+        logger.info(f"[STARTUP] {name} at +{elapsed * 1000:.0f} ms")
+
+    def report(self) -> str:
+        """Сводка по фазам и отметкам"""
+        lines = ["Startup profile:"]
+        for name, duration in self.phases:
+            lines.append(f"  {name:<28} {duration * 1000:8.0f} ms")
+        for name, elapsed in self.milestones:
+            lines.append(f"  @ {name:<26} +{elapsed * 1000:7.0f} ms")
+        return "\n".join(lines)
+
+
+async def warm_up_modules(modules: Iterable[str] = WARMUP_MODULES):
+    """
+    Импортирует тяжелые модули в отдельном потоке, чтобы первый запрос
+    пользователя не ждал их загрузки. Ошибки не мешают работе бота.
+    """
+    for module_name in modules:
+        try:
+            with startup_timer.phase(f"warmup {module_name}"):
+                await asyncio.to_thread(importlib.import_module, module_name)
+        except Exception as e:
+            logger.warning(f"[STARTUP] Warmup of {module_name} failed: {e}")
+
+    try:
+        from utils.morphology import get_morph_analyzer
+        from services.nutrition_resolver import get_nutrition_resolver
+        with startup_timer.phase("warmup morphology"):
+            await asyncio.to_thread(get_morph_analyzer)
+        with startup_timer.phase("warmup nutrition index"):
+            resolver = await asyncio.to_thread(get_nutrition_resolver)
+            await asyncio.to_thread(resolver.warm_up)
+    except Exception as e:
+        logger.warning(f"[STARTUP] Morphology warmup failed: {e}")
+
+    try:
+        from services.translator import preload_common_translations
+        preload_common_translations()
+    except Exception as e:
+        logger.warning(f"[STARTUP] Translation preload failed: {e}")
+
+    logger.info(startup_timer.report())
+
+
+startup_timer = StartupTimer()
@@ -0,0 +1,113 @@
+"""
+utils/text_match.py
+Поиск известных ключей в тексте без перебора словаря.
+
+SubstringMatcher отвечает на два вопроса за один проход по тексту:
+какой самый длинный ключ встречается внутри текста (автомат Ахо–Корасик)
+и в каком самом коротком ключе встречается сам текст (все ключи одной
+строкой, поиск str.find). Ключи можно добавлять после построения: они
+попадают в бор сразу, а ссылки автомата и строка ключей пересчитываются
+при следующем поиске.
+"""
+from bisect import bisect_right
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class SubstringMatcher:
+    """Ключи внутри текста и текст внутри ключей"""
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[str, ...]] = [()]
+        self._key_at: List[Optional[str]] = [None]  # ключ, который заканчивается в состоянии
+        self._keys: List[str] = []
+        self._lengths: List[int] = []
+        self._automaton_ready = False
+        self._haystack_ready = False
+        self._haystack = ""
+        self._key_starts: List[int] = []
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: str) -> None:
+        """Добавляет ключ (повторное добавление ничего не меняет)"""
+        if not key:
+            return
+        state = 0
+        for char in key:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._key_at.append(None)
+            state = next_state
+        if self._key_at[state] is not None:
+            return
+        self._key_at[state] = key
+        # Ключи по длине; при равной длине — в порядке добавления
+        position = bisect_right(self._lengths, len(key))
+        self._keys.insert(position, key)
+        self._lengths.insert(position, len(key))
+        self._automaton_ready = False
+        self._haystack_ready = False
+
+    def _build_automaton(self) -> None:
+        """Ссылки неудач и выходы автомата (обход бора в ширину)"""
+        self._out = [(key,) if key is not None else () for key in self._key_at]
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._out[next_state] += self._out[self._fail[next_state]]
+        self._automaton_ready = True
+
+    def _build_haystack(self) -> None:
+        self._haystack = "\n".join(self._keys)
+        self._key_starts = []
+        offset = 0
+        for key in self._keys:
+            self._key_starts.append(offset)
+            offset += len(key) + 1
+        self._haystack_ready = True
+
+    def longest_in(self, text: str) -> Optional[str]:
+        """Самый длинный ключ внутри текста (при равной длине — самый левый)"""
+        if not self._automaton_ready:
+            self._build_automaton()
+        goto, fail, out = self._goto, self._fail, self._out
+        best = None
+        best_start = 0
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for key in out[state]:
+                start = position - len(key) + 1
+                if best is None or len(key) > len(best) or (len(key) == len(best) and start < best_start):
+                    best, best_start = key, start
+        return best
+
+    def shortest_containing(self, text: str) -> Optional[str]:
+        """Самый короткий ключ, внутри которого есть текст (при равной длине — добавленный раньше)"""
+        if not text or "\n" in text:
+            return None
+        if not self._haystack_ready:
+            self._build_haystack()
+        position = self._haystack.find(text)
+        if position == -1:
+            return None
+        return self._keys[bisect_right(self._key_starts, position) - 1]
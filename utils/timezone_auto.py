@@ -1,131 +1,169 @@
 """
 utils/timezone_auto.py
 Автоматическое определение часового пояса по городу
+
+Один резолвер на процесс: индекс нормализованных названий (справочник,
+сокращения, английские названия, транслитерация) строится при импорте.
+Порядок поиска: название целиком → название внутри текста («г. Москва,
+Россия») → начало названия («новосиб») → текст внутри названия → леммы
+(«в Казани») → название внутри слова («краснодарский»). Результаты кэшируются.
 """
 import logging
-from typing import Optional
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils.catalog import load_catalog
+from utils.morphology import LemmaIndex
+from utils.text_match import SubstringMatcher
 
 logger = logging.getLogger(__name__)
 
 # Словарь соответствия городов и часовых поясов
-CITY_TIMEZONE_MAP = {
-    # Россия
-    'москва': 'Europe/Moscow',
-    'санкт-петербург': 'Europe/Moscow',
-    'новосибирск': 'Asia/Novosibirsk',
-    'мурманск': 'Europe/Moscow',
-    'екатеринбург': 'Asia/Yekaterinburg',
-    'казань': 'Europe/Moscow',
-    'нижний новгород': 'Europe/Moscow',
-    'челябинск': 'Asia/Yekaterinburg',
-    'самара': 'Europe/Samara',
-    'ростов-на-дону': 'Europe/Moscow',
-    'уфа': 'Asia/Yekaterinburg',
-    'красноярск': 'Asia/Krasnoyarsk',
-    'пермь': 'Asia/Yekaterinburg',
-    'воронеж': 'Europe/Moscow',
-    'волгоград': 'Europe/Volgograd',
-    'краснодар': 'Europe/Moscow',
-    'саратов': 'Europe/Saratov',
-    'тюмень': 'Asia/Yekaterinburg',
-    'тольятти': 'Europe/Moscow',
-    'ижевск': 'Europe/Samara',
-    'барнаул': 'Asia/Novosibirsk',
-    'иркутск': 'Asia/Irkutsk',
-    'хабаровск': 'Asia/Khabarovsk',
-    'владивосток': 'Asia/Vladivostok',
-    'якутск': 'Asia/Yakutsk',
-    
-    # Украина
-    'киев': 'Europe/Kyiv',
-    'харьков': 'Europe/Kyiv',
-    'одесса': 'Europe/Kyiv',
-    'днепр': 'Europe/Kyiv',
-    'донецк': 'Europe/Kyiv',
-    'львов': 'Europe/Kyiv',
-    
-    # Беларусь
-    'минск': 'Europe/Minsk',
-    'гомель': 'Europe/Minsk',
-    'брест': 'Europe/Minsk',
-    
-    # Казахстан
-    'алматы': 'Asia/Almaty',
-    'нур-султан': 'Asia/Qyzylorda',
-    'шымкент': 'Asia/Qyzylorda',
-    'астана': 'Asia/Almaty',
-    
-    # Узбекистан
-    'ташкент': 'Asia/Tashkent',
-    'самарканд': 'Asia/Samarkand',
-    'бухара': 'Asia/Samarkand',
-    
-    # Страны Балтии
-    'рига': 'Europe/Riga',
-    'таллин': 'Europe/Tallinn',
-    'вильнюс': 'Europe/Vilnius',
-    
-    # Кавказ
-    'баку': 'Asia/Baku',
-    'тбилиси': 'Asia/Tbilisi',
-    'ереван': 'Asia/Yerevan',
-    
-    # Средняя Азия
-    'бишкек': 'Asia/Bishkek',
-    'душанбе': 'Asia/Dushanbe',
-    'ашхабад': 'Asia/Ashgabat',
-    
-    # Европа
-    'лондон': 'Europe/London',
-    'берлин': 'Europe/Berlin',
-    'париж': 'Europe/Paris',
-    'рим': 'Europe/Rome',
-    'мадрид': 'Europe/Madrid',
-    'амстердам': 'Europe/Amsterdam',
-    'брюссель': 'Europe/Brussels',
-    'вена': 'Europe/Vienna',
-    'прага': 'Europe/Prague',
-    'будапешт': 'Europe/Budapest',
-    'варшава': 'Europe/Warsaw',
-    'стокгольм': 'Europe/Stockholm',
-    'копенгаген': 'Europe/Copenhagen',
-    'хельсинки': 'Europe/Helsinki',
-    
-    # Азия
-    'пекин': 'Asia/Shanghai',
-    'шанхай': 'Asia/Shanghai',
-    'гонконг': 'Asia/Hong_Kong',
-    'сингапур': 'Asia/Singapore',
-    'токио': 'Asia/Tokyo',
-    'сеул': 'Asia/Seoul',
-    'бангкок': 'Asia/Bangkok',
-    'джакарта': 'Asia/Jakarta',
-    'куала-лумпур': 'Asia/Kuala_Lumpur',
-    'манчестер': 'Europe/London',
-    
-    # Америка
-    'нью-йорк': 'America/New_York',
-    'лос-анджелес': 'America/Los_Angeles',
-    'чикаго': 'America/Chicago',
-    'вашингтон': 'America/New_York',
-    'бостон': 'America/New_York',
-    'миами': 'America/New_York',
-    'сан-франциско': 'America/Los_Angeles',
-    'торонто': 'America/Toronto',
-    'ванкувер': 'America/Vancouver',
-    'мехико': 'America/Mexico_City',
-    
-    # Другие крупные города
-    'дубай': 'Asia/Dubai',
-    'каир': 'Africa/Cairo',
-    'кейптаун': 'Africa/Johannesburg',
-    'мумбаи': 'Asia/Kolkata',
-    'дели': 'Asia/Kolkata',
-    'сидней': 'Australia/Sydney',
-    'мельбурн': 'Australia/Melbourne',
-    'аукленд': 'Pacific/Auckland',
+# Справочник в catalogs/city_timezones.json
+CITY_TIMEZONE_MAP = load_catalog("city_timezones")
+
+# Сокращения и английские названия → город справочника
+CITY_ALIASES = {
+    'спб': 'санкт-петербург', 'питер': 'санкт-петербург', 'петербург': 'санкт-петербург',
+    'мск': 'москва', 'московская область': 'москва', 'подмосковье': 'москва',
+    'нск': 'новосибирск', 'екб': 'екатеринбург', 'нн': 'нижний новгород',
+    'ростов': 'ростов-на-дону',
+    'moscow': 'москва', 'yekaterinburg': 'екатеринбург', 'saint petersburg': 'санкт-петербург', 'st petersburg': 'санкт-петербург',
+    'kiev': 'киев', 'kyiv': 'киев',
+    'london': 'лондон', 'berlin': 'берлин', 'paris': 'париж', 'rome': 'рим', 'madrid': 'мадрид',
+    'new york': 'нью-йорк', 'los angeles': 'лос-анджелес', 'chicago': 'чикаго',
+    'beijing': 'пекин', 'tokyo': 'токио', 'dubai': 'дубай',
 }
 
+_TRANSLIT = str.maketrans({
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ж': 'zh', 'з': 'z', 'и': 'i',
+    'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm', 'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's',
+    'т': 't', 'у': 'u', 'ф': 'f', 'х': 'kh', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'shch',
+    'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+})
+
+_SEPARATORS_RE = re.compile(r"[\s\-–—_.,;:()]+")
+_CITY_PREFIXES = ("город ", "г ")
+
+# Начало названия ищется от этой длины, название внутри текста — от этой
+_MIN_PREFIX = 3
+_MIN_INNER = 5
+
+
+@lru_cache(maxsize=4096)
+def normalize_city(text: str) -> str:
+    """«Г. Ростов-на-Дону» → «ростов на дону»: регистр, ё, дефисы, префикс «г.»"""
+    text = _SEPARATORS_RE.sub(" ", text.lower().replace("ё", "е")).strip()
+    for prefix in _CITY_PREFIXES:
+        if text.startswith(prefix):
+            return text[len(prefix):]
+    return text
+
+
+def transliterate(text: str) -> str:
+    """Латиница для русского названия: «екатеринбург» → «ekaterinburg»"""
+    return text.translate(_TRANSLIT)
+
+
+class CityTimezoneResolver:
+    """Часовой пояс (IANA) по названию города с готовым индексом и кэшем"""
+
+    def __init__(self, cities: Dict[str, str], aliases: Dict[str, str], cache_size: int = 4096):
+        index: Dict[str, str] = {}
+        for city, timezone in cities.items():
+            index.setdefault(normalize_city(city), timezone)
+        for alias, city in aliases.items():
+            index.setdefault(normalize_city(alias), cities[city])
+        for city, timezone in cities.items():
+            index.setdefault(transliterate(normalize_city(city)), timezone)
+        self._index = index
+        self._max_words = max(key.count(" ") + 1 for key in index)
+        self._sorted_keys: List[str] = sorted(index)
+        self._matcher = SubstringMatcher(index)
+        self._lemmas = LemmaIndex(cities.items(), "cities")
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _resolve(self, city: str) -> Optional[str]:
+        found = self.find(city)
+        if found is None:
+            return None
+        timezone, method = found
+        logger.info(f"🌍 Часовой пояс для города '{city}' ({method}): {timezone}")
+        return timezone
+
+    def find(self, city: str) -> Optional[Tuple[str, str]]:
+        """(часовой пояс, способ совпадения) или None"""
+        text = normalize_city(city or "")
+        if not text:
+            return None
+        timezone = self._index.get(text)
+        if timezone:
+            return timezone, "exact"
+        timezone = self._find_words(text.split())
+        if timezone:
+            return timezone, "words"
+        if len(text) >= _MIN_PREFIX:
+            timezone = self._find_prefix(text)
+            if timezone:
+                return timezone, "prefix"
+            key = self._matcher.shortest_containing(text)
+            if key:
+                return self._index[key], "partial"
+        # Леммы — после дешевых проверок и только если основа слова похожа на город:
+        # разбор незнакомых слов дорогой
+        if any(self._has_prefix(word[:max(2, min(4, len(word) - 1))]) for word in text.split()):
+            timezone = self._lemmas.find_key_in(city)
+            if timezone:
+                return timezone, "lemma"
+        # Название внутри слова («краснодарский край»); короткие названия дают ложные совпадения
+        key = self._matcher.longest_in(text)
+        if key and len(key) >= _MIN_INNER:
+            return self._index[key], "inner"
+        return None
+
+    def _find_words(self, words: List[str]) -> Optional[str]:
+        """Самое длинное (затем самое левое) название из слов текста"""
+        for size in range(min(self._max_words, len(words)), 0, -1):
+            for start in range(len(words) - size + 1):
+                timezone = self._index.get(" ".join(words[start:start + size]))
+                if timezone:
+                    return timezone
+        return None
+
+    def _has_prefix(self, text: str) -> bool:
+        keys = self._sorted_keys
+        position = bisect_left(keys, text)
+        return position < len(keys) and keys[position].startswith(text)
+
+    def _find_prefix(self, text: str) -> Optional[str]:
+        """Пояс самого короткого названия, которое начинается с текста"""
+        keys = self._sorted_keys
+        position = bisect_left(keys, text)
+        best = None
+        while position < len(keys) and keys[position].startswith(text):
+            if best is None or len(keys[position]) < len(best):
+                best = keys[position]
+            position += 1
+        return self._index[best] if best else None
+
+    def cache_info(self) -> Dict:
+        info = self.resolve.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+
+city_timezone_resolver = CityTimezoneResolver(CITY_TIMEZONE_MAP, CITY_ALIASES)
+
+
+def resolve_city_timezones(cities: Iterable[str]) -> Dict[str, Optional[str]]:
+    """Часовые пояса для списка городов (повторы считаются один раз)"""
+    return {city: city_timezone_resolver.resolve(city) for city in dict.fromkeys(cities)}
+
+
 def get_timezone_by_city(city: str) -> str:
     """
     Автоматическое определение часового пояса по названию города
@@ -139,80 +177,10 @@ def get_timezone_by_city(city: str) -> str:
     if not city:
         return 'UTC'
     
-    city_clean = city.strip().lower()
-    
-    # Прямое соответствие
-    if city_clean in CITY_TIMEZONE_MAP:
-        timezone = CITY_TIMEZONE_MAP[city_clean]
-        logger.info(f"🌍 Автоматически определён часовой пояс для города '{city}': {timezone}")
+    timezone = city_timezone_resolver.resolve(city.strip())
+    if timezone:
         return timezone
     
-    # Поиск по вхождению (для сложных названий)
-    for city_name, timezone in CITY_TIMEZONE_MAP.items():
-        if city_clean in city_name or city_name in city_clean:
-            logger.info(f"🌍 Автоматически определён часовой пояс для города '{city}': {timezone}")
-            return timezone
-    
-    # Поиск по ключевым словам
-    if any(keyword in city_clean for keyword in ['москва', 'московская']):
-        return 'Europe/Moscow'
-    elif any(keyword in city_clean for keyword in ['санкт-петербург', 'спб', 'петербург']):
-        return 'Europe/Moscow'
-    elif any(keyword in city_clean for keyword in ['мурманск', 'мурма']):
-        return 'Europe/Moscow'
-    elif any(keyword in city_clean for keyword in ['новосибирск', 'нск']):
-        return 'Asia/Novosibirsk'
-    elif any(keyword in city_clean for keyword in ['екатеринбург', 'екб']):
-        return 'Asia/Yekaterinburg'
-    elif any(keyword in city_clean for keyword in ['казань']):
-        return 'Europe/Moscow'
-    elif any(keyword in city_clean for keyword in ['нижний новгород', 'нн']):
-        return 'Europe/Moscow'
-    elif any(keyword in city_clean for keyword in ['самара']):
-        return 'Europe/Samara'
-    elif any(keyword in city_clean for keyword in ['ростов', 'ростов-на-дону']):
-        return 'Europe/Moscow'
-    elif any(keyword in city_clean for keyword in ['уфа']):
-        return 'Asia/Yekaterinburg'
-    elif any(keyword in city_clean for keyword in ['красноярск']):
-        return 'Asia/Krasnoyarsk'
-    elif any(keyword in city_clean for keyword in ['пермь']):
-        return 'Asia/Yekaterinburg'
-    elif any(keyword in city_clean for keyword in ['воронеж']):
-        return 'Europe/Moscow'
-    elif any(keyword in city_clean for keyword in ['волгоград']):
-        return 'Europe/Volgograd'
-    elif any(keyword in city_clean for keyword in ['краснодар']):
-        return 'Europe/Moscow'
-    
-    # Европа
-    elif any(keyword in city_clean for keyword in ['лондон', 'london']):
-        return 'Europe/London'
-    elif any(keyword in city_clean for keyword in ['берлин', 'berlin']):
-        return 'Europe/Berlin'
-    elif any(keyword in city_clean for keyword in ['париж', 'paris']):
-        return 'Europe/Paris'
-    elif any(keyword in city_clean for keyword in ['рим', 'rome']):
-        return 'Europe/Rome'
-    elif any(keyword in city_clean for keyword in ['мадрид', 'madrid']):
-        return 'Europe/Madrid'
-    
-    # Америка
-    elif any(keyword in city_clean for keyword in ['нью-йорк', 'new york']):
-        return 'America/New_York'
-    elif any(keyword in city_clean for keyword in ['лос-анджелес', 'los angeles']):
-        return 'America/Los_Angeles'
-    elif any(keyword in city_clean for keyword in ['чикаго', 'chicago']):
-        return 'America/Chicago'
-    
-    # Азия
-    elif any(keyword in city_clean for keyword in ['пекин', 'beijing']):
-        return 'Asia/Shanghai'
-    elif any(keyword in city_clean for keyword in ['токио', 'tokyo']):
-        return 'Asia/Tokyo'
-    elif any(keyword in city_clean for keyword in ['дубай', 'dubai']):
-        return 'Asia/Dubai'
-    
     logger.warning(f"⚠️ Часовой пояс для города '{city}' не найден, используется UTC")
     return 'UTC'
 
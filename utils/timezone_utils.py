@@ -1,9 +1,15 @@
 """
 Утилиты для работы с часовыми поясами пользователей
+
+Объекты часовых поясов (zoneinfo) создаются один раз на процесс и
+кэшируются по имени; для пакетных задач есть границы локальных суток сразу
+для многих пользователей.
 """
-from datetime import datetime, timezone
-from typing import Dict, Optional
-import pytz
+import re
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 # Популярные города России и мира с их часовыми поясами
 POPULAR_CITIES = {
@@ -47,7 +53,39 @@ POPULAR_OFFSETS = [
     'UTC+6', 'UTC+7', 'UTC+8', 'UTC+9', 'UTC+10', 'UTC+11', 'UTC+12'
 ]
 
-def get_user_local_date(user_timezone: str) -> datetime.date:
+_OFFSET_RE = re.compile(r"^(?:UTC|GMT)\s*([+-])\s*(\d{1,2})(?::?(\d{2}))?$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def get_zone(name: Optional[str]) -> Optional[tzinfo]:
+    """
+    Часовой пояс по IANA-имени ('Europe/Moscow') или смещению ('UTC+3');
+    None — неизвестный пояс. Объекты кэшируются на процесс.
+    """
+    if not name:
+        return None
+    name = name.strip()
+    if name.upper() in ("UTC", "GMT"):
+        return timezone.utc
+    match = _OFFSET_RE.match(name)
+    if match:
+        sign, hours, minutes = match.groups()
+        offset = timedelta(hours=int(hours), minutes=int(minutes or 0))
+        if offset > timedelta(hours=14):
+            return None
+        return timezone(-offset if sign == "-" else offset, name.upper()) if offset else timezone.utc
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def zone_or_utc(name: Optional[str]) -> tzinfo:
+    """Часовой пояс пользователя, для некорректного — UTC"""
+    return get_zone(name) or timezone.utc
+
+
+def get_user_local_date(user_timezone: str) -> date:
     """
     Получает текущую локальную дату пользователя
     
@@ -57,13 +95,8 @@ def get_user_local_date(user_timezone: str) -> datetime.date:
     Returns:
         datetime.date: Локальная дата пользователя
     """
-    try:
-        tz = pytz.timezone(user_timezone)
-        now_local = datetime.now(tz)
-        return now_local.date()
-    except Exception:
-        # Если часовой пояс некорректный, используем UTC
-        return datetime.now(timezone.utc).date()
+    # Если часовой пояс некорректный, используем UTC
+    return datetime.now(zone_or_utc(user_timezone)).date()
 
 def get_user_local_datetime(user_timezone: str) -> datetime:
     """
@@ -75,12 +108,8 @@ def get_user_local_datetime(user_timezone: str) -> datetime:
     Returns:
         datetime: Локальная дата и время пользователя
     """
-    try:
-        tz = pytz.timezone(user_timezone)
-        return datetime.now(tz)
-    except Exception:
-        # Если часовой пояс некорректный, используем UTC
-        return datetime.now(timezone.utc)
+    # Если часовой пояс некорректный, используем UTC
+    return datetime.now(zone_or_utc(user_timezone))
 
 def convert_utc_to_local(utc_datetime: datetime, user_timezone: str) -> datetime:
     """
@@ -93,15 +122,62 @@ def convert_utc_to_local(utc_datetime: datetime, user_timezone: str) -> datetime
     Returns:
         datetime: Локальное время пользователя
     """
-    try:
-        if utc_datetime.tzinfo is None:
-            utc_datetime = utc_datetime.replace(tzinfo=timezone.utc)
-        
-        tz = pytz.timezone(user_timezone)
-        return utc_datetime.astimezone(tz)
-    except Exception:
-        # Если часовой пояс некорректный, возвращаем UTC
-        return utc_datetime
+    if utc_datetime.tzinfo is None:
+        utc_datetime = utc_datetime.replace(tzinfo=timezone.utc)
+    
+    zone = get_zone(user_timezone)
+    # Если часовой пояс некорректный, возвращаем UTC
+    return utc_datetime.astimezone(zone) if zone is not None else utc_datetime
+
+def _day_bounds(zone_name: Optional[str], now: datetime, days_ago: int) -> Tuple[date, datetime, datetime]:
+    zone = zone_or_utc(zone_name)
+    day = now.astimezone(zone).date() - timedelta(days=days_ago)
+    start = datetime.combine(day, time.min, zone).astimezone(timezone.utc)
+    end = datetime.combine(day + timedelta(days=1), time.min, zone).astimezone(timezone.utc)
+    return day, start, end
+
+def local_day_bounds(user_timezones: Sequence[Optional[str]], days_ago: int = 0,
+                     now: Optional[datetime] = None) -> List[Tuple[date, datetime, datetime]]:
+    """
+    Локальная дата и границы этих суток в UTC [начало, конец) для каждого
+    часового пояса списка, по порядку. Каждый пояс считается один раз,
+    сколько бы пользователей в нем ни было; now — общий момент для всех.
+    """
+    now = now or datetime.now(timezone.utc)
+    bounds: Dict[Optional[str], Tuple[date, datetime, datetime]] = {}
+    result = []
+    for zone_name in user_timezones:
+        day_bounds = bounds.get(zone_name)
+        if day_bounds is None:
+            day_bounds = bounds[zone_name] = _day_bounds(zone_name, now, days_ago)
+        result.append(day_bounds)
+    return result
+
+def group_by_day_bounds(user_timezones: Mapping[Hashable, Optional[str]], days_ago: int = 0,
+                        now: Optional[datetime] = None) -> Dict[Tuple[date, datetime, datetime], List[Hashable]]:
+    """
+    Пользователи, сгруппированные по границам локальных суток в UTC:
+    {(дата, начало, конец): [user_id, ...]}. Одна группа — один запрос
+    с диапазоном created_at вместо запроса на пользователя.
+    """
+    users = list(user_timezones)
+    groups: Dict[Tuple[date, datetime, datetime], List[Hashable]] = {}
+    for user, day_bounds in zip(users, local_day_bounds([user_timezones[user] for user in users], days_ago, now)):
+        groups.setdefault(day_bounds, []).append(user)
+    return groups
+
+def group_by_utc_offset(zone_names: Sequence[Optional[str]],
+                        now: Optional[datetime] = None) -> Dict[timedelta, List[Optional[str]]]:
+    """
+    Имена часовых поясов, сгруппированные по текущему смещению от UTC
+    (с учетом летнего времени в момент now). Некорректные и пустые — в UTC.
+    """
+    now = now or datetime.now(timezone.utc)
+    groups: Dict[timedelta, List[Optional[str]]] = {}
+    for name in zone_names:
+        offset = now.astimezone(zone_or_utc(name)).utcoffset()
+        groups.setdefault(offset, []).append(name)
+    return groups
 
 def parse_timezone_input(text: str) -> Optional[str]:
     """
@@ -113,15 +189,23 @@ def parse_timezone_input(text: str) -> Optional[str]:
     Returns:
         str: IANA идентификатор часового пояса или None
     """
-    text = text.strip().upper()
+    from utils.timezone_auto import city_timezone_resolver
+    
+    original = text.strip()
+    text = original.upper()
     
     # Проверяем прямое соответствие городам
     for city, tz in POPULAR_CITIES.items():
         if city.upper() in text or tz.upper() in text:
             return tz
     
-    # Проверяем смещения
-    for offset in POPULAR_OFFSETS:
+    # Любой город справочника (сокращения, латиница, падежи)
+    tz = city_timezone_resolver.resolve(original)
+    if tz:
+        return tz
+    
+    # Проверяем смещения (длинные первыми: «UTC+10», а не «UTC+1»)
+    for offset in sorted(POPULAR_OFFSETS, key=len, reverse=True):
         if offset in text:
             return offset
     
@@ -2,77 +2,63 @@
 Конвертер единиц измерения для продуктов
 """
 import logging
-from typing import Dict
+from typing import Dict, Optional
+
+from utils.catalog import load_catalog
+from utils.morphology import LemmaIndex
+from utils.quantity_lexer import canonical_unit
 
 logger = logging.getLogger(__name__)
 
 # Справка средних весов продуктов в граммах
-UNIT_WEIGHTS = {
-    # Фрукты
-    "яблоко": 150,
-    "банан": 120,
-    "апельсин": 200,
-    "лимон": 60,
-    "груша": 140,
-    "персик": 100,
-    "слива": 40,
-    "киви": 80,
-    
-    # Овощи
-    "картофель": 100,
-    "картофелина": 100,
-    "лук": 70,
-    "луковица": 70,
-    "морковь": 80,
-    "морковка": 80,
-    "свекла": 150,
-    "огурец": 100,
-    "помидор": 100,
-    "чеснок": 5,
-    "зубчик": 5,
-    
-    # Яйца
-    "яйцо": 50,
-    "яйца": 50,
-    
-    # Хлебобулочные изделия
-    "хлеб": 30,
-    "кусок": 30,
-    "ломтик": 20,
-    "батон": 400,
-    
-    # Молочные продукты
-    "стакан": 200,  # молоко, кефир
-    "чашка": 150,   # творог, йогурт
-    "ложка": 15,    # сметана, масло
-    "столовая ложка": 15,
-    "чайная ложка": 5,
-    
-    # Крупы и макароны
-    "стакан": 200,  # крупа
-    "горсть": 50,
+# Справочник в catalogs/unit_weights.json
+UNIT_WEIGHTS = load_catalog("unit_weights")
+
+# Ключи UNIT_WEIGHTS по леммам: «яблока», «яблок» → «яблоко»
+_unit_weight_lemmas = LemmaIndex(UNIT_WEIGHTS, "unit_weights")
+
+
+def find_unit_weight(name: str, whole_name: bool = False) -> Optional[float]:
+    """
+    Средний вес одной штуки продукта в граммах или None.
+    whole_name=True — только название целиком (в любой форме), без слов внутри него.
+    """
+    name_lower = name.lower().strip()
     
-    # Мясо и птица
-    "курица": 150,  # бедро, грудка
-    "котлета": 80,
-    "отбивная": 120,
-    "сосиска": 50,
-    "колбаса": 50,
+    # Точное совпадение
+    if name_lower in UNIT_WEIGHTS:
+        return UNIT_WEIGHTS[name_lower]
     
-    # Рыба
-    "рыба": 150,
-    "кусок": 100,
+    key = _unit_weight_lemmas.get(name_lower)
+    if whole_name:
+        return UNIT_WEIGHTS[key] if key else None
     
-    # Орехи
-    "горсть": 30,
-    "щепотка": 2,
+    # Известное слово внутри названия
+    key = key or _unit_weight_lemmas.find_key_in(name_lower)
+    if key:
+        return UNIT_WEIGHTS[key]
     
-    # Сладости
-    "шоколадка": 100,
-    "конфета": 15,
-    "печенье": 80,
-    "вафля": 80,
-    "булочка": 80,
+    # Подстрока (для составных слов, которые не разбиваются на леммы)
+    for key, weight in UNIT_WEIGHTS.items():
+        if key in name_lower:
+            return weight
+    return None
+
+# Граммы в единице (канонические формы utils.quantity_lexer); «шт» — по UNIT_WEIGHTS
+GRAMS_PER_UNIT = {
+    'г': 1,
+    'кг': 1000,
+    'мл': 1,  # для воды ~1г = 1мл
+    'л': 1000,
+    'ложка': 15,
+    'чайная ложка': 5,
+    'стакан': 200,
+    'чашка': 150,
+    'щепотка': 1,
+    'пучок': 5,
+    'кусок': 50,
+    'ломтик': 20,
+    'горсть': 50,
 }
 
 def convert_to_grams(name: str, quantity: float, unit: str) -> float:
@@ -88,78 +74,24 @@ def convert_to_grams(name: str, quantity: float, unit: str) -> float:
         Вес в граммах
     """
     try:
-        # Если уже в граммах
-        if unit in ['г', 'гр', 'gram', 'грамм', 'граммов']:
-            return float(quantity)
-        
-        # Если в килограммах
-        elif unit in ['кг', 'kg', 'килограмм', 'килограммов']:
-            return float(quantity) * 1000
-        
-        # Если в миллилитрах (для воды ~1г = 1мл)
-        elif unit in ['мл', 'ml', 'миллилитр', 'миллилитров']:
-            return float(quantity)
-        
-        # Если в литрах
-        elif unit in ['л', 'l', 'литр']:
-            return float(quantity) * 1000
+        canonical = canonical_unit(unit) if unit else None
         
         # Если в штуках - ищем средний вес
-        elif unit in ['шт', 'штука', 'штуки', 'штук']:
-            name_lower = name.lower().strip()
-            
-            # Ищем точное совпадение
-            if name_lower in UNIT_WEIGHTS:
-                return float(quantity) * UNIT_WEIGHTS[name_lower]
-            
-            # Ищем по ключевым словам
-            for key, weight in UNIT_WEIGHTS.items():
-                if key in name_lower:
-                    return float(quantity) * weight
+        if canonical == 'шт':
+            weight = find_unit_weight(name)
+            if weight is not None:
+                return float(quantity) * weight
             
             # Если не нашли, используем средний вес 100г
             logger.warning(f"[WARNING] Неизвестный продукт для конвертации: {name}, используем 100г за шт")
             return float(quantity) * 100
         
-        # Ложки
-        elif unit in ['ложка', 'ложки', 'ложек', 'столовая ложка', 'столовых ложек']:
-            return float(quantity) * 15
-        
-        elif unit in ['чайная ложка', 'чайных ложек']:
-            return float(quantity) * 5
-        
-        # Стаканы
-        elif unit in ['стакан', 'стакана', 'стаканов']:
-            return float(quantity) * 200
-        
-        # Чашки
-        elif unit in ['чашка', 'чашки', 'чашек']:
-            return float(quantity) * 150
-        
-        # Щепотки
-        elif unit in ['щепотка', 'щепотки']:
-            return float(quantity) * 1
-        
-        # Пучки
-        elif unit in ['пучок', 'пучка', 'пучков']:
-            return float(quantity) * 5
-        
-        # Куски
-        elif unit in ['кусок', 'куска', 'кусков']:
-            return float(quantity) * 50
-        
-        # Ломтики
-        elif unit in ['ломтик', 'ломтика', 'ломтиков']:
-            return float(quantity) * 20
-        
-        # Горсти
-        elif unit in ['горсть', 'горсти']:
-            return float(quantity) * 50
+        if canonical in GRAMS_PER_UNIT:
+            return float(quantity) * GRAMS_PER_UNIT[canonical]
         
         # Если неизвестная единица, возвращаем как есть (предположим граммы)
-        else:
-            logger.warning(f"[WARNING] Неизвестная единица измерения: {unit}, используем как есть")
-            return float(quantity)
+        logger.warning(f"[WARNING] Неизвестная единица измерения: {unit}, используем как есть")
+        return float(quantity)
             
     except (ValueError, TypeError) as e:
         logger.error(f"[ERROR] Ошибка конвертации {name} {quantity} {unit}: {e}")
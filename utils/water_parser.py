@@ -1,92 +1,60 @@
 """
 Парсинг объёмов воды из текста.
 Поддерживает числа с единицами (л, мл, стакан, кружка и т.д.) и словесные объёмы.
-Добавлена поддержка словесных чисел.
+Текст разбирается общим лексером utils.quantity_lexer (числа словами тоже).
 """
-import re
 from typing import Optional
-from utils.number_parser import parse_russian_number
 
-# Словарь для преобразования словесных объёмов в миллилитры (оставляем как есть)
-VOLUME_WORDS = {
-    "литр": 1000,
-    "литра": 1000,
-    "литров": 1000,
-    "пол-литра": 500,
-    "пол литра": 500,
-    "поллитра": 500,
-    "полтора": 1500,
-    "полтора литра": 1500,
-    "два литра": 2000,
-    "три литра": 3000,
-    "стакан": 250,
-    "стакана": 250,
-    "стаканов": 250,
-    "кружка": 300,
-    "кружки": 300,
-    "бутылка": 500,
-    "бутылки": 500,
-    "маленькая бутылка": 330,
-    "большая бутылка": 1500,
-}
+from utils.quantity_lexer import NUMBER, TERM, UNIT, tokenize
 
-# Словарь единиц измерения с коэффициентами в миллилитры
+# Единицы (канонические формы лексера) в миллилитрах
 UNIT_MAP = {
     "мл": 1,
     "л": 1000,
-    "литр": 1000,
-    "литра": 1000,
-    "литров": 1000,
     "стакан": 250,
-    "стакана": 250,
-    "стаканов": 250,
+    "чашка": 200,
     "кружка": 300,
-    "кружки": 300,
     "бутылка": 500,
-    "бутылки": 500,
-    "воды": 1,  # Для "200 воды"
-    "вода": 1,  # Для "200 вода"
-    "воду": 1,  # Для "200 воду"
+}
+
+# Объём бутылки по размеру: «маленькая бутылка», «большую бутылку»
+BOTTLE_SIZES = {
+    "маленькая": 330, "маленькую": 330, "маленькой": 330,
+    "большая": 1500, "большую": 1500, "большой": 1500,
 }
 
 def parse_water_amount(text: str) -> Optional[int]:
     """
     Извлекает количество воды в миллилитрах из текста.
     Возвращает число мл или None, если не удалось распознать.
-    """
-    text_lower = text.lower().strip()
-
-    # 1. Прямые словесные объёмы (приоритет выше)
-    for phrase, ml in VOLUME_WORDS.items():
-        if phrase in text_lower:
-            return ml
-
-    # 2. Число с единицей измерения (например, "2 стакана", "300 мл", "1.5 л")
-    # Формируем регулярное выражение из всех возможных единиц
-    units_pattern = '|'.join(re.escape(unit) for unit in UNIT_MAP.keys())
-    match = re.search(r'(\d+(?:[.,]\d+)?)\s*(' + units_pattern + ')', text_lower)
-    if match:
-        qty_str = match.group(1).replace(',', '.')
-        qty = float(qty_str)
-        unit = match.group(2)
-        multiplier = UNIT_MAP.get(unit, 1)
-        return int(qty * multiplier)
 
-    # 3. Словесное число с единицей
-    for unit, multiplier in UNIT_MAP.items():
-        if unit in text_lower:
-            parts = text_lower.split(unit)
-            before = parts[0].strip()
-            num = parse_russian_number(before)
-            if num is not None:
-                return int(num * multiplier)
-            # Если числа нет, возможно подразумевается 1 (например, "литр воды")
-            # Но мы уже обработали словесные объёмы в п.1, сюда не должны попадать
-            # Поэтому просто продолжаем
-
-    # 4. Просто число (без единицы) – считаем, что это миллилитры
-    match = re.search(r'\b(\d+)\b', text_lower)
-    if match:
-        return int(match.group(1))
+    «2 стакана» → 500, «полтора литра» → 1500, «пол-литра» → 500,
+    «большая бутылка» → 1500, «300» → 300, «1.5» → 1500 (дробное число — литры),
+    «1/2 стакана» → 125. Ноль и отрицательные количества («-5») — None.
+    """
+    tokens = tokenize(text)
+
+    # 1. Единица измерения; число перед ней — количество (без числа — одна)
+    for index, token in enumerate(tokens):
+        if token.kind != UNIT or token.value not in UNIT_MAP:
+            continue
+        previous = tokens[index - 1] if index else None
+        if previous is not None and previous.kind == NUMBER:
+            return int(previous.value * UNIT_MAP[token.value]) if previous.value > 0 else None
+        if token.value == "бутылка" and previous is not None and previous.kind == TERM:
+            return BOTTLE_SIZES.get(previous.value, UNIT_MAP["бутылка"])
+        return UNIT_MAP[token.value]
+
+    # 2. Просто число – миллилитры; дробное меньше 10 («1.5», «полтора») – литры
+    for token in tokens:
+        if token.kind != NUMBER:
+            continue
+        if token.value <= 0:
+            return None
+        if token.value < 10 and token.value != int(token.value):
+            return int(token.value * 1000)
+        if not token.spelled:
+            return int(token.value)
+        return None
 
     return None